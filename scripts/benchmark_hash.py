@@ -0,0 +1,65 @@
+# mypy: disallow-untyped-defs
+"""Benchmark the OpenSubtitles hash against the former word-by-word implementation.
+
+Usage: ``python scripts/benchmark_hash.py [--size MIB] [--number N]``
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import struct
+import tempfile
+import timeit
+
+from subliminal.hashers import compute_hashes
+
+
+def hash_opensubtitles_loop(video_path: str) -> str | None:
+    """Former implementation, with 8192 reads of 8 bytes for the head and the tail of the file."""
+    bytesize = struct.calcsize(b'<q')
+    with open(video_path, 'rb') as f:
+        filesize = os.path.getsize(video_path)
+        filehash = filesize
+        if filesize < 65536 * 2:
+            return None
+        for _ in range(65536 // bytesize):
+            (l_value,) = struct.unpack(b'<q', f.read(bytesize))
+            filehash += l_value
+            filehash &= 0xFFFFFFFFFFFFFFFF
+        f.seek(max(0, filesize - 65536), 0)
+        for _ in range(65536 // bytesize):
+            (l_value,) = struct.unpack(b'<q', f.read(bytesize))
+            filehash += l_value
+            filehash &= 0xFFFFFFFFFFFFFFFF
+    return f'{filehash:016x}'
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--size', type=int, default=16, help='size of the video file in MiB')
+    parser.add_argument('--number', type=int, default=200, help='number of hashes per implementation')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, 'video.mkv')
+        with open(path, 'wb') as f:
+            f.write(os.urandom(args.size * 1024 * 1024))
+
+        def hash_bulk(video_path: str) -> str | None:
+            return compute_hashes(video_path, ['opensubtitles']).get('opensubtitles')
+
+        if hash_bulk(path) != hash_opensubtitles_loop(path):
+            parser.error('hashes differ')
+
+        loop = timeit.timeit(lambda: hash_opensubtitles_loop(path), number=args.number) / args.number
+        bulk = timeit.timeit(lambda: hash_bulk(path), number=args.number) / args.number
+
+    print(f'word-by-word: {loop * 1e3:.3f} ms per video')
+    print(f'bulk read:    {bulk * 1e3:.3f} ms per video')
+    print(f'speedup:      {loop / bulk:.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+# mypy: disallow-untyped-defs
+"""Benchmark the per-video overhead of the AsyncProviderPool, with and without a long-lived executor.
+
+Mock providers are used, so the time measured is the overhead of the pool.
+
+Usage: ``python scripts/benchmark_provider_pool.py [--videos N] [--providers N]``
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+from babelfish import Language  # type: ignore[import-untyped]
+
+import subliminal.core
+from subliminal.core import AsyncProviderPool
+from subliminal.extensions import RegistrableExtensionManager
+from subliminal.providers.mock import mock_subtitle_provider
+from subliminal.video import Movie
+
+if TYPE_CHECKING:
+    from collections.abc import Set
+
+    from subliminal.subtitle import Subtitle
+    from subliminal.video import Video
+
+
+class PerCallExecutorProviderPool(AsyncProviderPool):
+    """Former implementation, with a new executor for each video."""
+
+    def list_subtitles(self, video: Video, languages: Set[Language]) -> list[Subtitle]:
+        """List subtitles, creating and shutting down an executor."""
+        subtitles: list[Subtitle] = []
+        with ThreadPoolExecutor(self.max_workers) as executor:
+            for _provider, provider_subtitles in executor.map(
+                self.list_subtitles_provider_tuple,
+                self.providers,
+                itertools.repeat(video, len(self.providers)),
+                itertools.repeat(languages, len(self.providers)),
+            ):
+                if provider_subtitles is None:
+                    continue
+                subtitles.extend(provider_subtitles)
+        return subtitles
+
+
+def run(pool_class: type[AsyncProviderPool], videos: list[Video], providers: list[str]) -> float:
+    """List the subtitles of all the videos and return the time per video."""
+    languages = {Language('eng')}
+    start = time.perf_counter()
+    with pool_class(providers=providers) as pool:
+        for video in videos:
+            pool.list_subtitles(video, languages)
+    return (time.perf_counter() - start) / len(videos)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--videos', type=int, default=1000, help='number of videos')
+    parser.add_argument('--providers', type=int, default=4, help='number of mock providers')
+    args = parser.parse_args()
+
+    # register mock providers, without subtitles
+    manager = RegistrableExtensionManager('subliminal.benchmark-providers', [])
+    providers = []
+    for i in range(args.providers):
+        manager.register(mock_subtitle_provider(f'Mock{i}', []))
+        providers.append(f'mock{i}')
+    subliminal.core.provider_manager = manager
+
+    videos: list[Video] = [Movie(f'movie.{i}.2020.720p.mkv', f'Movie {i}', year=2020) for i in range(args.videos)]
+
+    before = run(PerCallExecutorProviderPool, videos, providers)
+    after = run(AsyncProviderPool, videos, providers)
+
+    print(f'{args.videos} videos, {args.providers} providers')
+    print(f'executor per video: {before * 1e6:.1f} us per video')
+    print(f'long-lived executor: {after * 1e6:.1f} us per video')
+    print(f'speedup:             {before / after:.1f}x')
+
+
+if __name__ == '__main__':
+    main()
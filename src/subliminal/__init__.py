@@ -19,10 +19,15 @@ __copyright__: str = 'Copyright 2016, Antoine Bertin'
 
 from .cache import region
 from .core import (
+    AsyncioProviderPool,
     AsyncProviderPool,
+    BatchProviderPool,
+    Hedging,
     ProviderPool,
+    Timeouts,
     check_video,
     download_best_subtitles,
+    download_best_subtitles_async,
     download_subtitles,
     list_subtitles,
     refine,
@@ -44,17 +49,22 @@ __all__ = [
     'SUBTITLE_EXTENSIONS',
     'VIDEO_EXTENSIONS',
     'AsyncProviderPool',
+    'AsyncioProviderPool',
+    'BatchProviderPool',
     'Episode',
     'Error',
+    'Hedging',
     'Movie',
     'Provider',
     'ProviderError',
     'ProviderPool',
     'Subtitle',
+    'Timeouts',
     'Video',
     'check_video',
     'compute_score',
     'download_best_subtitles',
+    'download_best_subtitles_async',
     'download_subtitles',
     'get_scores',
     'list_subtitles',
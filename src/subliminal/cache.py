@@ -16,6 +16,12 @@ EPISODE_EXPIRATION_TIME = datetime.timedelta(days=3).total_seconds()
 #: Expiration time for scraper searches
 REFINER_EXPIRATION_TIME = datetime.timedelta(weeks=1).total_seconds()
 
+#: Expiration time for the subtitles listed by the providers
+LISTING_EXPIRATION_TIME = datetime.timedelta(hours=1).total_seconds()
+
+#: Expiration time for video hashes, keyed by the identity of the file so they never become invalid
+HASH_EXPIRATION_TIME = datetime.timedelta(weeks=26).total_seconds()
+
 
 def _to_native_str(value: str | bytes) -> str:
     """Convert bytes to str."""
@@ -0,0 +1,179 @@
+"""Circuit breakers, to stop calling a failing provider for a while instead of for the rest of the run.
+
+A :class:`CircuitBreaker` is closed while the provider works. It opens when the rate of failures in the window
+of the last calls is too high, or immediately after a fatal error. While open, the calls fail fast. After a
+cooldown, it is half-open and lets a single probe call through: the circuit is closed again if the probe
+succeeds, and opened again otherwise.
+
+The :class:`~subliminal.core.ProviderPool` keeps a circuit breaker per provider, see
+:attr:`~subliminal.core.ProviderPool.circuit_breakers`.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import threading
+import time
+from collections import deque
+from enum import Enum
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitState(Enum):
+    """State of a :class:`CircuitBreaker`."""
+
+    #: The calls are allowed
+    CLOSED = 'closed'
+
+    #: The calls fail fast
+    OPEN = 'open'
+
+    #: A single probe call is allowed
+    HALF_OPEN = 'half-open'
+
+
+class CircuitBreaker:
+    """A circuit breaker, with a failure-rate window and half-open probing after a cooldown.
+
+    :param str name: name used in the logs.
+    :param int window: number of the last calls used to compute the failure rate.
+    :param float failure_rate: rate of failures in the window that opens the circuit.
+    :param int min_calls: minimum number of calls in the window before the circuit can open on the failure rate.
+    :param float cooldown: time before an open circuit becomes half-open, in seconds.
+
+    """
+
+    #: Name used in the logs
+    name: str
+
+    #: Number of the last calls used to compute the failure rate
+    window: int
+
+    #: Rate of failures in the window that opens the circuit
+    failure_rate: float
+
+    #: Minimum number of calls in the window before the circuit can open on the failure rate
+    min_calls: int
+
+    #: Time before an open circuit becomes half-open, in seconds
+    cooldown: float
+
+    def __init__(
+        self,
+        name: str = '',
+        *,
+        window: int = 20,
+        failure_rate: float = 0.5,
+        min_calls: int = 5,
+        cooldown: float = 60.0,
+    ) -> None:
+        self.name = name
+        self.window = window
+        self.failure_rate = failure_rate
+        self.min_calls = min_calls
+        self.cooldown = cooldown
+        self._lock = threading.Lock()
+        self._calls: deque[bool] = deque(maxlen=window)
+        self._opened_at: float | None = None
+        self._open_for = 0.0
+        self._probing = False
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} [{self.name}] {self.state.value}>'
+
+    def _state(self) -> CircuitState:
+        if self._opened_at is None:
+            return CircuitState.CLOSED
+        if time.monotonic() - self._opened_at < self._open_for:
+            return CircuitState.OPEN
+        return CircuitState.HALF_OPEN
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state of the circuit."""
+        with self._lock:
+            return self._state()
+
+    @property
+    def retry_in(self) -> float:
+        """Time before the circuit becomes half-open, in seconds, or 0 if it is not open."""
+        with self._lock:
+            if self._opened_at is None:
+                return 0.0
+            return max(0.0, self._opened_at + self._open_for - time.monotonic())
+
+    @property
+    def failures(self) -> int:
+        """Number of failures in the window."""
+        with self._lock:
+            return self._calls.count(False)
+
+    def allow(self) -> bool:
+        """Check if a call is allowed, reserving the probe call if the circuit is half-open.
+
+        :return: `True` if the call is allowed. The result of the call must then be recorded with
+            :meth:`record_success`, :meth:`record_failure` or :meth:`record_cancellation`.
+        :rtype: bool
+
+        """
+        with self._lock:
+            state = self._state()
+            if state == CircuitState.CLOSED:
+                return True
+            if state == CircuitState.OPEN or self._probing:
+                return False
+            logger.info('Circuit of %s is half-open, probing', self.name)
+            self._probing = True
+            return True
+
+    def record_success(self) -> None:
+        """Record a successful call, closing the circuit if it was half-open."""
+        with self._lock:
+            if self._opened_at is not None:
+                logger.info('Circuit of %s is closed', self.name)
+                self._opened_at = None
+                self._calls.clear()
+            self._probing = False
+            self._calls.append(True)
+
+    def record_failure(self, *, trip: bool = False, permanent: bool = False) -> None:
+        """Record a failed call, opening the circuit if needed.
+
+        :param bool trip: open the circuit immediately, for errors that are not transient.
+        :param bool permanent: open the circuit for good, for errors that a retry cannot fix (like a bad
+            configuration).
+
+        """
+        with self._lock:
+            self._calls.append(False)
+            half_open = self._probing
+            self._probing = False
+            failures = self._calls.count(False)
+            too_many = len(self._calls) >= self.min_calls and failures / len(self._calls) >= self.failure_rate
+            if permanent:
+                self._open(math.inf)
+            elif trip or half_open or too_many:
+                self._open(self.cooldown)
+
+    def record_cancellation(self) -> None:
+        """Record a call cancelled by the caller, that is neither a success nor a failure of the provider.
+
+        The probe call of a half-open circuit is released, the next call probes the provider.
+
+        """
+        with self._lock:
+            self._probing = False
+
+    def _open(self, duration: float) -> None:
+        logger.info('Circuit of %s is open for %.0fs', self.name, duration)
+        self._opened_at = time.monotonic()
+        self._open_for = duration
+
+    def reset(self) -> None:
+        """Close the circuit and forget the calls."""
+        with self._lock:
+            self._opened_at = None
+            self._probing = False
+            self._calls.clear()
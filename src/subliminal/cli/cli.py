@@ -18,6 +18,10 @@ from subliminal import (
     __version__,
     region,
 )
+from subliminal.http_cache import HTTPCache, configure_http_cache
+from subliminal.negative_cache import NegativeCache
+from subliminal.ratelimit import configure_shared_rate_limiters
+from subliminal.scan_index import ScanIndex
 
 from .commands import download
 from .helpers import (
@@ -41,6 +45,10 @@ def configure(ctx: click.Context, param: click.Parameter | None, filename: str |
 
 dirs = PlatformDirs('subliminal')
 cache_file = 'subliminal.dbm'
+scan_index_file = 'subliminal-scan-index.db'
+rate_limits_file = 'subliminal-rate-limits.db'
+http_cache_file = 'subliminal-http-cache.db'
+negative_cache_file = 'subliminal-negative-cache.db'
 default_config_path = dirs.user_config_path / 'subliminal.toml'
 
 
@@ -68,6 +76,24 @@ default_config_path = dirs.user_config_path / 'subliminal.toml'
     expose_value=True,
     help='Path to the cache directory.',
 )
+@click.option(
+    '--shared-rate-limits',
+    is_flag=True,
+    help=(
+        'Share the rate limits and download quotas of the providers with the other subliminal processes '
+        'using the same cache directory.'
+    ),
+)
+@click.option(
+    '--http-cache-size',
+    type=click.IntRange(min=0),
+    default=0,
+    show_default=True,
+    help=(
+        'Maximum size of the HTTP cache in MB, storing the large pages of the providers to revalidate them '
+        'instead of downloading them again, 100 is a good size. The HTTP cache is disabled with 0.'
+    ),
+)
 @providers_config.option(
     '--addic7ed',
     type=click.STRING,
@@ -116,6 +142,8 @@ def subliminal(
     ctx: click.Context,
     /,
     cache_dir: str,
+    shared_rate_limits: bool,
+    http_cache_size: int,
     debug: bool,
     logfile: os.PathLike[str] | None,
     logfile_level: str,
@@ -141,6 +169,15 @@ def subliminal(
         arguments={'filename': os.fspath(cache_dir_path / cache_file), 'lock_factory': MutexLock},
     )
 
+    # configure the rate limits shared between processes
+    configure_shared_rate_limiters(cache_dir_path / rate_limits_file if shared_rate_limits else None)
+
+    # configure the HTTP cache
+    configure_http_cache(
+        cache_dir_path / http_cache_file if http_cache_size > 0 else None,
+        max_size=http_cache_size * 1024 * 1024,
+    )
+
     # Set the logger level to DEBUG in case debug or logfile is defined
     subliminal_logger = logging.getLogger('subliminal')
     subliminal_logger.setLevel(logging.DEBUG)
@@ -177,6 +214,8 @@ def subliminal(
         logger.info(msg)
 
     ctx.obj['debug'] = debug
+    ctx.obj['scan_index_path'] = cache_dir_path / scan_index_file
+    ctx.obj['negative_cache_path'] = cache_dir_path / negative_cache_file
 
     # create provider and refiner configs
     provider_configs: dict[str, dict[str, Any]] = {}
@@ -222,15 +261,79 @@ def subliminal(
     is_flag=True,
     help='Clear subliminal cache. Use this ONLY if your cache is corrupted or if you experience issues.',
 )
+@click.option(
+    '--prune-scan-index',
+    is_flag=True,
+    help='Remove the videos that were deleted or modified from the scan index.',
+)
+@click.option(
+    '--clear-scan-index',
+    is_flag=True,
+    help='Clear the scan index, it will be rebuilt on the next download with `--scan-index`.',
+)
+@click.option(
+    '--prune-negative-cache',
+    is_flag=True,
+    help='Remove the searches that found no subtitle a long time ago from the negative cache.',
+)
+@click.option(
+    '--clear-negative-cache',
+    is_flag=True,
+    help='Clear the negative cache, all the searches will be made again.',
+)
+@click.option(
+    '--clear-http-cache',
+    is_flag=True,
+    help='Clear the HTTP cache, the pages of the providers will be downloaded again.',
+)
 @click.pass_context
-def cache(ctx: click.Context, clear_subliminal: bool) -> None:
+def cache(
+    ctx: click.Context,
+    clear_subliminal: bool,
+    prune_scan_index: bool,
+    clear_scan_index: bool,
+    prune_negative_cache: bool,
+    clear_negative_cache: bool,
+    clear_http_cache: bool,
+) -> None:
     """Cache management."""
-    if clear_subliminal and ctx.parent and 'cache_dir' in ctx.parent.params:
-        cache_dir_path = Path(ctx.parent.params['cache_dir'])
+    if not ctx.parent or 'cache_dir' not in ctx.parent.params:  # pragma: no cover
+        click.echo('Nothing done.')
+        return
+
+    cache_dir_path = Path(ctx.parent.params['cache_dir']).expanduser()
+    done = False
+    if clear_subliminal:
         for file in (cache_dir_path / cache_file).glob('*'):  # pragma: no cover
             file.unlink()
         click.echo("Subliminal's cache cleared.")
-    else:
+        done = True
+
+    if clear_scan_index or prune_scan_index:
+        with ScanIndex(cache_dir_path / scan_index_file) as index:
+            if clear_scan_index:
+                index.clear()
+                click.echo('Scan index cleared.')
+            else:
+                click.echo(f'{index.prune()} videos pruned from the scan index.')
+        done = True
+
+    if clear_negative_cache or prune_negative_cache:
+        with NegativeCache(cache_dir_path / negative_cache_file) as negative_cache:
+            if clear_negative_cache:
+                negative_cache.clear()
+                click.echo('Negative cache cleared.')
+            else:
+                click.echo(f'{negative_cache.prune()} searches pruned from the negative cache.')
+        done = True
+
+    if clear_http_cache:
+        with HTTPCache(cache_dir_path / http_cache_file) as http_cache:
+            http_cache.clear()
+        click.echo('HTTP cache cleared.')
+        done = True
+
+    if not done:
         click.echo('Nothing done.')
 
 
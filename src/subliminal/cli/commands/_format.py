@@ -5,12 +5,15 @@ from __future__ import annotations
 import logging
 import re
 from datetime import timedelta
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import click
 from babelfish import Error as BabelfishError  # type: ignore[import-untyped]
 from babelfish import Language
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
 logger = logging.getLogger(__name__)
 
 
@@ -54,6 +57,23 @@ class AgeParamType(click.ParamType):
         return timedelta(**{k: int(v) for k, v in match.groupdict(0).items()})
 
 
+class StageWorkersParamType(click.ParamType):
+    """:class:`~click.ParamType` for ``STAGE=N`` strings that returns the stage name and the number of workers."""
+
+    name = 'stage=n'
+
+    def __init__(self, stages: Sequence[str]) -> None:
+        self.stages = stages
+
+    def convert(self, value: str, param: click.Parameter | None, ctx: click.Context | None) -> tuple[str, int]:
+        """Convert a ``STAGE=N`` string to a tuple of the stage name and the number of workers."""
+        stage, _, workers = value.partition('=')
+        if stage not in self.stages or not workers.isdigit() or int(workers) < 1:
+            self.fail(f'{value} is not a valid STAGE=N, with N >= 1 and STAGE in {", ".join(self.stages)}', param, ctx)
+
+        return stage, int(workers)
+
+
 def plural(quantity: int, name: str, *, bold: bool = True, **kwargs: Any) -> str:
     """Format a quantity with plural."""
     return '{} {}{}'.format(
@@ -3,18 +3,22 @@
 
 from __future__ import annotations
 
+import itertools
 import logging
 import os
+import threading
 import warnings
-from collections import defaultdict
 from typing import TYPE_CHECKING, Any
 
 import click
 
 from subliminal import (
-    AsyncProviderPool,
+    VIDEO_EXTENSIONS,
+    BatchProviderPool,
     Episode,
+    Hedging,
     Movie,
+    Timeouts,
     Video,
     __version__,
     check_video,
@@ -27,22 +31,29 @@ from subliminal import (
 )
 from subliminal.core import (
     ARCHIVE_EXTENSIONS,
-    collect_video_filepaths,
+    collect_video_files,
     scan_path,
-    search_external_subtitles,
+    search_external_subtitles_batch,
 )
 from subliminal.exceptions import GuessingError
-from subliminal.extensions import get_default_providers, get_default_refiners
-from subliminal.utils import merge_extend_and_ignore_unions
+from subliminal.extensions import get_default_providers, get_default_refiners, local_refiners
+from subliminal.http import configure_connection_pools, connection_metrics
+from subliminal.http_cache import get_http_cache
+from subliminal.listing_cache import ListingCache
+from subliminal.negative_cache import NegativeCache
+from subliminal.pipeline import QUEUE_SIZE, Pipeline, Stage
+from subliminal.scan_index import ScanIndex
+from subliminal.utils import FileInfo, merge_extend_and_ignore_unions
 
-from ._format import AgeParamType, LanguageParamType, plural
+from ._format import AgeParamType, LanguageParamType, StageWorkersParamType, plural
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Callable, Iterator, Sequence
     from datetime import timedelta
 
     from babelfish import Language
 
+    from subliminal import Subtitle
 
 logger = logging.getLogger(__name__)
 
@@ -55,6 +66,11 @@ PROVIDER = click.Choice(['ALL', *sorted(provider_manager.names())])
 
 REFINER = click.Choice(['ALL', *sorted(refiner_manager.names())])
 
+#: Stages of the pipeline downloading the subtitles, in order
+PIPELINE_STAGES = ('scan', 'local-refine', 'network-refine', 'list', 'download', 'save')
+
+STAGE_WORKERS = StageWorkersParamType(PIPELINE_STAGES)
+
 
 @click.command()
 @click.option(
@@ -278,6 +294,99 @@ REFINER = click.Choice(['ALL', *sorted(refiner_manager.names())])
     default=None,
     help='Maximum number of threads to use.',
 )
+@click.option(
+    '--max-videos',
+    type=click.IntRange(1, 50),
+    default=1,
+    show_default=True,
+    help='Maximum number of videos processed at once.',
+)
+@click.option(
+    '--max-workers-per-provider',
+    type=click.IntRange(1, 10),
+    default=1,
+    show_default=True,
+    help='Maximum number of concurrent requests to each provider.',
+)
+@click.option(
+    '--stage-workers',
+    type=STAGE_WORKERS,
+    multiple=True,
+    help=(
+        f'Number of threads of a stage of the pipeline, with a stage in {", ".join(PIPELINE_STAGES)} '
+        '(can be used multiple times). The list and download stages default to --max-videos, the others to 1.'
+    ),
+)
+@click.option(
+    '--queue-size',
+    type=click.IntRange(1, None),
+    default=QUEUE_SIZE,
+    show_default=True,
+    help='Maximum number of videos waiting between two stages of the pipeline.',
+)
+@click.option(
+    '--early-termination/--no-early-termination',
+    default=False,
+    show_default=True,
+    help=(
+        'Stop listing the subtitles of a video as soon as a hash match is found for every language, '
+        'instead of waiting for all the providers.'
+    ),
+)
+@click.option(
+    '--hedge/--no-hedge',
+    default=False,
+    show_default=True,
+    help=(
+        'Also download the runner-up subtitle of a language if the best one is slow to download or a close match '
+        'from another provider, without using the providers with a low download quota.'
+    ),
+)
+@click.option(
+    '--time-budget',
+    type=click.FloatRange(0, min_open=True),
+    default=None,
+    metavar='SECONDS',
+    help='Maximum time spent listing and downloading the subtitles of a video, over all the providers.',
+)
+@click.option(
+    '--adaptive-timeouts/--no-adaptive-timeouts',
+    default=False,
+    show_default=True,
+    help=(
+        'Lower the timeout of the requests of a provider to a multiple of its usual response time, '
+        'so a provider that usually answers quickly cannot hang for long.'
+    ),
+)
+@click.option(
+    '--negative-cache/--no-negative-cache',
+    default=False,
+    show_default=True,
+    help=(
+        'Keep the searches that found no subtitle in the cache directory, and skip them on the next runs '
+        'for 1 day, then 3 days, then 7 days if they still find nothing.'
+    ),
+)
+@click.option(
+    '--bypass-negative-cache',
+    is_flag=True,
+    help='Make the searches skipped by the negative cache, and record their results. Implies --negative-cache.',
+)
+@click.option(
+    '--listing-cache/--no-listing-cache',
+    default=False,
+    show_default=True,
+    help=(
+        'Keep the subtitles listed by the providers for an hour in the cache, so running again with other options '
+        'only downloads the selected subtitles.'
+    ),
+)
+@click.option(
+    '--early-init/--no-early-init',
+    default=False,
+    show_default=True,
+    help='Initialize (log in) the providers in background while the videos are scanned.',
+)
 @click.option(
     '-z/-Z',
     '--archives/--no-archives',
@@ -285,6 +394,27 @@ REFINER = click.Choice(['ALL', *sorted(refiner_manager.names())])
     show_default=True,
     help=f'Scan archives for videos (supported extensions: {", ".join(ARCHIVE_EXTENSIONS)}).',
 )
+@click.option(
+    '--scan-index/--no-scan-index',
+    default=False,
+    show_default=True,
+    help=(
+        'Keep an index of the scanned videos in the cache directory, '
+        'so unchanged videos are not guessed again on the next runs.'
+    ),
+)
+@click.option(
+    '--scan-workers',
+    type=click.IntRange(1, None),
+    default=None,
+    help='Number of processes used to guess the collected videos in parallel.',
+)
+@click.option(
+    '--walk-workers',
+    type=click.IntRange(1, 50),
+    default=None,
+    help='Number of threads used to walk the subdirectories of a directory in parallel.',
+)
 @click.option(
     '--use-absolute-path',
     type=click.Choice(['fallback', 'always', 'never']),
@@ -337,7 +467,22 @@ def download(
     category_suffix: bool,
     language_format: str,
     max_workers: int,
+    max_videos: int,
+    max_workers_per_provider: int,
+    stage_workers: Sequence[tuple[str, int]],
+    queue_size: int,
+    early_termination: bool,
+    hedge: bool,
+    time_budget: float | None,
+    adaptive_timeouts: bool,
+    negative_cache: bool,
+    bypass_negative_cache: bool,
+    listing_cache: bool,
+    early_init: bool,
     archives: bool,
+    scan_index: bool,
+    scan_workers: int | None,
+    walk_workers: int | None,
     use_absolute_path: str,
     name: str | None,
     verbose: int,
@@ -347,6 +492,9 @@ def download(
 
     PATH can be an directory containing videos, a video file path or a video file name. It can be used multiple times.
 
+    The videos stream through a pipeline (scan, local refine, network refine, list, download, save), so the first
+    subtitles are saved while the next videos are still scanned.
+
     If an existing subtitle is detected (external or embedded) in the correct language, the download is skipped for
     the associated video.
 
@@ -405,70 +553,264 @@ def download(
     # Convert to absolute path only with 'always'
     absolute_path = use_absolute_path == 'always'
 
-    # scan videos
-    videos = []
-    ignored_videos = []
-    errored_paths = []
-    with click.progressbar(path, label='Collecting videos', item_show_func=lambda p: p or '') as bar:
-        for p in bar:
-            if debug:
-                # print a new line, so the logs appear below the progressbar
-                click.echo()
-            # expand user in case an absolute path is provided
-            p = os.path.expanduser(p)
-            logger.debug('Collecting path %s', p)
-
-            # collect files from directory
-            collected_filepaths = [p]
-            if os.path.isdir(p):
-                # collect video files
-                try:
-                    collected_filepaths = collect_video_filepaths(p, age=age, archives=archives, use_ctime=use_ctime)
-                except ValueError:  # pragma: no cover
-                    logger.exception('Unexpected error while collecting directory path %s', p)
-                    errored_paths.append(p)
-                    continue
+    # the videos stream through the stages, each stage with its own threads
+    workers = dict.fromkeys(PIPELINE_STAGES, 1)
+    workers.update({'list': max_videos, 'download': max_videos})
+    workers.update(stage_workers)
+
+    # keep alive as many connections to a host as the concurrent requests to it
+    configure_connection_pools(
+        max(workers['list'], workers['download'], workers['network-refine']) * max_workers_per_provider
+    )
+
+    # skip the searches that recently found no subtitle, or refresh them when bypassed
+    nc = None
+    if negative_cache or bypass_negative_cache:
+        nc = NegativeCache(obj['negative_cache_path'], bypass=bypass_negative_cache)
+    # reuse the subtitles listed recently
+    lc = ListingCache() if listing_cache else None
+
+    # create the pool, initializing the providers while scanning if requested
+    pp = BatchProviderPool(
+        max_workers=max_workers,
+        max_workers_per_provider=max_workers_per_provider,
+        max_videos=max_videos,
+        providers=use_providers,
+        provider_configs=obj['provider_configs'],
+        initialize_early=early_init,
+        timeouts=(
+            Timeouts(time_budget, adaptive=adaptive_timeouts) if time_budget is not None or adaptive_timeouts else None
+        ),
+        negative_cache=nc,
+        listing_cache=lc,
+    )
 
-            # scan videos
-            video_candidates: list[Video] = []
-            for filepath in collected_filepaths:
-                # Try scanning the video at path
-                video = scan_video_path(filepath, absolute_path=absolute_path, name=name, verbose=verbose, debug=debug)
+    index = None
+    if scan_index:
+        index = ScanIndex(obj['scan_index_path'])
+    elif scan_workers is not None and scan_workers > 1:
+        # the guesses made in parallel are retrieved from a temporary index
+        index = ScanIndex(':memory:')
+
+    # the stages of the pipeline fill these lists from their threads
+    ignored_videos: list[Video] = []
+    errored_paths: list[str] = []
+    saved_counts: list[int] = []
+    echo_lock = threading.Lock()
+
+    def scan_videos(files: list[tuple[str, FileInfo | None]]) -> Iterator[Video]:
+        # scan the videos of a directory
+        video_candidates: list[Video] = []
+        for filepath, file_info in files:
+            # Try scanning the video at path
+            video = scan_video_path(
+                filepath,
+                absolute_path=absolute_path,
+                name=name,
+                file_info=file_info,
+                index=index,
+                verbose=verbose,
+                debug=debug,
+            )
+            if video is None:
+                # Fallback to scanning with absolute path
+                if use_absolute_path == 'fallback':
+                    video = scan_video_path(
+                        filepath,
+                        absolute_path=True,
+                        name=name,
+                        file_info=file_info,
+                        index=index,
+                        verbose=verbose,
+                        debug=debug,
+                    )
+                # Cannot scan the video
                 if video is None:
-                    # Fallback to scanning with absolute path
-                    if use_absolute_path == 'fallback':
-                        video = scan_video_path(
-                            filepath,
-                            absolute_path=True,
-                            name=name,
-                            verbose=verbose,
-                            debug=debug,
+                    errored_paths.append(filepath)
+                    continue
+
+            # Set the use_time attribute before refining
+            video.use_ctime = use_ctime
+            video_candidates.append(video)
+
+        # search external subtitles, listing the directory only once
+        if not force and not force_external_subtitles:
+            external_subtitles = search_external_subtitles_batch(
+                [video.name for video in video_candidates],
+                directory=directory,
+            )
+            for video in video_candidates:
+                video.subtitles.extend(external_subtitles[video.name].values())
+
+        # check videos
+        for video in video_candidates:
+            if check_video(video, languages=language_set, age=age, undefined=single):
+                yield video
+            else:
+                ignored_videos.append(video)
+
+    def refine_with(refiners: Sequence[str]) -> Callable[[Video], Iterator[Video]]:
+        def refine_video(video: Video) -> Iterator[Video]:
+            if refiners:
+                refine(
+                    video,
+                    refiners=refiners,
+                    refiner_configs=obj['refiner_configs'],
+                    embedded_subtitles=not force and not force_embedded_subtitles,
+                    providers=use_providers,
+                    languages=language_set,
+                )
+            yield video
+
+        return refine_video
+
+    def list_video_subtitles(v: Video) -> Iterator[tuple[Video, list[Subtitle]]]:
+        # the time budget of the video is shared with its downloads, it ends in download_video_subtitles
+        pp.start_video_budget(v)
+        try:
+            if early_termination:
+                subtitles = pp.list_best_subtitles(
+                    v,
+                    language_set - v.subtitle_languages,
+                    hearing_impaired=hearing_impaired_flag,
+                    foreign_only=foreign_only_flag,
+                    skip_wrong_fps=skip_wrong_fps,
+                    only_one=single,
+                    ignore_subtitles=ignore_subtitles,
+                )
+            else:
+                subtitles = pp.list_subtitles(v, language_set - v.subtitle_languages)
+        except BaseException:
+            pp.end_video_budget(v)
+            raise
+        yield v, subtitles
+
+    def download_video_subtitles(listed: tuple[Video, list[Subtitle]]) -> Iterator[tuple[Video, list[Subtitle]]]:
+        v, subtitles = listed
+        scores = get_scores(v)
+        try:
+            downloaded_subtitles = pp.download_best_subtitles(
+                subtitles,
+                v,
+                language_set,
+                min_score=scores['hash'] * min_score // 100,
+                hearing_impaired=hearing_impaired_flag,
+                foreign_only=foreign_only_flag,
+                skip_wrong_fps=skip_wrong_fps,
+                only_one=single,
+                ignore_subtitles=ignore_subtitles,
+                hedging=Hedging() if hedge else None,
+            )
+        finally:
+            pp.end_video_budget(v)
+        yield v, downloaded_subtitles
+
+    def save_video_subtitles(downloaded: tuple[Video, list[Subtitle]]) -> Iterator[None]:
+        v, subtitles = downloaded
+        saved_subtitles = save_subtitles(
+            v,
+            subtitles,
+            single=single,
+            directory=directory,
+            encoding=encoding,
+            subtitle_format=subtitle_format,
+            category_suffix=category_suffix,
+            language_format=language_format,
+        )
+        saved_counts.append(len(saved_subtitles))
+        # the subtitles are reported as soon as they are saved, then released
+        with echo_lock:
+            echo_saved_subtitles(v, saved_subtitles, verbose)
+        yield from ()
+
+    stages = [
+        Stage('scan', scan_videos, workers=workers['scan']),
+        Stage(
+            'local-refine',
+            refine_with([r for r in use_refiners if r in local_refiners]),
+            workers=workers['local-refine'],
+        ),
+        Stage(
+            'network-refine',
+            refine_with([r for r in use_refiners if r not in local_refiners]),
+            workers=workers['network-refine'],
+        ),
+    ]
+    # without providers, the videos are only scanned and refined
+    if use_providers:
+        stages += [
+            Stage('list', list_video_subtitles, workers=workers['list']),
+            Stage('download', download_video_subtitles, workers=workers['download']),
+            Stage('save', save_video_subtitles, workers=workers['save']),
+        ]
+    with pp:
+        with (
+            Pipeline(stages, queue_size=queue_size) as pipeline,
+            click.progressbar(path, label='Collecting videos', item_show_func=lambda p: p or '') as bar,
+        ):
+            for p in bar:
+                if debug:
+                    # print a new line, so the logs appear below the progressbar
+                    click.echo()
+                # expand user in case an absolute path is provided
+                p = os.path.expanduser(p)
+                logger.debug('Collecting path %s', p)
+
+                # collect files from directory
+                collected_files: list[tuple[str, FileInfo | None]] = [(p, None)]
+                if os.path.isdir(p):
+                    # collect video files
+                    try:
+                        collected_infos = collect_video_files(
+                            p,
+                            age=age,
+                            archives=archives,
+                            use_ctime=use_ctime,
+                            max_workers=walk_workers,
                         )
-                    # Cannot scan the video
-                    if video is None:
-                        errored_paths.append(filepath)
+                    except ValueError:  # pragma: no cover
+                        logger.exception('Unexpected error while collecting directory path %s', p)
+                        errored_paths.append(p)
                         continue
 
-                # Set the use_time attribute before refining
-                video.use_ctime = use_ctime
-                video_candidates.append(video)
+                    # guess the collected videos in parallel
+                    if index is not None and scan_workers is not None and scan_workers > 1:
+                        video_infos = [f for f in collected_infos if f.path.lower().endswith(VIDEO_EXTENSIONS)]
+                        # guess the same paths as scan_video_path
+                        index.guess_batch(
+                            video_infos,
+                            name=name,
+                            paths=[os.path.abspath(f.path) if absolute_path else f.path for f in video_infos],
+                            workers=scan_workers,
+                        )
+                    # Use the cached file information of the files collected from a directory
+                    collected_files = [(f.path, f) for f in collected_infos]
+
+                # send the files to the pipeline directory by directory, waiting while it is full
+                for _, files in itertools.groupby(collected_files, key=lambda f: os.path.dirname(f[0])):
+                    pipeline.put(list(files))
 
-            # check and refine videos
-            for video in video_candidates:
-                if not force and not force_external_subtitles:
-                    video.subtitles.extend(search_external_subtitles(video.name, directory=directory).values())
-                if check_video(video, languages=language_set, age=age, undefined=single):
-                    refine(
-                        video,
-                        refiners=use_refiners,
-                        refiner_configs=obj['refiner_configs'],
-                        embedded_subtitles=not force and not force_embedded_subtitles,
-                        providers=use_providers,
-                        languages=language_set,
-                    )
-                    videos.append(video)
-                else:
-                    ignored_videos.append(video)
+        if pp.discarded_providers:  # pragma: no cover
+            click.secho(
+                f'Some providers have been discarded due to unexpected errors: {", ".join(pp.discarded_providers)}',
+                fg='yellow',
+            )
+
+    connection_metrics.log()
+    http_cache = get_http_cache()
+    if http_cache is not None:
+        http_cache.log()
+
+    if nc is not None:
+        logger.info('Negative cache: %d searches skipped', nc.hits)
+        nc.close()
+
+    if lc is not None:
+        logger.info('Listing cache: %d listings reused, %d listings made', lc.hits, lc.misses)
+
+    if index is not None:
+        logger.info('Scan index: %d videos reused, %d videos guessed', index.hits, index.misses)
+        index.close()
 
     # output errored paths
     if verbose > 0:
@@ -488,17 +830,18 @@ def download(
                 msg += ' - not a video file'
             click.secho(msg, fg='yellow')
 
-    # report collected videos
+    # report collected videos, the videos that passed the checks were refined
+    collected_videos = pipeline.processed['local-refine']
     click.echo(
         '{} collected / {} ignored / {}'.format(
-            plural(len(videos), 'video', fg='green' if videos else None),
+            plural(collected_videos, 'video', fg='green' if collected_videos else None),
             plural(len(ignored_videos), 'video', fg='yellow' if ignored_videos else None),
             plural(len(errored_paths), 'error', fg='red' if errored_paths else None),
         ),
     )
 
     # exit if no video collected
-    if not videos:
+    if not collected_videos:
         return
 
     # exit if no providers are used
@@ -512,101 +855,57 @@ def download(
                 click.echo(f'All ignored from configuration: `ignore_provider={config_ignore}`')
         return
 
-    # download best subtitles
-    downloaded_subtitles = defaultdict(list)
-    with AsyncProviderPool(
-        max_workers=max_workers,
-        providers=use_providers,
-        provider_configs=obj['provider_configs'],
-    ) as pp:
-        with click.progressbar(
-            videos,
-            label='Downloading subtitles',
-            item_show_func=lambda v: os.path.split(v.name)[1] if v is not None else '',
-        ) as bar:
-            for v in bar:
-                if debug:
-                    # print a new line, so the logs appear below the progressbar
-                    click.echo()
-                scores = get_scores(v)
-                subtitles = pp.download_best_subtitles(
-                    pp.list_subtitles(v, language_set - v.subtitle_languages),
-                    v,
-                    language_set,
-                    min_score=scores['hash'] * min_score // 100,
-                    hearing_impaired=hearing_impaired_flag,
-                    foreign_only=foreign_only_flag,
-                    skip_wrong_fps=skip_wrong_fps,
-                    only_one=single,
-                    ignore_subtitles=ignore_subtitles,
-                )
-                downloaded_subtitles[v] = subtitles
+    # the pool waited for the ignored provider calls on exit
+    if verbose > 0 and pp.time_saved > 0:
+        click.echo(f'Stopping the listings early saved {pp.time_saved:.1f}s')
 
-        if pp.discarded_providers:  # pragma: no cover
-            click.secho(
-                f'Some providers have been discarded due to unexpected errors: {", ".join(pp.discarded_providers)}',
-                fg='yellow',
-            )
+    if verbose == 0:
+        click.echo(f'Downloaded {plural(sum(saved_counts), "subtitle")}')
 
-    # save subtitles
-    total_subtitles = 0
-    for v, subtitles in downloaded_subtitles.items():
-        saved_subtitles = save_subtitles(
-            v,
-            subtitles,
-            single=single,
-            directory=directory,
-            encoding=encoding,
-            subtitle_format=subtitle_format,
-            category_suffix=category_suffix,
-            language_format=language_format,
-        )
-        total_subtitles += len(saved_subtitles)
-
-        if verbose > 0:
-            click.echo(f'{plural(len(saved_subtitles), "subtitle")} downloaded for {os.path.split(v.name)[1]}')
-
-        if verbose > 1:
-            for s in saved_subtitles:
-                matches = s.get_matches(v)
-                score = compute_score(s, v)
-
-                # score color
-                score_color = None
-                scores = get_scores(v)
-                if isinstance(v, Movie):  # pragma: no cover
-                    if score < scores['title']:
-                        score_color = 'red'
-                    elif score < scores['title'] + scores['year'] + scores['release_group']:
-                        score_color = 'yellow'
-                    else:
-                        score_color = 'green'
-                elif isinstance(v, Episode):  # pragma: no cover
-                    if score < scores['series'] + scores['season'] + scores['episode']:
-                        score_color = 'red'
-                    elif score < scores['series'] + scores['season'] + scores['episode'] + scores['release_group']:
-                        score_color = 'yellow'
-                    else:
-                        score_color = 'green'
-
-                # scale score from 0 to 100
-                scaled_score = score * 100 / scores['hash']
-
-                # echo some nice colored output
-                language_str = (
-                    s.language.name if s.language.country is None else f'{s.language.name} ({s.language.country.name})'
-                )
-                click.echo(
-                    '  - [{score}] {language} subtitle from {provider_name} (match on {matches})'.format(
-                        score=click.style(f'{scaled_score:5.1f}', fg=score_color, bold=score >= scores['hash']),
-                        language=language_str,
-                        provider_name=s.provider_name,
-                        matches=', '.join(sorted(matches, key=lambda m: scores.get(m, 0), reverse=True)),
-                    ),
-                )
 
-    if verbose == 0:
-        click.echo(f'Downloaded {plural(total_subtitles, "subtitle")}')
+def echo_saved_subtitles(v: Video, saved_subtitles: Sequence[Subtitle], verbose: int) -> None:
+    """Report the subtitles saved for a video, with more details with a higher verbosity."""
+    if verbose > 0:
+        click.echo(f'{plural(len(saved_subtitles), "subtitle")} downloaded for {os.path.split(v.name)[1]}')
+
+    if verbose > 1:
+        for s in saved_subtitles:
+            matches = s.get_matches(v)
+            score = compute_score(s, v)
+
+            # score color
+            score_color = None
+            scores = get_scores(v)
+            if isinstance(v, Movie):  # pragma: no cover
+                if score < scores['title']:
+                    score_color = 'red'
+                elif score < scores['title'] + scores['year'] + scores['release_group']:
+                    score_color = 'yellow'
+                else:
+                    score_color = 'green'
+            elif isinstance(v, Episode):  # pragma: no cover
+                if score < scores['series'] + scores['season'] + scores['episode']:
+                    score_color = 'red'
+                elif score < scores['series'] + scores['season'] + scores['episode'] + scores['release_group']:
+                    score_color = 'yellow'
+                else:
+                    score_color = 'green'
+
+            # scale score from 0 to 100
+            scaled_score = score * 100 / scores['hash']
+
+            # echo some nice colored output
+            language_str = (
+                s.language.name if s.language.country is None else f'{s.language.name} ({s.language.country.name})'
+            )
+            click.echo(
+                '  - [{score}] {language} subtitle from {provider_name} (match on {matches})'.format(
+                    score=click.style(f'{scaled_score:5.1f}', fg=score_color, bold=score >= scores['hash']),
+                    language=language_str,
+                    provider_name=s.provider_name,
+                    matches=', '.join(sorted(matches, key=lambda m: scores.get(m, 0), reverse=True)),
+                ),
+            )
 
 
 def scan_video_path(
@@ -614,11 +913,13 @@ def scan_video_path(
     *,
     name: str | None = None,
     absolute_path: bool = False,
+    file_info: FileInfo | None = None,
+    index: ScanIndex | None = None,
     verbose: int = 0,
     debug: bool = False,
 ) -> Video | None:
     """Try to scan a video at path, with a option to convert to absolute path before."""
-    exists = os.path.exists(filepath)
+    exists = file_info is not None or os.path.exists(filepath)
     # Take the absolute path, and only if the path exists
     if absolute_path and exists:
         filepath = os.path.abspath(filepath)
@@ -626,7 +927,7 @@ def scan_video_path(
     filepath_or_name = f'{filepath} ({name})' if name else filepath
 
     try:
-        video = scan_path(filepath, name=name)
+        video = scan_path(filepath, name=name, file_info=file_info, index=index)
 
     except GuessingError as e:
         logger.exception(
@@ -2,20 +2,27 @@
 
 from __future__ import annotations
 
+import asyncio
 import itertools
 import logging
+import math
 import operator
 import os
-from collections import defaultdict
-from concurrent.futures import ThreadPoolExecutor
-from typing import TYPE_CHECKING, Any
+import threading
+import time
+from collections import defaultdict, deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from contextlib import AbstractContextManager, aclosing, contextmanager, nullcontext
+from typing import TYPE_CHECKING, Any, ClassVar, TypeVar
 
 from babelfish import Language  # type: ignore[import-untyped]
 
 from subliminal.utils import safely_guessit
 
 from .archives import ARCHIVE_ERRORS, ARCHIVE_EXTENSIONS, is_supported_archive, scan_archive
-from .exceptions import ArchiveError, DiscardingError
+from .circuit_breaker import CircuitBreaker, CircuitState
+from .exceptions import ArchiveError, AuthenticationError, ConfigurationError, DiscardingError
 from .extensions import (
     discarded_episode_refiners,
     discarded_movie_refiners,
@@ -25,35 +32,722 @@ from .extensions import (
     refiner_manager,
 )
 from .matches import fps_matches
+from .scan_index import ScanIndex
 from .score import compute_score as default_compute_score
+from .score import get_scores
 from .subtitle import SUBTITLE_EXTENSIONS, ExternalSubtitle, SubtitleCategory
-from .utils import get_age, handle_exception
+from .utils import FileInfo, handle_exception
 from .video import VIDEO_EXTENSIONS, Episode, Movie, Video
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator, Mapping, Sequence, Set
+    from collections.abc import AsyncGenerator, Callable, Generator, Iterable, Iterator, Mapping, Sequence, Set
     from datetime import timedelta
     from types import TracebackType
+    from typing import Self
 
+    from subliminal.listing_cache import ListingCache
+    from subliminal.negative_cache import NegativeCache
     from subliminal.providers import Provider
     from subliminal.score import ComputeScore
     from subliminal.subtitle import Subtitle
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar('T')
 
-class ProviderPool:
+#: Number of latencies kept by provider, for the listings and the downloads, see :class:`Hedging` and :class:`Timeouts`
+MAX_LATENCIES = 50
+
+
+def _score_subtitles(
+    subtitles: Sequence[Subtitle],
+    video: Video,
+    *,
+    hearing_impaired: bool | None = None,
+    foreign_only: bool | None = None,
+    skip_wrong_fps: bool = False,
+    compute_score: ComputeScore | None = None,
+    ignore_subtitles: Sequence[str] | None = None,
+) -> list[tuple[Subtitle, int]]:
+    """Filter the subtitles and sort them by score, best first, see :meth:`ProviderPool.download_best_subtitles`."""
+    compute_score = compute_score or default_compute_score
+    ignore_subtitles = ignore_subtitles or []
+
+    # ignore subtitles
+    subtitles = [s for s in subtitles if s.id not in ignore_subtitles]
+
+    # skip subtitles that do not match the FPS of the video (if defined)
+    if skip_wrong_fps and video.frame_rate is not None and video.frame_rate > 0:
+        subtitles = [s for s in subtitles if fps_matches(video, fps=s.fps, strict=False)]
+
+    # sort by hearing impaired and foreign only
+    category = SubtitleCategory.from_flags(hearing_impaired=hearing_impaired, foreign_only=foreign_only)
+    if category != SubtitleCategory.UNKNOWN:
+        logger.info('Sort subtitles by %s types first', category.value)
+        subtitles = sorted(
+            subtitles,
+            key=lambda s: s.category == category,
+            reverse=True,
+        )
+
+    # sort subtitles by score
+    return sorted(
+        [(s, compute_score(s, video)) for s in subtitles],
+        key=operator.itemgetter(1),
+        reverse=True,
+    )
+
+
+def _percentile(values: Sequence[float], percentile: float) -> float:
+    """Get the `percentile` of the `values`, with the nearest-rank method."""
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(percentile / 100 * len(ordered)) - 1)]
+
+
+def _remaining(deadline: float | None) -> float | None:
+    """Get the time remaining until the `deadline`, in seconds, or None without deadline."""
+    return None if deadline is None else max(0.0, deadline - time.monotonic())
+
+
+class Timeouts:
+    """Time budget of each video and adaptive timeouts of the providers, see :class:`ProviderPool`.
+
+    The time budget of a video covers a listing or a download of its subtitles, across all the providers, or all
+    the listings and downloads between :meth:`ProviderPool.start_video_budget` and
+    :meth:`ProviderPool.end_video_budget`, like :func:`download_best_subtitles` does. Once it is spent, the providers
+    are not called for the video anymore and the running calls are ignored.
+
+    With `adaptive`, the timeout of the requests of a provider is `factor` times the `percentile` of its latencies
+    in the current run, so a provider answering in 300 ms is not allowed to hang for 10 s. The timeout is never
+    above the timeout configured for the provider, nor above the remaining time budget of the video.
+
+    .. note::
+        The timeouts only apply to the providers with a :attr:`~subliminal.providers.Provider.timeout`.
+
+    :param float video_budget: time budget of each video, in seconds, or None for no budget.
+    :param bool adaptive: adapt the timeouts to the latencies of the providers.
+    :param float percentile: percentile of the latencies of the provider, from 0 to 100.
+    :param float factor: multiplier of the percentile of the latencies.
+    :param float min_timeout: minimum adaptive timeout, in seconds.
+    :param int min_samples: minimum number of latencies to adapt the timeout.
+
+    """
+
+    __slots__ = ('adaptive', 'factor', 'min_samples', 'min_timeout', 'percentile', 'video_budget')
+
+    #: Time budget of each video, in seconds
+    video_budget: float | None
+
+    #: Adapt the timeouts to the latencies of the providers
+    adaptive: bool
+
+    #: Percentile of the latencies of the provider
+    percentile: float
+
+    #: Multiplier of the percentile of the latencies
+    factor: float
+
+    #: Minimum adaptive timeout, in seconds
+    min_timeout: float
+
+    #: Minimum number of latencies to adapt the timeout
+    min_samples: int
+
+    def __init__(
+        self,
+        video_budget: float | None = None,
+        *,
+        adaptive: bool = True,
+        percentile: float = 95,
+        factor: float = 3.0,
+        min_timeout: float = 2.0,
+        min_samples: int = 5,
+    ) -> None:
+        self.video_budget = video_budget
+        self.adaptive = adaptive
+        self.percentile = min(100, max(0, percentile))
+        self.factor = factor
+        self.min_timeout = min_timeout
+        self.min_samples = max(1, min_samples)
+
+    def __repr__(self) -> str:
+        return (
+            f'<{self.__class__.__name__} video_budget={self.video_budget!r}, adaptive={self.adaptive!r}, '
+            f'percentile={self.percentile!r}, factor={self.factor!r}>'
+        )
+
+    def get_timeout(
+        self,
+        latencies: Sequence[float],
+        default: float | None = None,
+        deadline: float | None = None,
+    ) -> float | None:
+        """Get the timeout of the requests of a provider.
+
+        :param latencies: the last latencies of the provider, in seconds.
+        :param default: the timeout configured for the provider, in seconds.
+        :param deadline: the end of the time budget of the video, from :func:`time.monotonic`.
+        :return: the timeout, in seconds, or None for no timeout.
+        :rtype: float
+
+        """
+        timeout = default
+        if self.adaptive and len(latencies) >= self.min_samples:
+            adapted = max(self.min_timeout, self.factor * _percentile(latencies, self.percentile))
+            timeout = adapted if timeout is None else min(timeout, adapted)
+        remaining = _remaining(deadline)
+        if remaining is not None:
+            timeout = remaining if timeout is None else min(timeout, remaining)
+        return timeout
+
+
+class Hedging:
+    """Settings of the hedged downloads, see :meth:`ProviderPool.download_best_subtitles`.
+
+    While the best subtitle of a language is downloading, the runner-up is downloaded speculatively if:
+
+        * the runner-up is from another provider and its score is within `score_margin` of the best score,
+        * or the download takes longer than the `percentile` of the download latencies of the provider.
+
+    The runner-up is never downloaded speculatively from a provider with a known download quota at or below
+    `min_quota`, see :attr:`~subliminal.ratelimit.RateLimiter.quota`.
+
+    :param int score_margin: maximum score difference for a runner-up of another provider to be downloaded at once.
+    :param float percentile: percentile of the download latencies of the provider, from 0 to 100.
+    :param float delay: delay before downloading the runner-up while the provider has less than `min_samples`
+        download latencies, in seconds.
+    :param int min_samples: minimum number of download latencies to use the `percentile`.
+    :param int min_quota: minimum remaining quota of the provider of the runner-up.
+
+    """
+
+    __slots__ = ('delay', 'min_quota', 'min_samples', 'percentile', 'score_margin')
+
+    #: Maximum score difference for a runner-up of another provider to be downloaded at once
+    score_margin: int
+
+    #: Percentile of the download latencies of the provider
+    percentile: float
+
+    #: Delay before downloading the runner-up without enough download latencies, in seconds
+    delay: float
+
+    #: Minimum number of download latencies to use the percentile
+    min_samples: int
+
+    #: Minimum remaining quota of the provider of the runner-up
+    min_quota: int
+
+    def __init__(
+        self,
+        *,
+        score_margin: int = 5,
+        percentile: float = 90,
+        delay: float = 2.0,
+        min_samples: int = 5,
+        min_quota: int = 10,
+    ) -> None:
+        self.score_margin = score_margin
+        self.percentile = min(100, max(0, percentile))
+        self.delay = delay
+        self.min_samples = max(1, min_samples)
+        self.min_quota = min_quota
+
+    def __repr__(self) -> str:
+        return (
+            f'<{self.__class__.__name__} score_margin={self.score_margin!r}, percentile={self.percentile!r}, '
+            f'delay={self.delay!r}>'
+        )
+
+    def get_delay(self, latencies: Sequence[float]) -> float:
+        """Get the delay before downloading the runner-up, from the download latencies of the provider.
+
+        :param latencies: the last download latencies of the provider, in seconds.
+        :return: the delay, in seconds.
+        :rtype: float
+
+        """
+        if len(latencies) < self.min_samples:
+            return self.delay
+        return _percentile(latencies, self.percentile)
+
+    def allows(self, provider: str) -> bool:
+        """Check if the quota of the `provider` allows speculative downloads."""
+        quota = provider_manager[provider].plugin.get_rate_limiter().quota
+        return quota is None or quota > self.min_quota
+
+
+class _DownloadGroup:
+    """Candidates of a language, the downloads that are started and their results."""
+
+    __slots__ = ('candidates', 'results', 'started', 'winner')
+
+    def __init__(self) -> None:
+        self.candidates: deque[tuple[Subtitle, int]] = deque()
+        self.started: list[tuple[Subtitle, int]] = []
+        self.results: dict[int, bool] = {}
+        self.winner: Subtitle | None = None
+
+    @property
+    def pending(self) -> list[tuple[Subtitle, int]]:
+        return [(subtitle, score) for subtitle, score in self.started if id(subtitle) not in self.results]
+
+    @property
+    def done(self) -> bool:
+        return self.winner is not None or (not self.candidates and not self.pending)
+
+    def resolve(self) -> None:
+        """Pick the first valid subtitle, unless a download that ranks higher is still running."""
+        for subtitle, _ in self.started:
+            downloaded = self.results.get(id(subtitle))
+            if downloaded is None:
+                return
+            if downloaded:
+                self.winner = subtitle
+                return
+
+
+class _DownloadScheduler:
+    """Schedule the downloads of :meth:`ProviderPool.download_best_subtitles`.
+
+    The candidates are grouped by language, or in a single group with `only_one`. The best candidate of each
+    group is downloaded at once and the next candidate is downloaded if it fails. With `hedging`, the next
+    candidate is also downloaded speculatively, see :class:`Hedging`.
+
+    :param candidates: the subtitles with their scores, best first.
+    :param bool only_one: download only one subtitle, not one per language.
+    :param hedging: settings of the hedged downloads, if any.
+    :param latencies: the last download latencies, by provider.
+
+    """
+
+    def __init__(
+        self,
+        candidates: Sequence[tuple[Subtitle, int]],
+        *,
+        only_one: bool = False,
+        hedging: Hedging | None = None,
+        latencies: Mapping[str, Sequence[float]] | None = None,
+    ) -> None:
+        self.hedging = hedging
+        self.latencies = latencies or {}
+        self.ranks = {id(subtitle): rank for rank, (subtitle, _) in enumerate(candidates)}
+        self.start_times: dict[int, float] = {}
+        self.groups: dict[Language | None, _DownloadGroup] = {}
+        for subtitle, score in candidates:
+            key = None if only_one else subtitle.language
+            self.groups.setdefault(key, _DownloadGroup()).candidates.append((subtitle, score))
+        self._group_of = {id(s): group for group in self.groups.values() for s, _ in group.candidates}
+
+    @property
+    def finished(self) -> bool:
+        """All the groups have a downloaded subtitle or no candidate left."""
+        return all(group.done for group in self.groups.values())
+
+    @property
+    def downloaded(self) -> list[Subtitle]:
+        """The downloaded subtitles, best first."""
+        winners = [group.winner for group in self.groups.values() if group.winner is not None]
+        return sorted(winners, key=lambda subtitle: self.ranks[id(subtitle)])
+
+    def _start(self, group: _DownloadGroup, now: float) -> Subtitle:
+        subtitle, score = group.candidates.popleft()
+        group.started.append((subtitle, score))
+        self.start_times[id(subtitle)] = now
+        return subtitle
+
+    def _hedge_deadline(self, group: _DownloadGroup) -> float | None:
+        """Time to download the runner-up of the `group` speculatively, or None."""
+        if self.hedging is None or group.done or not group.candidates:
+            return None
+
+        # hedge once, while only the last started download is running
+        pending = group.pending
+        if len(pending) != 1 or pending[0] != group.started[-1]:
+            return None
+        current, score = pending[0]
+        runner_up, runner_up_score = group.candidates[0]
+        if not self.hedging.allows(runner_up.provider_name):
+            return None
+
+        started_at = self.start_times[id(current)]
+        if runner_up.provider_name != current.provider_name and score - runner_up_score <= self.hedging.score_margin:
+            return started_at
+        return started_at + self.hedging.get_delay(self.latencies.get(current.provider_name, ()))
+
+    def update(self, now: float) -> list[Subtitle]:
+        """Start the downloads that are due.
+
+        :param float now: the current time, from :func:`time.monotonic`.
+        :return: the subtitles to download.
+        :rtype: list of :class:`~subliminal.subtitle.Subtitle`
+
+        """
+        subtitles = []
+        for group in self.groups.values():
+            if group.done:
+                continue
+
+            # fall back on the next candidate
+            if not group.pending:
+                subtitles.append(self._start(group, now))
+
+            deadline = self._hedge_deadline(group)
+            if deadline is not None and now >= deadline:
+                runner_up = self._start(group, now)
+                logger.info('Downloading subtitle %r speculatively', runner_up)
+                subtitles.append(runner_up)
+
+        return subtitles
+
+    def complete(self, subtitle: Subtitle, downloaded: bool, now: float) -> list[Subtitle]:  # noqa: FBT001
+        """Record the result of a download and start the downloads that are due, see :meth:`update`."""
+        group = self._group_of[id(subtitle)]
+        group.results[id(subtitle)] = downloaded
+        group.resolve()
+        return self.update(now)
+
+    def next_deadline(self) -> float | None:
+        """Time of the next speculative download, or None."""
+        deadlines = [d for d in map(self._hedge_deadline, self.groups.values()) if d is not None]
+        return min(deadlines, default=None)
+
+
+class _ScoreCeiling:
+    """Languages with a subtitle at the maximum score, to stop listing subtitles when no better subtitle can be found.
+
+    The parameters are the same as :func:`_score_subtitles`, so the subtitles are scored like they will be
+    for the download.
+
+    """
+
+    def __init__(
+        self,
+        video: Video,
+        languages: Set[Language],
+        *,
+        only_one: bool = False,
+        hearing_impaired: bool | None = None,
+        foreign_only: bool | None = None,
+        skip_wrong_fps: bool = False,
+        compute_score: ComputeScore | None = None,
+        ignore_subtitles: Sequence[str] | None = None,
+    ) -> None:
+        self.video = video
+        self.languages = set(languages)
+        self.only_one = only_one
+        self.max_score = get_scores(video)['hash']
+        self.category = SubtitleCategory.from_flags(hearing_impaired=hearing_impaired, foreign_only=foreign_only)
+        self.score_kwargs: dict[str, Any] = {
+            'hearing_impaired': hearing_impaired,
+            'foreign_only': foreign_only,
+            'skip_wrong_fps': skip_wrong_fps,
+            'compute_score': compute_score,
+            'ignore_subtitles': ignore_subtitles,
+        }
+        self.found: set[Language] = set()
+
+    def add(self, subtitles: Sequence[Subtitle]) -> bool:
+        """Score the `subtitles` and return `True` if the maximum score is reached for all the languages."""
+        for subtitle, score in _score_subtitles(subtitles, self.video, **self.score_kwargs):
+            # a subtitle of the preferred category ranks first among the subtitles with the same score
+            if score >= self.max_score and self.category in (SubtitleCategory.UNKNOWN, subtitle.category):
+                self.found.add(subtitle.language)
+
+        if self.only_one:
+            return bool(self.found & self.languages)
+        return self.languages <= self.found
+
+
+def _measure_ignored_calls(
+    futures: Sequence[Future[Any] | asyncio.Future[Any]],
+    add_time_saved: Callable[[float], None],
+) -> None:
+    """Call `add_time_saved` as the ignored calls complete, with the wall time they would have been waited for."""
+    stopped_at = time.perf_counter()
+    longest = 0.0
+    lock = threading.Lock()
+
+    def done(_future: Any) -> None:
+        nonlocal longest
+        with lock:
+            elapsed = time.perf_counter() - stopped_at
+            if elapsed > longest:
+                add_time_saved(elapsed - longest)
+                longest = elapsed
+
+    for future in futures:
+        future.add_done_callback(done)
+
+
+def _record_failure(breaker: CircuitBreaker, error: Exception) -> None:
+    """Record a failed provider call, configuration errors open the circuit for good and discarding errors trip it."""
+    breaker.record_failure(
+        trip=isinstance(error, DiscardingError),
+        permanent=isinstance(error, (AuthenticationError, ConfigurationError)),
+    )
+
+
+def _call_timeout(
+    timeouts: Timeouts | None,
+    provider: Provider,
+    latencies: Sequence[float],
+    deadline: float | None,
+) -> AbstractContextManager[None]:
+    """Adapt the timeout of a call to the `provider` to its `latencies` and the `deadline` of the video."""
+    if timeouts is None:
+        return nullcontext()
+    return provider.call_timeout(timeouts.get_timeout(latencies, provider.timeout, deadline))
+
+
+def _provider_wait_time(name: str) -> float:
+    """Time to wait before the provider can send a request, to call the available providers first."""
+    return provider_manager[name].plugin.get_rate_limiter().wait_time  # type: ignore[no-any-return]
+
+
+def _distribute_subtitles(
+    videos: Sequence[Video],
+    results: Iterable[tuple[str, Sequence[Video], list[list[Subtitle]] | None]],
+) -> list[list[Subtitle]]:
+    """Distribute the subtitles listed by the providers for each group of videos to the videos, in order."""
+    subtitles: dict[Video, list[Subtitle]] = {video: [] for video in videos}
+    for name, group, group_subtitles in results:
+        # discard provider that failed
+        if group_subtitles is None:
+            logger.info('Discarding provider %s', name)
+            continue
+
+        # add the subtitles of each video
+        for video, video_subtitles in zip(group, group_subtitles, strict=True):
+            subtitles[video].extend(video_subtitles)
+
+    return [subtitles[video] for video in videos]
+
+
+class _Listing:
+    """A call listing the subtitles of videos with a provider, see :meth:`_ListingSteps._prepare_listing`."""
+
+    __slots__ = ('breaker', 'cached_languages', 'deadline', 'indices', 'languages', 'subtitles', 'video_languages')
+
+    #: Subtitles of each video, the subtitles listed recently until the result of the call is recorded
+    subtitles: list[list[Subtitle]]
+
+    #: Indices of the videos listed with the provider, empty if the provider is not called
+    indices: list[int]
+
+    #: Languages to search for, for each listed video
+    video_languages: dict[int, Set[Language]]
+
+    #: Languages of the subtitles listed recently, for each listed video
+    cached_languages: dict[int, Set[Language]]
+
+    #: Languages to search for, over all the listed videos
+    languages: Set[Language]
+
+    #: End of the time budget of the listed videos
+    deadline: float | None
+
+    #: Circuit breaker of the provider
+    breaker: CircuitBreaker
+
+    def __init__(self, count: int, breaker: CircuitBreaker) -> None:
+        self.subtitles = [[] for _ in range(count)]
+        self.indices = []
+        self.video_languages = {}
+        self.cached_languages = {}
+        self.languages = set()
+        self.deadline = None
+        self.breaker = breaker
+
+
+class _ListingSteps:
+    """Steps around the listings of the providers, shared by :class:`ProviderPool` and :class:`AsyncioProviderPool`."""
+
+    circuit_breakers: dict[str, CircuitBreaker]
+    timeouts: Timeouts | None
+    negative_cache: NegativeCache | None
+    listing_cache: ListingCache | None
+    _deadlines: dict[str, tuple[float, int]]
+    _deadlines_lock: threading.Lock
+
+    def _circuit_breaker(self, name: str) -> CircuitBreaker:
+        return self.circuit_breakers.setdefault(name, CircuitBreaker(name))
+
+    def start_video_budget(self, video: Video) -> None:
+        """Start the time budget of the `video`, if it is not started, until the matching :meth:`end_video_budget`.
+
+        The listings and the downloads of the video in between share its time budget, see :class:`Timeouts`.
+
+        :param video: the video.
+        :type video: :class:`~subliminal.video.Video`
+
+        """
+        if self.timeouts is None or self.timeouts.video_budget is None:
+            return
+        with self._deadlines_lock:
+            deadline, users = self._deadlines.get(video.name, (time.monotonic() + self.timeouts.video_budget, 0))
+            self._deadlines[video.name] = (deadline, users + 1)
+
+    def end_video_budget(self, video: Video) -> None:
+        """End the time budget of the `video` started by :meth:`start_video_budget`.
+
+        :param video: the video.
+        :type video: :class:`~subliminal.video.Video`
+
+        """
+        with self._deadlines_lock:
+            if video.name not in self._deadlines:
+                return
+            deadline, users = self._deadlines[video.name]
+            if users > 1:
+                self._deadlines[video.name] = (deadline, users - 1)
+            else:
+                del self._deadlines[video.name]
+
+    @contextmanager
+    def video_budget(self, *videos: Video) -> Iterator[None]:
+        """Share the time budget of the `videos` between the listings and the downloads in the `with` block.
+
+        :param videos: the videos.
+        :type videos: :class:`~subliminal.video.Video`
+
+        """
+        for video in videos:
+            self.start_video_budget(video)
+        try:
+            yield
+        finally:
+            for video in videos:
+                self.end_video_budget(video)
+
+    def _get_deadline(self, video: Video) -> float | None:
+        """Get the end of the time budget of the `video`, if started."""
+        with self._deadlines_lock:
+            entry = self._deadlines.get(video.name)
+        return entry[0] if entry is not None else None
+
+    def _prepare_listing(self, provider: str, videos: Sequence[Video], languages: Set[Language]) -> _Listing:
+        """Prepare a call listing the subtitles of the `videos` with the `provider`.
+
+        The videos and languages are checked against the provider, the videos with a spent time budget and the
+        searches that recently found no subtitle are skipped, the subtitles listed recently are reused, and the
+        circuit breaker of the provider is checked.
+
+        :return: the listing, without video to list if the provider must not be called.
+        :rtype: :class:`_Listing`
+
+        """
+        listing = _Listing(len(videos), self._circuit_breaker(provider))
+
+        # check videos validity and their time budget
+        indices = []
+        deadlines = []
+        for i, video in enumerate(videos):
+            if not provider_manager[provider].plugin.check(video):  # type: ignore[attr-defined]
+                logger.info('Skipping provider %r for %r: not a valid video', provider, video)
+                continue
+            deadline = self._get_deadline(video)
+            if _remaining(deadline) == 0:
+                logger.info('Skipping provider %r for %r: time budget of the video is spent', provider, video)
+                continue
+            indices.append(i)
+            if deadline is not None:
+                deadlines.append(deadline)
+        if not indices:
+            return listing
+
+        # check supported languages
+        provider_languages = provider_manager[provider].plugin.check_languages(languages)  # type: ignore[attr-defined]
+        if not provider_languages:
+            logger.info('Skipping provider %r: no language to search for', provider)
+            return listing
+
+        # skip the languages that the provider recently found no subtitle of, for each video
+        video_languages = dict.fromkeys(indices, provider_languages)
+        if self.negative_cache is not None:
+            for i in indices:
+                video_languages[i] = self.negative_cache.filter_languages(provider, videos[i], provider_languages)
+            indices = [i for i in indices if video_languages[i]]
+            if not indices:
+                logger.info('Skipping provider %r: no subtitle found recently', provider)
+                return listing
+
+        # reuse the subtitles listed recently, for each video
+        if self.listing_cache is not None:
+            for i in indices:
+                listing.subtitles[i], missing = self.listing_cache.get(provider, videos[i], video_languages[i])
+                listing.cached_languages[i] = set(video_languages[i]) - missing
+                video_languages[i] = missing
+            indices = [i for i in indices if video_languages[i]]
+            if not indices:
+                logger.info('Using the subtitles listed recently by provider %r', provider)
+                return listing
+
+        # check the circuit breaker
+        if not listing.breaker.allow():
+            logger.info('Skipping provider %r: circuit is %s', provider, listing.breaker.state.value)
+            return listing
+
+        listing.indices = indices
+        listing.video_languages = video_languages
+        listing.languages = set().union(*(video_languages[i] for i in indices))
+        listing.deadline = min(deadlines, default=None)
+        return listing
+
+    def _record_listing(
+        self,
+        provider: str,
+        videos: Sequence[Video],
+        listing: _Listing,
+        batch: Sequence[Sequence[Subtitle]],
+    ) -> list[list[Subtitle]]:
+        """Record the subtitles listed by a successful call, in the caches of the pool.
+
+        :param batch: the subtitles of each listed video, in the order of :attr:`_Listing.indices`.
+        :return: the subtitles of each video, with the subtitles listed recently.
+        :rtype: list of list of :class:`~subliminal.subtitle.Subtitle`
+
+        """
+        listing.breaker.record_success()
+        for i, video_subtitles in zip(listing.indices, batch, strict=True):
+            # the languages taken from the cache are not added twice
+            if listing.cached_languages.get(i):
+                video_subtitles = [s for s in video_subtitles if s.language not in listing.cached_languages[i]]
+            listing.subtitles[i] += video_subtitles
+            if self.negative_cache is not None:
+                self.negative_cache.record(provider, videos[i], listing.video_languages[i], video_subtitles)
+            if self.listing_cache is not None:
+                self.listing_cache.set(provider, videos[i], listing.video_languages[i], video_subtitles)
+        return listing.subtitles
+
+
+class ProviderPool(_ListingSteps):
     """A pool of providers with the same API as a single :class:`~subliminal.providers.Provider`.
 
     It has a few extra features:
 
         * Lazy loads providers when needed and supports the `with` statement to :meth:`terminate`
           the providers on exit.
-        * Automatically discard providers on failure.
+        * Optionally initializes the providers in background threads as soon as it is created,
+          see :meth:`initialize_providers`.
+        * Automatically discard providers on failure, with a circuit breaker per provider that lets them
+          back after a cooldown, see :mod:`subliminal.circuit_breaker`.
+        * Optionally enforces a time budget for each video and adapts the timeouts of the providers to their
+          latencies, see :class:`Timeouts`.
+        * Optionally skips the searches that recently found no subtitle, see
+          :class:`~subliminal.negative_cache.NegativeCache`, and reuses the subtitles listed recently, see
+          :class:`~subliminal.listing_cache.ListingCache`.
 
     :param list providers: name of providers to use, if not all.
     :param dict provider_configs: provider configuration as keyword arguments per provider name to pass when
         instantiating the :class:`~subliminal.providers.Provider`.
+    :param bool initialize_early: start initializing all the providers in background threads.
+    :param timeouts: time budget of each video and adaptive timeouts of the providers, if any.
+    :type timeouts: :class:`Timeouts`
+    :param negative_cache: cache of the searches that found no subtitle, if any.
+    :type negative_cache: :class:`~subliminal.negative_cache.NegativeCache`
+    :param listing_cache: cache of the subtitles listed by the providers, if any.
+    :type listing_cache: :class:`~subliminal.listing_cache.ListingCache`
 
     """
 
@@ -66,20 +760,61 @@ class ProviderPool:
     #: Initialized providers
     initialized_providers: dict[str, Provider]
 
-    #: Discarded providers
-    discarded_providers: set[str]
+    #: Circuit breakers of the providers, by name
+    circuit_breakers: dict[str, CircuitBreaker]
+
+    #: Wall time saved by stopping the listings early, in seconds, see :meth:`list_best_subtitles`
+    time_saved: float
+
+    #: Last download latencies, by provider, in seconds
+    download_latencies: dict[str, deque[float]]
+
+    #: Last listing latencies, by provider, in seconds
+    list_latencies: dict[str, deque[float]]
+
+    #: Time budget of each video and adaptive timeouts of the providers
+    timeouts: Timeouts | None
+
+    #: Cache of the searches that found no subtitle
+    negative_cache: NegativeCache | None
+
+    #: Cache of the subtitles listed by the providers
+    listing_cache: ListingCache | None
+
+    #: The downloads run concurrently, so they can be hedged, see :meth:`download_best_subtitles`
+    concurrent_downloads: ClassVar[bool] = False
 
     def __init__(
         self,
         providers: Sequence[str] | None = None,
         provider_configs: Mapping[str, Any] | None = None,
+        *,
+        initialize_early: bool = False,
+        timeouts: Timeouts | None = None,
+        negative_cache: NegativeCache | None = None,
+        listing_cache: ListingCache | None = None,
     ) -> None:
         self.providers = providers if providers is not None else get_default_providers()
         self.provider_configs = provider_configs or {}
         self.initialized_providers = {}
-        self.discarded_providers = set()
-
-    def __enter__(self) -> ProviderPool:
+        self.circuit_breakers = {name: CircuitBreaker(name) for name in self.providers}
+        self.time_saved = 0.0
+        self._time_saved_lock = threading.Lock()
+        self.download_latencies = defaultdict(lambda: deque(maxlen=MAX_LATENCIES))
+        self.list_latencies = defaultdict(lambda: deque(maxlen=MAX_LATENCIES))
+        self.timeouts = timeouts
+        self.negative_cache = negative_cache
+        self.listing_cache = listing_cache
+        self._deadlines: dict[str, tuple[float, int]] = {}
+        self._deadlines_lock = threading.Lock()
+        self._provider_locks: dict[str, threading.Lock] = {}
+        self._provider_locks_lock = threading.Lock()
+        self._initialization_errors: dict[str, Exception] = {}
+        self._initializer: ThreadPoolExecutor | None = None
+        if initialize_early:
+            self.initialize_providers()
+
+    def __enter__(self) -> Self:
         return self
 
     def __exit__(
@@ -90,18 +825,59 @@ class ProviderPool:
     ) -> None:
         self.terminate()
 
+    @property
+    def discarded_providers(self) -> set[str]:
+        """Providers with an open circuit, they are not called until their :attr:`circuit_breakers` are half-open."""
+        return {name for name, breaker in self.circuit_breakers.items() if breaker.state == CircuitState.OPEN}
+
     def __getitem__(self, name: str) -> Provider:
         if name not in self.providers:
             raise KeyError
 
-        if name not in self.initialized_providers:
-            logger.info('Initializing provider %s', name)
-            provider = provider_manager[name].plugin(**self.provider_configs.get(name, {}))
-            provider.initialize()
-            self.initialized_providers[name] = provider
+        # concurrent callers wait for a single initialization
+        with self._get_provider_lock(name):
+            if name not in self.initialized_providers:
+                # raise the error of the initialization in background
+                error = self._initialization_errors.pop(name, None)
+                if error is not None:
+                    raise error
+
+                logger.info('Initializing provider %s', name)
+                provider = provider_manager[name].plugin(**self.provider_configs.get(name, {}))
+                provider.initialize()
+                self.initialized_providers[name] = provider
 
         return self.initialized_providers[name]
 
+    def _get_provider_lock(self, name: str) -> threading.Lock:
+        with self._provider_locks_lock:
+            return self._provider_locks.setdefault(name, threading.Lock())
+
+    def _initialize_provider(self, name: str) -> None:
+        try:
+            self[name]
+        except Exception as e:  # noqa: BLE001
+            # the error is raised when the provider is used
+            logger.debug('Provider %s failed to initialize in background: %r', name, e)
+            self._initialization_errors[name] = e
+
+    def initialize_providers(self) -> None:
+        """Start initializing all the :attr:`providers` in background threads, without waiting.
+
+        It is typically called while the videos are scanned, so the logins overlap with the scanning.
+        A provider used while it is initializing waits for its initialization, and an initialization error
+        is raised on first use.
+
+        """
+        if self._initializer is not None:
+            return
+        names = [name for name in self.providers if name not in self.initialized_providers]
+        if not names:
+            return
+        self._initializer = ThreadPoolExecutor(len(names), thread_name_prefix='subliminal-init')
+        for name in names:
+            self._initializer.submit(self._initialize_provider, name)
+
     def __delitem__(self, name: str) -> None:
         if name not in self.initialized_providers:
             raise KeyError(name)
@@ -131,31 +907,31 @@ class ProviderPool:
         :rtype: list of :class:`~subliminal.subtitle.Subtitle` or None
 
         """
-        # check video validity
-        if not provider_manager[provider].plugin.check(video):  # type: ignore[attr-defined]
-            logger.info('Skipping provider %r: not a valid video', provider)
-            return []
-
-        # check supported languages
-        provider_languages = provider_manager[provider].plugin.check_languages(languages)  # type: ignore[attr-defined]
-        if not provider_languages:
-            logger.info('Skipping provider %r: no language to search for', provider)
-            return []
-
-        # list subtitles
-        logger.info('Listing subtitles with provider %r and languages %r', provider, provider_languages)
-        try:
-            subtitles = self[provider].list_subtitles(video, provider_languages)
-        except DiscardingError as e:
-            handle_exception(e, f'Provider {provider}')
-            # return None to discard this provider with a known error
-            return None
-        except Exception as e:  # noqa: BLE001  # pragma: no cover
-            handle_exception(e, f'Provider {provider}')
-            # return [] so the provider is not discarded with unknown error
-            return []
+        with self.video_budget(video):
+            listing = self._prepare_listing(provider, [video], languages)
+            if not listing.indices:
+                return listing.subtitles[0]
 
-        return subtitles
+            # list subtitles
+            logger.info('Listing subtitles with provider %r and languages %r', provider, listing.languages)
+            try:
+                instance = self[provider]
+                started_at = time.monotonic()
+                with _call_timeout(self.timeouts, instance, self.list_latencies[provider], listing.deadline):
+                    subtitles = instance.list_subtitles(video, listing.languages)
+            except DiscardingError as e:
+                handle_exception(e, f'Provider {provider}')
+                _record_failure(listing.breaker, e)
+                # return None to discard this provider with a known error
+                return None
+            except Exception as e:  # noqa: BLE001  # pragma: no cover
+                handle_exception(e, f'Provider {provider}')
+                _record_failure(listing.breaker, e)
+                # return [] so the provider is not discarded with unknown error
+                return []
+
+            self.list_latencies[provider].append(time.monotonic() - started_at)
+            return self._record_listing(provider, [video], listing, [subtitles])[0]
 
     def list_subtitles(self, video: Video, languages: Set[Language]) -> list[Subtitle]:
         """List subtitles.
@@ -170,25 +946,1097 @@ class ProviderPool:
         """
         subtitles = []
 
-        for name in self.providers:
-            # check discarded providers
-            if name in self.discarded_providers:
-                logger.debug('Skipping discarded provider %r', name)
+        for name, provider_subtitles in self.list_subtitles_as_completed(video, languages):
+            # discard provider that failed
+            if provider_subtitles is None:
+                logger.info('Discarding provider %s', name)
                 continue
 
-            # list subtitles
-            provider_subtitles = self.list_subtitles_provider(name, video, languages)
-            if provider_subtitles is None:
-                logger.info('Discarding provider %s', name)
-                self.discarded_providers.add(name)
-                continue
+            # add the subtitles
+            subtitles.extend(provider_subtitles)
+
+        return subtitles
+
+    def list_subtitles_provider_batch(
+        self,
+        provider: str,
+        videos: Sequence[Video],
+        languages: Set[Language],
+    ) -> list[list[Subtitle]] | None:
+        """List subtitles of many videos with a single call to a provider.
+
+        The videos and languages are checked against the provider, and the videos with a spent time budget
+        are skipped, see :meth:`~subliminal.providers.Provider.list_subtitles_batch`.
+
+        :param str provider: name of the provider.
+        :param videos: videos to list subtitles for, typically the episodes of a season.
+        :type videos: list of :class:`~subliminal.video.Video`
+        :param languages: languages to search for.
+        :type languages: set of :class:`~babelfish.language.Language`
+        :return: found subtitles of each video, in the order of the `videos`, or None if there was an error and
+            the provider should be discarded.
+        :rtype: list of list of :class:`~subliminal.subtitle.Subtitle` or None
+
+        """
+        with self.video_budget(*videos):
+            listing = self._prepare_listing(provider, videos, languages)
+            if not listing.indices:
+                return listing.subtitles
+
+            # list subtitles
+            logger.info(
+                'Listing subtitles of %d video(s) with provider %r and languages %r',
+                len(listing.indices),
+                provider,
+                listing.languages,
+            )
+            try:
+                instance = self[provider]
+                started_at = time.monotonic()
+                with _call_timeout(self.timeouts, instance, self.list_latencies[provider], listing.deadline):
+                    batch = instance.list_subtitles_batch([videos[i] for i in listing.indices], listing.languages)
+            except DiscardingError as e:
+                handle_exception(e, f'Provider {provider}')
+                _record_failure(listing.breaker, e)
+                # return None to discard this provider with a known error
+                return None
+            except Exception as e:  # noqa: BLE001  # pragma: no cover
+                handle_exception(e, f'Provider {provider}')
+                _record_failure(listing.breaker, e)
+                # return [] so the provider is not discarded with unknown error
+                return listing.subtitles
+
+            self.list_latencies[provider].append(time.monotonic() - started_at)
+            return self._record_listing(provider, videos, listing, batch)
+
+    def list_subtitles_batch(self, videos: Sequence[Video], languages: Set[Language]) -> list[list[Subtitle]]:
+        """List subtitles of many videos, with a single call to each provider for the episodes of a season.
+
+        The videos are grouped with :func:`group_videos`, and each group is listed with
+        :meth:`list_subtitles_provider_batch`, so the providers fetching a whole season at once make a single
+        request for all its episodes.
+
+        :param videos: videos to list subtitles for.
+        :type videos: list of :class:`~subliminal.video.Video`
+        :param languages: languages to search for.
+        :type languages: set of :class:`~babelfish.language.Language`
+        :return: found subtitles of each video, in the order of the `videos`.
+        :rtype: list of list of :class:`~subliminal.subtitle.Subtitle`
+
+        """
+        with self.video_budget(*videos):
+            results = (
+                (name, group, self.list_subtitles_provider_batch(name, group, languages))
+                for group in group_videos(videos)
+                for name in self.providers
+            )
+            return _distribute_subtitles(videos, results)
+
+    def list_subtitles_as_completed(
+        self,
+        video: Video,
+        languages: Set[Language],
+    ) -> Generator[tuple[str, list[Subtitle] | None], None, None]:
+        """List subtitles, yielding the subtitles of each provider as soon as they are available.
+
+        The providers are called one after the other, closing the generator skips the remaining providers.
+
+        :param video: video to list subtitles for.
+        :type video: :class:`~subliminal.video.Video`
+        :param languages: languages to search for.
+        :type languages: set of :class:`~babelfish.language.Language`
+        :return: the name of each provider with its subtitles, or None if the provider should be discarded.
+        :rtype: generator of tuple of str and list of :class:`~subliminal.subtitle.Subtitle` or None
+
+        """
+        with self.video_budget(video):
+            for name in self.providers:
+                # check discarded providers
+                if name in self.discarded_providers:
+                    logger.debug('Skipping discarded provider %r', name)
+                    continue
+
+                yield name, self.list_subtitles_provider(name, video, languages)
+
+    def list_best_subtitles(
+        self,
+        video: Video,
+        languages: Set[Language],
+        *,
+        hearing_impaired: bool | None = None,
+        foreign_only: bool | None = None,
+        skip_wrong_fps: bool = False,
+        only_one: bool = False,
+        compute_score: ComputeScore | None = None,
+        ignore_subtitles: Sequence[str] | None = None,
+    ) -> list[Subtitle]:
+        """List subtitles, stopping as soon as no better subtitle can be found.
+
+        The subtitles are scored as they arrive, with the same parameters as :meth:`download_best_subtitles`.
+        Once every language (or one language with `only_one`) has a subtitle with the maximum score, a hash match,
+        the provider calls that are not started are cancelled and the running calls are ignored. The wall time
+        until the ignored calls complete is added to :attr:`time_saved`.
+
+        .. note::
+            Only the subtitles listed before stopping are returned, so there are fewer subtitles to fall back on
+            if the download of the best subtitle fails.
+
+        :param video: video to list subtitles for.
+        :type video: :class:`~subliminal.video.Video`
+        :param languages: languages to search for.
+        :type languages: set of :class:`~babelfish.language.Language`
+        :return: found subtitles.
+        :rtype: list of :class:`~subliminal.subtitle.Subtitle`
+
+        """
+        ceiling = _ScoreCeiling(
+            video,
+            languages,
+            only_one=only_one,
+            hearing_impaired=hearing_impaired,
+            foreign_only=foreign_only,
+            skip_wrong_fps=skip_wrong_fps,
+            compute_score=compute_score,
+            ignore_subtitles=ignore_subtitles,
+        )
+        subtitles: list[Subtitle] = []
+
+        results = self.list_subtitles_as_completed(video, languages)
+        try:
+            for name, provider_subtitles in results:
+                # discard provider that failed
+                if provider_subtitles is None:
+                    logger.info('Discarding provider %s', name)
+                    continue
+
+                # add the subtitles and stop if they cannot be improved
+                subtitles.extend(provider_subtitles)
+                if ceiling.add(provider_subtitles):
+                    logger.info('Maximum score reached for %r, stop listing subtitles', video)
+                    break
+        finally:
+            results.close()
+
+        return subtitles
+
+    def _gather_subtitles(self, futures: Mapping[str, Future[list[Subtitle] | None]], video: Video) -> list[Subtitle]:
+        """Gather the subtitles of the provider calls, in order, ignoring the calls past the time budget."""
+        _, not_done = wait(futures.values(), timeout=_remaining(self._get_deadline(video)))
+        if not_done:
+            logger.info('Time budget of %r is spent, ignoring %d provider call(s)', video, len(not_done))
+            self._ignore_calls(not_done)
+
+        subtitles: list[Subtitle] = []
+        for name, future in futures.items():
+            if future in not_done:
+                continue
+            provider_subtitles = future.result()
+            # discard provider that failed
+            if provider_subtitles is None:
+                logger.info('Discarding provider %s', name)
+                continue
+
+            # add subtitles
+            subtitles.extend(provider_subtitles)
+
+        return subtitles
+
+    def _ignore_calls(self, futures: Iterable[Future[Any]]) -> None:
+        """Cancel the calls that are not started, and measure the :attr:`time_saved` on the running calls."""
+        running = [future for future in futures if not future.cancel()]
+        if running:
+            logger.debug('Ignoring %d running provider call(s)', len(running))
+        _measure_ignored_calls(running, self._add_time_saved)
+
+    def _add_time_saved(self, delay: float) -> None:
+        with self._time_saved_lock:
+            self.time_saved += delay
+
+    def download_subtitle(self, subtitle: Subtitle) -> bool:
+        """Download `subtitle`'s :attr:`~subliminal.subtitle.Subtitle.content`.
+
+        :param subtitle: subtitle to download.
+        :type subtitle: :class:`~subliminal.subtitle.Subtitle`
+        :return: `True` if the subtitle has been successfully downloaded, `False` otherwise.
+        :rtype: bool
+
+        """
+        # check the circuit breaker
+        breaker = self._circuit_breaker(subtitle.provider_name)
+        if not breaker.allow():
+            logger.warning('Provider %r is discarded', subtitle.provider_name)
+            return False
+
+        logger.info('Downloading subtitle %r', subtitle)
+        try:
+            provider = self[subtitle.provider_name]
+            started_at = time.monotonic()
+            with _call_timeout(self.timeouts, provider, self.download_latencies[subtitle.provider_name], None):
+                provider.download_subtitle(subtitle)
+        except ARCHIVE_ERRORS:  # type: ignore[misc]  # pragma: no cover
+            logger.exception('Bad archive for subtitle %r', subtitle)
+            breaker.record_success()
+        except Exception as e:  # noqa: BLE001
+            handle_exception(e, f'Provider {subtitle.provider_name}')
+            _record_failure(breaker, e)
+        else:
+            breaker.record_success()
+            self.download_latencies[subtitle.provider_name].append(time.monotonic() - started_at)
+
+        # check subtitle validity
+        if not subtitle.is_valid():
+            logger.error('Invalid subtitle')
+            return False
+
+        return True
+
+    def _submit_download(self, subtitle: Subtitle) -> Future[bool]:
+        """Download the `subtitle`, the subclasses with :attr:`concurrent_downloads` do it in background."""
+        future: Future[bool] = Future()
+        future.set_result(self.download_subtitle(subtitle))
+        return future
+
+    def download_subtitles(self, subtitles: Sequence[Subtitle]) -> list[bool]:
+        """Download the :attr:`~subliminal.subtitle.Subtitle.content` of many subtitles, see :meth:`download_subtitle`.
+
+        The subtitles are downloaded one after the other, the subclasses download them concurrently.
+
+        :param subtitles: subtitles to download.
+        :type subtitles: list of :class:`~subliminal.subtitle.Subtitle`
+        :return: `True` for each subtitle that has been successfully downloaded, `False` otherwise.
+        :rtype: list of bool
+
+        """
+        return [self._submit_download(subtitle).result() for subtitle in subtitles]
+
+    def download_best_subtitles(
+        self,
+        subtitles: Sequence[Subtitle],
+        video: Video,
+        languages: Set[Language],
+        *,
+        min_score: int = 0,
+        hearing_impaired: bool | None = None,
+        foreign_only: bool | None = None,
+        skip_wrong_fps: bool = False,
+        only_one: bool = False,
+        compute_score: ComputeScore | None = None,
+        ignore_subtitles: Sequence[str] | None = None,
+        hedging: Hedging | None = None,
+    ) -> list[Subtitle]:
+        """Download the best matching subtitles.
+
+        The best subtitle of each language is downloaded at once. If a download fails, the next subtitle of the
+        same language is tried. With `hedging` and :attr:`concurrent_downloads`, the next subtitle can also be
+        downloaded speculatively before the download of the best subtitle completes, the valid subtitle with the
+        best score is kept.
+
+        Once the time budget of the video is spent (see :class:`Timeouts`), no other download is started and the
+        running downloads are ignored.
+
+        :param subtitles: the subtitles to use.
+        :type subtitles: list of :class:`~subliminal.subtitle.Subtitle`
+        :param video: video to download subtitles for.
+        :type video: :class:`~subliminal.video.Video`
+        :param languages: languages to download.
+        :type languages: set of :class:`~babelfish.language.Language`
+        :param int min_score: minimum score for a subtitle to be downloaded.
+        :param (bool | None) hearing_impaired: hearing impaired preference (yes/no/indifferent).
+        :param (bool | None) foreign_only: foreign only preference (yes/no/indifferent).
+        :param bool skip_wrong_fps: skip subtitles with an FPS that do not match the video (False).
+        :param bool only_one: download only one subtitle, not one per language.
+        :param compute_score: function that takes `subtitle` and `video` as positional arguments,
+            and returns the score.
+        :param ignore_subtitles: list of subtitle ids to ignore (None defaults to an empty list).
+        :param hedging: settings of the speculative downloads, if enabled.
+        :type hedging: :class:`Hedging`
+        :return: downloaded subtitles.
+        :rtype: list of :class:`~subliminal.subtitle.Subtitle`
+
+        """
+        scored_subtitles = _score_subtitles(
+            subtitles,
+            video,
+            hearing_impaired=hearing_impaired,
+            foreign_only=foreign_only,
+            skip_wrong_fps=skip_wrong_fps,
+            compute_score=compute_score,
+            ignore_subtitles=ignore_subtitles,
+        )
+
+        # check score
+        candidates: list[tuple[Subtitle, int]] = []
+        for subtitle, score in scored_subtitles:
+            if score < min_score:
+                logger.info('Score %d is below min_score (%d)', score, min_score)
+                break
+            candidates.append((subtitle, score))
+
+        # download the best subtitle of each language at once, falling back on the next on error
+        if hedging is not None and not self.concurrent_downloads:
+            logger.debug('Hedging requires concurrent downloads')
+            hedging = None
+        scheduler = _DownloadScheduler(
+            candidates,
+            only_one=only_one,
+            hedging=hedging,
+            latencies=self.download_latencies,
+        )
+        futures: dict[Future[bool], Subtitle] = {}
+        with self.video_budget(video):
+            video_deadline = self._get_deadline(video)
+            for subtitle in scheduler.update(time.monotonic()):
+                futures[self._submit_download(subtitle)] = subtitle
+            while futures and not scheduler.finished:
+                deadline = min((d for d in (scheduler.next_deadline(), video_deadline) if d is not None), default=None)
+                done, _ = wait(futures, timeout=_remaining(deadline), return_when=FIRST_COMPLETED)
+                started = [scheduler.complete(futures.pop(f), f.result(), time.monotonic()) for f in done]
+                if _remaining(video_deadline) == 0:
+                    logger.info('Time budget of %r is spent, stop downloading subtitles', video)
+                    self._ignore_calls(futures)
+                    break
+                started.append(scheduler.update(time.monotonic()))
+                for subtitle in itertools.chain.from_iterable(started):
+                    futures[self._submit_download(subtitle)] = subtitle
+
+        downloaded_subtitles = scheduler.downloaded
+        if {s.language for s in downloaded_subtitles} >= languages:
+            logger.debug('All languages downloaded')
+
+        return downloaded_subtitles
+
+    def process_videos(self, func: Callable[[Video], T], videos: Iterable[Video]) -> Iterator[tuple[Video, T]]:
+        """Call `func` on each video and yield the videos with the results.
+
+        The videos are processed one after the other, see :class:`BatchProviderPool` to process many videos at once.
+
+        :param func: function taking a video as argument, typically calling :meth:`list_subtitles`.
+        :param videos: videos to process.
+        :return: the videos with the results of `func`, in the order they were processed.
+        :rtype: iterator of tuple of :class:`~subliminal.video.Video` and the result
+
+        """
+        for video in videos:
+            yield video, func(video)
+
+    def terminate(self) -> None:
+        """Terminate all the :attr:`initialized_providers`, after the initializations in background."""
+        if self._initializer is not None:
+            self._initializer.shutdown(wait=True)
+            self._initializer = None
+        self._initialization_errors.clear()
+        logger.debug('Terminating initialized providers')
+        for name in list(self.initialized_providers):
+            del self[name]
+
+
+class AsyncProviderPool(ProviderPool):
+    """Subclass of :class:`ProviderPool` with asynchronous support for :meth:`~ProviderPool.list_subtitles`.
+
+    The subtitles are also downloaded in threads, one at a time for each provider.
+
+    The threads are kept in the :attr:`executor` between calls, it is created when entering the `with` statement
+    (or on first use) and shut down by :meth:`terminate`.
+
+    :param int max_workers: maximum number of threads to use. If `None`, :attr:`max_workers` will be set
+        to the number of :attr:`~ProviderPool.providers`.
+
+    """
+
+    #: Maximum number of threads to use.
+    max_workers: int
+
+    concurrent_downloads: ClassVar[bool] = True
+
+    def __init__(self, max_workers: int | None = None, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+
+        #: Maximum number of threads to use
+        self.max_workers = max_workers or len(self.providers)
+
+        self._executor: ThreadPoolExecutor | None = None
+        self._executor_lock = threading.Lock()
+        self._download_locks: dict[str, threading.Lock] = defaultdict(threading.Lock)
+
+    def __enter__(self) -> Self:
+        self.executor  # noqa: B018
+        return self
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """Executor running the calls to the providers, it can also be used for downloads and refiners.
+
+        It is created on first access and shut down by :meth:`terminate`.
+
+        """
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max(1, self.max_workers), thread_name_prefix='subliminal')
+            return self._executor
+
+    def list_subtitles_provider_tuple(
+        self,
+        provider: str,
+        video: Video,
+        languages: Set[Language],
+    ) -> tuple[str, list[Subtitle] | None]:
+        """List subtitles with a single provider, multi-threaded."""
+        return provider, super().list_subtitles_provider(provider, video, languages)
+
+    def list_subtitles(self, video: Video, languages: Set[Language]) -> list[Subtitle]:
+        """List subtitles, multi-threaded."""
+        with self.video_budget(video):
+            subtitles: list[Subtitle] = []
+
+            # No provider to use
+            if self.max_workers == 0:  # pragma: no cover
+                return subtitles
+
+            futures = {
+                name: self.executor.submit(self.list_subtitles_provider, name, video, languages)
+                for name in self.providers
+            }
+            return self._gather_subtitles(futures, video)
+
+    def list_subtitles_batch(self, videos: Sequence[Video], languages: Set[Language]) -> list[list[Subtitle]]:
+        """List subtitles of many videos, multi-threaded."""
+        with self.video_budget(*videos):
+            # No provider to use
+            if self.max_workers == 0:  # pragma: no cover
+                return [[] for _ in videos]
+
+            futures = [
+                (name, group, self.executor.submit(self.list_subtitles_provider_batch, name, group, languages))
+                for group in group_videos(videos)
+                for name in self.providers
+            ]
+            return _distribute_subtitles(videos, ((name, group, future.result()) for name, group, future in futures))
+
+    def list_subtitles_as_completed(
+        self,
+        video: Video,
+        languages: Set[Language],
+    ) -> Generator[tuple[str, list[Subtitle] | None], None, None]:
+        """List subtitles, multi-threaded, yielding the subtitles of each provider as soon as they are available.
+
+        Closing the generator cancels the calls that are not started and ignores the running calls.
+
+        """
+        with self.video_budget(video):
+            # No provider to use
+            if self.max_workers == 0:  # pragma: no cover
+                return
+
+            futures = {
+                self.executor.submit(self.list_subtitles_provider, name, video, languages): name
+                for name in self.providers
+            }
+            try:
+                for future in as_completed(futures, timeout=_remaining(self._get_deadline(video))):
+                    yield futures[future], future.result()
+            except FutureTimeoutError:
+                logger.info('Time budget of %r is spent, stop listing subtitles', video)
+            finally:
+                self._ignore_calls(f for f in futures if not f.done())
+
+    def download_subtitle(self, subtitle: Subtitle) -> bool:
+        """Download `subtitle`'s :attr:`~subliminal.subtitle.Subtitle.content`, one at a time for each provider."""
+        with self._download_locks[subtitle.provider_name]:
+            return super().download_subtitle(subtitle)
+
+    def _submit_download(self, subtitle: Subtitle) -> Future[bool]:
+        # No provider to use
+        if self.max_workers == 0:  # pragma: no cover
+            return super()._submit_download(subtitle)
+        return self.executor.submit(self.download_subtitle, subtitle)
+
+    def download_subtitles(self, subtitles: Sequence[Subtitle]) -> list[bool]:
+        """Download many subtitles, multi-threaded, one subtitle at a time for each provider."""
+        futures = [self._submit_download(subtitle) for subtitle in subtitles]
+        return [future.result() for future in futures]
+
+    def terminate(self) -> None:
+        """Shut down the :attr:`executor` and terminate all the :attr:`~ProviderPool.initialized_providers`."""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+        super().terminate()
+
+
+class BatchProviderPool(ProviderPool):
+    """Subclass of :class:`ProviderPool` processing many videos at once, with isolated providers.
+
+    Each provider has its own threads, at most `max_workers_per_provider`, so a slow provider only delays
+    its own calls. At most `max_workers` provider calls run at the same time over all the providers,
+    and :meth:`process_videos` handles up to `max_videos` videos at once.
+
+    :param int max_workers: maximum number of concurrent provider calls. If `None`, :attr:`max_workers` will be set
+        to the number of :attr:`~ProviderPool.providers` times `max_workers_per_provider`.
+    :param int max_workers_per_provider: maximum number of concurrent calls to each provider.
+    :param int max_videos: maximum number of videos processed at once. If `None`, :attr:`max_videos` will be set
+        to :attr:`max_workers`.
+
+    """
+
+    #: Maximum number of concurrent provider calls
+    max_workers: int
+
+    #: Maximum number of concurrent calls to each provider
+    max_workers_per_provider: int
+
+    #: Maximum number of videos processed at once
+    max_videos: int
+
+    concurrent_downloads: ClassVar[bool] = True
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        *args: Any,
+        max_workers_per_provider: int = 1,
+        max_videos: int | None = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.max_workers_per_provider = max(1, max_workers_per_provider)
+        self.max_workers = max_workers or max(1, len(self.providers)) * self.max_workers_per_provider
+        self.max_videos = max_videos or self.max_workers
+        self._workers = threading.BoundedSemaphore(self.max_workers)
+        self._executors: dict[str, ThreadPoolExecutor] = {}
+        self._executors_lock = threading.Lock()
+
+    def _get_executor(self, provider: str) -> ThreadPoolExecutor:
+        with self._executors_lock:
+            if provider not in self._executors:
+                self._executors[provider] = ThreadPoolExecutor(
+                    self.max_workers_per_provider,
+                    thread_name_prefix=f'subliminal-{provider}',
+                )
+            return self._executors[provider]
+
+    def _run(self, func: Callable[..., T], *args: Any) -> T:
+        with self._workers:
+            return func(*args)
+
+    def _submit(self, provider: str, func: Callable[..., T], *args: Any) -> Future[T]:
+        """Run `func` in the threads of the `provider`, within the global limit of workers."""
+        return self._get_executor(provider).submit(self._run, func, *args)
+
+    def list_subtitles_provider(self, provider: str, video: Video, languages: Set[Language]) -> list[Subtitle] | None:
+        """List subtitles with a single provider, skipping it if it was discarded while the call was queued."""
+        if provider in self.discarded_providers:
+            logger.debug('Skipping discarded provider %r', provider)
+            return []
+        return super().list_subtitles_provider(provider, video, languages)
+
+    def list_subtitles(self, video: Video, languages: Set[Language]) -> list[Subtitle]:
+        """List subtitles, calling the providers concurrently.
+
+        The providers that are not rate limited are called first, see
+        :attr:`~subliminal.ratelimit.RateLimiter.wait_time`.
+
+        """
+        with self.video_budget(video):
+            futures: dict[str, Future[list[Subtitle] | None]] = {}
+            for name in sorted(self.providers, key=_provider_wait_time):
+                # check discarded providers
+                if name in self.discarded_providers:
+                    logger.debug('Skipping discarded provider %r', name)
+                    continue
+                futures[name] = self._submit(name, self.list_subtitles_provider, name, video, languages)
+
+            return self._gather_subtitles(futures, video)
+
+    def list_subtitles_provider_batch(
+        self,
+        provider: str,
+        videos: Sequence[Video],
+        languages: Set[Language],
+    ) -> list[list[Subtitle]] | None:
+        """List subtitles of many videos with a single provider, skipping it if it was discarded while queued."""
+        if provider in self.discarded_providers:
+            logger.debug('Skipping discarded provider %r', provider)
+            return [[] for _ in videos]
+        return super().list_subtitles_provider_batch(provider, videos, languages)
+
+    def list_subtitles_batch(self, videos: Sequence[Video], languages: Set[Language]) -> list[list[Subtitle]]:
+        """List subtitles of many videos, calling the providers concurrently for all the groups of videos."""
+        with self.video_budget(*videos):
+            futures = [
+                (name, group, self._submit(name, self.list_subtitles_provider_batch, name, group, languages))
+                for group in group_videos(videos)
+                for name in sorted(self.providers, key=_provider_wait_time)
+                if name not in self.discarded_providers
+            ]
+            return _distribute_subtitles(videos, ((name, group, future.result()) for name, group, future in futures))
+
+    def list_subtitles_as_completed(
+        self,
+        video: Video,
+        languages: Set[Language],
+    ) -> Generator[tuple[str, list[Subtitle] | None], None, None]:
+        """List subtitles, calling the providers concurrently and yielding their subtitles as soon as available.
+
+        Closing the generator cancels the calls that are not started and ignores the running calls.
+
+        """
+        with self.video_budget(video):
+            futures: dict[Future[list[Subtitle] | None], str] = {}
+            for name in sorted(self.providers, key=_provider_wait_time):
+                # check discarded providers
+                if name in self.discarded_providers:
+                    logger.debug('Skipping discarded provider %r', name)
+                    continue
+                futures[self._submit(name, self.list_subtitles_provider, name, video, languages)] = name
+
+            try:
+                for future in as_completed(futures, timeout=_remaining(self._get_deadline(video))):
+                    yield futures[future], future.result()
+            except FutureTimeoutError:
+                logger.info('Time budget of %r is spent, stop listing subtitles', video)
+            finally:
+                self._ignore_calls(f for f in futures if not f.done())
+
+    def download_subtitle(self, subtitle: Subtitle) -> bool:
+        """Download `subtitle`'s :attr:`~subliminal.subtitle.Subtitle.content`, in the threads of its provider."""
+        return self._submit(subtitle.provider_name, super().download_subtitle, subtitle).result()
+
+    def _submit_download(self, subtitle: Subtitle) -> Future[bool]:
+        return self._submit(subtitle.provider_name, super().download_subtitle, subtitle)
+
+    def download_subtitles(self, subtitles: Sequence[Subtitle]) -> list[bool]:
+        """Download many subtitles concurrently, in the threads of their providers."""
+        futures = [self._submit_download(subtitle) for subtitle in subtitles]
+        return [future.result() for future in futures]
+
+    def process_videos(self, func: Callable[[Video], T], videos: Iterable[Video]) -> Iterator[tuple[Video, T]]:
+        """Call `func` on up to :attr:`max_videos` videos at once and yield the videos with the results.
+
+        The `videos` are consumed as the previous videos are processed. Closing the generator processes no more
+        videos and waits for the running calls.
+
+        :param func: function taking a video as argument, typically calling :meth:`list_subtitles`.
+        :param videos: videos to process.
+        :return: the videos with the results of `func`, as soon as they are available.
+        :rtype: iterator of tuple of :class:`~subliminal.video.Video` and the result
+
+        """
+        videos = iter(videos)
+        futures: dict[Future[T], Video] = {}
+        with ThreadPoolExecutor(self.max_videos, thread_name_prefix='subliminal-video') as executor:
+            try:
+                for video in itertools.islice(videos, self.max_videos):
+                    futures[executor.submit(func, video)] = video
+                while futures:
+                    done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        video = futures.pop(future)
+                        # keep the window full while the result is handled
+                        for next_video in itertools.islice(videos, 1):
+                            futures[executor.submit(func, next_video)] = next_video
+                        yield video, future.result()
+            finally:
+                for future in futures:
+                    future.cancel()
+
+    def terminate(self) -> None:
+        """Wait for the running calls and terminate all the :attr:`~ProviderPool.initialized_providers`."""
+        with self._executors_lock:
+            executors, self._executors = self._executors, {}
+        for executor in executors.values():
+            executor.shutdown(wait=True)
+        super().terminate()
+
+
+class AsyncioProviderPool(_ListingSteps):
+    """A pool of providers with the asyncio API of :class:`~subliminal.providers.Provider`.
+
+    It has the same features as :class:`ProviderPool`, with coroutines instead of methods. The providers with
+    :attr:`~subliminal.providers.Provider.native_async` support handle up to `max_concurrency_per_provider`
+    calls at once, the other providers run in threads, one call at a time.
+
+    It supports the `async with` statement to :meth:`terminate` the providers on exit.
+
+    :param list providers: name of providers to use, if not all.
+    :param dict provider_configs: provider configuration as keyword arguments per provider name to pass when
+        instantiating the :class:`~subliminal.providers.Provider`.
+    :param int max_concurrency: maximum number of concurrent provider calls. If `None`, :attr:`max_concurrency`
+        will be set to the number of :attr:`providers` times `max_concurrency_per_provider`.
+    :param int max_concurrency_per_provider: maximum number of concurrent calls to a native asyncio provider.
+    :param timeouts: time budget of each video and adaptive timeouts of the providers, if any.
+    :type timeouts: :class:`Timeouts`
+    :param negative_cache: cache of the searches that found no subtitle, if any.
+    :type negative_cache: :class:`~subliminal.negative_cache.NegativeCache`
+    :param listing_cache: cache of the subtitles listed by the providers, if any.
+    :type listing_cache: :class:`~subliminal.listing_cache.ListingCache`
+
+    """
+
+    #: Name of providers to use
+    providers: Sequence[str]
+
+    #: Provider configuration
+    provider_configs: Mapping[str, Any]
+
+    #: Initialized providers
+    initialized_providers: dict[str, Provider]
+
+    #: Circuit breakers of the providers, by name
+    circuit_breakers: dict[str, CircuitBreaker]
+
+    #: Wall time saved by stopping the listings early, in seconds, see :meth:`list_best_subtitles`
+    time_saved: float
+
+    #: Last download latencies, by provider, in seconds
+    download_latencies: dict[str, deque[float]]
+
+    #: Last listing latencies, by provider, in seconds
+    list_latencies: dict[str, deque[float]]
+
+    #: Time budget of each video and adaptive timeouts of the providers
+    timeouts: Timeouts | None
+
+    #: Cache of the searches that found no subtitle
+    negative_cache: NegativeCache | None
+
+    #: Cache of the subtitles listed by the providers
+    listing_cache: ListingCache | None
+
+    #: Maximum number of concurrent provider calls
+    max_concurrency: int
+
+    #: Maximum number of concurrent calls to a native asyncio provider
+    max_concurrency_per_provider: int
+
+    def __init__(
+        self,
+        providers: Sequence[str] | None = None,
+        provider_configs: Mapping[str, Any] | None = None,
+        *,
+        max_concurrency: int | None = None,
+        max_concurrency_per_provider: int = 4,
+        timeouts: Timeouts | None = None,
+        negative_cache: NegativeCache | None = None,
+        listing_cache: ListingCache | None = None,
+    ) -> None:
+        self.providers = providers if providers is not None else get_default_providers()
+        self.provider_configs = provider_configs or {}
+        self.initialized_providers = {}
+        self.circuit_breakers = {name: CircuitBreaker(name) for name in self.providers}
+        self.time_saved = 0.0
+        self.download_latencies = defaultdict(lambda: deque(maxlen=MAX_LATENCIES))
+        self.list_latencies = defaultdict(lambda: deque(maxlen=MAX_LATENCIES))
+        self.timeouts = timeouts
+        self.negative_cache = negative_cache
+        self.listing_cache = listing_cache
+        self._deadlines: dict[str, tuple[float, int]] = {}
+        self._deadlines_lock = threading.Lock()
+        self.max_concurrency_per_provider = max(1, max_concurrency_per_provider)
+        self.max_concurrency = max_concurrency or max(1, len(self.providers)) * self.max_concurrency_per_provider
+        self._concurrency = asyncio.Semaphore(self.max_concurrency)
+        self._provider_semaphores: dict[str, asyncio.Semaphore] = {}
+        self._provider_locks: dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        self._ignored_tasks: set[asyncio.Task[Any]] = set()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.terminate()
+
+    @property
+    def discarded_providers(self) -> set[str]:
+        """Providers with an open circuit, they are not called until their :attr:`circuit_breakers` are half-open."""
+        return {name for name, breaker in self.circuit_breakers.items() if breaker.state == CircuitState.OPEN}
+
+    async def get_provider(self, name: str) -> Provider:
+        """Get the provider, initializing it on first use.
+
+        :param str name: name of the provider.
+        :return: the initialized provider.
+        :rtype: :class:`~subliminal.providers.Provider`
+        :raises: :class:`KeyError` if the provider is not in :attr:`providers`.
+
+        """
+        if name not in self.providers:
+            raise KeyError(name)
+
+        # concurrent calls wait for a single initialization
+        async with self._provider_locks[name]:
+            if name not in self.initialized_providers:
+                logger.info('Initializing provider %s', name)
+                provider = provider_manager[name].plugin(**self.provider_configs.get(name, {}))
+                await provider.initialize_async()
+                self.initialized_providers[name] = provider
+
+        return self.initialized_providers[name]
+
+    def _get_semaphore(self, name: str) -> asyncio.Semaphore:
+        if name not in self._provider_semaphores:
+            plugin = provider_manager[name].plugin
+            concurrency = self.max_concurrency_per_provider if plugin.native_async else 1
+            # never more concurrent calls than allowed connections
+            if plugin.rate_limit is not None and plugin.rate_limit.max_concurrent is not None:
+                concurrency = min(concurrency, plugin.rate_limit.max_concurrent)
+            self._provider_semaphores[name] = asyncio.Semaphore(max(1, concurrency))
+        return self._provider_semaphores[name]
+
+    async def _call(
+        self,
+        name: str,
+        method: str,
+        *args: Any,
+        latencies: deque[float],
+        deadline: float | None = None,
+    ) -> Any:
+        """Call the coroutine `method` of the provider, within the concurrency limits, and record its latency."""
+        async with self._get_semaphore(name), self._concurrency:
+            provider = await self.get_provider(name)
+            started_at = time.monotonic()
+            with _call_timeout(self.timeouts, provider, latencies, deadline):
+                result = await getattr(provider, method)(*args)
+            latencies.append(time.monotonic() - started_at)
+            return result
+
+    async def list_subtitles_provider(
+        self,
+        provider: str,
+        video: Video,
+        languages: Set[Language],
+    ) -> list[Subtitle] | None:
+        """List subtitles with a single provider, see :meth:`ProviderPool.list_subtitles_provider`.
+
+        :param str provider: name of the provider.
+        :param video: video to list subtitles for.
+        :type video: :class:`~subliminal.video.Video`
+        :param languages: languages to search for.
+        :type languages: set of :class:`~babelfish.language.Language`
+        :return: found subtitles or None if there was an error and the provider should be discarded.
+        :rtype: list of :class:`~subliminal.subtitle.Subtitle` or None
+
+        """
+        with self.video_budget(video):
+            listing = self._prepare_listing(provider, [video], languages)
+            if not listing.indices:
+                return listing.subtitles[0]
+
+            # list subtitles, cancelling the call when the time budget of the video is spent
+            logger.info('Listing subtitles with provider %r and languages %r', provider, listing.languages)
+            try:
+                subtitles: list[Subtitle] = await asyncio.wait_for(
+                    self._call(
+                        provider,
+                        'list_subtitles_async',
+                        video,
+                        listing.languages,
+                        latencies=self.list_latencies[provider],
+                        deadline=listing.deadline,
+                    ),
+                    timeout=_remaining(listing.deadline),
+                )
+            except asyncio.TimeoutError:
+                logger.info('Time budget of the video is spent, cancelled provider %r', provider)
+                listing.breaker.record_cancellation()
+                return []
+            except DiscardingError as e:
+                handle_exception(e, f'Provider {provider}')
+                _record_failure(listing.breaker, e)
+                # return None to discard this provider with a known error
+                return None
+            except Exception as e:  # noqa: BLE001  # pragma: no cover
+                handle_exception(e, f'Provider {provider}')
+                _record_failure(listing.breaker, e)
+                # return [] so the provider is not discarded with unknown error
+                return []
+
+            return self._record_listing(provider, [video], listing, [subtitles])[0]
+
+    async def list_subtitles(self, video: Video, languages: Set[Language]) -> list[Subtitle]:
+        """List subtitles, calling the providers concurrently.
+
+        :param video: video to list subtitles for.
+        :type video: :class:`~subliminal.video.Video`
+        :param languages: languages to search for.
+        :type languages: set of :class:`~babelfish.language.Language`
+        :return: found subtitles.
+        :rtype: list of :class:`~subliminal.subtitle.Subtitle`
+
+        """
+        with self.video_budget(video):
+            names = [name for name in self.providers if name not in self.discarded_providers]
+            results = await asyncio.gather(*(self.list_subtitles_provider(name, video, languages) for name in names))
+
+            subtitles: list[Subtitle] = []
+            for name, provider_subtitles in zip(names, results, strict=True):
+                # discard provider that failed
+                if provider_subtitles is None:
+                    logger.info('Discarding provider %s', name)
+                    continue
+
+                # add subtitles
+                subtitles.extend(provider_subtitles)
+
+            return subtitles
+
+    async def list_subtitles_provider_batch(
+        self,
+        provider: str,
+        videos: Sequence[Video],
+        languages: Set[Language],
+    ) -> list[list[Subtitle]] | None:
+        """List subtitles of many videos with a single call to a provider.
+
+        See :meth:`ProviderPool.list_subtitles_provider_batch`, with the same parameters.
+
+        """
+        with self.video_budget(*videos):
+            listing = self._prepare_listing(provider, videos, languages)
+            if not listing.indices:
+                return listing.subtitles
+
+            # list subtitles, cancelling the call when the time budget of the videos is spent
+            logger.info(
+                'Listing subtitles of %d video(s) with provider %r and languages %r',
+                len(listing.indices),
+                provider,
+                listing.languages,
+            )
+            try:
+                batch: list[list[Subtitle]] = await asyncio.wait_for(
+                    self._call(
+                        provider,
+                        'list_subtitles_batch_async',
+                        [videos[i] for i in listing.indices],
+                        listing.languages,
+                        latencies=self.list_latencies[provider],
+                        deadline=listing.deadline,
+                    ),
+                    timeout=_remaining(listing.deadline),
+                )
+            except asyncio.TimeoutError:
+                logger.info('Time budget of the videos is spent, cancelled provider %r', provider)
+                listing.breaker.record_cancellation()
+                return listing.subtitles
+            except DiscardingError as e:
+                handle_exception(e, f'Provider {provider}')
+                _record_failure(listing.breaker, e)
+                # return None to discard this provider with a known error
+                return None
+            except Exception as e:  # noqa: BLE001  # pragma: no cover
+                handle_exception(e, f'Provider {provider}')
+                _record_failure(listing.breaker, e)
+                # return [] so the provider is not discarded with unknown error
+                return listing.subtitles
+
+            return self._record_listing(provider, videos, listing, batch)
+
+    async def list_subtitles_batch(self, videos: Sequence[Video], languages: Set[Language]) -> list[list[Subtitle]]:
+        """List subtitles of many videos, calling the providers concurrently for all the groups of videos.
+
+        See :meth:`ProviderPool.list_subtitles_batch`, with the same parameters.
+
+        """
+        with self.video_budget(*videos):
+            calls = [
+                (name, group)
+                for group in group_videos(videos)
+                for name in self.providers
+                if name not in self.discarded_providers
+            ]
+            results = await asyncio.gather(
+                *(self.list_subtitles_provider_batch(name, group, languages) for name, group in calls)
+            )
+            return _distribute_subtitles(
+                videos,
+                ((name, group, group_subtitles) for (name, group), group_subtitles in zip(calls, results, strict=True)),
+            )
+
+    async def list_subtitles_as_completed(
+        self,
+        video: Video,
+        languages: Set[Language],
+    ) -> AsyncGenerator[tuple[str, list[Subtitle] | None], None]:
+        """List subtitles, yielding the subtitles of each provider as soon as they are available.
+
+        Closing the generator ignores the running calls, they are awaited by :meth:`terminate`.
+
+        :param video: video to list subtitles for.
+        :type video: :class:`~subliminal.video.Video`
+        :param languages: languages to search for.
+        :type languages: set of :class:`~babelfish.language.Language`
+        :return: the name of each provider with its subtitles, or None if the provider should be discarded.
+        :rtype: async generator of tuple of str and list of :class:`~subliminal.subtitle.Subtitle` or None
+
+        """
+        with self.video_budget(video):
+
+            async def list_subtitles_provider(name: str) -> tuple[str, list[Subtitle] | None]:
+                return name, await self.list_subtitles_provider(name, video, languages)
+
+            names = [name for name in self.providers if name not in self.discarded_providers]
+            tasks = [asyncio.ensure_future(list_subtitles_provider(name)) for name in names]
+            try:
+                for next_result in asyncio.as_completed(tasks):
+                    yield await next_result
+            finally:
+                running = [task for task in tasks if not task.done()]
+                if running:
+                    logger.debug('Ignoring %d running provider call(s)', len(running))
+                self._ignored_tasks.update(running)
+                for task in running:
+                    task.add_done_callback(self._ignored_tasks.discard)
+                _measure_ignored_calls(running, self._add_time_saved)
+
+    def _add_time_saved(self, delay: float) -> None:
+        self.time_saved += delay
+
+    async def list_best_subtitles(
+        self,
+        video: Video,
+        languages: Set[Language],
+        *,
+        hearing_impaired: bool | None = None,
+        foreign_only: bool | None = None,
+        skip_wrong_fps: bool = False,
+        only_one: bool = False,
+        compute_score: ComputeScore | None = None,
+        ignore_subtitles: Sequence[str] | None = None,
+    ) -> list[Subtitle]:
+        """List subtitles until no better subtitle can be found, see :meth:`ProviderPool.list_best_subtitles`."""
+        ceiling = _ScoreCeiling(
+            video,
+            languages,
+            only_one=only_one,
+            hearing_impaired=hearing_impaired,
+            foreign_only=foreign_only,
+            skip_wrong_fps=skip_wrong_fps,
+            compute_score=compute_score,
+            ignore_subtitles=ignore_subtitles,
+        )
+        subtitles: list[Subtitle] = []
+
+        async with aclosing(self.list_subtitles_as_completed(video, languages)) as results:
+            async for name, provider_subtitles in results:
+                # discard provider that failed
+                if provider_subtitles is None:
+                    logger.info('Discarding provider %s', name)
+                    continue
 
-            # add the subtitles
-            subtitles.extend(provider_subtitles)
+                # add the subtitles and stop if they cannot be improved
+                subtitles.extend(provider_subtitles)
+                if ceiling.add(provider_subtitles):
+                    logger.info('Maximum score reached for %r, stop listing subtitles', video)
+                    break
 
         return subtitles
 
-    def download_subtitle(self, subtitle: Subtitle) -> bool:
+    async def download_subtitle(self, subtitle: Subtitle) -> bool:
         """Download `subtitle`'s :attr:`~subliminal.subtitle.Subtitle.content`.
 
         :param subtitle: subtitle to download.
@@ -197,19 +2045,24 @@ class ProviderPool:
         :rtype: bool
 
         """
-        # check discarded providers
-        if subtitle.provider_name in self.discarded_providers:
+        # check the circuit breaker
+        breaker = self._circuit_breaker(subtitle.provider_name)
+        if not breaker.allow():
             logger.warning('Provider %r is discarded', subtitle.provider_name)
             return False
 
         logger.info('Downloading subtitle %r', subtitle)
+        latencies = self.download_latencies[subtitle.provider_name]
         try:
-            self[subtitle.provider_name].download_subtitle(subtitle)
+            await self._call(subtitle.provider_name, 'download_subtitle_async', subtitle, latencies=latencies)
         except ARCHIVE_ERRORS:  # type: ignore[misc]  # pragma: no cover
             logger.exception('Bad archive for subtitle %r', subtitle)
+            breaker.record_success()
         except Exception as e:  # noqa: BLE001
-            handle_exception(e, f'Discarding provider {subtitle.provider_name}')
-            self.discarded_providers.add(subtitle.provider_name)
+            handle_exception(e, f'Provider {subtitle.provider_name}')
+            _record_failure(breaker, e)
+        else:
+            breaker.record_success()
 
         # check subtitle validity
         if not subtitle.is_valid():
@@ -218,7 +2071,18 @@ class ProviderPool:
 
         return True
 
-    def download_best_subtitles(
+    async def download_subtitles(self, subtitles: Sequence[Subtitle]) -> list[bool]:
+        """Download many subtitles concurrently, within the concurrency limits of the providers.
+
+        :param subtitles: subtitles to download.
+        :type subtitles: list of :class:`~subliminal.subtitle.Subtitle`
+        :return: `True` for each subtitle that has been successfully downloaded, `False` otherwise.
+        :rtype: list of bool
+
+        """
+        return list(await asyncio.gather(*(self.download_subtitle(subtitle) for subtitle in subtitles)))
+
+    async def download_best_subtitles(
         self,
         subtitles: Sequence[Subtitle],
         video: Video,
@@ -231,142 +2095,73 @@ class ProviderPool:
         only_one: bool = False,
         compute_score: ComputeScore | None = None,
         ignore_subtitles: Sequence[str] | None = None,
+        hedging: Hedging | None = None,
     ) -> list[Subtitle]:
-        """Download the best matching subtitles.
-
-        :param subtitles: the subtitles to use.
-        :type subtitles: list of :class:`~subliminal.subtitle.Subtitle`
-        :param video: video to download subtitles for.
-        :type video: :class:`~subliminal.video.Video`
-        :param languages: languages to download.
-        :type languages: set of :class:`~babelfish.language.Language`
-        :param int min_score: minimum score for a subtitle to be downloaded.
-        :param (bool | None) hearing_impaired: hearing impaired preference (yes/no/indifferent).
-        :param (bool | None) foreign_only: foreign only preference (yes/no/indifferent).
-        :param bool skip_wrong_fps: skip subtitles with an FPS that do not match the video (False).
-        :param bool only_one: download only one subtitle, not one per language.
-        :param compute_score: function that takes `subtitle` and `video` as positional arguments,
-            and returns the score.
-        :param ignore_subtitles: list of subtitle ids to ignore (None defaults to an empty list).
-        :return: downloaded subtitles.
-        :rtype: list of :class:`~subliminal.subtitle.Subtitle`
-
-        """
-        compute_score = compute_score or default_compute_score
-        ignore_subtitles = ignore_subtitles or []
-
-        # ignore subtitles
-        subtitles = [s for s in subtitles if s.id not in ignore_subtitles]
-
-        # skip subtitles that do not match the FPS of the video (if defined)
-        if skip_wrong_fps and video.frame_rate is not None and video.frame_rate > 0:
-            subtitles = [s for s in subtitles if fps_matches(video, fps=s.fps, strict=False)]
-
-        # sort by hearing impaired and foreign only
-        category = SubtitleCategory.from_flags(hearing_impaired=hearing_impaired, foreign_only=foreign_only)
-        if category != SubtitleCategory.UNKNOWN:
-            logger.info('Sort subtitles by %s types first', category.value)
-            subtitles = sorted(
-                subtitles,
-                key=lambda s: s.category == category,
-                reverse=True,
-            )
-
-        # sort subtitles by score
-        scored_subtitles = sorted(
-            [(s, compute_score(s, video)) for s in subtitles],
-            key=operator.itemgetter(1),
-            reverse=True,
+        """Download the best matching subtitles, see :meth:`ProviderPool.download_best_subtitles`."""
+        scored_subtitles = _score_subtitles(
+            subtitles,
+            video,
+            hearing_impaired=hearing_impaired,
+            foreign_only=foreign_only,
+            skip_wrong_fps=skip_wrong_fps,
+            compute_score=compute_score,
+            ignore_subtitles=ignore_subtitles,
         )
 
-        # download best subtitles, falling back on the next on error
-        downloaded_subtitles: list[Subtitle] = []
+        # check score
+        candidates: list[tuple[Subtitle, int]] = []
         for subtitle, score in scored_subtitles:
-            # check score
             if score < min_score:
                 logger.info('Score %d is below min_score (%d)', score, min_score)
                 break
-
-            # check downloaded languages
-            if subtitle.language in {s.language for s in downloaded_subtitles}:  # pragma: no cover
-                logger.debug('Skipping subtitle: %r already downloaded', subtitle.language)
-                continue
-
-            # download
-            if self.download_subtitle(subtitle):  # pragma: no branch
-                downloaded_subtitles.append(subtitle)
-
-            # stop when all languages are downloaded
-            if {s.language for s in downloaded_subtitles} == languages:
-                logger.debug('All languages downloaded')
-                break
-
-            # stop if only one subtitle is requested
-            if only_one and len(downloaded_subtitles) > 0:
-                logger.debug('Only one subtitle downloaded')
-                break
+            candidates.append((subtitle, score))
+
+        # download the best subtitle of each language at once, falling back on the next on error
+        scheduler = _DownloadScheduler(
+            candidates,
+            only_one=only_one,
+            hedging=hedging,
+            latencies=self.download_latencies,
+        )
+        tasks: dict[asyncio.Task[bool], Subtitle] = {}
+        with self.video_budget(video):
+            video_deadline = self._get_deadline(video)
+            for subtitle in scheduler.update(time.monotonic()):
+                tasks[asyncio.ensure_future(self.download_subtitle(subtitle))] = subtitle
+            while tasks and not scheduler.finished:
+                deadline = min((d for d in (scheduler.next_deadline(), video_deadline) if d is not None), default=None)
+                done, _ = await asyncio.wait(tasks, timeout=_remaining(deadline), return_when=asyncio.FIRST_COMPLETED)
+                started = [scheduler.complete(tasks.pop(t), t.result(), time.monotonic()) for t in done]
+                if _remaining(video_deadline) == 0:
+                    logger.info('Time budget of %r is spent, stop downloading subtitles', video)
+                    break
+                started.append(scheduler.update(time.monotonic()))
+                for subtitle in itertools.chain.from_iterable(started):
+                    tasks[asyncio.ensure_future(self.download_subtitle(subtitle))] = subtitle
+
+        # the speculative downloads and the downloads past the time budget are awaited by terminate
+        self._ignored_tasks.update(tasks)
+        for task in tasks:
+            task.add_done_callback(self._ignored_tasks.discard)
+
+        downloaded_subtitles = scheduler.downloaded
+        if {s.language for s in downloaded_subtitles} >= languages:
+            logger.debug('All languages downloaded')
 
         return downloaded_subtitles
 
-    def terminate(self) -> None:
-        """Terminate all the :attr:`initialized_providers`."""
+    async def terminate(self) -> None:
+        """Wait for the ignored calls and terminate all the :attr:`initialized_providers`."""
+        if self._ignored_tasks:
+            await asyncio.gather(*self._ignored_tasks, return_exceptions=True)
         logger.debug('Terminating initialized providers')
         for name in list(self.initialized_providers):
-            del self[name]
-
-
-class AsyncProviderPool(ProviderPool):
-    """Subclass of :class:`ProviderPool` with asynchronous support for :meth:`~ProviderPool.list_subtitles`.
-
-    :param int max_workers: maximum number of threads to use. If `None`, :attr:`max_workers` will be set
-        to the number of :attr:`~ProviderPool.providers`.
-
-    """
-
-    #: Maximum number of threads to use.
-    max_workers: int
-
-    def __init__(self, max_workers: int | None = None, *args: Any, **kwargs: Any) -> None:
-        super().__init__(*args, **kwargs)
-
-        #: Maximum number of threads to use
-        self.max_workers = max_workers or len(self.providers)
-
-    def list_subtitles_provider_tuple(
-        self,
-        provider: str,
-        video: Video,
-        languages: Set[Language],
-    ) -> tuple[str, list[Subtitle] | None]:
-        """List subtitles with a single provider, multi-threaded."""
-        return provider, super().list_subtitles_provider(provider, video, languages)
-
-    def list_subtitles(self, video: Video, languages: Set[Language]) -> list[Subtitle]:
-        """List subtitles, multi-threaded."""
-        subtitles: list[Subtitle] = []
-
-        # Avoid raising a ValueError with `ThreadPoolExecutor(self.max_workers)`
-        if self.max_workers == 0:  # pragma: no cover
-            return subtitles
-
-        with ThreadPoolExecutor(self.max_workers) as executor:
-            executor_map = executor.map(
-                self.list_subtitles_provider_tuple,
-                self.providers,
-                itertools.repeat(video, len(self.providers)),
-                itertools.repeat(languages, len(self.providers)),
-            )
-            for provider, provider_subtitles in executor_map:
-                # discard provider that failed
-                if provider_subtitles is None:
-                    logger.info('Discarding provider %s', provider)
-                    self.discarded_providers.add(provider)
-                    continue
-
-                # add subtitles
-                subtitles.extend(provider_subtitles)
-
-        return subtitles
+            provider = self.initialized_providers.pop(name)
+            try:
+                logger.info('Terminating provider %s', name)
+                await provider.terminate_async()
+            except Exception as e:  # noqa: BLE001  # pragma: no cover
+                handle_exception(e, f'Provider {name} improperly terminated')
 
 
 def check_video(
@@ -412,6 +2207,26 @@ def check_video(
     return True
 
 
+def group_videos(videos: Iterable[Video]) -> list[list[Video]]:
+    """Group the episodes of the same season, to list their subtitles at once.
+
+    The episodes are grouped by series, year and season, in the order of their first occurrence. Each movie
+    is in its own group.
+
+    :param videos: videos to group.
+    :type videos: list of :class:`~subliminal.video.Video`
+    :return: the groups of videos.
+    :rtype: list of list of :class:`~subliminal.video.Video`
+
+    """
+    groups: dict[Any, list[Video]] = {}
+    for video in videos:
+        key = (video.series, video.year, video.season) if isinstance(video, Episode) else video
+        groups.setdefault(key, []).append(video)
+
+    return list(groups.values())
+
+
 def parse_language_code(subtitle_filename: str, video_filename: str) -> str | None:
     """Parse the subtitle filename to extract the language.
 
@@ -442,6 +2257,7 @@ def search_external_subtitles(
     """Search for external subtitles from a video `path` and their associated language.
 
     Unless `directory` is provided, search will be made in the same directory as the video file.
+    Use :func:`search_external_subtitles_batch` to search for many videos at once.
 
     :param str path: path to the video.
     :param str directory: directory to search for subtitles.
@@ -449,23 +2265,63 @@ def search_external_subtitles(
     :rtype: dict
 
     """
-    # split path
-    dirpath, filename = os.path.split(path)
-    dirpath = dirpath or '.'
-
-    # search for subtitles
-    subtitles = {}
-    for p in os.listdir(directory or dirpath):
-        language_code = parse_language_code(p, filename)
-        if language_code is None:
-            continue
+    return search_external_subtitles_batch([path], directory=directory)[os.fspath(path)]
+
+
+def search_external_subtitles_batch(
+    paths: Iterable[str | os.PathLike],
+    *,
+    directory: str | os.PathLike | None = None,
+) -> dict[str, dict[str, ExternalSubtitle]]:
+    """Search for external subtitles of many videos, listing each directory only once.
+
+    The videos are grouped by directory and, in each directory, the subtitle files are matched to the videos with
+    an index of the video file roots, instead of parsing every file for every video.
+    Unless `directory` is provided, search will be made in the same directory as each video file.
+
+    :param paths: paths to the videos.
+    :type paths: iterable of str
+    :param str directory: directory to search for subtitles.
+    :return: found subtitles with their languages, per video path.
+    :rtype: dict[str, dict[str, :class:`~subliminal.subtitle.ExternalSubtitle`]]
+
+    """
+    # group the video filenames by directory
+    filenames_by_dirpath: dict[str, dict[str, list[str]]] = defaultdict(lambda: defaultdict(list))
+    results: dict[str, dict[str, ExternalSubtitle]] = {}
+    for path in paths:
+        path = os.fspath(path)
+        dirpath, filename = os.path.split(path)
+        dirpath = os.fspath(directory) if directory is not None else dirpath or '.'
+        filenames_by_dirpath[dirpath][filename].append(path)
+        results[path] = {}
+
+    for dirpath, paths_by_filename in filenames_by_dirpath.items():
+        # index of the video filename roots
+        filenames_by_root: dict[str, list[str]] = defaultdict(list)
+        for filename in paths_by_filename:
+            filenames_by_root[os.path.splitext(filename)[0]].append(filename)
+        root_lengths = sorted({len(root) for root in filenames_by_root})
+
+        # list the directory once
+        for p in os.listdir(dirpath):
+            if not p.lower().endswith(SUBTITLE_EXTENSIONS):
+                continue
+
+            # only the videos with a root that is a prefix of the subtitle filename can match
+            for length in root_lengths:
+                for filename in filenames_by_root.get(p[:length], []):
+                    language_code = parse_language_code(p, filename)
+                    if language_code is None:  # pragma: no cover
+                        continue
 
-        subtitle = ExternalSubtitle.from_language_code(language_code, subtitle_path=p)
-        subtitles[p] = subtitle
+                    for path in paths_by_filename[filename]:
+                        results[path][p] = ExternalSubtitle.from_language_code(language_code, subtitle_path=p)
 
-    logger.debug('Found subtitles %r', subtitles)
+    for path, subtitles in results.items():
+        logger.debug('Found subtitles for %r: %r', path, subtitles)
 
-    return subtitles
+    return results
 
 
 def scan_name(path: str | os.PathLike, name: str | None = None) -> Video:
@@ -486,20 +2342,33 @@ def scan_name(path: str | os.PathLike, name: str | None = None) -> Video:
     return Video.fromguess(path, safely_guessit(repl))
 
 
-def scan_video(path: str | os.PathLike, name: str | None = None) -> Video:
+def scan_video(
+    path: str | os.PathLike,
+    name: str | None = None,
+    *,
+    file_info: FileInfo | None = None,
+    index: ScanIndex | None = None,
+) -> Video:
     """Scan a video from an existing `path`.
 
     :param str path: existing path to the video.
     :param str name: if defined, name to use with guessit instead of the path.
+    :param file_info: cached information about the file at `path`, if None the file is stat-ed.
+    :type file_info: :class:`~subliminal.utils.FileInfo`
+    :param index: if defined, reuse the guess stored in the index if the file did not change.
+    :type index: :class:`~subliminal.scan_index.ScanIndex`
     :return: the scanned video.
     :rtype: :class:`~subliminal.video.Video`
     :raises: :class:`ValueError`: video path is not well defined.
     """
     path = os.fspath(path)
     # check for non-existing path
-    if not os.path.exists(path):
-        msg = 'Path does not exist'
-        raise ValueError(msg)
+    if file_info is None:
+        try:
+            file_info = FileInfo.from_path(path)
+        except OSError as e:
+            msg = 'Path does not exist'
+            raise ValueError(msg) from e
 
     # check video extension
     if not path.lower().endswith(VIDEO_EXTENSIONS):
@@ -507,27 +2376,41 @@ def scan_video(path: str | os.PathLike, name: str | None = None) -> Video:
         raise ValueError(msg)
 
     # guess
-    video = scan_name(path, name=name)
+    if index is not None:
+        video = Video.fromguess(path, index.guess(file_info, name=name, path=path))
+    else:
+        video = scan_name(path, name=name)
 
     # size
-    video.size = os.path.getsize(path)
+    video.size = file_info.size
+    video.file_info = file_info
     logger.debug('Size is %d', video.size)
 
     return video
 
 
-def scan_video_or_archive(path: str | os.PathLike, name: str | None = None) -> Video:
+def scan_video_or_archive(
+    path: str | os.PathLike,
+    name: str | None = None,
+    *,
+    file_info: FileInfo | None = None,
+    index: ScanIndex | None = None,
+) -> Video:
     """Scan a video or an archive from a `path`.
 
     :param str path: existing path to the video or archive.
     :param str name: if defined, name to use with guessit instead of the path.
+    :param file_info: cached information about the file at `path`, if known.
+    :type file_info: :class:`~subliminal.utils.FileInfo`
+    :param index: if defined, reuse the guess stored in the index for unchanged videos.
+    :type index: :class:`~subliminal.scan_index.ScanIndex`
     :return: the scanned video.
     :rtype: :class:`~subliminal.video.Video`
     :raises: :class:`ValueError`: video path is not well defined.
     """
     path = os.fspath(path)
     # check for non-existing path
-    if not os.path.exists(path):
+    if file_info is None and not os.path.exists(path):
         msg = 'Path does not exist'
         raise ValueError(msg)
 
@@ -535,7 +2418,7 @@ def scan_video_or_archive(path: str | os.PathLike, name: str | None = None) -> V
     filename = os.path.basename(path)
     if filename.lower().endswith(VIDEO_EXTENSIONS):
         # scan video
-        return scan_video(path, name=name)
+        return scan_video(path, name=name, file_info=file_info, index=index)
 
     if is_supported_archive(filename):
         # scan archive
@@ -551,37 +2434,138 @@ def scan_video_or_archive(path: str | os.PathLike, name: str | None = None) -> V
     raise ValueError(msg)  # pragma: no cover
 
 
-def scan_path(filepath: str | os.PathLike[str], *, name: str | None = None) -> Video:
+def scan_path(
+    filepath: str | os.PathLike[str],
+    *,
+    name: str | None = None,
+    file_info: FileInfo | None = None,
+    index: ScanIndex | None = None,
+) -> Video:
     """Scan a video or an archive from a `path`, maybe non-existing.
 
     :param str path: path to the video or archive, may be an existing path or not.
     :param str name: if defined, name to use with guessit instead of the path.
+    :param file_info: cached information about the file at `path`, if it was collected from the filesystem.
+    :type file_info: :class:`~subliminal.utils.FileInfo`
+    :param index: if defined, reuse the guess stored in the index for unchanged videos.
+    :type index: :class:`~subliminal.scan_index.ScanIndex`
     :return: the scanned video.
     :rtype: :class:`~subliminal.video.Video`
     :raises: :class:`ValueError`: video path is not well defined.
     """
-    if not os.path.isfile(filepath):
+    if file_info is None and not os.path.isfile(filepath):
         return scan_name(filepath, name=name)
-    return scan_video_or_archive(filepath, name=name)
+    return scan_video_or_archive(filepath, name=name, file_info=file_info, index=index)
 
 
-def collect_video_filepaths(
+def _scan_directory(dirpath: str, *, archives: bool = True) -> tuple[list[FileInfo], list[str]]:
+    """List a directory once with :func:`os.scandir`.
+
+    Hidden and sample files and directories are skipped, as well as links.
+
+    :param str dirpath: path of the directory.
+    :param bool archives: collect archives as well as videos.
+    :return: the candidate files, sorted by name, and the subdirectories to walk.
+    :rtype: tuple[list[:class:`~subliminal.utils.FileInfo`], list[str]]
+    """
+    logger.debug('Walking directory %r', dirpath)
+    extensions = VIDEO_EXTENSIONS + ARCHIVE_EXTENSIONS if archives else VIDEO_EXTENSIONS
+
+    files: list[FileInfo] = []
+    subdirs: list[str] = []
+    try:
+        with os.scandir(dirpath) as it:
+            entries = sorted(it, key=operator.attrgetter('name'))
+    except OSError:
+        logger.warning('Could not list directory %r', dirpath)
+        return files, subdirs
+
+    for entry in entries:
+        name = entry.name
+        try:
+            is_dir = entry.is_dir()
+        except OSError:  # pragma: no cover
+            is_dir = False
+
+        if is_dir:
+            # remove hidden dirnames
+            if name.startswith('.'):
+                logger.debug('Skipping hidden dirname %r in %r', name, dirpath)
+                continue
+            # Skip Sample folder
+            if name.lower() == 'sample':
+                logger.debug('Skipping sample dirname %r in %r', name, dirpath)
+                continue
+            # do not follow links to directories
+            if entry.is_symlink():
+                continue
+            subdirs.append(entry.path)
+            continue
+
+        # filter on videos and archives
+        if not name.lower().endswith(extensions):
+            continue
+
+        # skip hidden files
+        if name.startswith('.'):
+            logger.debug('Skipping hidden filename %r in %r', name, dirpath)
+            continue
+        # skip 'sample' media files
+        if os.path.splitext(name)[0].lower() == 'sample':
+            logger.debug('Skipping sample filename %r in %r', name, dirpath)
+            continue
+
+        # skip links
+        if entry.is_symlink():
+            logger.debug('Skipping link %r in %r', name, dirpath)
+            continue
+
+        try:
+            file_info = FileInfo.from_entry(entry)
+        except OSError:  # pragma: no cover
+            logger.warning('Could not get age of file %r in %r', name, dirpath)
+            continue
+        files.append(file_info)
+
+    return files, subdirs
+
+
+def walk_video_files(path: str | os.PathLike, *, archives: bool = True) -> Iterator[FileInfo]:
+    """Walk the directory `path` and yield the video (and archive) files.
+
+    Each directory is listed only once with :func:`os.scandir` and the file information is taken
+    from the directory entries, avoiding additional system calls per file.
+
+    :param str path: directory path to walk.
+    :param bool archives: collect archives as well as videos.
+    :return: the collected files.
+    :rtype: iterator of :class:`~subliminal.utils.FileInfo`
+    """
+    files, subdirs = _scan_directory(os.fspath(path), archives=archives)
+    yield from files
+    for subdir in subdirs:
+        yield from walk_video_files(subdir, archives=archives)
+
+
+def collect_video_files(
     path: str | os.PathLike,
     *,
     age: timedelta | None = None,
     use_ctime: bool = True,
     archives: bool = True,
-    name: str | None = None,
-) -> list[str]:
-    """Collect video file paths in directory `path`.
+    max_workers: int | None = None,
+) -> list[FileInfo]:
+    """Collect video files in directory `path`, with their cached file information.
 
     :param str path: existing directory path to scan.
     :param datetime.timedelta age: maximum age of the video or archive.
     :param bool use_ctime: use the latest of creation time and modification time to compute the age of the video,
         instead of just modification time.
     :param bool archives: scan videos in archives.
-    :return: the collected video file names.
-    :rtype: list of str
+    :param int max_workers: maximum number of threads used to walk the top-level subdirectories in parallel.
+        If None or 1, the directory is walked in the current thread.
+    :return: the collected video files.
+    :rtype: list of :class:`~subliminal.utils.FileInfo`
     :raises: :class:`ValueError`: video path is not well defined.
     """
     path = os.fspath(path)
@@ -595,60 +2579,52 @@ def collect_video_filepaths(
         msg = 'Path is not a directory'
         raise ValueError(msg)
 
-    # walk the path
-    video_filepaths = []
-    for dirpath, dirnames, filenames in os.walk(path):
-        logger.debug('Walking directory %r', dirpath)
+    # walk the path, the top-level subdirectories are independent and can be walked in parallel
+    files, subdirs = _scan_directory(path, archives=archives)
+    if max_workers is not None and max_workers > 1 and len(subdirs) > 1:
+        with ThreadPoolExecutor(min(max_workers, len(subdirs))) as executor:
+            for subdir_files in executor.map(lambda d: list(walk_video_files(d, archives=archives)), subdirs):
+                files.extend(subdir_files)
+    else:
+        for subdir in subdirs:
+            files.extend(walk_video_files(subdir, archives=archives))
 
-        # remove badly encoded and hidden dirnames
-        for dirname in list(dirnames):
-            if dirname.startswith('.'):
-                logger.debug('Skipping hidden dirname %r in %r', dirname, dirpath)
-                dirnames.remove(dirname)
-            # Skip Sample folder
-            if dirname.lower() == 'sample':
-                logger.debug('Skipping sample dirname %r in %r', dirname, dirpath)
-                dirnames.remove(dirname)
-
-        # scan for videos
-        for filename in sorted(filenames):
-            # filter on videos and archives
-            if not filename.lower().endswith(VIDEO_EXTENSIONS) and not (
-                archives and filename.lower().endswith(ARCHIVE_EXTENSIONS)
-            ):
-                continue
+    # skip old files
+    if age is None:
+        return files
 
-            # skip hidden files
-            if filename.startswith('.'):
-                logger.debug('Skipping hidden filename %r in %r', filename, dirpath)
-                continue
-            # skip 'sample' media files
-            if os.path.splitext(filename)[0].lower() == 'sample':
-                logger.debug('Skipping sample filename %r in %r', filename, dirpath)
-                continue
+    video_files = []
+    for file_info in files:
+        if file_info.get_age(use_ctime=use_ctime) > age:
+            logger.debug('Skipping old file %r', file_info.path)
+            continue
+        video_files.append(file_info)
 
-            # reconstruct the file path
-            filepath = os.path.join(dirpath, filename)
+    return video_files
 
-            # skip links
-            if os.path.islink(filepath):
-                logger.debug('Skipping link %r in %r', filename, dirpath)
-                continue
 
-            # skip old files
-            try:
-                file_age = get_age(filepath, use_ctime=use_ctime)
-            except ValueError:  # pragma: no cover
-                logger.warning('Could not get age of file %r in %r', filename, dirpath)
-                continue
-            else:
-                if age and file_age > age:
-                    logger.debug('Skipping old file %r in %r', filename, dirpath)
-                    continue
+def collect_video_filepaths(
+    path: str | os.PathLike,
+    *,
+    age: timedelta | None = None,
+    use_ctime: bool = True,
+    archives: bool = True,
+    name: str | None = None,
+) -> list[str]:
+    """Collect video file paths in directory `path`.
 
-            video_filepaths.append(filepath)
+    See :func:`collect_video_files` to also get the cached file information.
 
-    return video_filepaths
+    :param str path: existing directory path to scan.
+    :param datetime.timedelta age: maximum age of the video or archive.
+    :param bool use_ctime: use the latest of creation time and modification time to compute the age of the video,
+        instead of just modification time.
+    :param bool archives: scan videos in archives.
+    :return: the collected video file names.
+    :rtype: list of str
+    :raises: :class:`ValueError`: video path is not well defined.
+    """
+    return [f.path for f in collect_video_files(path, age=age, use_ctime=use_ctime, archives=archives)]
 
 
 def scan_videos(
@@ -658,6 +2634,8 @@ def scan_videos(
     use_ctime: bool = False,
     archives: bool = True,
     name: str | None = None,
+    index: ScanIndex | None = None,
+    workers: int | None = None,
 ) -> list[Video]:
     """Scan `path` for videos and their subtitles.
 
@@ -669,21 +2647,39 @@ def scan_videos(
         instead of just modification time.
     :param bool archives: scan videos in archives.
     :param str name: name to use with guessit instead of the path.
+    :param index: if defined, only guess the new or modified videos and reuse the indexed guesses for the others.
+    :type index: :class:`~subliminal.scan_index.ScanIndex`
+    :param int workers: number of processes used to guess the videos in parallel, if None or 1 guess them
+        in the current process.
     :return: the scanned videos.
     :rtype: list of :class:`~subliminal.video.Video`
     :raises: :class:`ValueError`: video path is not well defined.
     """
-    filepaths = collect_video_filepaths(path, age=age, use_ctime=use_ctime, archives=archives)
+    video_files = collect_video_files(path, age=age, use_ctime=use_ctime, archives=archives)
+
+    # guess the videos in parallel, the guesses are then retrieved from the index
+    temporary_index = None
+    if workers is not None and workers > 1:
+        if index is None:
+            index = temporary_index = ScanIndex(':memory:')
+        index.guess_batch(
+            [f for f in video_files if f.path.lower().endswith(VIDEO_EXTENSIONS)],
+            name=name,
+            workers=workers,
+        )
 
     videos = []
-    for filepath in filepaths:
+    for file_info in video_files:
         try:
-            video = scan_video_or_archive(filepath, name=name)
+            video = scan_video_or_archive(file_info.path, name=name, file_info=file_info, index=index)
         except ValueError:
             logger.exception('Error scanning video')
             continue
         videos.append(video)
 
+    if temporary_index is not None:
+        temporary_index.close()
+
     return videos
 
 
@@ -739,7 +2735,7 @@ def list_subtitles(
     :param languages: languages to search for.
     :type languages: set of :class:`~babelfish.language.Language`
     :param pool_class: class to use as provider pool.
-    :type pool_class: :class:`ProviderPool`, :class:`AsyncProviderPool` or similar
+    :type pool_class: :class:`ProviderPool`, :class:`AsyncProviderPool`, :class:`BatchProviderPool` or similar
     :param kwargs: additional parameters for the provided `pool_class` constructor.
     :return: found subtitles per video.
     :rtype: dict of :class:`~subliminal.video.Video` to list of :class:`~subliminal.subtitle.Subtitle`
@@ -759,13 +2755,19 @@ def list_subtitles(
     if not checked_videos:
         return listed_subtitles
 
-    # list subtitles
+    # group the videos by missing languages
+    videos_by_languages: dict[frozenset[Language], list[Video]] = defaultdict(list)
+    for video in checked_videos:
+        videos_by_languages[frozenset(languages - video.subtitle_languages)].append(video)
+
+    # list subtitles, batching the episodes of the same season
     with pool_class(**kwargs) as pool:
-        for video in checked_videos:
-            logger.info('Listing subtitles for %r', video)
-            subtitles = pool.list_subtitles(video, languages - video.subtitle_languages)
-            listed_subtitles[video].extend(subtitles)
-            logger.info('Found %d subtitle(s)', len(subtitles))
+        for video_languages, grouped_videos in videos_by_languages.items():
+            logger.info('Listing subtitles for %d video(s)', len(grouped_videos))
+            results = pool.list_subtitles_batch(grouped_videos, video_languages)
+            for video, subtitles in zip(grouped_videos, results, strict=True):
+                listed_subtitles[video].extend(subtitles)
+                logger.info('Found %d subtitle(s) for %r', len(subtitles), video)
 
     return listed_subtitles
 
@@ -781,14 +2783,12 @@ def download_subtitles(
     :param subtitles: subtitles to download.
     :type subtitles: list of :class:`~subliminal.subtitle.Subtitle`
     :param pool_class: class to use as provider pool.
-    :type pool_class: :class:`ProviderPool`, :class:`AsyncProviderPool` or similar
+    :type pool_class: :class:`ProviderPool`, :class:`AsyncProviderPool`, :class:`BatchProviderPool` or similar
     :param kwargs: additional parameters for the provided `pool_class` constructor.
 
     """
     with pool_class(**kwargs) as pool:
-        for subtitle in subtitles:
-            logger.info('Downloading subtitle %r', subtitle)
-            pool.download_subtitle(subtitle)
+        pool.download_subtitles(subtitles)
 
 
 def download_best_subtitles(
@@ -801,6 +2801,8 @@ def download_best_subtitles(
     skip_wrong_fps: bool = False,
     only_one: bool = False,
     compute_score: ComputeScore | None = None,
+    early_termination: bool = False,
+    hedging: Hedging | None = None,
     pool_class: type[ProviderPool] = ProviderPool,
     **kwargs: Any,
 ) -> dict[Video, list[Subtitle]]:
@@ -819,8 +2821,12 @@ def download_best_subtitles(
     :param bool only_one: download only one subtitle, not one per language.
     :param compute_score: function that takes `subtitle` and `video` as positional arguments,
         `hearing_impaired` as keyword argument and returns the score.
+    :param bool early_termination: stop listing the subtitles of a video as soon as no better subtitle can be
+        found, see :meth:`ProviderPool.list_best_subtitles`.
+    :param hedging: settings of the speculative downloads of the runner-up subtitles, if enabled.
+    :type hedging: :class:`Hedging`
     :param pool_class: class to use as provider pool.
-    :type pool_class: :class:`ProviderPool`, :class:`AsyncProviderPool` or similar
+    :type pool_class: :class:`ProviderPool`, :class:`AsyncProviderPool`, :class:`BatchProviderPool` or similar
     :param kwargs: additional parameters for the provided `pool_class` constructor.
     :return: downloaded subtitles per video.
     :rtype: dict of :class:`~subliminal.video.Video` to list of :class:`~subliminal.subtitle.Subtitle`
@@ -842,22 +2848,126 @@ def download_best_subtitles(
 
     # download best subtitles
     with pool_class(**kwargs) as pool:
-        for video in checked_videos:
+
+        def download_video_subtitles(video: Video) -> list[Subtitle]:
             logger.info('Downloading best subtitles for %r', video)
-            subtitles = pool.download_best_subtitles(
-                pool.list_subtitles(video, languages - video.subtitle_languages),
-                video,
-                languages,
-                min_score=min_score,
-                hearing_impaired=hearing_impaired,
-                foreign_only=foreign_only,
-                skip_wrong_fps=skip_wrong_fps,
-                only_one=only_one,
-                compute_score=compute_score,
-            )
-            logger.info('Downloaded %d subtitle(s)', len(subtitles))
+            # the listings and the downloads share the time budget of the video
+            with pool.video_budget(video):
+                if early_termination:
+                    subtitles = pool.list_best_subtitles(
+                        video,
+                        languages - video.subtitle_languages,
+                        hearing_impaired=hearing_impaired,
+                        foreign_only=foreign_only,
+                        skip_wrong_fps=skip_wrong_fps,
+                        only_one=only_one,
+                        compute_score=compute_score,
+                    )
+                else:
+                    subtitles = pool.list_subtitles(video, languages - video.subtitle_languages)
+                return pool.download_best_subtitles(
+                    subtitles,
+                    video,
+                    languages,
+                    min_score=min_score,
+                    hearing_impaired=hearing_impaired,
+                    foreign_only=foreign_only,
+                    skip_wrong_fps=skip_wrong_fps,
+                    only_one=only_one,
+                    compute_score=compute_score,
+                    hedging=hedging,
+                )
+
+        for video, subtitles in pool.process_videos(download_video_subtitles, checked_videos):
+            logger.info('Downloaded %d subtitle(s) for %r', len(subtitles), video)
+            downloaded_subtitles[video].extend(subtitles)
+
+    if pool.time_saved > 0:
+        logger.info('Stopping the listings early saved %.1fs', pool.time_saved)
+
+    return downloaded_subtitles
+
+
+async def download_best_subtitles_async(
+    videos: Set[Video],
+    languages: Set[Language],
+    *,
+    min_score: int = 0,
+    hearing_impaired: bool | None = None,
+    foreign_only: bool | None = None,
+    skip_wrong_fps: bool = False,
+    only_one: bool = False,
+    compute_score: ComputeScore | None = None,
+    early_termination: bool = False,
+    hedging: Hedging | None = None,
+    pool_class: type[AsyncioProviderPool] = AsyncioProviderPool,
+    **kwargs: Any,
+) -> dict[Video, list[Subtitle]]:
+    """List and download the best matching subtitles, processing all the videos concurrently.
+
+    This is the asyncio version of :func:`download_best_subtitles`, with the same parameters.
+
+    :param pool_class: class to use as provider pool.
+    :type pool_class: :class:`AsyncioProviderPool` or similar
+    :param kwargs: additional parameters for the provided `pool_class` constructor.
+    :return: downloaded subtitles per video.
+    :rtype: dict of :class:`~subliminal.video.Video` to list of :class:`~subliminal.subtitle.Subtitle`
+
+    """
+    downloaded_subtitles: dict[Video, list[Subtitle]] = defaultdict(list)
+
+    # check videos
+    checked_videos = []
+    for video in videos:
+        if not check_video(video, languages=languages, undefined=only_one):
+            logger.info('Skipping video %r', video)
+            continue
+        checked_videos.append(video)
+
+    # return immediately if no video passed the checks
+    if not checked_videos:
+        return downloaded_subtitles
+
+    # download best subtitles
+    async with pool_class(**kwargs) as pool:
+
+        async def download_video_subtitles(video: Video) -> list[Subtitle]:
+            logger.info('Downloading best subtitles for %r', video)
+            # the listings and the downloads share the time budget of the video
+            with pool.video_budget(video):
+                if early_termination:
+                    subtitles = await pool.list_best_subtitles(
+                        video,
+                        languages - video.subtitle_languages,
+                        hearing_impaired=hearing_impaired,
+                        foreign_only=foreign_only,
+                        skip_wrong_fps=skip_wrong_fps,
+                        only_one=only_one,
+                        compute_score=compute_score,
+                    )
+                else:
+                    subtitles = await pool.list_subtitles(video, languages - video.subtitle_languages)
+                return await pool.download_best_subtitles(
+                    subtitles,
+                    video,
+                    languages,
+                    min_score=min_score,
+                    hearing_impaired=hearing_impaired,
+                    foreign_only=foreign_only,
+                    skip_wrong_fps=skip_wrong_fps,
+                    only_one=only_one,
+                    compute_score=compute_score,
+                    hedging=hedging,
+                )
+
+        results = await asyncio.gather(*(download_video_subtitles(video) for video in checked_videos))
+        for video, subtitles in zip(checked_videos, results, strict=True):
+            logger.info('Downloaded %d subtitle(s) for %r', len(subtitles), video)
             downloaded_subtitles[video].extend(subtitles)
 
+    if pool.time_saved > 0:
+        logger.info('Stopping the listings early saved %.1fs', pool.time_saved)
+
     return downloaded_subtitles
 
 
@@ -198,3 +198,6 @@ discarded_movie_refiners: list[str] = ['tvdb']
 
 #: Discarded Episode refiners
 discarded_episode_refiners: list[str] = []
+
+#: Refiners that do not use the network
+local_refiners: list[str] = ['hash', 'metadata']
@@ -0,0 +1,289 @@
+"""Compute the video hashes required by the providers, opening each file only once.
+
+A :class:`Hasher` declares the byte ranges of the file it needs and consumes them incrementally.
+:func:`compute_hashes` reads the union of the ranges of the requested hashers in chunks of
+:data:`CHUNK_SIZE` bytes and feeds each chunk to every hasher that needs it.
+
+Providers declare the hasher they use with :attr:`~subliminal.providers.Provider.hasher`.
+
+:func:`compute_cached_hashes` keeps the hashes in a bounded in-memory LRU cache and in the
+:data:`~subliminal.cache.region`, keyed by the identity of the file (device, inode, size and
+modification time), so unchanged files are never read again and replaced files are hashed again.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+from dogpile.cache.api import NO_VALUE
+
+from .cache import HASH_EXPIRATION_TIME, region
+from .utils import FileInfo, sum_uint64
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+logger = logging.getLogger(__name__)
+
+#: Size of the chunks read from the video files
+CHUNK_SIZE = 1024 * 1024
+
+#: Maximum number of hashes kept in memory
+MEMORY_CACHE_SIZE = 4096
+
+
+class HashState(ABC):
+    """State of a hash computation, fed with the data of the ranges of its :class:`Hasher`, in order."""
+
+    @abstractmethod
+    def update(self, data: bytes | memoryview) -> None:
+        """Consume the next `data`."""
+
+    @abstractmethod
+    def hexdigest(self) -> str:
+        """Get the hash, once all the data was consumed."""
+
+
+class Hasher(ABC):
+    """Base class for video hashers."""
+
+    #: Name of the hasher
+    name: str
+
+    @abstractmethod
+    def ranges(self, size: int) -> list[tuple[int, int]] | None:
+        """Get the byte ranges required to hash a file.
+
+        :param int size: size of the file.
+        :return: sorted and non-overlapping `(start, stop)` ranges, or None if the file cannot be hashed.
+        :rtype: list[tuple[int, int]] | None
+
+        """
+
+    @abstractmethod
+    def start(self, size: int) -> HashState:
+        """Start the computation of a hash.
+
+        :param int size: size of the file.
+        :return: the state to feed with the data of the :meth:`ranges`.
+        :rtype: :class:`HashState`
+
+        """
+
+
+class _OpenSubtitlesState(HashState):
+    def __init__(self, size: int) -> None:
+        self.value = size
+        self.rest = b''
+
+    def update(self, data: bytes | memoryview) -> None:
+        data = self.rest + bytes(data)
+        aligned = len(data) - len(data) % 8
+        self.value = (self.value + sum_uint64(data[:aligned])) & 0xFFFFFFFFFFFFFFFF
+        self.rest = data[aligned:]
+
+    def hexdigest(self) -> str:
+        return f'{self.value:016x}'
+
+
+class OpenSubtitlesHasher(Hasher):
+    """OpenSubtitles' algorithm: the size of the file plus the 64-bit words of its first and last 64KiB.
+
+    It is also used by BSPlayer and Subtis.
+    """
+
+    name = 'opensubtitles'
+
+    #: Size of the head and tail blocks
+    block_size = 65536
+
+    def ranges(self, size: int) -> list[tuple[int, int]] | None:  # noqa: D102
+        if size < self.block_size * 2:
+            return None
+        return [(0, self.block_size), (size - self.block_size, size)]
+
+    def start(self, size: int) -> HashState:  # noqa: D102
+        return _OpenSubtitlesState(size)
+
+
+class _HashlibState(HashState):
+    def __init__(self, name: str) -> None:
+        self.hash = hashlib.new(name, usedforsecurity=False)
+
+    def update(self, data: bytes | memoryview) -> None:
+        self.hash.update(data)
+
+    def hexdigest(self) -> str:
+        return self.hash.hexdigest()
+
+
+class NapiProjektHasher(Hasher):
+    """NapiProjekt's algorithm: the MD5 of the first 10MiB of the file."""
+
+    name = 'napiprojekt'
+
+    #: Size of the hashed head of the file
+    head_size = 1024 * 1024 * 10
+
+    def ranges(self, size: int) -> list[tuple[int, int]] | None:  # noqa: D102
+        return [(0, min(size, self.head_size))]
+
+    def start(self, size: int) -> HashState:  # noqa: D102
+        return _HashlibState('md5')
+
+
+#: Available hashers, by name
+hashers: dict[str, Hasher] = {}
+
+
+def register_hasher(hasher: Hasher) -> None:
+    """Register a hasher, so it can be used by the providers.
+
+    :param hasher: the hasher, registered by its :attr:`~Hasher.name`.
+    :type hasher: :class:`Hasher`
+
+    """
+    hashers[hasher.name] = hasher
+
+
+register_hasher(OpenSubtitlesHasher())
+register_hasher(NapiProjektHasher())
+
+
+def _merge_ranges(ranges: Iterable[tuple[int, int]]) -> list[tuple[int, int]]:
+    """Merge overlapping or contiguous ranges."""
+    merged: list[tuple[int, int]] = []
+    for start, stop in sorted(ranges):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], stop))
+        else:
+            merged.append((start, stop))
+    return merged
+
+
+def compute_hashes(video_path: str | os.PathLike[str], names: Iterable[str]) -> dict[str, str]:
+    """Compute several hashes of a video, opening and reading it only once.
+
+    The file is read in chunks of :data:`CHUNK_SIZE` bytes, over the union of the byte ranges required
+    by the hashers, and each chunk is fed to the hashers that need it.
+
+    :param video_path: path of the video.
+    :param names: names of the :data:`hashers` to use.
+    :return: the hashes by hasher name, without the hashers that cannot hash the file.
+    :rtype: dict[str, str]
+    :raises: :class:`OSError` if the file cannot be read.
+
+    """
+    video_path = os.fspath(video_path)
+    with open(video_path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+
+        # hashers with their ranges and states
+        jobs: list[tuple[str, list[tuple[int, int]], HashState]] = []
+        for name in dict.fromkeys(names):
+            hasher = hashers[name]
+            ranges = hasher.ranges(size)
+            if ranges is None:
+                logger.debug('File %r cannot be hashed with %s', video_path, name)
+                continue
+            jobs.append((name, ranges, hasher.start(size)))
+
+        for start, stop in _merge_ranges(r for _, ranges, _ in jobs for r in ranges):
+            f.seek(start)
+            position = start
+            while position < stop:
+                chunk = memoryview(f.read(min(CHUNK_SIZE, stop - position)))
+                if not chunk:
+                    break
+                end = position + len(chunk)
+                for _, ranges, state in jobs:
+                    for range_start, range_stop in ranges:
+                        lower, upper = max(range_start, position), min(range_stop, end)
+                        if lower < upper:
+                            state.update(chunk[lower - position : upper - position])
+                position = end
+
+    return {name: state.hexdigest() for name, _, state in jobs}
+
+
+_memory_cache: OrderedDict[str, str] = OrderedDict()
+_memory_cache_lock = threading.Lock()
+
+
+def _cache_key(file_info: FileInfo, name: str) -> str:
+    device, inode, size, mtime_ns = file_info.identity
+    return f'subliminal.hashers:{name}:{device}:{inode}:{size}:{mtime_ns}'
+
+
+def _get_cached_hash(key: str) -> str | None:
+    with _memory_cache_lock:
+        value = _memory_cache.get(key)
+        if value is not None:
+            _memory_cache.move_to_end(key)
+            return value
+
+    if not region.is_configured:
+        return None
+    cached = region.get(key, expiration_time=HASH_EXPIRATION_TIME)
+    if cached is NO_VALUE:
+        return None
+    _set_memory_cached_hash(key, cached)
+    return cached  # type: ignore[no-any-return]
+
+
+def _set_memory_cached_hash(key: str, value: str) -> None:
+    with _memory_cache_lock:
+        _memory_cache[key] = value
+        _memory_cache.move_to_end(key)
+        while len(_memory_cache) > MEMORY_CACHE_SIZE:
+            _memory_cache.popitem(last=False)
+
+
+def clear_memory_cache() -> None:
+    """Clear the in-memory cache of :func:`compute_cached_hashes`, the persistent cache is kept."""
+    with _memory_cache_lock:
+        _memory_cache.clear()
+
+
+def compute_cached_hashes(video_path: str | os.PathLike[str], names: Iterable[str]) -> dict[str, str]:
+    """Like :func:`compute_hashes`, but only read the file for the hashes that are not cached yet.
+
+    The hashes are cached in memory, up to :data:`MEMORY_CACHE_SIZE` hashes, and in the
+    :data:`~subliminal.cache.region` if it is configured.
+
+    :param video_path: path of the video.
+    :param names: names of the :data:`hashers` to use.
+    :return: the hashes by hasher name, without the hashers that cannot hash the file.
+    :rtype: dict[str, str]
+    :raises: :class:`OSError` if the file cannot be read.
+
+    """
+    file_info = FileInfo.from_path(video_path)
+
+    hashes: dict[str, str] = {}
+    missing: list[str] = []
+    for name in dict.fromkeys(names):
+        value = _get_cached_hash(_cache_key(file_info, name))
+        if value is None:
+            missing.append(name)
+        else:
+            hashes[name] = value
+
+    if not missing:
+        logger.debug('Using cached hashes for %r', file_info.path)
+        return hashes
+
+    computed = compute_hashes(video_path, missing)
+    for name, value in computed.items():
+        key = _cache_key(file_info, name)
+        _set_memory_cached_hash(key, value)
+        if region.is_configured:
+            region.set(key, value)
+
+    return hashes | computed
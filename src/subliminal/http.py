@@ -0,0 +1,444 @@
+"""HTTP clients shared by the providers and the refiners.
+
+The synchronous clients are :class:`requests.Session` created by :func:`create_session`. Their
+:class:`TransportAdapter` keeps the connections alive in pools sized for the concurrency of the workers,
+see :func:`configure_connection_pools`, so the connections and their TLS handshakes are reused instead of
+discarded when many workers call the same host. The compressed responses are negotiated with the
+``Accept-Encoding`` header, and the requests and new connections of each host are counted in
+:data:`connection_metrics`. The responses of the sessions created with ``cached=True`` are stored in the
+:class:`~subliminal.http_cache.HTTPCache` and revalidated, see :mod:`subliminal.http_cache`.
+
+:class:`AsyncSession` is the asynchronous client used by the providers with native asyncio support.
+It uses `httpx <https://www.python-httpx.org/>`_ if installed (``pip install subliminal[async]``), with
+connection pooling and HTTP/2 if the ``h2`` module is available. Otherwise, the requests are sent
+with a :class:`requests.Session` in threads.
+
+The responses are always returned as :class:`requests.Response` objects, so the parsing code of a provider
+is the same for the synchronous and asynchronous API, and :class:`requests.HTTPError` is raised by
+:meth:`~requests.Response.raise_for_status` in both cases.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import logging
+import threading
+import weakref
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlsplit
+
+from requests import Response, Session
+from requests.structures import CaseInsensitiveDict
+from urllib3 import connectionpool  # type: ignore[import-untyped]
+from urllib3.util import make_headers  # type: ignore[import-untyped]
+
+from .http_cache import get_http_cache
+from .ratelimit import RateLimitAdapter
+
+try:
+    import httpx  # type: ignore[import-not-found,unused-ignore]
+except ImportError:  # pragma: no cover
+    httpx = None
+
+if TYPE_CHECKING:
+    import ssl
+    from collections.abc import Mapping
+    from types import TracebackType
+    from typing import Self
+
+    from requests import PreparedRequest
+
+    from .ratelimit import RateLimiter
+
+logger = logging.getLogger(__name__)
+
+#: HTTP/2 is available with httpx
+HTTP2 = httpx is not None and importlib.util.find_spec('h2') is not None
+
+#: Default number of connections kept alive for each host, see :func:`configure_connection_pools`
+POOL_SIZE = 10
+
+#: Compressions accepted in the responses
+ACCEPT_ENCODING: str = make_headers(accept_encoding=True)['accept-encoding']
+
+
+class HostMetrics:
+    """Connection metrics of a host."""
+
+    __slots__ = ('connections', 'requests')
+
+    #: Number of requests sent
+    requests: int
+
+    #: Number of connections opened
+    connections: int
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.connections = 0
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} requests={self.requests!r} connections={self.connections!r}>'
+
+    @property
+    def reused(self) -> int:
+        """Number of requests sent on a connection kept alive."""
+        return max(0, self.requests - self.connections)
+
+
+class ConnectionMetrics:
+    """Connection metrics of the hosts, to check that the connections are reused."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._hosts: dict[str, HostMetrics] = {}
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} hosts={len(self._hosts)!r}>'
+
+    def _get(self, host: str) -> HostMetrics:
+        if host not in self._hosts:
+            self._hosts[host] = HostMetrics()
+        return self._hosts[host]
+
+    def record_request(self, host: str) -> None:
+        """Count a request sent to the `host`."""
+        with self._lock:
+            self._get(host).requests += 1
+
+    def record_connection(self, host: str) -> None:
+        """Count a connection opened to the `host`."""
+        with self._lock:
+            self._get(host).connections += 1
+
+    @property
+    def hosts(self) -> dict[str, HostMetrics]:
+        """Metrics of each host, a copy."""
+        with self._lock:
+            return dict(self._hosts)
+
+    def reset(self) -> None:
+        """Forget the metrics."""
+        with self._lock:
+            self._hosts.clear()
+
+    def log(self) -> None:
+        """Log the metrics of each host."""
+        for host, metrics in sorted(self.hosts.items()):
+            logger.info(
+                'Host %s: %d request(s) on %d connection(s), %d reused',
+                host,
+                metrics.requests,
+                metrics.connections,
+                metrics.reused,
+            )
+
+
+#: Connection metrics of all the sessions created by :func:`create_session`
+connection_metrics = ConnectionMetrics()
+
+
+class _HTTPConnectionPool(connectionpool.HTTPConnectionPool):  # type: ignore[misc]
+    """Pool of HTTP connections, counting the connections opened."""
+
+    def _new_conn(self) -> Any:
+        connection_metrics.record_connection(self.host)
+        return super()._new_conn()
+
+
+class _HTTPSConnectionPool(connectionpool.HTTPSConnectionPool):  # type: ignore[misc]
+    """Pool of HTTPS connections, counting the connections opened."""
+
+    def _new_conn(self) -> Any:
+        connection_metrics.record_connection(self.host)
+        return super()._new_conn()
+
+
+_pool_size = POOL_SIZE
+_adapters: weakref.WeakSet[TransportAdapter] = weakref.WeakSet()
+_adapters_lock = threading.Lock()
+
+
+def configure_connection_pools(pool_size: int | None) -> None:
+    """Set the number of connections kept alive for each host, typically the number of concurrent workers.
+
+    The pools of the existing :class:`TransportAdapter` are resized, their idle connections are closed.
+
+    :param pool_size: number of connections kept alive for each host, or None for :data:`POOL_SIZE`.
+
+    """
+    global _pool_size
+    with _adapters_lock:
+        _pool_size = max(1, pool_size) if pool_size is not None else POOL_SIZE
+        adapters = list(_adapters)
+    for adapter in adapters:
+        if adapter.pool_size != _pool_size:
+            adapter.resize(_pool_size)
+
+
+class TransportAdapter(RateLimitAdapter):
+    """:class:`~subliminal.ratelimit.RateLimitAdapter` with pools of connections sized for the concurrency.
+
+    It counts the requests and the connections in :data:`connection_metrics`.
+
+    :param rate_limiter: the rate limiter, if None the requests are not limited.
+    :type rate_limiter: :class:`~subliminal.ratelimit.RateLimiter`
+    :param int pool_size: number of connections kept alive for each host, if None it is set by
+        :func:`configure_connection_pools` and follows its changes.
+    :param bool cached: store the responses to the GET requests in the cache configured with
+        :func:`~subliminal.http_cache.configure_http_cache`, and revalidate them.
+
+    """
+
+    #: Number of connections kept alive for each host
+    pool_size: int
+
+    #: The responses are stored in the HTTP cache
+    cached: bool
+
+    def __init__(
+        self,
+        rate_limiter: RateLimiter | None = None,
+        *,
+        pool_size: int | None = None,
+        cached: bool = False,
+    ) -> None:
+        self.pool_size = pool_size if pool_size is not None else _pool_size
+        self.cached = cached
+        super().__init__(rate_limiter, pool_connections=self.pool_size, pool_maxsize=self.pool_size)
+        if pool_size is None:
+            with _adapters_lock:
+                _adapters.add(self)
+
+    @classmethod
+    def create_ssl_context(cls) -> ssl.SSLContext | None:
+        """Create the SSL context of the connections, also used by :class:`AsyncSession`, or None for the default."""
+        return None
+
+    def init_poolmanager(self, connections: int, maxsize: int, block: bool = False, **pool_kwargs: Any) -> None:  # noqa: FBT001, FBT002
+        """Create and initialize the urllib3 PoolManager, with the pools counting the connections."""
+        super().init_poolmanager(connections, maxsize, block, **pool_kwargs)
+        self.poolmanager.pool_classes_by_scheme = {'http': _HTTPConnectionPool, 'https': _HTTPSConnectionPool}
+
+    def resize(self, pool_size: int) -> None:
+        """Resize the pools, closing the idle connections.
+
+        :param int pool_size: number of connections kept alive for each host.
+
+        """
+        self.pool_size = pool_size
+        self.poolmanager.clear()
+        self.init_poolmanager(pool_size, pool_size)
+
+    def send(self, request: PreparedRequest, *args: Any, **kwargs: Any) -> Response:
+        """Send the request, when the rate limiter allows it, and count it.
+
+        With :attr:`cached`, a fresh stored response is returned without request, and a stale one is revalidated.
+
+        """
+        http_cache = get_http_cache() if self.cached else None
+        if http_cache is None or request.method != 'GET' or kwargs.get('stream') or request.url is None:
+            connection_metrics.record_request(urlsplit(request.url or '').hostname or '')
+            return super().send(request, *args, **kwargs)
+
+        cached = http_cache.get(request.url)
+        if cached is not None and cached.fresh:
+            http_cache.record_hit()
+            return cached.to_response(request)
+        if cached is not None:
+            request.headers.update(cached.validators)
+
+        connection_metrics.record_request(urlsplit(request.url).hostname or '')
+        response = super().send(request, *args, **kwargs)
+        if cached is not None and response.status_code == 304:
+            http_cache.record_revalidation()
+            # read the empty body to release the connection to its pool
+            response.content  # noqa: B018
+            response.close()
+            return http_cache.refresh(cached, response)
+
+        http_cache.record_miss()
+        http_cache.set(response)
+        return response
+
+
+def create_session(
+    rate_limiter: RateLimiter | None = None,
+    *,
+    headers: Mapping[str, str] | None = None,
+    pool_size: int | None = None,
+    cached: bool = False,
+    adapter_class: type[TransportAdapter] = TransportAdapter,
+) -> Session:
+    """Create a session sending the requests through a :class:`TransportAdapter`.
+
+    :param rate_limiter: the rate limiter of the requests, if any.
+    :type rate_limiter: :class:`~subliminal.ratelimit.RateLimiter`
+    :param headers: default headers of the requests.
+    :param int pool_size: number of connections kept alive for each host, if None it is set by
+        :func:`configure_connection_pools`.
+    :param bool cached: store the responses in the HTTP cache, see :mod:`subliminal.http_cache`.
+    :param adapter_class: class of the adapter, like :class:`~subliminal.providers.SecLevelOneTLSAdapter`.
+    :return: the session.
+    :rtype: :class:`requests.Session`
+
+    """
+    session = Session()
+    adapter = adapter_class(rate_limiter, pool_size=pool_size, cached=cached)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    session.headers['Accept-Encoding'] = ACCEPT_ENCODING
+    session.headers['Connection'] = 'keep-alive'
+    session.headers.update(headers or {})
+    return session
+
+
+def _to_requests_response(response: Any) -> Response:
+    """Convert a :class:`httpx.Response` to a :class:`requests.Response`."""
+    converted = Response()
+    converted.status_code = response.status_code
+    converted.headers = CaseInsensitiveDict(response.headers)
+    converted._content = response.content
+    converted.url = str(response.url)
+    converted.reason = response.reason_phrase
+    converted.encoding = response.encoding
+    return converted
+
+
+class AsyncSession:
+    """An asynchronous HTTP session, with default :attr:`headers` and a pool of connections.
+
+    It supports the `async with` statement to :meth:`close` the session on exit.
+
+    :param headers: default headers of the requests.
+    :param int max_connections: maximum number of connections kept open, if None it is set by
+        :func:`configure_connection_pools`.
+    :param rate_limiter: rate limiter of the requests, if any.
+    :type rate_limiter: :class:`~subliminal.ratelimit.RateLimiter`
+    :param adapter_class: class of the adapter of the :class:`requests.Session` used without httpx, its
+        :meth:`~TransportAdapter.create_ssl_context` is also used with httpx.
+
+    """
+
+    #: Default headers of the requests, they can be modified like :attr:`requests.Session.headers`
+    headers: CaseInsensitiveDict[str]
+
+    #: Maximum number of connections kept open
+    max_connections: int
+
+    #: Rate limiter of the requests
+    rate_limiter: RateLimiter | None
+
+    #: Class of the adapter of the :class:`requests.Session`
+    adapter_class: type[TransportAdapter]
+
+    def __init__(
+        self,
+        headers: Mapping[str, str] | None = None,
+        *,
+        max_connections: int | None = None,
+        rate_limiter: RateLimiter | None = None,
+        adapter_class: type[TransportAdapter] = TransportAdapter,
+    ) -> None:
+        self.headers = CaseInsensitiveDict(headers or {})
+        self.max_connections = max_connections if max_connections is not None else _pool_size
+        self.rate_limiter = rate_limiter
+        self.adapter_class = adapter_class
+        self._client: Any = None
+        self._session: Session | None = None
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.close()
+
+    @property
+    def backend(self) -> str:
+        """Name of the library sending the requests, ``'httpx'`` or ``'requests'``."""
+        return 'httpx' if httpx is not None else 'requests'
+
+    def _get_session(self) -> Session:
+        if self._session is None:
+            # the rate limiter is used by request
+            self._session = create_session(pool_size=self.max_connections, adapter_class=self.adapter_class)
+        return self._session
+
+    def _get_client(self) -> Any:  # pragma: no cover
+        if self._client is None:
+            limits = httpx.Limits(max_connections=self.max_connections, max_keepalive_connections=self.max_connections)
+            verify = self.adapter_class.create_ssl_context() or True
+            self._client = httpx.AsyncClient(http2=HTTP2, limits=limits, follow_redirects=True, verify=verify)
+        return self._client
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Mapping[str, Any] | None = None,
+        json: Any = None,
+        data: Any = None,
+        headers: Mapping[str, str] | None = None,
+        timeout: float | None = None,
+    ) -> Response:
+        """Send a request, when the :attr:`rate_limiter` allows it.
+
+        The requests with a '429' or '503' response are retried, see :class:`~subliminal.ratelimit.RateLimitAdapter`.
+
+        :param str method: HTTP method.
+        :param str url: URL of the request.
+        :param params: query parameters.
+        :param json: body of the request, encoded as JSON.
+        :param data: body of the request.
+        :param headers: headers added to the default :attr:`headers`.
+        :param float timeout: timeout in seconds.
+        :return: the response.
+        :rtype: :class:`requests.Response`
+
+        """
+        request_headers = dict(self.headers)
+        if headers:
+            request_headers.update(headers)
+        kwargs = {'params': params, 'json': json, 'data': data, 'headers': request_headers, 'timeout': timeout}
+
+        if self.rate_limiter is None:
+            return await self._send(method, url, **kwargs)
+
+        retries = self.rate_limiter.limit.max_retries
+        while True:
+            await self.rate_limiter.acquire_async()
+            response = await self._send(method, url, **kwargs)
+            if not self.rate_limiter.update(response.status_code, response.headers.get('Retry-After')) or retries <= 0:
+                return response
+            retries -= 1
+
+    async def _send(self, method: str, url: str, **kwargs: Any) -> Response:
+        if httpx is not None:  # pragma: no cover
+            response = await self._get_client().request(method, url, **kwargs)
+            return _to_requests_response(response)
+
+        return await asyncio.to_thread(self._get_session().request, method, url, **kwargs)
+
+    async def get(self, url: str, **kwargs: Any) -> Response:
+        """Send a GET request, see :meth:`request`."""
+        return await self.request('GET', url, **kwargs)
+
+    async def post(self, url: str, **kwargs: Any) -> Response:
+        """Send a POST request, see :meth:`request`."""
+        return await self.request('POST', url, **kwargs)
+
+    async def close(self) -> None:
+        """Close the connections."""
+        if self._client is not None:  # pragma: no cover
+            await self._client.aclose()
+            self._client = None
+        if self._session is not None:
+            self._session.close()
+            self._session = None
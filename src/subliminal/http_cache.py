@@ -0,0 +1,324 @@
+"""On-disk cache of HTTP responses, revalidated with their ``ETag`` and ``Last-Modified`` validators.
+
+Some providers parse large pages that rarely change, like the list of all the shows of a website. When the
+entry of :mod:`subliminal.cache` expires, the page is requested again with the validators of the stored response,
+``If-None-Match`` and ``If-Modified-Since``, and a '304 Not Modified' response reuses the stored body instead of
+downloading it again.
+
+The sessions created with ``create_session(cached=True)``, see :func:`~subliminal.http.create_session`, use the
+cache configured with :func:`configure_http_cache`. Only the successful responses to GET requests with a validator
+are stored, and the least recently used entries are evicted above :attr:`HTTPCache.max_size`.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import TYPE_CHECKING
+
+from requests import Response
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+if TYPE_CHECKING:
+    from types import TracebackType
+    from typing import Self
+
+    from requests import PreparedRequest
+
+logger = logging.getLogger(__name__)
+
+#: Default maximum size of the stored bodies, in bytes
+MAX_SIZE = 100 * 1024 * 1024
+
+#: Maximum time waiting for the lock of the database, in seconds
+LOCK_TIMEOUT = 30.0
+
+#: Headers of a response that are not stored, they describe the transfer and not the body
+TRANSFER_HEADERS = frozenset({'content-encoding', 'content-length', 'transfer-encoding', 'connection', 'keep-alive'})
+
+
+def _max_age(cache_control: str) -> float | None:
+    """Get the number of seconds a response is fresh, from its ``Cache-Control`` header.
+
+    :return: the max-age, 0 with ``no-cache`` or None with ``no-store``.
+
+    """
+    max_age = 0.0
+    for directive in cache_control.lower().split(','):
+        name, _, value = directive.strip().partition('=')
+        if name == 'no-store':
+            return None
+        if name == 'no-cache':
+            return 0.0
+        if name == 'max-age':
+            try:
+                max_age = max(0.0, float(value.strip('"')))
+            except ValueError:
+                max_age = 0.0
+    return max_age
+
+
+class CachedResponse:
+    """A response stored in the :class:`HTTPCache`."""
+
+    __slots__ = ('content', 'expires', 'headers', 'url')
+
+    #: URL of the response
+    url: str
+
+    #: Headers of the response, without the headers of the transfer
+    headers: CaseInsensitiveDict[str]
+
+    #: Body of the response, decompressed
+    content: bytes
+
+    #: Time after which the response must be revalidated
+    expires: float
+
+    def __init__(self, url: str, headers: CaseInsensitiveDict[str], content: bytes, expires: float) -> None:
+        self.url = url
+        self.headers = headers
+        self.content = content
+        self.expires = expires
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} [{self.url}] {len(self.content)} bytes>'
+
+    @property
+    def fresh(self) -> bool:
+        """The response can be used without revalidation."""
+        return time.time() < self.expires
+
+    @property
+    def validators(self) -> dict[str, str]:
+        """Conditional headers revalidating the response."""
+        validators = {}
+        if 'ETag' in self.headers:
+            validators['If-None-Match'] = self.headers['ETag']
+        if 'Last-Modified' in self.headers:
+            validators['If-Modified-Since'] = self.headers['Last-Modified']
+        return validators
+
+    def to_response(self, request: PreparedRequest) -> Response:
+        """Build the :class:`requests.Response` to the `request`."""
+        response = Response()
+        response.status_code = 200
+        response.reason = 'OK'
+        response.headers = CaseInsensitiveDict(self.headers)
+        response._content = self.content
+        response.url = self.url
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.request = request
+        return response
+
+
+class HTTPCache:
+    """An on-disk cache of HTTP responses, backed by SQLite.
+
+    It supports the `with` statement to :meth:`close` the cache on exit.
+
+    :param str filename: path of the SQLite database, use ``':memory:'`` for an in-memory cache.
+    :param int max_size: maximum size of the stored bodies, in bytes.
+
+    """
+
+    #: Path of the SQLite database
+    filename: str
+
+    #: Maximum size of the stored bodies, in bytes
+    max_size: int
+
+    #: Number of responses used without request
+    hits: int
+
+    #: Number of responses revalidated with a '304 Not Modified'
+    revalidations: int
+
+    #: Number of responses downloaded
+    misses: int
+
+    def __init__(self, filename: str | os.PathLike[str], max_size: int = MAX_SIZE) -> None:
+        self.filename = os.fspath(filename)
+        self.max_size = max_size
+        self.hits = 0
+        self.revalidations = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            self.filename,
+            timeout=LOCK_TIMEOUT,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        self._connection.execute(
+            'CREATE TABLE IF NOT EXISTS responses ('
+            'url TEXT PRIMARY KEY, headers TEXT, content BLOB, size INTEGER, expires REAL, accessed REAL)'
+        )
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._connection.execute('SELECT COUNT(*) FROM responses').fetchone()
+        return int(count)
+
+    @property
+    def size(self) -> int:
+        """Size of the stored bodies, in bytes."""
+        with self._lock:
+            (size,) = self._connection.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()
+        return int(size)
+
+    def get(self, url: str) -> CachedResponse | None:
+        """Get the stored response of the `url`, and mark it as recently used.
+
+        :param str url: URL of the request.
+        :return: the stored response, or None.
+        :rtype: :class:`CachedResponse`
+
+        """
+        with self._lock:
+            row = self._connection.execute(
+                'SELECT headers, content, expires FROM responses WHERE url = ?', (url,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._connection.execute('UPDATE responses SET accessed = ? WHERE url = ?', (time.time(), url))
+        headers, content, expires = row
+        return CachedResponse(url, CaseInsensitiveDict(json.loads(headers)), bytes(content), expires)
+
+    def set(self, response: Response) -> bool:
+        """Store a successful response with a validator, evicting the least recently used responses if needed.
+
+        :param response: the response.
+        :type response: :class:`requests.Response`
+        :return: True if the response was stored.
+        :rtype: bool
+
+        """
+        if response.status_code != 200 or not ('ETag' in response.headers or 'Last-Modified' in response.headers):
+            return False
+        max_age = _max_age(response.headers.get('Cache-Control', ''))
+        if max_age is None or len(response.content) > self.max_size:
+            return False
+
+        headers = {k: v for k, v in response.headers.items() if k.lower() not in TRANSFER_HEADERS}
+        now = time.time()
+        with self._lock:
+            self._connection.execute(
+                'INSERT OR REPLACE INTO responses (url, headers, content, size, expires, accessed) '
+                'VALUES (?, ?, ?, ?, ?, ?)',
+                (response.url, json.dumps(headers), response.content, len(response.content), now + max_age, now),
+            )
+            self._evict()
+        return True
+
+    def refresh(self, cached: CachedResponse, response: Response) -> Response:
+        """Update a stored response revalidated by a '304 Not Modified' `response`, and build the full response.
+
+        :param cached: the stored response.
+        :type cached: :class:`CachedResponse`
+        :param response: the '304 Not Modified' response.
+        :type response: :class:`requests.Response`
+        :return: the full response.
+        :rtype: :class:`requests.Response`
+
+        """
+        # the 304 response updates the headers of the stored response
+        for key, value in response.headers.items():
+            if key.lower() not in TRANSFER_HEADERS:
+                cached.headers[key] = value
+        max_age = _max_age(cached.headers.get('Cache-Control', ''))
+        cached.expires = time.time() + (max_age or 0.0)
+        with self._lock:
+            self._connection.execute(
+                'UPDATE responses SET headers = ?, expires = ? WHERE url = ?',
+                (json.dumps(dict(cached.headers)), cached.expires, cached.url),
+            )
+        full_response = cached.to_response(response.request)
+        full_response.connection = response.connection
+        full_response.elapsed = response.elapsed
+        return full_response
+
+    def _evict(self) -> None:
+        (size,) = self._connection.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()
+        if size <= self.max_size:
+            return
+        rows = self._connection.execute('SELECT url, size FROM responses ORDER BY accessed').fetchall()
+        evicted = []
+        for url, entry_size in rows:
+            if size <= self.max_size:
+                break
+            evicted.append((url,))
+            size -= entry_size
+        self._connection.executemany('DELETE FROM responses WHERE url = ?', evicted)
+        logger.debug('Evicted %d responses from the HTTP cache', len(evicted))
+
+    def clear(self) -> None:
+        """Remove all the stored responses."""
+        with self._lock:
+            self._connection.execute('DELETE FROM responses')
+
+    def record_hit(self) -> None:
+        """Count a response used without request, see :attr:`hits`."""
+        with self._lock:
+            self.hits += 1
+
+    def record_revalidation(self) -> None:
+        """Count a response revalidated with a '304 Not Modified', see :attr:`revalidations`."""
+        with self._lock:
+            self.revalidations += 1
+
+    def record_miss(self) -> None:
+        """Count a response downloaded, see :attr:`misses`."""
+        with self._lock:
+            self.misses += 1
+
+    def log(self) -> None:
+        """Log the counters."""
+        logger.info(
+            'HTTP cache: %d response(s) reused, %d revalidated, %d downloaded',
+            self.hits,
+            self.revalidations,
+            self.misses,
+        )
+
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            self._connection.close()
+
+
+_http_cache: HTTPCache | None = None
+
+
+def configure_http_cache(path: str | os.PathLike[str] | None, max_size: int = MAX_SIZE) -> None:
+    """Store the responses of the cached sessions in the SQLite database at `path`.
+
+    :param path: path of the SQLite database, or None to disable the cache.
+    :param int max_size: maximum size of the stored bodies, in bytes.
+
+    """
+    global _http_cache
+    if _http_cache is not None:
+        _http_cache.close()
+    _http_cache = HTTPCache(path, max_size) if path is not None else None
+
+
+def get_http_cache() -> HTTPCache | None:
+    """Get the cache configured with :func:`configure_http_cache`, if any."""
+    return _http_cache
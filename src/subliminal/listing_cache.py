@@ -0,0 +1,128 @@
+"""Cache of the subtitles listed by the providers, to select the best subtitles again without listing them.
+
+When the best subtitles are selected again shortly after, because a download failed or with other preferences like
+a different minimum score, the candidates of each provider are taken from the :class:`ListingCache` instead of
+querying the provider again: only the downloads of the subtitles use the network.
+
+The subtitles are stored without their content in the :data:`~subliminal.cache.region`, for
+:data:`~subliminal.cache.LISTING_EXPIRATION_TIME`, keyed by the provider, the video file, see
+:func:`~subliminal.negative_cache.video_identity`, and the language.
+"""
+
+from __future__ import annotations
+
+import copy
+import logging
+import os
+from typing import TYPE_CHECKING
+
+from dogpile.cache.api import NO_VALUE
+
+from .cache import LISTING_EXPIRATION_TIME, region
+from .negative_cache import video_identity
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence, Set
+
+    from babelfish import Language  # type: ignore[import-untyped]
+    from dogpile.cache import CacheRegion
+
+    from .subtitle import Subtitle
+    from .video import Video
+
+logger = logging.getLogger(__name__)
+
+
+def _without_content(subtitle: Subtitle) -> Subtitle:
+    """Copy a subtitle without its content."""
+    subtitle = copy.copy(subtitle)
+    subtitle.set_content(None)
+    return subtitle
+
+
+class ListingCache:
+    """Cache of the subtitles listed by the providers, by video and language.
+
+    :param float expiration_time: time the subtitles are kept, in seconds.
+    :param cache_region: region storing the subtitles, if not the :data:`~subliminal.cache.region`.
+    :type cache_region: :class:`~dogpile.cache.region.CacheRegion`
+
+    """
+
+    #: Time the subtitles are kept, in seconds
+    expiration_time: float
+
+    #: Region storing the subtitles
+    region: CacheRegion
+
+    #: Number of listings taken from the cache, by provider and language
+    hits: int
+
+    #: Number of listings not found in the cache, by provider and language
+    misses: int
+
+    def __init__(
+        self,
+        expiration_time: float = LISTING_EXPIRATION_TIME,
+        cache_region: CacheRegion | None = None,
+    ) -> None:
+        self.expiration_time = expiration_time
+        self.region = cache_region if cache_region is not None else region
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(provider: str, video: Video, language: Language) -> str:
+        return (
+            f'subliminal.listing:{provider}:{video_identity(video)}:'
+            f'{os.path.basename(video.name)}:{video.size or ""}:{language}'
+        )
+
+    def get(self, provider: str, video: Video, languages: Set[Language]) -> tuple[list[Subtitle], set[Language]]:
+        """Get the subtitles recently listed by the `provider` for the `video`.
+
+        :param str provider: name of the provider.
+        :param video: the video.
+        :type video: :class:`~subliminal.video.Video`
+        :param languages: languages to search for.
+        :type languages: set of :class:`~babelfish.language.Language`
+        :return: the cached subtitles, and the languages that are not cached.
+        :rtype: tuple[list[:class:`~subliminal.subtitle.Subtitle`], set[:class:`~babelfish.language.Language`]]
+
+        """
+        if not self.region.is_configured:
+            return [], set(languages)
+
+        subtitles: list[Subtitle] = []
+        missing = set()
+        for language in languages:
+            cached = self.region.get(self._key(provider, video, language), expiration_time=self.expiration_time)
+            if cached is NO_VALUE:
+                missing.add(language)
+                self.misses += 1
+                continue
+            # the subtitles are downloaded, copy them so the cached ones stay without content
+            subtitles.extend(_without_content(subtitle) for subtitle in cached)
+            self.hits += 1
+        return subtitles, missing
+
+    def set(self, provider: str, video: Video, languages: Set[Language], subtitles: Sequence[Subtitle]) -> None:
+        """Store the subtitles listed by the `provider` for the `video`.
+
+        :param str provider: name of the provider.
+        :param video: the video.
+        :type video: :class:`~subliminal.video.Video`
+        :param languages: languages searched.
+        :type languages: set of :class:`~babelfish.language.Language`
+        :param subtitles: subtitles found.
+        :type subtitles: list of :class:`~subliminal.subtitle.Subtitle`
+
+        """
+        if not self.region.is_configured:
+            return
+
+        for language in languages:
+            self.region.set(
+                self._key(provider, video, language),
+                [_without_content(subtitle) for subtitle in subtitles if subtitle.language == language],
+            )
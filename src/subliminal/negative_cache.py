@@ -0,0 +1,292 @@
+"""Persistent cache of the searches that found no subtitle, to skip them on the next runs.
+
+When a provider finds no subtitle of a language for a video, it will most likely find none on the next run either.
+The :class:`NegativeCache` remembers such a search for a while, keyed by the provider, the canonical identity of the
+video, see :func:`video_identity`, and the language. The longer a search keeps finding nothing, the longer it is
+skipped: with the default :data:`DECAY`, it is retried after 1 day, then 3 days, then every 7 days.
+
+Most lookups are for searches that are not cached: an in-memory :class:`BloomFilter` of the cached searches
+answers them without querying the database, even with millions of entries.
+"""
+
+from __future__ import annotations
+
+import datetime
+import hashlib
+import logging
+import math
+import os
+import sqlite3
+import threading
+import time
+from typing import TYPE_CHECKING
+
+from .utils import sanitize
+from .video import Episode, Movie
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping, Sequence, Set
+    from types import TracebackType
+    from typing import Self
+
+    from babelfish import Language  # type: ignore[import-untyped]
+
+    from .subtitle import Subtitle
+    from .video import Video
+
+logger = logging.getLogger(__name__)
+
+#: Default time a search is skipped after finding no subtitle 1, 2, 3 or more times in a row, in seconds
+DECAY: tuple[float, ...] = tuple(datetime.timedelta(days=d).total_seconds() for d in (1, 3, 7))
+
+#: Default capacity of the :class:`BloomFilter`, it grows with the number of entries
+FILTER_CAPACITY = 100_000
+
+#: False positive rate of the :class:`BloomFilter`
+FILTER_ERROR_RATE = 0.01
+
+#: Maximum time waiting for the lock of the database, in seconds
+LOCK_TIMEOUT = 30.0
+
+
+def video_identity(video: Video) -> str:
+    """Get the canonical identity of a video, the same for all the releases of a movie or an episode.
+
+    :param video: the video.
+    :type video: :class:`~subliminal.video.Video`
+    :return: the identity.
+    :rtype: str
+
+    """
+    if isinstance(video, Episode):
+        episodes = ','.join(str(e) for e in video.episodes)
+        return f'episode:{sanitize(video.series)}:{video.year or ""}:{video.country or ""}:{video.season}:{episodes}'
+    if isinstance(video, Movie):
+        return f'movie:{sanitize(video.title)}:{video.year or ""}'
+    return f'video:{sanitize(os.path.basename(video.name))}'
+
+
+class BloomFilter:
+    """A set of strings with false positives but no false negatives, in a fixed amount of memory.
+
+    :param int capacity: number of strings it can hold with the `error_rate`.
+    :param float error_rate: rate of the false positives when full.
+
+    """
+
+    #: Number of strings it can hold with the error rate
+    capacity: int
+
+    #: Rate of the false positives when full
+    error_rate: float
+
+    #: Number of strings added
+    count: int
+
+    def __init__(self, capacity: int = FILTER_CAPACITY, error_rate: float = FILTER_ERROR_RATE) -> None:
+        self.capacity = max(1, capacity)
+        self.error_rate = error_rate
+        self.count = 0
+        self._size = max(8, int(-self.capacity * math.log(error_rate) / math.log(2) ** 2))
+        self._hashes = max(1, round(self._size / self.capacity * math.log(2)))
+        self._bits = bytearray((self._size + 7) // 8)
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} [{self.count}/{self.capacity}]>'
+
+    def __contains__(self, key: str) -> bool:
+        return all(self._bits[i >> 3] & (1 << (i & 7)) for i in self._indices(key))
+
+    def _indices(self, key: str) -> Iterable[int]:
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return ((h1 + i * h2) % self._size for i in range(self._hashes))
+
+    @property
+    def full(self) -> bool:
+        """More strings than the capacity were added, the rate of false positives is higher than the error rate."""
+        return self.count > self.capacity
+
+    def add(self, key: str) -> None:
+        """Add a string."""
+        for i in self._indices(key):
+            self._bits[i >> 3] |= 1 << (i & 7)
+        self.count += 1
+
+
+class NegativeCache:
+    """An on-disk cache of the searches that found no subtitle, backed by SQLite.
+
+    It supports the `with` statement to :meth:`close` the cache on exit.
+
+    :param str filename: path of the SQLite database, use ``':memory:'`` for an in-memory cache.
+    :param decay: time a search is skipped after finding no subtitle 1, 2, 3 or more times in a row, in seconds.
+    :param language_decays: decay of specific languages, instead of `decay`.
+    :type language_decays: dict[:class:`~babelfish.language.Language`, Sequence[float]]
+    :param bool bypass: make all the searches, and record their results.
+
+    """
+
+    #: Path of the SQLite database
+    filename: str
+
+    #: Time a search is skipped after finding no subtitle 1, 2, 3 or more times in a row, in seconds
+    decay: Sequence[float]
+
+    #: Decay of specific languages
+    language_decays: Mapping[Language, Sequence[float]]
+
+    #: All the searches are made, and their results recorded
+    bypass: bool
+
+    #: Number of searches skipped
+    hits: int
+
+    def __init__(
+        self,
+        filename: str | os.PathLike[str],
+        decay: Sequence[float] = DECAY,
+        language_decays: Mapping[Language, Sequence[float]] | None = None,
+        *,
+        bypass: bool = False,
+    ) -> None:
+        self.filename = os.fspath(filename)
+        self.decay = decay
+        self.language_decays = language_decays or {}
+        self.bypass = bypass
+        self.hits = 0
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            self.filename,
+            timeout=LOCK_TIMEOUT,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        self._connection.execute(
+            'CREATE TABLE IF NOT EXISTS searches (key TEXT PRIMARY KEY, misses INTEGER, expires REAL)'
+        )
+        self._filter = BloomFilter()
+        with self._lock:
+            self._rebuild_filter()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._connection.execute('SELECT COUNT(*) FROM searches').fetchone()
+        return int(count)
+
+    @staticmethod
+    def _key(provider: str, video: Video, language: Language) -> str:
+        return f'{provider}|{video_identity(video)}|{language}'
+
+    def _rebuild_filter(self) -> None:
+        keys = [key for (key,) in self._connection.execute('SELECT key FROM searches')]
+        self._filter = BloomFilter(max(FILTER_CAPACITY, 2 * len(keys)))
+        for key in keys:
+            self._filter.add(key)
+
+    def _get_decay(self, language: Language) -> Sequence[float]:
+        return self.language_decays.get(language, self.decay)
+
+    def filter_languages(self, provider: str, video: Video, languages: Set[Language]) -> set[Language]:
+        """Remove the languages that the `provider` recently found no subtitle of, for the `video`.
+
+        :param str provider: name of the provider.
+        :param video: the video.
+        :type video: :class:`~subliminal.video.Video`
+        :param languages: languages to search for.
+        :type languages: set of :class:`~babelfish.language.Language`
+        :return: the languages to search for.
+        :rtype: set of :class:`~babelfish.language.Language`
+
+        """
+        if self.bypass:
+            return set(languages)
+
+        keys = {language: self._key(provider, video, language) for language in languages}
+        candidates = {language: key for language, key in keys.items() if key in self._filter}
+        if not candidates:
+            return set(languages)
+
+        now = time.time()
+        skipped = set()
+        with self._lock:
+            for language, key in candidates.items():
+                row = self._connection.execute('SELECT expires FROM searches WHERE key = ?', (key,)).fetchone()
+                if row is not None and row[0] > now:
+                    skipped.add(language)
+        self.hits += len(skipped)
+        return set(languages) - skipped
+
+    def record(self, provider: str, video: Video, languages: Set[Language], subtitles: Sequence[Subtitle]) -> None:
+        """Record the result of a search, the languages without subtitle are skipped for a while.
+
+        :param str provider: name of the provider.
+        :param video: the video.
+        :type video: :class:`~subliminal.video.Video`
+        :param languages: languages searched.
+        :type languages: set of :class:`~babelfish.language.Language`
+        :param subtitles: subtitles found.
+        :type subtitles: list of :class:`~subliminal.subtitle.Subtitle`
+
+        """
+        found = {subtitle.language for subtitle in subtitles}
+        now = time.time()
+        with self._lock:
+            for language in languages:
+                key = self._key(provider, video, language)
+                if language in found:
+                    if key in self._filter:
+                        self._connection.execute('DELETE FROM searches WHERE key = ?', (key,))
+                    continue
+
+                row = self._connection.execute('SELECT misses FROM searches WHERE key = ?', (key,)).fetchone()
+                misses = row[0] + 1 if row is not None else 1
+                decay = self._get_decay(language)
+                expires = now + decay[min(misses, len(decay)) - 1]
+                self._connection.execute(
+                    'INSERT OR REPLACE INTO searches (key, misses, expires) VALUES (?, ?, ?)',
+                    (key, misses, expires),
+                )
+                if row is None:
+                    self._filter.add(key)
+            if self._filter.full:
+                self._rebuild_filter()
+
+    def prune(self) -> int:
+        """Remove the entries expired for longer than the longest decay.
+
+        The expired entries are kept for a while, to count the searches that found nothing in a row.
+
+        :return: the number of removed entries.
+        :rtype: int
+
+        """
+        longest = max([*self.decay, *(d for decay in self.language_decays.values() for d in decay)])
+        with self._lock:
+            cursor = self._connection.execute('DELETE FROM searches WHERE expires <= ?', (time.time() - longest,))
+            self._rebuild_filter()
+        logger.info('Pruned %d entries from the negative cache', cursor.rowcount)
+        return cursor.rowcount
+
+    def clear(self) -> None:
+        """Remove all the entries, all the searches are made again."""
+        with self._lock:
+            self._connection.execute('DELETE FROM searches')
+            self._filter = BloomFilter()
+
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,217 @@
+"""Staged pipelines, to process a stream of items with bounded memory.
+
+A :class:`Pipeline` runs a sequence of :class:`Stage`, each with its own worker threads, connected with bounded
+queues. Each item goes through the stages as soon as it is put in the pipeline, so the first results are ready
+while the next items are still read, and a slow stage blocks the previous stages instead of piling up items
+in memory.
+
+The function of a stage takes an item and returns an iterable of items for the next stage: an empty iterable
+drops the item, and many items expand it. What the last stage returns is discarded, it is typically a sink
+saving the results.
+
+.. code-block:: python
+
+    with Pipeline([Stage('scan', scan), Stage('list', list_subtitles, workers=4), Stage('save', save)]) as pipeline:
+        for path in paths:
+            pipeline.put(path)
+
+"""
+
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Sequence
+    from types import TracebackType
+    from typing import Self
+
+logger = logging.getLogger(__name__)
+
+#: Default maximum number of items waiting between two stages
+QUEUE_SIZE = 16
+
+# marks the end of the items in a queue
+_DONE = object()
+
+
+class Stage:
+    """A stage of a :class:`Pipeline`.
+
+    :param str name: name of the stage, used in the logs and the names of the threads.
+    :param func: function taking an item and returning an iterable of items for the next stage.
+    :param int workers: number of threads running the function.
+
+    """
+
+    __slots__ = ('func', 'name', 'workers')
+
+    #: Name of the stage
+    name: str
+
+    #: Function taking an item and returning an iterable of items for the next stage
+    func: Callable[[Any], Iterable[Any]]
+
+    #: Number of threads running the function
+    workers: int
+
+    def __init__(self, name: str, func: Callable[[Any], Iterable[Any]], *, workers: int = 1) -> None:
+        self.name = name
+        self.func = func
+        self.workers = max(1, workers)
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} [{self.name}] workers={self.workers!r}>'
+
+
+class Pipeline:
+    """Stages connected with bounded queues, each stage running in its own threads.
+
+    The items are :meth:`put` in the first stage, and :meth:`join` waits for all the stages to complete once
+    the pipeline is closed. It supports the `with` statement to :meth:`start` the stages, and :meth:`close` and
+    :meth:`join` the pipeline on exit.
+
+    If a stage function raises an error, the remaining items are dropped and the error is raised by :meth:`put`
+    and :meth:`join`.
+
+    :param stages: the stages, in order.
+    :type stages: list of :class:`Stage`
+    :param int queue_size: maximum number of items waiting before each stage.
+
+    """
+
+    #: Stages, in order
+    stages: Sequence[Stage]
+
+    #: Maximum number of items waiting before each stage
+    queue_size: int
+
+    #: Number of items processed by each stage, by name
+    processed: dict[str, int]
+
+    def __init__(self, stages: Sequence[Stage], *, queue_size: int = QUEUE_SIZE) -> None:
+        if not stages:
+            msg = 'A pipeline needs at least one stage'
+            raise ValueError(msg)
+        self.stages = stages
+        self.queue_size = max(1, queue_size)
+        self.processed = dict.fromkeys((stage.name for stage in stages), 0)
+        self._queues: list[queue.Queue[Any]] = [queue.Queue(self.queue_size) for _ in stages]
+        self._running = [stage.workers for stage in stages]
+        self._lock = threading.Lock()
+        self._threads: list[threading.Thread] = []
+        self._error: Exception | None = None
+        self._cancelled = False
+        self._closed = False
+
+    def __enter__(self) -> Self:
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        # drop the remaining items on error
+        if exc_type is not None:
+            self.cancel()
+        self.close()
+        if exc_type is None:
+            self.join()
+        else:
+            self._join_threads()
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} [{" > ".join(stage.name for stage in self.stages)}]>'
+
+    def start(self) -> None:
+        """Start the threads of the stages."""
+        if self._threads:
+            return
+        for index, stage in enumerate(self.stages):
+            for i in range(stage.workers):
+                thread = threading.Thread(
+                    target=self._work,
+                    args=(index,),
+                    name=f'subliminal-{stage.name}-{i}',
+                    daemon=True,
+                )
+                thread.start()
+                self._threads.append(thread)
+
+    def put(self, item: Any) -> None:
+        """Put an item in the first stage, waiting while its queue is full.
+
+        :param item: the item.
+        :raises: the error of a stage function, if any.
+
+        """
+        if self._error is not None:
+            raise self._error
+        if self._closed:
+            msg = 'The pipeline is closed'
+            raise RuntimeError(msg)
+        self._queues[0].put(item)
+
+    def close(self) -> None:
+        """Mark the end of the items, the stages stop once they have processed the items already put."""
+        if self._closed:
+            return
+        self._closed = True
+        for _ in range(self.stages[0].workers):
+            self._queues[0].put(_DONE)
+
+    def cancel(self) -> None:
+        """Drop the items that are not processed yet, the running stage functions are not interrupted."""
+        self._cancelled = True
+
+    def join(self) -> None:
+        """Wait for the stages to process all the items, after :meth:`close`.
+
+        :raises: the error of a stage function, if any.
+
+        """
+        self._join_threads()
+        if self._error is not None:
+            raise self._error
+
+    def _join_threads(self) -> None:
+        for thread in self._threads:
+            thread.join()
+
+    def _work(self, index: int) -> None:
+        stage = self.stages[index]
+        source = self._queues[index]
+        target = self._queues[index + 1] if index + 1 < len(self._queues) else None
+        while True:
+            item = source.get()
+            if item is _DONE:
+                break
+            # keep getting the items, so the previous stages are not blocked
+            if self._cancelled or self._error is not None:
+                continue
+            try:
+                for result in stage.func(item):
+                    if target is not None:
+                        target.put(result)
+            except Exception as e:
+                logger.exception('Error in stage %s of the pipeline', stage.name)
+                with self._lock:
+                    if self._error is None:
+                        self._error = e
+                continue
+            with self._lock:
+                self.processed[stage.name] += 1
+
+        # the last worker of the stage marks the end of the items for the next stage
+        with self._lock:
+            self._running[index] -= 1
+            last = self._running[index] == 0
+        if last and target is not None:
+            for _ in range(self.stages[index + 1].workers):
+                target.put(_DONE)
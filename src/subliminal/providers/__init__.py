@@ -4,27 +4,40 @@ Providers list and download subtitles for a :class:`~subliminal.video.Video` obj
 A Provider is a ContextManager with ``__enter__`` and ``__exit__`` methods and
 two public methods: :meth:`~subliminal.providers.Provider.list_subtitles` and
 :meth:`~subliminal.providers.Provider.download_subtitle`.
+
+Providers fetching the subtitles of a whole season at once can also override
+:meth:`~subliminal.providers.Provider.list_subtitles_batch`, to list the subtitles of many episodes
+with a single request.
+
+The asyncio API, :meth:`~subliminal.providers.Provider.list_subtitles_async` and
+:meth:`~subliminal.providers.Provider.download_subtitle_async`, runs the synchronous methods
+in threads, unless the provider has a native implementation (see
+:attr:`~subliminal.providers.Provider.native_async`).
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import ssl
+from contextlib import contextmanager
+from contextvars import ContextVar
 from typing import TYPE_CHECKING, Any, ClassVar, Generic, TypeVar
 from xmlrpc.client import SafeTransport
 
 # Do not put babelfish in a TYPE_CHECKING block for intersphinx to work properly
 from babelfish import Language  # type: ignore[import-untyped]  # noqa: TC002
 from bs4 import BeautifulSoup, FeatureNotFound
-from requests import adapters
-from urllib3 import poolmanager  # type: ignore[import-untyped]
 
 from subliminal import __short_version__
+from subliminal.hashers import compute_cached_hashes
+from subliminal.http import TransportAdapter, connection_metrics
+from subliminal.ratelimit import RateLimit, RateLimiter, get_rate_limiter
 from subliminal.subtitle import Subtitle
 from subliminal.video import Episode, Movie, Video
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence, Set
+    from collections.abc import Callable, Iterator, Sequence, Set
     from http.client import HTTPSConnection
     from types import TracebackType
     from typing import Self
@@ -33,31 +46,42 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
-class SecLevelOneTLSAdapter(adapters.HTTPAdapter):
-    """:class:`~requests.adapters.HTTPAdapter` with security level set to 1."""
+class SecLevelOneTLSAdapter(TransportAdapter):
+    """:class:`~subliminal.http.TransportAdapter` with security level set to 1."""
 
-    def init_poolmanager(self, connections: int, maxsize: int, block: bool = False, **pool_kwargs: Any) -> None:  # noqa: FBT001, FBT002
-        """Create and initialize the urllib3 PoolManager."""
+    @classmethod
+    def create_ssl_context(cls) -> ssl.SSLContext:
+        """Create the SSL context of the connections, with security level set to 1."""
         ctx = ssl.create_default_context()
         ctx.set_ciphers('DEFAULT@SECLEVEL=1')
-        self.poolmanager = poolmanager.PoolManager(
-            num_pools=connections,
-            maxsize=maxsize,
-            block=block,
+        return ctx
+
+    def init_poolmanager(self, connections: int, maxsize: int, block: bool = False, **pool_kwargs: Any) -> None:  # noqa: FBT001, FBT002
+        """Create and initialize the urllib3 PoolManager."""
+        super().init_poolmanager(
+            connections,
+            maxsize,
+            block,
             ssl_version=ssl.PROTOCOL_TLS,
-            ssl_context=ctx,
+            ssl_context=self.create_ssl_context(),
         )
 
 
 class TimeoutSafeTransport(SafeTransport):
-    """Timeout support for :class:`!xmlrpc.client.SafeTransport`."""
+    """Timeout support for :class:`!xmlrpc.client.SafeTransport`.
 
-    timeout: float | None
+    The `timeout` can be a callable, called for each request, like the :attr:`Provider.timeout` of a provider
+    to follow its :meth:`Provider.call_timeout`.
+
+    """
+
+    #: Timeout of the requests in seconds, or a callable returning it
+    timeout: float | Callable[[], float | None] | None
 
     def __init__(
         self,
         *args: Any,
-        timeout: float | None = None,
+        timeout: float | Callable[[], float | None] | None = None,
         user_agent: str | None = None,
         **kwargs: Any,
     ) -> None:
@@ -75,8 +99,17 @@ class TimeoutSafeTransport(SafeTransport):
         :rtype: :library/http.client:class:`~http.client.HTTPSConnection`
 
         """
+        # the connection is made for each request, but kept alive for the same host
+        chost = self.get_host_info(host)[0]
+        connection_metrics.record_request(chost)
+        if not (self._connection and host == self._connection[0]):
+            connection_metrics.record_connection(chost)
+        timeout = self.timeout() if callable(self.timeout) else self.timeout
         c = SafeTransport.make_connection(self, host)
-        c.timeout = self.timeout
+        c.timeout = timeout
+        # the socket of a kept alive connection is already open
+        if c.sock is not None:
+            c.sock.settimeout(timeout)
 
         return c
 
@@ -117,6 +150,9 @@ class ParserBeautifulSoup(BeautifulSoup):
 
 S = TypeVar('S', bound=Subtitle)
 
+#: Provider and timeout of the call running in the current thread or task, see :meth:`Provider.call_timeout`
+_call_timeout: ContextVar[tuple[Provider, float | None] | None] = ContextVar('call_timeout', default=None)
+
 
 class Provider(Generic[S]):
     """Base class for providers.
@@ -138,16 +174,75 @@ class Provider(Generic[S]):
     #: Required hash, if any
     required_hash: ClassVar[str | None] = None
 
+    #: Name of the hasher in :data:`subliminal.hashers.hashers` used to hash the videos, if any
+    hasher: ClassVar[str | None] = None
+
+    #: The asyncio API is implemented natively, instead of running the synchronous methods in threads
+    native_async: ClassVar[bool] = False
+
+    #: Limits of the requests to the provider, see :mod:`subliminal.ratelimit`
+    rate_limit: ClassVar[RateLimit | None] = None
+
     #: Subtitle class to use
     subtitle_class: ClassVar[type[S] | None] = None  # type: ignore[misc]
 
     #: User Agent to use
     user_agent: str = f'Subliminal/{__short_version__}'
 
-    @staticmethod
-    def hash_video(video_path: str) -> str | None:
-        """Hash the video to be used by the provider."""
-        return None
+    _timeout: float | None = None
+
+    @classmethod
+    def hash_video(cls, video_path: str) -> str | None:
+        """Hash the video to be used by the provider, with its :attr:`hasher`.
+
+        The hash is cached, see :func:`subliminal.hashers.compute_cached_hashes`.
+
+        """
+        if cls.hasher is None:
+            return None
+        return compute_cached_hashes(video_path, [cls.hasher]).get(cls.hasher)
+
+    @classmethod
+    def get_rate_limiter(cls) -> RateLimiter:
+        """Get the rate limiter shared by all the instances of the provider, with its :attr:`rate_limit`.
+
+        Without :attr:`rate_limit`, the requests are not limited but the '429' and '503' responses are
+        still retried after a backoff.
+
+        """
+        # the module avoids sharing the limiter with another provider class of the same name
+        return get_rate_limiter(f'{cls.__module__}.{cls.__qualname__}', cls.rate_limit)
+
+    @property
+    def timeout(self) -> float | None:
+        """Timeout of the requests in seconds, if the provider supports it, see :class:`~subliminal.core.Timeouts`.
+
+        Within :meth:`call_timeout`, the timeout of the current call.
+
+        """
+        call = _call_timeout.get()
+        if call is not None and call[0] is self:
+            return call[1]
+        return self._timeout
+
+    @timeout.setter
+    def timeout(self, value: float | None) -> None:
+        self._timeout = value
+
+    @contextmanager
+    def call_timeout(self, timeout: float | None) -> Iterator[None]:
+        """Use the `timeout` for the requests of the current thread or asyncio task.
+
+        The :attr:`timeout` of the other calls, running concurrently, is not changed.
+
+        :param float timeout: the timeout, in seconds, or None for no timeout.
+
+        """
+        token = _call_timeout.set((self, timeout))
+        try:
+            yield
+        finally:
+            _call_timeout.reset(token)
 
     def __enter__(self) -> Self:
         self.initialize()
@@ -258,6 +353,24 @@ class Provider(Generic[S]):
         """
         raise NotImplementedError
 
+    def list_subtitles_batch(self, videos: Sequence[Video], languages: Set[Language]) -> list[list[S]]:
+        """List subtitles for many `videos` at once with the given `languages`.
+
+        The `videos` are typically the episodes of the same season, see :func:`~subliminal.core.group_videos`.
+        Providers that fetch the subtitles of a whole season with a single request override it to query once
+        and distribute the subtitles to each video. By default, :meth:`list_subtitles` is called for each video.
+
+        :param videos: videos to list subtitles for.
+        :type videos: list of :class:`~subliminal.video.Video`
+        :param languages: languages to search for.
+        :type languages: set of :class:`~babelfish.language.Language`
+        :return: found subtitles of each video, in the order of the `videos`.
+        :rtype: list of list of :class:`~subliminal.subtitle.Subtitle`
+        :raise: :class:`~subliminal.exceptions.ProviderError`
+
+        """
+        return [self.list_subtitles(video, languages) for video in videos]
+
     def download_subtitle(self, subtitle: S) -> None:
         """Download `subtitle`'s :attr:`~subliminal.subtitle.Subtitle.content`.
 
@@ -268,5 +381,66 @@ class Provider(Generic[S]):
         """
         raise NotImplementedError
 
+    async def __aenter__(self) -> Self:
+        await self.initialize_async()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.terminate_async()
+
+    async def initialize_async(self) -> None:
+        """Initialize the provider, for the asyncio API.
+
+        By default, :meth:`initialize` runs in a thread.
+
+        .. note::
+            This is called automatically when entering the `async with` statement
+
+        """
+        await asyncio.to_thread(self.initialize)
+
+    async def terminate_async(self) -> None:
+        """Terminate the provider, for the asyncio API.
+
+        By default, :meth:`terminate` runs in a thread.
+
+        .. note::
+            This is called automatically when exiting the `async with` statement
+
+        """
+        await asyncio.to_thread(self.terminate)
+
+    async def list_subtitles_async(self, video: Video, languages: Set[Language]) -> list[S]:
+        """List subtitles for the `video` with the given `languages`, like :meth:`list_subtitles`.
+
+        By default, :meth:`list_subtitles` runs in a thread.
+
+        """
+        return await asyncio.to_thread(self.list_subtitles, video, languages)
+
+    async def list_subtitles_batch_async(self, videos: Sequence[Video], languages: Set[Language]) -> list[list[S]]:
+        """List subtitles for many `videos` at once, like :meth:`list_subtitles_batch`.
+
+        By default, :meth:`list_subtitles_batch` runs in a thread, or :meth:`list_subtitles_async` is called
+        concurrently for each video if the provider has a :attr:`native_async` implementation.
+
+        """
+        if self.native_async:
+            return list(await asyncio.gather(*(self.list_subtitles_async(video, languages) for video in videos)))
+        return await asyncio.to_thread(self.list_subtitles_batch, videos, languages)
+
+    async def download_subtitle_async(self, subtitle: S) -> None:
+        """Download `subtitle`'s :attr:`~subliminal.subtitle.Subtitle.content`, like :meth:`download_subtitle`.
+
+        By default, :meth:`download_subtitle` runs in a thread.
+
+        """
+        await asyncio.to_thread(self.download_subtitle, subtitle)
+
     def __repr__(self) -> str:
         return f'<{self.__class__.__name__} [{self.video_types!r}]>'
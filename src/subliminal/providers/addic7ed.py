@@ -8,18 +8,20 @@ import hashlib
 import logging
 import re
 import unicodedata
+from collections import defaultdict
 from random import randint
 from typing import TYPE_CHECKING, Any, ClassVar
 from urllib.parse import unquote
 
 from babelfish import Language, language_converters  # type: ignore[import-untyped]
 from babelfish.exceptions import LanguageReverseError  # type: ignore[import-untyped]
-from requests import Response, Session
 from requests.cookies import RequestsCookieJar
 
 from subliminal.cache import SHOW_EXPIRATION_TIME, region
 from subliminal.exceptions import ConfigurationError, DownloadLimitExceeded, NotInitializedProviderError
+from subliminal.http import create_session
 from subliminal.matches import guess_matches
+from subliminal.singleflight import single_flight
 from subliminal.subtitle import Subtitle
 from subliminal.utils import safely_guessit, sanitize
 from subliminal.video import Episode, Video
@@ -27,7 +29,9 @@ from subliminal.video import Episode, Video
 from . import ParserBeautifulSoup, Provider
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping, Set
+    from collections.abc import Mapping, Sequence, Set
+
+    from requests import Response, Session
 
 logger = logging.getLogger(__name__)
 
@@ -247,7 +251,7 @@ class Addic7edProvider(Provider):
 
     def initialize(self) -> None:
         """Initialize the provider."""
-        self.session = Session()
+        self.session = create_session(self.get_rate_limiter(), cached=True)
         self.session.headers['Accept-Language'] = 'en-US,en;q=1.0'
         self.session.headers['Referer'] = self.server_url
 
@@ -273,6 +277,7 @@ class Addic7edProvider(Provider):
         self.logged_in = False
         self.session.close()
 
+    @single_flight
     @region.cache_on_arguments(expiration_time=SHOW_EXPIRATION_TIME)
     def _get_show_ids(self) -> dict[str, int]:
         """Get the ``dict`` of show ids per series by querying the `shows.php` page.
@@ -363,6 +368,7 @@ class Addic7edProvider(Provider):
 
         return int(match.groupdict()['show_id'])
 
+    @single_flight
     @region.cache_on_arguments(expiration_time=SHOW_EXPIRATION_TIME)
     def _search_show_ids(
         self,
@@ -510,6 +516,7 @@ class Addic7edProvider(Provider):
 
         return show_id
 
+    @single_flight
     def query(
         self,
         show_id: int | None,
@@ -614,6 +621,33 @@ class Addic7edProvider(Provider):
             if s.language in languages and s.episode == video.episode
         ]
 
+    def list_subtitles_batch(self, videos: Sequence[Video], languages: Set[Language]) -> list[list[Addic7edSubtitle]]:
+        """List the subtitles for many videos, querying the page of each season only once."""
+        # nothing to batch
+        if len(videos) < 2:
+            return super().list_subtitles_batch(videos, languages)
+
+        # group the episodes by season
+        seasons: dict[tuple[str, int | None, int], list[tuple[int, Episode]]] = defaultdict(list)
+        for i, video in enumerate(videos):
+            if isinstance(video, Episode):  # pragma: no branch
+                seasons[video.series, video.year, video.season].append((i, video))
+
+        results: list[list[Addic7edSubtitle]] = [[] for _ in videos]
+        for (series, year, season), episodes in seasons.items():
+            # lookup show_id
+            show_id = self._get_show_id_with_alternative_names(episodes[0][1])
+            if show_id is None:  # pragma: no cover
+                logger.error('No show id found for %r (%r)', series, {'year': year})
+                continue
+
+            # query the season once and distribute the subtitles to the episodes
+            subtitles = self.query(show_id, series=series, season=season, year=year)
+            for i, video in episodes:
+                results[i] = [s for s in subtitles if s.language in languages and s.episode == video.episode]
+
+        return results
+
     def download_subtitle(self, subtitle: Addic7edSubtitle) -> None:
         """Download the content of the subtitle."""
         if not self.session:  # pragma: no cover
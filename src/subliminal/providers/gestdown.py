@@ -2,14 +2,17 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import re
+from collections import defaultdict
 from typing import TYPE_CHECKING, Any, ClassVar
 
 from babelfish import Language  # type: ignore[import-untyped]
 from requests import HTTPError, Session
 
 from subliminal.exceptions import DownloadLimitExceeded, NotInitializedProviderError
+from subliminal.http import AsyncSession, create_session
 from subliminal.matches import guess_matches
 from subliminal.subtitle import Subtitle
 from subliminal.utils import safely_guessit, sanitize
@@ -18,7 +21,9 @@ from subliminal.video import Episode, Video
 from . import Provider
 
 if TYPE_CHECKING:
-    from collections.abc import Set
+    from collections.abc import Sequence, Set
+
+    from requests import Response
 
 logger = logging.getLogger(__name__)
 
@@ -114,19 +119,26 @@ class GestdownProvider(Provider):
     video_types: ClassVar = (Episode,)
     server_url: ClassVar[str] = 'https://api.gestdown.info'
     subtitle_class: ClassVar = GestdownSubtitle
+    native_async: ClassVar = True
 
     timeout: int
     session: Session | None
+    async_session: AsyncSession | None
 
     def __init__(self, *, timeout: int = 10) -> None:
         self.timeout = timeout
         self.session = None
+        self.async_session = None
+
+    @property
+    def headers(self) -> dict[str, str]:
+        """Headers of the requests."""
+        return {'User-Agent': self.user_agent, 'accept': 'application/json'}
 
     def initialize(self) -> None:
         """Initialize the provider."""
-        self.session = Session()
-        self.session.headers['User-Agent'] = self.user_agent
-        self.session.headers['accept'] = 'application/json'
+        self.session = create_session(self.get_rate_limiter(), cached=True)
+        self.session.headers.update(self.headers)
 
     def terminate(self) -> None:
         """Terminate the provider."""
@@ -135,28 +147,28 @@ class GestdownProvider(Provider):
 
         self.session.close()
 
-    def _search_show_id(self, series: str, series_tvdb_id: str | None = None) -> str | None:
-        """Search the show id from the `series`.
-
-        :param str series: series of the episode.
-        :param str series_tvdb_id: tvdb id of the series.
-        :return: the show id, if found.
-        :rtype: str
+    async def initialize_async(self) -> None:
+        """Initialize the provider, for the asyncio API."""
+        self.async_session = AsyncSession(self.headers, rate_limiter=self.get_rate_limiter())
 
-        """
-        if self.session is None:
+    async def terminate_async(self) -> None:
+        """Terminate the provider, for the asyncio API."""
+        if self.async_session is None:
             raise NotInitializedProviderError
 
-        # build the params
+        await self.async_session.close()
+
+    def _show_id_url(self, series: str, series_tvdb_id: str | None = None) -> str:
+        """Get the url to search the show id."""
         if series_tvdb_id is not None:
-            query = f'{self.server_url}/shows/external/tvdb/{series_tvdb_id}'
             logger.info('Searching show ids for TVBD id %s', series_tvdb_id)
-        else:
-            query = f'{self.server_url}/shows/search/{series}'
-            logger.info('Searching show ids for %s', series)
+            return f'{self.server_url}/shows/external/tvdb/{series_tvdb_id}'
+        logger.info('Searching show ids for %s', series)
+        return f'{self.server_url}/shows/search/{series}'
 
-        # make the search
-        r = self.session.get(query, timeout=self.timeout)
+    @staticmethod
+    def _parse_show_id(r: Response, series: str) -> str | None:
+        """Parse the show id from the response of the search."""
         try:
             r.raise_for_status()
         except HTTPError:
@@ -175,6 +187,31 @@ class GestdownProvider(Provider):
         logger.warning('Show id not found: suggestion does not match: %r', result)
         return None
 
+    def _search_show_id(self, series: str, series_tvdb_id: str | None = None) -> str | None:
+        """Search the show id from the `series`.
+
+        :param str series: series of the episode.
+        :param str series_tvdb_id: tvdb id of the series.
+        :return: the show id, if found.
+        :rtype: str
+
+        """
+        if self.session is None:
+            raise NotInitializedProviderError
+
+        # make the search
+        r = self.session.get(self._show_id_url(series, series_tvdb_id), timeout=self.timeout)
+        return self._parse_show_id(r, series)
+
+    async def _search_show_id_async(self, series: str, series_tvdb_id: str | None = None) -> str | None:
+        """Search the show id from the `series`, see :meth:`_search_show_id`."""
+        if self.async_session is None:
+            raise NotInitializedProviderError
+
+        # make the search
+        r = await self.async_session.get(self._show_id_url(series, series_tvdb_id), timeout=self.timeout)
+        return self._parse_show_id(r, series)
+
     def get_title_and_show_id(self, video: Episode) -> tuple[str, str | None]:
         """Get the title and show_id."""
         # lookup show_id
@@ -192,21 +229,32 @@ class GestdownProvider(Provider):
 
         return (title, show_id)
 
-    def _query_all_episodes(self, show_id: str, season: int, language: Language) -> list[dict[str, Any]]:
-        """Get the subtitles in the specified language for all the episodes of a season of the show.
+    async def get_title_and_show_id_async(self, video: Episode) -> tuple[str, str | None]:
+        """Get the title and show_id, see :meth:`get_title_and_show_id`."""
+        # lookup show_id
+        series_tvdb_id = getattr(video, 'series_tvdb_id', None)
+        title = video.series
+        show_id = await self._search_show_id_async(title, series_tvdb_id=series_tvdb_id)
 
-        :param str show_id: the show id.
-        :param int season: the season to query.
-        :param language: the language of the subtitles.
-        :type language: :class:`~babelfish.language.Language`
-        :return: the list of found subtitles (as dicts).
-        :rtype: list[dict[str, Any]]
-        """
-        if self.session is None:
-            raise NotInitializedProviderError
+        # Try alternative names
+        if show_id is None:
+            for title in video.alternative_series:
+                show_id = await self._search_show_id_async(title)
+                if show_id is not None:
+                    # show_id found, keep the title and show_id
+                    break
 
-        query = f'{self.server_url}/shows/{show_id}/{season}/{language.alpha3}'
-        r = self.session.get(query, timeout=self.timeout)
+        return (title, show_id)
+
+    def _episodes_url(self, show_id: str, season: int, episode: int | None, language: Language) -> str:
+        """Get the url to query all the episodes of a season, or a single episode."""
+        if episode is None:
+            return f'{self.server_url}/shows/{show_id}/{season}/{language.alpha3}'
+        return f'{self.server_url}/subtitles/get/{show_id}/{season}/{episode}/{language.alpha3}'
+
+    @staticmethod
+    def _parse_all_episodes(r: Response, query: str) -> list[dict[str, Any]]:
+        """Parse the subtitles of all the episodes of a season."""
         try:
             r.raise_for_status()
         except HTTPError:
@@ -222,6 +270,44 @@ class GestdownProvider(Provider):
 
         return result['episodes']  # type: ignore[no-any-return]
 
+    @staticmethod
+    def _parse_single_episode(r: Response, query: str) -> list[dict[str, Any]]:
+        """Parse the subtitles of a single episode, as a list like :meth:`_parse_all_episodes`."""
+        try:
+            r.raise_for_status()
+        except HTTPError:
+            logger.exception('wrong query: %s', query)
+            return []
+
+        result = r.json()
+        if not result or any(k not in result for k in ('episode', 'matchingSubtitles')):
+            # Provider returns a status of 304 Not Modified with an empty content
+            # raise_for_status won't raise exception for that status code
+            logger.debug('No data returned from provider')
+            return []
+
+        # Transform to list of episodes, identical to `query_all_episodes`
+        data: dict[str, Any] = result['episode']
+        data['subtitles'] = result['matchingSubtitles']
+        return [data]
+
+    def _query_all_episodes(self, show_id: str, season: int, language: Language) -> list[dict[str, Any]]:
+        """Get the subtitles in the specified language for all the episodes of a season of the show.
+
+        :param str show_id: the show id.
+        :param int season: the season to query.
+        :param language: the language of the subtitles.
+        :type language: :class:`~babelfish.language.Language`
+        :return: the list of found subtitles (as dicts).
+        :rtype: list[dict[str, Any]]
+        """
+        if self.session is None:
+            raise NotInitializedProviderError
+
+        query = self._episodes_url(show_id, season, None, language)
+        r = self.session.get(query, timeout=self.timeout)
+        return self._parse_all_episodes(r, query)
+
     def _query_single_episode(
         self,
         show_id: str,
@@ -242,27 +328,44 @@ class GestdownProvider(Provider):
         if self.session is None:
             raise NotInitializedProviderError
 
-        base_query = f'{self.server_url}/subtitles/get'
-        query = f'{base_query}/{show_id}/{season}/{episode}/{language.alpha3}'
-
+        query = self._episodes_url(show_id, season, episode, language)
         r = self.session.get(query, timeout=self.timeout)
-        try:
-            r.raise_for_status()
-        except HTTPError:
-            logger.exception('wrong query: %s', query)
-            return []
+        return self._parse_single_episode(r, query)
 
-        result = r.json()
-        if not result or any(k not in result for k in ('episode', 'matchingSubtitles')):
-            # Provider returns a status of 304 Not Modified with an empty content
-            # raise_for_status won't raise exception for that status code
-            logger.debug('No data returned from provider')
-            return []
+    def _parse_subtitles(
+        self, episodes: list[dict[str, Any]], series: str, language: Language
+    ) -> list[GestdownSubtitle]:
+        """Create the subtitles from the episodes."""
+        # loop over subtitle rows
+        subtitles = []
+        for found in episodes:
+            title = found['title']
+            episode = found['number']
+            season = found['season']
+            for subtitle in found['subtitles']:
+                # read the item
+                hearing_impaired = subtitle['hearingImpaired']
+                page_link = f'{self.server_url}{subtitle["downloadUri"]}'
+                release_group = subtitle['version']
 
-        # Transform to list of episodes, identical to `query_all_episodes`
-        data: dict[str, Any] = result['episode']
-        data['subtitles'] = result['matchingSubtitles']
-        return [data]
+                m = id_pattern.match(page_link)
+                subtitle_id = m.groups()[0] if m else page_link
+
+                subtitle = self.subtitle_class(
+                    language=language,
+                    subtitle_id=subtitle_id,
+                    hearing_impaired=hearing_impaired,
+                    series=series,
+                    season=season,
+                    episode=episode,
+                    title=title,
+                    release_group=release_group,
+                    page_link=page_link,
+                )
+                logger.debug('Found subtitle %r', subtitle)
+                subtitles.append(subtitle)
+
+        return subtitles
 
     def query(
         self,
@@ -302,36 +405,32 @@ class GestdownProvider(Provider):
             # download only the specified episode
             episodes = self._query_single_episode(show_id, season, episode, language)
 
-        # loop over subtitle rows
-        subtitles = []
-        for found in episodes:
-            title = found['title']
-            episode = found['number']
-            season = found['season']
-            for subtitle in found['subtitles']:
-                # read the item
-                hearing_impaired = subtitle['hearingImpaired']
-                page_link = f'{self.server_url}{subtitle["downloadUri"]}'
-                release_group = subtitle['version']
+        return self._parse_subtitles(episodes, series, language)
 
-                m = id_pattern.match(page_link)
-                subtitle_id = m.groups()[0] if m else page_link
+    async def query_async(
+        self,
+        show_id: str | None,
+        series: str,
+        season: int,
+        episode: int | None,
+        language: Language,
+    ) -> list[GestdownSubtitle]:
+        """Query the provider for subtitles, see :meth:`query`."""
+        if self.async_session is None:
+            raise NotInitializedProviderError
 
-                subtitle = self.subtitle_class(
-                    language=language,
-                    subtitle_id=subtitle_id,
-                    hearing_impaired=hearing_impaired,
-                    series=series,
-                    season=season,
-                    episode=episode,
-                    title=title,
-                    release_group=release_group,
-                    page_link=page_link,
-                )
-                logger.debug('Found subtitle %r', subtitle)
-                subtitles.append(subtitle)
+        # get the page of the season of the show
+        if show_id is None:
+            logger.debug('A show id must be provided, show_id=None is not allowed')
+            return []
 
-        return subtitles
+        logger.info('Getting the subtitles list of show id %s, season %d', show_id, season)
+        query = self._episodes_url(show_id, season, episode, language)
+        r = await self.async_session.get(query, timeout=self.timeout)
+        parse = self._parse_all_episodes if episode is None else self._parse_single_episode
+        episodes = parse(r, query)
+
+        return self._parse_subtitles(episodes, series, language)
 
     def list_subtitles(self, video: Video, languages: Set[Language]) -> list[GestdownSubtitle]:
         """List all the subtitles for the video."""
@@ -353,17 +452,101 @@ class GestdownProvider(Provider):
 
         return subtitles
 
-    def download_subtitle(self, subtitle: GestdownSubtitle) -> None:
-        """Download the content of the subtitle."""
-        if self.session is None:
-            raise NotInitializedProviderError
+    async def list_subtitles_async(self, video: Video, languages: Set[Language]) -> list[GestdownSubtitle]:
+        """List all the subtitles for the video, querying the languages concurrently."""
+        if not isinstance(video, Episode):
+            return []
 
-        if not subtitle.page_link:
-            return
+        # lookup title and show_id
+        title, show_id = await self.get_title_and_show_id_async(video)
 
-        # download the subtitle
-        logger.info('Downloading subtitle %r', subtitle)
-        r = self.session.get(subtitle.page_link, timeout=self.timeout)
+        # Cannot find show_id
+        if show_id is None:
+            logger.error('No show id found for %r', video.series)
+            return []
+
+        # query for subtitles with the show_id
+        results = await asyncio.gather(
+            *(self.query_async(show_id, title, video.season, video.episode, lang) for lang in languages)
+        )
+        return [s for subtitles in results for s in subtitles]
+
+    @staticmethod
+    def _group_seasons(videos: Sequence[Video]) -> list[list[tuple[int, Episode]]]:
+        """Group the episodes of the same season, with their index in the `videos`."""
+        seasons: dict[tuple[str, int], list[tuple[int, Episode]]] = defaultdict(list)
+        for i, video in enumerate(videos):
+            if isinstance(video, Episode):
+                seasons[video.series, video.season].append((i, video))
+
+        return list(seasons.values())
+
+    def list_subtitles_batch(self, videos: Sequence[Video], languages: Set[Language]) -> list[list[GestdownSubtitle]]:
+        """List the subtitles for many videos, querying all the episodes of each season at once."""
+        # nothing to batch
+        if len(videos) < 2:
+            return super().list_subtitles_batch(videos, languages)
+
+        results: list[list[GestdownSubtitle]] = [[] for _ in videos]
+        for episodes in self._group_seasons(videos):
+            # lookup title and show_id
+            first = episodes[0][1]
+            title, show_id = self.get_title_and_show_id(first)
+
+            # Cannot find show_id
+            if show_id is None:
+                logger.error('No show id found for %r', first.series)
+                continue
+
+            # query the season once per language, or the episode directly if it is alone
+            episode = first.episode if len(episodes) == 1 else None
+            subtitles = [s for lang in languages for s in self.query(show_id, title, first.season, episode, lang)]
+            for i, video in episodes:
+                results[i] = [s for s in subtitles if s.episode == video.episode]
+
+        return results
+
+    async def list_subtitles_batch_async(
+        self,
+        videos: Sequence[Video],
+        languages: Set[Language],
+    ) -> list[list[GestdownSubtitle]]:
+        """List the subtitles for many videos, querying the seasons and the languages concurrently."""
+        # nothing to batch
+        if len(videos) < 2:
+            return await super().list_subtitles_batch_async(videos, languages)
+
+        async def list_season_subtitles(episodes: list[tuple[int, Episode]]) -> list[GestdownSubtitle]:
+            # lookup title and show_id
+            first = episodes[0][1]
+            title, show_id = await self.get_title_and_show_id_async(first)
+
+            # Cannot find show_id
+            if show_id is None:
+                logger.error('No show id found for %r', first.series)
+                return []
+
+            # query the season once per language, or the episode directly if it is alone
+            episode = first.episode if len(episodes) == 1 else None
+            found = await asyncio.gather(
+                *(self.query_async(show_id, title, first.season, episode, lang) for lang in languages)
+            )
+            return [s for subtitles in found for s in subtitles]
+
+        seasons = self._group_seasons(videos)
+        found = await asyncio.gather(*(list_season_subtitles(episodes) for episodes in seasons))
+
+        # distribute the subtitles to the episodes
+        results: list[list[GestdownSubtitle]] = [[] for _ in videos]
+        for episodes, subtitles in zip(seasons, found, strict=True):
+            for i, video in episodes:
+                results[i] = [s for s in subtitles if s.episode == video.episode]
+
+        return results
+
+    @staticmethod
+    def _parse_download(r: Response, subtitle: GestdownSubtitle) -> None:
+        """Set the content of the subtitle from the response of the download."""
         try:
             r.raise_for_status()
         except HTTPError:
@@ -381,3 +564,29 @@ class GestdownProvider(Provider):
             raise DownloadLimitExceeded
 
         subtitle.set_content(r.content)
+
+    def download_subtitle(self, subtitle: GestdownSubtitle) -> None:
+        """Download the content of the subtitle."""
+        if self.session is None:
+            raise NotInitializedProviderError
+
+        if not subtitle.page_link:
+            return
+
+        # download the subtitle
+        logger.info('Downloading subtitle %r', subtitle)
+        r = self.session.get(subtitle.page_link, timeout=self.timeout)
+        self._parse_download(r, subtitle)
+
+    async def download_subtitle_async(self, subtitle: GestdownSubtitle) -> None:
+        """Download the content of the subtitle, for the asyncio API."""
+        if self.async_session is None:
+            raise NotInitializedProviderError
+
+        if not subtitle.page_link:
+            return
+
+        # download the subtitle
+        logger.info('Downloading subtitle %r', subtitle)
+        r = await self.async_session.get(subtitle.page_link, timeout=self.timeout)
+        self._parse_download(r, subtitle)
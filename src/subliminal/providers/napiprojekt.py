@@ -2,16 +2,15 @@
 
 from __future__ import annotations
 
-import hashlib
 import io
 import logging
 from gzip import BadGzipFile, GzipFile
 from typing import TYPE_CHECKING, ClassVar
 
 from babelfish import Language  # type: ignore[import-untyped]
-from requests import Session
 
 from subliminal.exceptions import NotInitializedProviderError
+from subliminal.http import create_session
 from subliminal.subtitle import Subtitle, fix_line_ending
 
 from . import Provider
@@ -19,6 +18,8 @@ from . import Provider
 if TYPE_CHECKING:
     from collections.abc import Set
 
+    from requests import Session
+
     from subliminal.video import Video
 
 logger = logging.getLogger(__name__)
@@ -87,6 +88,7 @@ class NapiProjektProvider(Provider):
     subtitle_class: ClassVar = NapiProjektSubtitle
 
     required_hash: ClassVar = 'napiprojekt'
+    hasher: ClassVar = 'napiprojekt'
     server_url: ClassVar[str] = 'https://napiprojekt.pl/unit_napisy/dl.php'
 
     timeout: int
@@ -96,23 +98,9 @@ class NapiProjektProvider(Provider):
         self.timeout = timeout
         self.session = None
 
-    @staticmethod
-    def hash_video(video_path: str) -> str | None:
-        """Compute a hash using NapiProjekt's algorithm.
-
-        :param str video_path: path of the video.
-        :return: the hash.
-        :rtype: str
-
-        """
-        readsize = 1024 * 1024 * 10
-        with open(video_path, 'rb') as f:
-            data = f.read(readsize)
-        return hashlib.md5(data).hexdigest()  # noqa: S324
-
     def initialize(self) -> None:
         """Initialize the provider."""
-        self.session = Session()
+        self.session = create_session(self.get_rate_limiter())
         self.session.headers['User-Agent'] = self.user_agent
 
     def terminate(self) -> None:
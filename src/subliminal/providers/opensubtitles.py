@@ -180,6 +180,7 @@ class OpenSubtitlesProvider(Provider):
         Language.fromopensubtitles(lang) for lang in language_converters['opensubtitles'].codes
     }
     subtitle_class: ClassVar = OpenSubtitlesSubtitle
+    hasher: ClassVar = 'opensubtitles'
 
     server_url: ClassVar[str] = 'https://api.opensubtitles.org/xml-rpc'
     # user_agent = 'subliminal v%s' % __short_version__
@@ -197,7 +198,9 @@ class OpenSubtitlesProvider(Provider):
         *,
         timeout: int = 10,
     ) -> None:
-        transport = TimeoutSafeTransport(timeout=timeout, user_agent='VLSub')
+        self.timeout = timeout
+        # the timeout is read for each request, to follow the timeout of the current call
+        transport = TimeoutSafeTransport(timeout=lambda: self.timeout, user_agent='VLSub')
         self.server = ServerProxy(self.server_url, transport)
         if any((username, password)) and not all((username, password)):
             msg = 'Username and password must be specified'
@@ -4,7 +4,6 @@ from __future__ import annotations
 
 import contextlib
 import logging
-import time
 from collections.abc import Callable
 from datetime import datetime, timedelta, timezone
 from functools import wraps
@@ -12,7 +11,6 @@ from typing import TYPE_CHECKING, Any, ClassVar, cast
 
 from babelfish import Language, language_converters  # type: ignore[import-untyped]
 from dogpile.cache.api import NO_VALUE
-from requests import Response, Session
 
 from subliminal import __short_version__
 from subliminal.cache import region
@@ -24,7 +22,9 @@ from subliminal.exceptions import (
     ProviderError,
     ServiceUnavailable,
 )
+from subliminal.http import AsyncSession, create_session
 from subliminal.matches import guess_matches
+from subliminal.ratelimit import RateLimit
 from subliminal.subtitle import Subtitle
 from subliminal.utils import safely_guessit
 from subliminal.video import Episode, Movie, Video
@@ -32,9 +32,11 @@ from subliminal.video import Episode, Movie, Video
 from . import Provider
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Generator, Mapping, Set
+    from collections.abc import Callable, Generator, Iterable, Mapping, MutableMapping, Set
     from typing import TypeVar
 
+    from requests import Response, Session
+
     C = TypeVar('C', bound=Callable)
 
 
@@ -307,6 +309,24 @@ def requires_auth(func: C) -> C:
     return cast('C', wrapper)
 
 
+def requires_auth_async(func: C) -> C:
+    """Decorator for :class:`OpenSubtitlesComProvider` coroutines that require authentication."""
+
+    @wraps(func)
+    async def wrapper(self: OpenSubtitlesComProvider, *args: Any, **kwargs: Any) -> Any:
+        if not self.check_token():
+            # token expired
+            await self.login_async()
+
+            if not self.check_token():
+                msg = 'Cannot authenticate with username and password'
+                raise AuthenticationError(msg)
+
+        return await func(self, *args, **kwargs)
+
+    return cast('C', wrapper)
+
+
 class OpenSubtitlesComProvider(Provider):
     """OpenSubtitles.com Provider.
 
@@ -322,7 +342,11 @@ class OpenSubtitlesComProvider(Provider):
 
     server_url: ClassVar[str] = 'https://api.opensubtitles.com/api/v1/'
     subtitle_class: ClassVar = OpenSubtitlesComSubtitle
+    hasher: ClassVar = 'opensubtitles'
+    # the API allows 5 requests per second per IP
+    rate_limit: ClassVar = RateLimit(5, burst=5)
     languages: ClassVar[Set[Language]] = opensubtitlescom_languages
+    native_async: ClassVar = True
 
     user_agent: str = f'Subliminal v{__short_version__}'
     subtitle_format: str = 'srt'
@@ -334,6 +358,7 @@ class OpenSubtitlesComProvider(Provider):
     timeout: int
     token_expires_at: datetime | None
     session: Session | None
+    async_session: AsyncSession | None
 
     def __init__(
         self,
@@ -355,14 +380,22 @@ class OpenSubtitlesComProvider(Provider):
         self.timeout = timeout
         self.token_expires_at = None
         self.session = None
+        self.async_session = None
+
+    @property
+    def headers(self) -> dict[str, str]:
+        """Headers of the requests, without the authentication token."""
+        return {
+            'User-Agent': self.user_agent,
+            'Api-Key': self.apikey,
+            'Accept': '*/*',
+            'Content-Type': 'application/json',
+        }
 
     def initialize(self) -> None:
         """Initialize the provider."""
-        self.session = Session()
-        self.session.headers['User-Agent'] = self.user_agent
-        self.session.headers['Api-Key'] = self.apikey
-        self.session.headers['Accept'] = '*/*'
-        self.session.headers['Content-Type'] = 'application/json'
+        self.session = create_session(self.get_rate_limiter())
+        self.session.headers.update(self.headers)
 
     def terminate(self) -> None:
         """Terminate the provider."""
@@ -372,9 +405,26 @@ class OpenSubtitlesComProvider(Provider):
         # logout
         self.logout()
 
+    async def initialize_async(self) -> None:
+        """Initialize the provider, for the asyncio API."""
+        self.async_session = AsyncSession(self.headers, rate_limiter=self.get_rate_limiter())
+
+    async def terminate_async(self) -> None:
+        """Terminate the provider, for the asyncio API."""
+        if not self.async_session:
+            raise NotInitializedProviderError
+
+        await self.async_session.close()
+        self.async_session = None
+
+    @property
+    def _sessions_headers(self) -> list[MutableMapping[str, Any]]:
+        """Headers of the opened sessions, holding the authentication token."""
+        return [session.headers for session in (self.session, self.async_session) if session]
+
     def check_token(self) -> bool:
         """Check if the token is valid."""
-        if not self.session:
+        if not self.session and not self.async_session:
             raise NotInitializedProviderError
 
         # Check token is present
@@ -390,23 +440,29 @@ class OpenSubtitlesComProvider(Provider):
             return False
 
         # Login was already done, add token to Bearer
-        self.session.headers['Authorization'] = 'Bearer ' + str(token)
+        self.token = str(token)
         return True
 
-    def login(self, *, wait: bool = False) -> None:
-        """Login with the POST REST API."""
-        if not self.session:
-            raise NotInitializedProviderError
+    def _login_data(self, *, wait: bool) -> dict[str, str] | None:
+        """Get the body of the login request, or None if the credentials are missing."""
         if not self.username or not self.password:
             logger.info('Cannot log in, a username and password must be provided')
-            return
+            return None
 
         if wait:
-            # Wait 1s between calls
-            time.sleep(1)
+            # Wait 1s between login calls
+            self.get_rate_limiter().pause(1)
 
         logger.info('Logging in')
-        data = {'username': self.username, 'password': self.password}
+        return {'username': self.username, 'password': self.password}
+
+    def login(self, *, wait: bool = False) -> None:
+        """Login with the POST REST API."""
+        if not self.session:
+            raise NotInitializedProviderError
+        data = self._login_data(wait=wait)
+        if data is None:
+            return
 
         try:
             r = self.session.post(self.server_url + 'login', json=data, timeout=self.timeout)
@@ -416,6 +472,28 @@ class OpenSubtitlesComProvider(Provider):
             logger.exception('An error occurred')
             raise
 
+        self._set_token(r)
+
+    async def login_async(self, *, wait: bool = False) -> None:
+        """Login with the POST REST API, for the asyncio API."""
+        if not self.async_session:
+            raise NotInitializedProviderError
+        data = self._login_data(wait=wait)
+        if data is None:
+            return
+
+        try:
+            r = await self.async_session.post(self.server_url + 'login', json=data, timeout=self.timeout)
+            r = checked(r)
+        except ProviderError:
+            # raise error
+            logger.exception('An error occurred')
+            raise
+
+        self._set_token(r)
+
+    def _set_token(self, r: Response) -> None:
+        """Set and cache the token of the login response."""
         ret = r.json()
         token = ret['token']
         if not token:
@@ -446,11 +524,12 @@ class OpenSubtitlesComProvider(Provider):
     @property
     def token(self) -> str | None:
         """Authentication token."""
-        if not self.session:
+        headers = self._sessions_headers
+        if not headers:
             return None
-        if 'Authorization' not in self.session.headers:
+        if 'Authorization' not in headers[0]:
             return None
-        auth = str(self.session.headers['Authorization'])
+        auth = str(headers[0]['Authorization'])
         prefix = 'Bearer '
         if auth is None or not auth.startswith(prefix):
             return None
@@ -459,17 +538,15 @@ class OpenSubtitlesComProvider(Provider):
     @token.setter
     def token(self, value: str) -> None:
         """Authentication token."""
-        if not self.session:
-            return
-        self.session.headers['Authorization'] = 'Bearer ' + str(value)
+        for headers in self._sessions_headers:
+            headers['Authorization'] = 'Bearer ' + str(value)
 
     @token.deleter
     def token(self) -> None:
         """Authentication token."""
-        if not self.session:
-            return
-        if 'Authorization' in self.session.headers:
-            del self.session.headers['Authorization']
+        for headers in self._sessions_headers:
+            if 'Authorization' in headers:
+                del headers['Authorization']
 
     @requires_auth
     def user_infos(self) -> dict[str, Any]:
@@ -518,14 +595,10 @@ class OpenSubtitlesComProvider(Provider):
         """Make a GET request to the path, with parameters."""
         if not self.session:
             raise NotInitializedProviderError
-        # sort dict
-        params = dict(sorted(params.items())) if params else {}
-        # lowercase, do not transform spaces to "+", because then they become html-encoded
-        params = {k.lower(): (v.lower() if isinstance(v, str) else v) for k, v in params.items()}
 
         # no need to set the headers, there are set for `self.session`
         try:
-            r = self.session.get(self.server_url + path, params=params, timeout=self.timeout)
+            r = self.session.get(self.server_url + path, params=self._get_params(params), timeout=self.timeout)
             r = checked(r)
         except ProviderError:
             logger.exception('An error occurred')
@@ -535,6 +608,73 @@ class OpenSubtitlesComProvider(Provider):
 
         return r.json()  # type: ignore[no-any-return]
 
+    async def api_post_async(
+        self,
+        path: str,
+        body: Mapping[str, Any] | None = None,
+        *,
+        raises: bool = True,
+    ) -> dict[str, Any]:
+        """Make a POST request to the path, with body, for the asyncio API."""
+        if not self.async_session:
+            raise NotInitializedProviderError
+
+        body = dict(body) if body else {}
+
+        try:
+            r = await self.async_session.post(self.server_url + path, json=body, timeout=self.timeout)
+            r = checked(r)
+        except ProviderError:
+            logger.exception('An error occurred')
+            if raises:
+                raise
+            return {}
+
+        return r.json()  # type: ignore[no-any-return]
+
+    async def api_get_async(
+        self,
+        path: str,
+        params: Mapping[str, Any] | None = None,
+        *,
+        raises: bool = True,
+    ) -> dict[str, Any]:
+        """Make a GET request to the path, with parameters, for the asyncio API."""
+        if not self.async_session:
+            raise NotInitializedProviderError
+
+        try:
+            r = await self.async_session.get(
+                self.server_url + path,
+                params=self._get_params(params),
+                timeout=self.timeout,
+            )
+            r = checked(r)
+        except ProviderError:
+            logger.exception('An error occurred')
+            if raises:
+                raise
+            return {}
+
+        return r.json()  # type: ignore[no-any-return]
+
+    @staticmethod
+    def _get_params(params: Mapping[str, Any] | None) -> dict[str, Any]:
+        """Sort and lowercase the parameters of a GET request."""
+        # sort dict
+        params = dict(sorted(params.items())) if params else {}
+        # lowercase, do not transform spaces to "+", because then they become html-encoded
+        return {k.lower(): (v.lower() if isinstance(v, str) else v) for k, v in params.items()}
+
+    def _has_page(self, response: Mapping[str, Any], page: int) -> bool:
+        """Check if the `page` of the search results should be fetched, after the `response` of the previous one."""
+        # check that the maximum number of pages has not been exceeded
+        if self.max_result_pages > 0 and page > self.max_result_pages:
+            return False
+
+        # check if we fetched all pages already
+        return 'total_pages' in response and page <= response['total_pages']
+
     def _search(self, **params: Any) -> Generator[dict[str, Any], None, None]:
         page = 1
 
@@ -549,15 +689,29 @@ class OpenSubtitlesComProvider(Provider):
             yield from response['data']
 
             page += 1
+            if not self._has_page(response, page):
+                break
+
+    async def _search_async(self, **params: Any) -> list[dict[str, Any]]:
+        page = 1
+        results: list[dict[str, Any]] = []
 
-            # check that the maximum number of pages has not been exceeded
-            if self.max_result_pages > 0 and page > self.max_result_pages:
+        while True:
+            # Extended params with page
+            ext_params = {'page': page, **params}
+            logger.info('Searching subtitles %r', ext_params)
+            # GET request and add page information
+            response = await self.api_get_async('subtitles', ext_params)
+            if not response or not response['data']:
                 break
+            results.extend(response['data'])
 
-            # check if we fetched all pages already
-            if 'total_pages' not in response or page > response['total_pages']:
+            page += 1
+            if not self._has_page(response, page):
                 break
 
+        return results
+
     def _make_query(
         self,
         *,
@@ -640,34 +794,78 @@ class OpenSubtitlesComProvider(Provider):
         **kwargs: Any,
     ) -> list[OpenSubtitlesComSubtitle]:
         """Query the server and return all the data."""
-        # fill the search criteria
-        criteria = self._make_query(**kwargs)
+        subtitles: list[OpenSubtitlesComSubtitle] = []
+        for criterion in self._make_criteria(languages, **kwargs):
+            self._add_subtitles(subtitles, self._search(**criterion), criterion)
 
+        return self._filter_subtitles(
+            subtitles,
+            allow_machine_translated=allow_machine_translated,
+            sort_by_download_count=sort_by_download_count,
+        )
+
+    async def query_async(
+        self,
+        languages: Set[Language],
+        *,
+        allow_machine_translated: bool = False,
+        sort_by_download_count: bool = True,
+        **kwargs: Any,
+    ) -> list[OpenSubtitlesComSubtitle]:
+        """Query the server and return all the data, for the asyncio API."""
         subtitles: list[OpenSubtitlesComSubtitle] = []
+        for criterion in self._make_criteria(languages, **kwargs):
+            self._add_subtitles(subtitles, await self._search_async(**criterion), criterion)
+
+        return self._filter_subtitles(
+            subtitles,
+            allow_machine_translated=allow_machine_translated,
+            sort_by_download_count=sort_by_download_count,
+        )
 
+    def _make_criteria(self, languages: Set[Language], **kwargs: Any) -> list[dict[str, Any]]:
+        """Make the list of query parameters, with the languages."""
+        # fill the search criteria
+        criteria = self._make_query(**kwargs)
         for criterion in criteria:
-            # add the language and query the server
+            # add the language
             criterion.update({'languages': ','.join(sorted(lang.opensubtitlescom for lang in languages))})
+        return criteria
 
-            imdb_match = 'imdb_id' in criterion or 'show_imdb_id' in criterion
-            tmdb_match = 'tmdb_id' in criterion or 'show_tmdb_id' in criterion
-
-            # loop over subtitle items
-            for response in self._search(**criterion):
-                # read single response
-                subtitle = self.subtitle_class.from_response(
-                    response,
-                    imdb_match=imdb_match,
-                    tmdb_match=tmdb_match,
-                )
-
-                # Some criteria are redundant, so skip duplicates
-                # Use set for faster search
-                unique_ids = {s.id for s in subtitles}
-                if subtitle.id not in unique_ids:
-                    logger.debug('Found subtitle %r', subtitle)
-                    subtitles.append(subtitle)
+    def _add_subtitles(
+        self,
+        subtitles: list[OpenSubtitlesComSubtitle],
+        responses: Iterable[dict[str, Any]],
+        criterion: Mapping[str, Any],
+    ) -> None:
+        """Add the subtitles of the search results of a criterion, skipping the duplicates."""
+        imdb_match = 'imdb_id' in criterion or 'show_imdb_id' in criterion
+        tmdb_match = 'tmdb_id' in criterion or 'show_tmdb_id' in criterion
+
+        # loop over subtitle items
+        for response in responses:
+            # read single response
+            subtitle = self.subtitle_class.from_response(
+                response,
+                imdb_match=imdb_match,
+                tmdb_match=tmdb_match,
+            )
+
+            # Some criteria are redundant, so skip duplicates
+            # Use set for faster search
+            unique_ids = {s.id for s in subtitles}
+            if subtitle.id not in unique_ids:
+                logger.debug('Found subtitle %r', subtitle)
+                subtitles.append(subtitle)
 
+    @staticmethod
+    def _filter_subtitles(
+        subtitles: list[OpenSubtitlesComSubtitle],
+        *,
+        allow_machine_translated: bool,
+        sort_by_download_count: bool,
+    ) -> list[OpenSubtitlesComSubtitle]:
+        """Filter out the machine translated subtitles, and sort the others."""
         # filter out the machine translated subtitles
         if not allow_machine_translated:
             subtitles = [sub for sub in subtitles if not sub.machine_translated]
@@ -677,8 +875,9 @@ class OpenSubtitlesComProvider(Provider):
 
         return list(subtitles)
 
-    def list_subtitles(self, video: Video, languages: Set[Language]) -> list[OpenSubtitlesComSubtitle]:
-        """List all the subtitles for the video."""
+    @staticmethod
+    def _video_query(video: Video) -> dict[str, Any]:
+        """Get the query parameters of the video."""
         query = season = episode = None
         if isinstance(video, Episode):
             # TODO: add show_imdb_id and show_tmdb_id
@@ -688,32 +887,77 @@ class OpenSubtitlesComProvider(Provider):
         elif isinstance(video, Movie):
             query = video.title
 
+        return {
+            'moviehash': video.hashes.get('opensubtitles'),
+            'imdb_id': video.imdb_id,
+            'query': query,
+            'season': season,
+            'episode': episode,
+        }
+
+    def list_subtitles(self, video: Video, languages: Set[Language]) -> list[OpenSubtitlesComSubtitle]:
+        """List all the subtitles for the video."""
         return self.query(
             languages,
-            moviehash=video.hashes.get('opensubtitles'),
-            imdb_id=video.imdb_id,
-            query=query,
-            season=season,
-            episode=episode,
             allow_machine_translated=False,
             sort_by_download_count=True,
+            **self._video_query(video),
+        )
+
+    async def list_subtitles_async(self, video: Video, languages: Set[Language]) -> list[OpenSubtitlesComSubtitle]:
+        """List all the subtitles for the video, for the asyncio API."""
+        return await self.query_async(
+            languages,
+            allow_machine_translated=False,
+            sort_by_download_count=True,
+            **self._video_query(video),
         )
 
+    def _download_body(self, subtitle: OpenSubtitlesComSubtitle) -> dict[str, Any]:
+        """Get the body of the request of the download link, if the download quota is not exhausted."""
+        # stop if another client exhausted the download quota
+        if self.get_rate_limiter().quota_exhausted:
+            logger.error('download quota exceeded')
+            raise DownloadLimitReached
+
+        # get the subtitle download link
+        logger.info('Downloading subtitle %r', subtitle)
+        return {'file_id': subtitle.file_id, 'file_name': subtitle.file_name, 'sub_format': self.subtitle_format}
+
     @requires_auth
     def download_subtitle(self, subtitle: OpenSubtitlesComSubtitle) -> None:
         """Download the content of the subtitle."""
         if not self.session:
             raise NotInitializedProviderError
 
-        # get the subtitle download link
-        logger.info('Downloading subtitle %r', subtitle)
-        body = {'file_id': subtitle.file_id, 'file_name': subtitle.file_name, 'sub_format': self.subtitle_format}
-        r = self.api_post('download', body)
-        if any(k not in r for k in ('link', 'remaining')):
+        link = self._parse_download_link(self.api_post('download', self._download_body(subtitle)))
+        if link is None:
             return
 
-        link = r['link']
+        # download the subtitle
+        self._parse_download(self.session.get(link, timeout=self.timeout), subtitle)
+
+    @requires_auth_async
+    async def download_subtitle_async(self, subtitle: OpenSubtitlesComSubtitle) -> None:
+        """Download the content of the subtitle, for the asyncio API."""
+        if not self.async_session:
+            raise NotInitializedProviderError
+
+        link = self._parse_download_link(await self.api_post_async('download', self._download_body(subtitle)))
+        if link is None:
+            return
+
+        # download the subtitle
+        self._parse_download(await self.async_session.get(link, timeout=self.timeout), subtitle)
+
+    def _parse_download_link(self, r: Mapping[str, Any]) -> str | None:
+        """Get the download link, and update the download quota."""
+        if any(k not in r for k in ('link', 'remaining')):
+            return None
+
+        link = str(r['link'])
         remaining = int(r['remaining'])
+        self.get_rate_limiter().set_quota(remaining, reset_at=parse_reset_time(r.get('reset_time_utc')))
 
         # detect download limit exceeded
         if remaining <= 0:
@@ -723,9 +967,11 @@ class OpenSubtitlesComProvider(Provider):
                 logger.error('download quota exceeded')
             raise DownloadLimitReached
 
-        # download the subtitle
-        download_response = self.session.get(link, timeout=self.timeout)
+        return link
 
+    @staticmethod
+    def _parse_download(download_response: Response, subtitle: OpenSubtitlesComSubtitle) -> None:
+        """Set the content of the subtitle from the download response."""
         if not download_response.content:
             # Provider returns a status of 304 Not Modified with an empty content
             # raise_for_status won't raise exception for that status code
@@ -790,6 +1036,26 @@ class DisabledUserAgent(OpenSubtitlesComError, AuthenticationError):
     pass
 
 
+def parse_reset_time(value: str | None) -> float | None:
+    """Parse the reset time of the download quota, like ``2022-04-08T13:03:16.000Z``.
+
+    :param str value: the reset time, in UTC.
+    :return: the reset time as a timestamp, or None if it is invalid.
+    :rtype: float | None
+
+    """
+    if not value:
+        return None
+    try:
+        reset_time = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        logger.debug('Invalid quota reset time %r', value)
+        return None
+    if reset_time.tzinfo is None:
+        reset_time = reset_time.replace(tzinfo=timezone.utc)
+    return reset_time.timestamp()
+
+
 def checked(response: Response) -> Response:
     """Check a response status before returning it.
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import io
 import json
 import logging
@@ -9,10 +10,11 @@ from typing import TYPE_CHECKING, Any, ClassVar
 from zipfile import ZipFile
 
 from babelfish import Language, language_converters  # type: ignore[import-untyped]
-from requests import Session
 
 from subliminal.exceptions import NotInitializedProviderError, ProviderError
+from subliminal.http import AsyncSession, create_session
 from subliminal.matches import guess_matches
+from subliminal.singleflight import single_flight
 from subliminal.subtitle import Subtitle
 from subliminal.utils import safely_guessit
 from subliminal.video import Episode, Movie, Video
@@ -22,6 +24,8 @@ from . import Provider, SecLevelOneTLSAdapter
 if TYPE_CHECKING:
     from collections.abc import Sequence, Set
 
+    from requests import Response, Session
+
 
 logger = logging.getLogger(__name__)
 
@@ -90,20 +94,26 @@ class PodnapisiProvider(Provider):
     }
     subtitle_class: ClassVar = PodnapisiSubtitle
     server_url: ClassVar[str] = 'https://www.podnapisi.net/subtitles'
+    native_async: ClassVar = True
 
     timeout: int
     session: Session | None
+    async_session: AsyncSession | None
 
     def __init__(self, *, timeout: int = 10) -> None:
         self.timeout = timeout
         self.session = None
+        self.async_session = None
+
+    @property
+    def headers(self) -> dict[str, str]:
+        """Headers of the requests."""
+        return {'User-Agent': self.user_agent, 'Accept': 'application/json'}
 
     def initialize(self) -> None:
         """Initialize the provider."""
-        self.session = Session()
-        self.session.mount('https://', SecLevelOneTLSAdapter())
-        self.session.headers['User-Agent'] = self.user_agent
-        self.session.headers['Accept'] = 'application/json'
+        self.session = create_session(self.get_rate_limiter(), adapter_class=SecLevelOneTLSAdapter)
+        self.session.headers.update(self.headers)
 
     def terminate(self) -> None:
         """Terminate the provider."""
@@ -112,6 +122,108 @@ class PodnapisiProvider(Provider):
 
         self.session.close()
 
+    async def initialize_async(self) -> None:
+        """Initialize the provider, for the asyncio API."""
+        self.async_session = AsyncSession(
+            self.headers,
+            rate_limiter=self.get_rate_limiter(),
+            adapter_class=SecLevelOneTLSAdapter,
+        )
+
+    async def terminate_async(self) -> None:
+        """Terminate the provider, for the asyncio API."""
+        if self.async_session is None:
+            raise NotInitializedProviderError
+
+        await self.async_session.close()
+
+    @staticmethod
+    def _query_params(
+        language: Language,
+        keyword: str,
+        season: int | None,
+        episode: int | None,
+        year: int | None,
+    ) -> dict[str, Any]:
+        """Get the parameters of the search."""
+        # set parameters, see https://www.podnapisi.net/forum/viewtopic.php?f=62&t=26164#p212652
+        params: dict[str, Any] = {'keywords': keyword, 'language': str(language)}
+        if season is not None and episode is not None:
+            params['seasons'] = season
+            params['episodes'] = episode
+            params['movie_type'] = ['tv-series', 'mini-series']
+        else:
+            params['movie_type'] = 'movie'
+        if year:
+            params['year'] = year
+        return params
+
+    def _parse_page(
+        self,
+        r: Response,
+        pids: set[str],
+        *,
+        is_episode: bool,
+    ) -> tuple[list[PodnapisiSubtitle], int | None]:
+        """Parse a page of results of the search.
+
+        :param r: the response of the search.
+        :param set pids: the ids of the subtitles already found, to ignore the duplicates.
+        :param bool is_episode: the search is for an episode.
+        :return: the subtitles of the page and the next page, if any.
+        :rtype: tuple[list[PodnapisiSubtitle], int | None]
+
+        """
+        r.raise_for_status()
+        result = json.loads(r.text)
+
+        # loop over subtitles
+        subtitles = []
+        for data in result['data']:
+            # read xml elements
+            pid = data['id']
+            # ignore duplicates, see https://www.podnapisi.net/forum/viewtopic.php?f=62&t=26164&start=10#p213321
+            if pid in pids:
+                logger.debug('Ignoring duplicate %r', pid)
+                continue
+
+            if is_episode and data['movie']['type'] == 'movie':
+                logger.error('Wrong type detected: movie for episode')
+                continue
+
+            language = Language.fromietf(data['language'])
+            hearing_impaired = 'hearing_impaired' in data['flags']
+            page_link = data['url']
+            releases = data['releases'] + data['custom_releases']
+            title = data['movie']['title']
+            season = int(data['movie']['episode_info'].get('season')) if is_episode else None
+            episode = int(data['movie']['episode_info'].get('episode')) if is_episode else None
+            year = int(data['movie']['year'])
+
+            subtitle = self.subtitle_class(
+                language=language,
+                subtitle_id=pid,
+                hearing_impaired=hearing_impaired,
+                page_link=page_link,
+                releases=releases,
+                title=title,
+                season=season,
+                episode=episode,
+                year=year,
+            )
+
+            logger.debug('Found subtitle %r', subtitle)
+            subtitles.append(subtitle)
+            pids.add(pid)
+
+        # stop on last page
+        if int(result['page']) >= int(result['all_pages']):
+            return subtitles, None
+
+        # increment current page
+        return subtitles, int(result['page']) + 1
+
+    @single_flight
     def query(
         self,
         language: Language,
@@ -135,89 +247,63 @@ class PodnapisiProvider(Provider):
         if self.session is None:
             raise NotInitializedProviderError
 
-        # set parameters, see https://www.podnapisi.net/forum/viewtopic.php?f=62&t=26164#p212652
-        params: dict[str, Any] = {'keywords': keyword, 'language': str(language)}
-        is_episode = False
-        if season is not None and episode is not None:
-            is_episode = True
-            params['seasons'] = season
-            params['episodes'] = episode
-            params['movie_type'] = ['tv-series', 'mini-series']
-        else:
-            params['movie_type'] = 'movie'
-        if year:
-            params['year'] = year
+        params = self._query_params(language, keyword, season, episode, year)
 
         # loop over paginated results
         logger.info('Searching subtitles %r', params)
-        subtitles = []
-        pids = set()
+        subtitles: list[PodnapisiSubtitle] = []
+        pids: set[str] = set()
         while True:
-            # query the server
             r = self.session.get(self.server_url + '/search/advanced', params=params, timeout=self.timeout)
-            r.raise_for_status()
-            result = json.loads(r.text)
-
-            # loop over subtitles
-            for data in result['data']:
-                # read xml elements
-                pid = data['id']
-                # ignore duplicates, see https://www.podnapisi.net/forum/viewtopic.php?f=62&t=26164&start=10#p213321
-                if pid in pids:
-                    logger.debug('Ignoring duplicate %r', pid)
-                    continue
-
-                if is_episode and data['movie']['type'] == 'movie':
-                    logger.error('Wrong type detected: movie for episode')
-                    continue
-
-                language = Language.fromietf(data['language'])
-                hearing_impaired = 'hearing_impaired' in data['flags']
-                page_link = data['url']
-                releases = data['releases'] + data['custom_releases']
-                title = data['movie']['title']
-                season = int(data['movie']['episode_info'].get('season')) if is_episode else None
-                episode = int(data['movie']['episode_info'].get('episode')) if is_episode else None
-                year = int(data['movie']['year'])
-
-                subtitle = self.subtitle_class(
-                    language=language,
-                    subtitle_id=pid,
-                    hearing_impaired=hearing_impaired,
-                    page_link=page_link,
-                    releases=releases,
-                    title=title,
-                    season=season,
-                    episode=episode,
-                    year=year,
-                )
-
-                logger.debug('Found subtitle %r', subtitle)
-                subtitles.append(subtitle)
-                pids.add(pid)
-
-            # stop on last page
-            if int(result['page']) >= int(result['all_pages']):
-                break
-
-            # increment current page
-            params['page'] = int(result['page']) + 1
-            logger.debug('Getting page %d', params['page'])
-
-        return subtitles
+            page_subtitles, page = self._parse_page(r, pids, is_episode=season is not None and episode is not None)
+            subtitles.extend(page_subtitles)
+            if page is None:
+                return subtitles
 
-    def list_subtitles(self, video: Video, languages: Set[Language]) -> list[PodnapisiSubtitle]:
-        """List all the subtitles for the video."""
-        season = episode = None
+            params['page'] = page
+            logger.debug('Getting page %d', page)
+
+    async def query_async(
+        self,
+        language: Language,
+        keyword: str,
+        *,
+        season: int | None = None,
+        episode: int | None = None,
+        year: int | None = None,
+    ) -> list[PodnapisiSubtitle]:
+        """Query the provider for subtitles, see :meth:`query`."""
+        if self.async_session is None:
+            raise NotInitializedProviderError
+
+        params = self._query_params(language, keyword, season, episode, year)
+
+        # loop over paginated results
+        logger.info('Searching subtitles %r', params)
+        subtitles: list[PodnapisiSubtitle] = []
+        pids: set[str] = set()
+        while True:
+            r = await self.async_session.get(self.server_url + '/search/advanced', params=params, timeout=self.timeout)
+            page_subtitles, page = self._parse_page(r, pids, is_episode=season is not None and episode is not None)
+            subtitles.extend(page_subtitles)
+            if page is None:
+                return subtitles
+
+            params['page'] = page
+            logger.debug('Getting page %d', page)
+
+    @staticmethod
+    def _search_terms(video: Video) -> tuple[list[str], int | None, int | None]:
+        """Get the titles to search, in order, and the season and episode of the `video`."""
         if isinstance(video, Episode):
-            titles = [video.series, *video.alternative_series]
-            season = video.season
-            episode = video.episode
-        elif isinstance(video, Movie):
-            titles = [video.title, *video.alternative_titles]
-        else:
-            return []
+            return [video.series, *video.alternative_series], video.season, video.episode
+        if isinstance(video, Movie):
+            return [video.title, *video.alternative_titles], None, None
+        return [], None, None
 
+    def list_subtitles(self, video: Video, languages: Set[Language]) -> list[PodnapisiSubtitle]:
+        """List all the subtitles for the video."""
+        titles, season, episode = self._search_terms(video)
         for title in titles:
             subtitles = [
                 s
@@ -229,6 +315,19 @@ class PodnapisiProvider(Provider):
 
         return []
 
+    async def list_subtitles_async(self, video: Video, languages: Set[Language]) -> list[PodnapisiSubtitle]:
+        """List all the subtitles for the video, querying the languages concurrently."""
+        titles, season, episode = self._search_terms(video)
+        for title in titles:
+            results = await asyncio.gather(
+                *(self.query_async(lang, title, season=season, episode=episode, year=video.year) for lang in languages)
+            )
+            subtitles = [s for lang_subtitles in results for s in lang_subtitles]
+            if subtitles:
+                return subtitles
+
+        return []
+
     def download_subtitle(self, subtitle: PodnapisiSubtitle) -> None:
         """Download the content of the subtitle."""
         if self.session is None:
@@ -241,6 +340,25 @@ class PodnapisiProvider(Provider):
             params={'container': 'zip'},
             timeout=self.timeout,
         )
+        self._parse_download(r, subtitle)
+
+    async def download_subtitle_async(self, subtitle: PodnapisiSubtitle) -> None:
+        """Download the content of the subtitle, for the asyncio API."""
+        if self.async_session is None:
+            raise NotInitializedProviderError
+
+        # download as a zip
+        logger.info('Downloading subtitle %r', subtitle)
+        r = await self.async_session.get(
+            self.server_url + f'/{subtitle.subtitle_id}/download',
+            params={'container': 'zip'},
+            timeout=self.timeout,
+        )
+        self._parse_download(r, subtitle)
+
+    @staticmethod
+    def _parse_download(r: Response, subtitle: PodnapisiSubtitle) -> None:
+        """Set the content of the subtitle from the zip of the download."""
         r.raise_for_status()
 
         # open the zip
@@ -8,10 +8,10 @@ from typing import TYPE_CHECKING, Any, ClassVar, cast
 from urllib.parse import quote
 
 from babelfish import Language
-from requests import Session
 from requests.exceptions import HTTPError, JSONDecodeError, RequestException
 
 from subliminal.exceptions import NotInitializedProviderError, ProviderError
+from subliminal.http import AsyncSession, create_session
 from subliminal.matches import guess_matches
 from subliminal.subtitle import Subtitle
 from subliminal.utils import safely_guessit
@@ -22,6 +22,8 @@ from . import Provider
 if TYPE_CHECKING:
     from collections.abc import Set
 
+    from requests import Response, Session
+
     from subliminal.video import Video
 
 logger = logging.getLogger(__name__)
@@ -114,37 +116,29 @@ class SubtisProvider(Provider[SubtisSubtitle]):
     languages: ClassVar[Set[Language]] = subtis_languages
     video_types: ClassVar = (Movie,)
     subtitle_class: ClassVar = SubtisSubtitle
+    hasher: ClassVar = 'opensubtitles'
 
     server_url: ClassVar[str] = 'https://api.subt.is/v1'
+    native_async: ClassVar = True
 
     timeout: int
     session: Session | None
+    async_session: AsyncSession | None
 
     def __init__(self, *, timeout: int = 10) -> None:
         self.timeout = timeout
         self.session = None
+        self.async_session = None
 
-    @staticmethod
-    def hash_video(video_path: str) -> str | None:
-        """Compute a hash using OpenSubtitles' algorithm.
-
-        :param video_path: path of the video file.
-        :return: the hash string, or None if file is too small or error occurs.
-        """
-        from subliminal.refiners.hash import hash_opensubtitles
-
-        video_path = os.fspath(video_path)
-        try:
-            return hash_opensubtitles(video_path)
-        except OSError:
-            logger.debug('Could not compute hash for %s', video_path)
-            return None
+    @property
+    def headers(self) -> dict[str, str]:
+        """Headers of the requests."""
+        return {'User-Agent': self.user_agent, 'Accept': 'application/json'}
 
     def initialize(self) -> None:
         """Initialize the provider."""
-        self.session = Session()
-        self.session.headers['User-Agent'] = self.user_agent
-        self.session.headers['Accept'] = 'application/json'
+        self.session = create_session(self.get_rate_limiter())
+        self.session.headers.update(self.headers)
 
     def terminate(self) -> None:
         """Terminate the provider."""
@@ -153,6 +147,17 @@ class SubtisProvider(Provider[SubtisSubtitle]):
         self.session.close()
         self.session = None
 
+    async def initialize_async(self) -> None:
+        """Initialize the provider, for the asyncio API."""
+        self.async_session = AsyncSession(self.headers, rate_limiter=self.get_rate_limiter())
+
+    async def terminate_async(self) -> None:
+        """Terminate the provider, for the asyncio API."""
+        if self.async_session is None:
+            raise NotInitializedProviderError
+        await self.async_session.close()
+        self.async_session = None
+
     def _session_request(self, url: str) -> dict[str, Any] | None:
         """Perform a GET request to the provider."""
         if self.session is None:
@@ -164,6 +169,24 @@ class SubtisProvider(Provider[SubtisSubtitle]):
             logger.exception('Request error for %s', url)
             raise SubtisError from None
 
+        return self._parse_json(r, url)
+
+    async def _session_request_async(self, url: str) -> dict[str, Any] | None:
+        """Perform a GET request to the provider, see :meth:`_session_request`."""
+        if self.async_session is None:
+            raise NotInitializedProviderError
+
+        try:
+            r = await self.async_session.get(url, timeout=self.timeout)
+        except RequestException:
+            logger.exception('Request error for %s', url)
+            raise SubtisError from None
+
+        return self._parse_json(r, url)
+
+    @staticmethod
+    def _parse_json(r: Response, url: str) -> dict[str, Any] | None:
+        """Parse the JSON body of a response, or None if nothing was found."""
         if r.status_code in (400, 404):
             return None
 
@@ -200,103 +223,93 @@ class SubtisProvider(Provider[SubtisSubtitle]):
 
         return subtitle_link, str(title_name)
 
-    def query(self, video: Movie, languages: Set[Language]) -> list[SubtisSubtitle]:
-        """Query the provider for subtitles using cascade search.
+    def _searches(self, video: Movie) -> list[tuple[str, str, bool, str | None]]:
+        """Get the searches of the cascade, from the most to the least specific.
 
-        Cascade order (from most to least specific):
         1. Hash - OpenSubtitles video hash (most precise)
         2. Bytes - File size match
         3. Filename - Exact filename match
         4. Alternative - Fuzzy match (fallback)
+
+        Returns:
+            List of (search name, url, is_synced, video_hash).
         """
+        searches: list[tuple[str, str, bool, str | None]] = []
+        encoded_filename = quote(os.path.basename(video.name), safe='')
+
+        if video.name and os.path.isfile(video.name):
+            video_hash = video.hashes.get('subtis')
+            if video_hash:
+                searches.append(('hash', f'{self.server_url}/subtitle/find/file/hash/{video_hash}', True, video_hash))
+
+        if video.size:
+            searches.append(('bytes', f'{self.server_url}/subtitle/find/file/bytes/{video.size}', True, None))
+
+        searches.append(('filename', f'{self.server_url}/subtitle/find/file/name/{encoded_filename}', True, None))
+        searches.append(('alternative', f'{self.server_url}/subtitle/file/alternative/{encoded_filename}', False, None))
+        return searches
+
+    def _parse_search(
+        self,
+        data: dict[str, Any] | None,
+        language: Language,
+        url: str,
+        *,
+        is_synced: bool,
+        video_hash: str | None,
+    ) -> list[SubtisSubtitle]:
+        """Build the subtitle found by a search of the cascade, if any."""
+        if not data:
+            return []
+        parsed = self._parse_response(data)
+        if not parsed:
+            return []
+
+        subtitle_link, title_name = parsed
+        return [
+            SubtisSubtitle(
+                language=language,
+                subtitle_id=subtitle_link,
+                page_link=url,
+                title=title_name,
+                download_link=subtitle_link,
+                is_synced=is_synced,
+                video_hash=video_hash,
+            )
+        ]
+
+    def query(self, video: Movie, languages: Set[Language]) -> list[SubtisSubtitle]:
+        """Query the provider for subtitles using cascade search, see :meth:`_searches`."""
         if not video.name:
             return []
 
         language = next((lang for lang in languages if lang.alpha3 == 'spa'), Language('spa'))
-
         filename = os.path.basename(video.name)
-        encoded_filename = quote(filename, safe='')
+        for search, url, is_synced, video_hash in self._searches(video):
+            logger.info('Searching subtitles by %s for %s', search, filename)
+            data = self._session_request(url)
+            subtitles = self._parse_search(data, language, url, is_synced=is_synced, video_hash=video_hash)
+            if subtitles:
+                logger.debug('Found subtitle via %s search', search)
+                return subtitles
 
-        if video.name and os.path.isfile(video.name):
-            video_hash = video.hashes.get('subtis')
-            if video_hash:
-                hash_url = f'{self.server_url}/subtitle/find/file/hash/{video_hash}'
-                logger.info('Searching subtitles by hash for %s', filename)
-                data = self._session_request(hash_url)
-                if data:
-                    parsed = self._parse_response(data)
-                    if parsed:
-                        subtitle_link, title_name = parsed
-                        logger.debug('Found subtitle via hash search')
-                        return [
-                            SubtisSubtitle(
-                                language=language,
-                                subtitle_id=subtitle_link,
-                                page_link=hash_url,
-                                title=title_name,
-                                download_link=subtitle_link,
-                                is_synced=True,
-                                video_hash=video_hash,
-                            )
-                        ]
+        logger.info('No subtitle found for %s', filename)
+        return []
 
-        if video.size:
-            bytes_url = f'{self.server_url}/subtitle/find/file/bytes/{video.size}'
-            logger.info('Searching subtitles by bytes for %s', filename)
-            data = self._session_request(bytes_url)
-            if data:
-                parsed = self._parse_response(data)
-                if parsed:
-                    subtitle_link, title_name = parsed
-                    logger.debug('Found subtitle via bytes search')
-                    return [
-                        SubtisSubtitle(
-                            language=language,
-                            subtitle_id=subtitle_link,
-                            page_link=bytes_url,
-                            title=title_name,
-                            download_link=subtitle_link,
-                            is_synced=True,
-                        )
-                    ]
-
-        filename_url = f'{self.server_url}/subtitle/find/file/name/{encoded_filename}'
-        logger.info('Searching subtitles by filename for %s', filename)
-        data = self._session_request(filename_url)
-        if data:
-            parsed = self._parse_response(data)
-            if parsed:
-                subtitle_link, title_name = parsed
-                logger.debug('Found subtitle via filename search')
-                return [
-                    SubtisSubtitle(
-                        language=language,
-                        subtitle_id=subtitle_link,
-                        page_link=filename_url,
-                        title=title_name,
-                        download_link=subtitle_link,
-                        is_synced=True,
-                    )
-                ]
-
-        alternative_url = f'{self.server_url}/subtitle/file/alternative/{encoded_filename}'
-        logger.info('Searching subtitles (alternative) for %s', filename)
-        data = self._session_request(alternative_url)
-        if data:
-            parsed = self._parse_response(data)
-            if parsed:
-                subtitle_link, title_name = parsed
-                logger.debug('Found subtitle via alternative search (fuzzy)')
-                return [
-                    SubtisSubtitle(
-                        language=language,
-                        subtitle_id=subtitle_link,
-                        page_link=alternative_url,
-                        title=title_name,
-                        download_link=subtitle_link,
-                        is_synced=False,
-                    )
-                ]
+    async def query_async(self, video: Movie, languages: Set[Language]) -> list[SubtisSubtitle]:
+        """Query the provider for subtitles using cascade search, see :meth:`query`."""
+        if not video.name:
+            return []
+
+        language = next((lang for lang in languages if lang.alpha3 == 'spa'), Language('spa'))
+        filename = os.path.basename(video.name)
+        for search, url, is_synced, video_hash in self._searches(video):
+            logger.info('Searching subtitles by %s for %s', search, filename)
+            data = await self._session_request_async(url)
+            subtitles = self._parse_search(data, language, url, is_synced=is_synced, video_hash=video_hash)
+            if subtitles:
+                logger.debug('Found subtitle via %s search', search)
+                return subtitles
 
         logger.info('No subtitle found for %s', filename)
         return []
@@ -308,6 +321,13 @@ class SubtisProvider(Provider[SubtisSubtitle]):
 
         return self.query(video, languages)
 
+    async def list_subtitles_async(self, video: Video, languages: Set[Language]) -> list[SubtisSubtitle]:
+        """List all the subtitles for the video, for the asyncio API."""
+        if not isinstance(video, Movie):
+            return []
+
+        return await self.query_async(video, languages)
+
     def download_subtitle(self, subtitle: SubtisSubtitle) -> None:
         """Download the content of the subtitle."""
         if self.session is None:
@@ -325,6 +345,30 @@ class SubtisProvider(Provider[SubtisSubtitle]):
             logger.exception('Download error for %s', subtitle.download_link)
             raise SubtisError from None
 
+        self._parse_download(r, subtitle)
+
+    async def download_subtitle_async(self, subtitle: SubtisSubtitle) -> None:
+        """Download the content of the subtitle, for the asyncio API."""
+        if self.async_session is None:
+            raise NotInitializedProviderError
+
+        if not subtitle.download_link:
+            return
+
+        logger.info('Downloading subtitle %s', subtitle.download_link)
+
+        try:
+            r = await self.async_session.get(subtitle.download_link, timeout=self.timeout)
+            r.raise_for_status()
+        except RequestException:
+            logger.exception('Download error for %s', subtitle.download_link)
+            raise SubtisError from None
+
+        self._parse_download(r, subtitle)
+
+    @staticmethod
+    def _parse_download(r: Response, subtitle: SubtisSubtitle) -> None:
+        """Set the content of the subtitle from the response of the download."""
         if not r.content:
             logger.warning('Empty subtitle content from %s', subtitle.download_link)
             return
@@ -9,11 +9,11 @@ from typing import TYPE_CHECKING, Any, ClassVar, cast
 
 from babelfish import Language, language_converters  # type: ignore[import-untyped]
 from bs4 import Tag
-from requests import Session
 
 from subliminal import __short_version__
 from subliminal.cache import SHOW_EXPIRATION_TIME, region
 from subliminal.exceptions import NotInitializedProviderError, ProviderError
+from subliminal.http import create_session
 from subliminal.matches import guess_matches
 from subliminal.subtitle import Subtitle
 from subliminal.utils import safely_guessit
@@ -24,7 +24,7 @@ from . import ParserBeautifulSoup, Provider
 if TYPE_CHECKING:
     from collections.abc import Set
 
-    from requests import Response
+    from requests import Response, Session
 
     from subliminal.video import Video
 
@@ -136,7 +136,7 @@ class SubtitulamosProvider(Provider):
 
     def initialize(self) -> None:
         """Initialize the provider."""
-        self.session = Session()
+        self.session = create_session(self.get_rate_limiter(), cached=True)
         self.session.headers['User-Agent'] = f'Subliminal/{__short_version__}'
 
     def terminate(self) -> None:
@@ -332,7 +332,7 @@ class SubtitulamosProvider(Provider):
             return
 
         logger.info('Downloading subtitle %s', subtitle.download_link)
-        r = self.session.get(subtitle.download_link, headers={'Referer': subtitle.page_link}, timeout=10)
+        r = self.session.get(subtitle.download_link, headers={'Referer': subtitle.page_link}, timeout=self.timeout)
         r.raise_for_status()
 
         subtitle.set_content(r.content)
@@ -10,11 +10,12 @@ from typing import TYPE_CHECKING, ClassVar
 from zipfile import ZipFile
 
 from babelfish import Language, language_converters  # type: ignore[import-untyped]
-from requests import Session
 
 from subliminal.cache import EPISODE_EXPIRATION_TIME, SHOW_EXPIRATION_TIME, region
 from subliminal.exceptions import NotInitializedProviderError, ProviderError
+from subliminal.http import create_session
 from subliminal.matches import guess_matches
+from subliminal.singleflight import single_flight
 from subliminal.subtitle import Subtitle
 from subliminal.utils import safely_guessit, sanitize
 from subliminal.video import Episode, Video
@@ -22,7 +23,9 @@ from subliminal.video import Episode, Video
 from . import ParserBeautifulSoup, Provider
 
 if TYPE_CHECKING:
-    from collections.abc import Set
+    from collections.abc import Sequence, Set
+
+    from requests import Session
 
 logger = logging.getLogger(__name__)
 
@@ -114,14 +117,16 @@ class TVsubtitlesProvider(Provider):
     server_url: ClassVar[str] = 'https://www.tvsubtitles.net'
     subtitle_class: ClassVar = TVsubtitlesSubtitle
 
+    timeout: int
     session: Session | None
 
-    def __init__(self) -> None:
+    def __init__(self, *, timeout: int = 10) -> None:
+        self.timeout = timeout
         self.session = None
 
     def initialize(self) -> None:
         """Initialize the provider."""
-        self.session = Session()
+        self.session = create_session(self.get_rate_limiter(), cached=True)
         self.session.headers['User-Agent'] = self.user_agent
         self.session.headers['Referer'] = f'{self.server_url}/'
         self.session.headers['X-Requested-With'] = 'XMLHttpRequest'
@@ -132,6 +137,7 @@ class TVsubtitlesProvider(Provider):
             raise NotInitializedProviderError
         self.session.close()
 
+    @single_flight
     @region.cache_on_arguments(expiration_time=SHOW_EXPIRATION_TIME)
     def search_show_id(self, series: str, year: int | None = None) -> int | None:
         """Search the show id from the `series` and `year`.
@@ -147,7 +153,7 @@ class TVsubtitlesProvider(Provider):
             raise NotInitializedProviderError
         # make the search
         logger.info('Searching show id for %r', series)
-        r = self.session.post(self.server_url + '/search.php', data={'qs': series}, timeout=10)
+        r = self.session.post(self.server_url + '/search.php', data={'qs': series}, timeout=self.timeout)
         r.raise_for_status()
 
         # get the series out of the suggestions
@@ -171,6 +177,7 @@ class TVsubtitlesProvider(Provider):
 
         return show_id
 
+    @single_flight
     @region.cache_on_arguments(expiration_time=EPISODE_EXPIRATION_TIME)
     def get_episode_ids(self, show_id: int, season: int) -> dict[int, int]:
         """Get episode ids from the show id and the season.
@@ -185,7 +192,7 @@ class TVsubtitlesProvider(Provider):
             raise NotInitializedProviderError
         # get the page of the season of the show
         logger.info('Getting the page of show id %d, season %d', show_id, season)
-        r = self.session.get(self.server_url + f'/tvshow-{show_id:d}-{season:d}.html', timeout=10)
+        r = self.session.get(self.server_url + f'/tvshow-{show_id:d}-{season:d}.html', timeout=self.timeout)
         soup = ParserBeautifulSoup(r.content, ['lxml', 'html.parser'])
 
         # loop over episode rows
@@ -228,7 +235,7 @@ class TVsubtitlesProvider(Provider):
 
         # get the episode page
         logger.info('Getting the page for episode %d', episode_ids[episode])
-        r = self.session.get(self.server_url + f'/episode-{episode_ids[episode]:d}.html', timeout=10)
+        r = self.session.get(self.server_url + f'/episode-{episode_ids[episode]:d}.html', timeout=self.timeout)
         soup = ParserBeautifulSoup(r.content, ['lxml', 'html.parser'])
 
         # loop over subtitles rows
@@ -257,12 +264,8 @@ class TVsubtitlesProvider(Provider):
 
         return subtitles
 
-    def list_subtitles(self, video: Video, languages: Set[Language]) -> list[TVsubtitlesSubtitle]:
-        """List all the subtitles for the video."""
-        if not isinstance(video, Episode):
-            return []
-
-        # lookup show_id
+    def _search_show_id_with_alternative_names(self, video: Episode) -> tuple[str | None, int | None]:
+        """Get the title and show id, using alternative series names also."""
         titles = [video.series, *video.alternative_series]
         title = None
         show_id = None
@@ -271,6 +274,16 @@ class TVsubtitlesProvider(Provider):
             if show_id is not None:
                 break
 
+        return title, show_id
+
+    def list_subtitles(self, video: Video, languages: Set[Language]) -> list[TVsubtitlesSubtitle]:
+        """List all the subtitles for the video."""
+        if not isinstance(video, Episode):
+            return []
+
+        # lookup show_id
+        title, show_id = self._search_show_id_with_alternative_names(video)
+
         # query for subtitles with the show_id
         if show_id is not None and title is not None and video.episode is not None:
             return [
@@ -282,6 +295,48 @@ class TVsubtitlesProvider(Provider):
         logger.error('No show id found for %r (%r)', video.series, {'year': video.year})
         return []
 
+    def list_subtitles_batch(
+        self,
+        videos: Sequence[Video],
+        languages: Set[Language],
+    ) -> list[list[TVsubtitlesSubtitle]]:
+        """List the subtitles for many videos, looking up the show id and the episode ids of a season only once.
+
+        The subtitles are listed on the page of each episode, so there is still a request per episode.
+
+        """
+        # nothing to batch
+        if len(videos) < 2:
+            return super().list_subtitles_batch(videos, languages)
+
+        show_ids: dict[tuple[str, int | None], tuple[str | None, int | None]] = {}
+        results: list[list[TVsubtitlesSubtitle]] = []
+        for video in videos:
+            if not isinstance(video, Episode):
+                results.append([])
+                continue
+
+            # lookup show_id once per series
+            key = (video.series, video.year)
+            if key not in show_ids:
+                show_ids[key] = self._search_show_id_with_alternative_names(video)
+            title, show_id = show_ids[key]
+
+            # query for subtitles with the show_id
+            if show_id is None or title is None or video.episode is None:
+                logger.error('No show id found for %r (%r)', video.series, {'year': video.year})
+                results.append([])
+                continue
+            results.append(
+                [
+                    s
+                    for s in self.query(show_id, title, video.season, video.episode, video.year)
+                    if s.language in languages and s.episode == video.episode
+                ]
+            )
+
+        return results
+
     def download_subtitle(self, subtitle: TVsubtitlesSubtitle) -> None:
         """Download the content of the subtitle."""
         if not self.session:
@@ -289,7 +344,7 @@ class TVsubtitlesProvider(Provider):
         # download as a zip
         logger.info('Downloading subtitle %r', subtitle)
         url = self.server_url + f'/download-{subtitle.subtitle_id}.html'
-        r = self.session.get(url, timeout=10)
+        r = self.session.get(url, timeout=self.timeout)
         r.raise_for_status()
 
         # Not direct download
@@ -304,7 +359,7 @@ class TVsubtitlesProvider(Provider):
                 raise ValueError(msg)
 
             direct_url = f'{self.server_url}/{filepath}'
-            r = self.session.get(direct_url, timeout=10)
+            r = self.session.get(direct_url, timeout=self.timeout)
             r.raise_for_status()
 
         # open the zip
@@ -0,0 +1,469 @@
+"""Rate limiting of the requests sent to the providers.
+
+Providers declare their limits with :attr:`~subliminal.providers.Provider.rate_limit`: requests per second,
+burst and concurrent connections. All the instances of a provider share the same :class:`RateLimiter`,
+see :meth:`~subliminal.providers.Provider.get_rate_limiter`, that spaces the requests with a token bucket.
+
+A '429 Too Many Requests' or '503 Service Unavailable' response pauses the limiter for the duration of the
+``Retry-After`` header, or with a jittered exponential backoff, and the request is retried. The current
+wait state is exposed with :attr:`RateLimiter.wait_time`, so the callers can schedule other work.
+
+The limiters can also keep a quota, like the number of remaining downloads, and share their state between
+processes with :func:`configure_shared_rate_limiters`.
+
+The requests of a :class:`requests.Session` are rate limited by mounting a :class:`RateLimitAdapter`,
+and the requests of a :class:`~subliminal.http.AsyncSession` with its `rate_limiter` argument.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import email.utils
+import logging
+import os
+import random
+import sqlite3
+import threading
+import time
+from contextlib import closing, contextmanager
+from typing import TYPE_CHECKING, Any
+
+from requests import adapters
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from requests import PreparedRequest, Response, Session
+
+logger = logging.getLogger(__name__)
+
+#: Status codes of the responses asking to slow down
+RETRY_STATUS_CODES = frozenset({429, 503})
+
+#: Base delay of the exponential backoff, in seconds
+BACKOFF_BASE = 1.0
+
+#: Maximum delay of the exponential backoff and of ``Retry-After``, in seconds
+BACKOFF_MAX = 60.0
+
+#: Duration of a quota without known reset time, in seconds
+QUOTA_EXPIRATION_TIME = 24 * 3600
+
+#: Maximum time waiting for the lock of a shared database, in seconds
+SHARED_LOCK_TIMEOUT = 30.0
+
+
+class RateLimit:
+    """Limits of the requests to a provider.
+
+    :param float rate: maximum number of requests per second, on average. If `None`, the rate is not limited.
+    :param int burst: maximum number of requests sent at once, above the average rate.
+    :param int max_concurrent: maximum number of requests in flight at the same time, if limited.
+    :param int max_retries: maximum number of retries of a request after a '429' or '503' response.
+
+    """
+
+    __slots__ = ('burst', 'max_concurrent', 'max_retries', 'rate')
+
+    #: Maximum number of requests per second
+    rate: float | None
+
+    #: Maximum number of requests sent at once
+    burst: int
+
+    #: Maximum number of requests in flight
+    max_concurrent: int | None
+
+    #: Maximum number of retries after a '429' or '503' response
+    max_retries: int
+
+    def __init__(
+        self,
+        rate: float | None = None,
+        *,
+        burst: int = 1,
+        max_concurrent: int | None = None,
+        max_retries: int = 3,
+    ) -> None:
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.max_concurrent = max_concurrent
+        self.max_retries = max_retries
+
+    def __repr__(self) -> str:
+        return (
+            f'<{self.__class__.__name__} rate={self.rate!r}, burst={self.burst!r}, '
+            f'max_concurrent={self.max_concurrent!r}>'
+        )
+
+
+def parse_retry_after(value: str | None, now: float | None = None) -> float | None:
+    """Parse the value of a ``Retry-After`` header.
+
+    :param str value: the header value, as a number of seconds or as an HTTP date.
+    :param float now: the current timestamp, if not the current time.
+    :return: the delay in seconds, capped to :data:`BACKOFF_MAX`, or None if the value is invalid.
+    :rtype: float | None
+
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        delay = float(value)
+    except ValueError:
+        try:
+            date = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            logger.debug('Invalid Retry-After header %r', value)
+            return None
+        delay = date.timestamp() - (time.time() if now is None else now)
+    return min(max(0.0, delay), BACKOFF_MAX)
+
+
+class _State:
+    """State of a :class:`RateLimiter`."""
+
+    __slots__ = ('failures', 'paused_until', 'quota', 'quota_reset', 'tokens', 'updated')
+
+    def __init__(
+        self,
+        tokens: float,
+        updated: float,
+        paused_until: float = 0.0,
+        failures: int = 0,
+        quota: int | None = None,
+        quota_reset: float | None = None,
+    ) -> None:
+        self.tokens = tokens
+        self.updated = updated
+        self.paused_until = paused_until
+        self.failures = failures
+        self.quota = quota
+        self.quota_reset = quota_reset
+
+
+class RateLimiter:
+    """A thread-safe token bucket, with a backoff after the responses asking to slow down and a quota.
+
+    The state is kept in memory, see :class:`SharedRateLimiter` to share it between processes.
+
+    :param limit: the limits, if any.
+    :type limit: :class:`RateLimit`
+    :param str name: name used in the logs.
+
+    """
+
+    #: The limits
+    limit: RateLimit
+
+    #: Name used in the logs
+    name: str
+
+    def __init__(self, limit: RateLimit | None = None, name: str = '') -> None:
+        self.limit = limit if limit is not None else RateLimit()
+        self.name = name
+        self._lock = threading.Lock()
+        self._memory_state = _State(float(self.limit.burst), self._clock())
+        self._connections = (
+            threading.BoundedSemaphore(self.limit.max_concurrent) if self.limit.max_concurrent is not None else None
+        )
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} [{self.name}] {self.limit!r}>'
+
+    def _clock(self) -> float:
+        """Current time of the bucket, in seconds."""
+        return time.monotonic()
+
+    @contextmanager
+    def _state(self) -> Iterator[_State]:
+        """Get the state, for reading or modifying it atomically."""
+        with self._lock:
+            yield self._memory_state
+
+    def _refill(self, state: _State, now: float) -> None:
+        if self.limit.rate is not None:
+            state.tokens = min(float(self.limit.burst), state.tokens + max(0.0, now - state.updated) * self.limit.rate)
+        state.updated = now
+
+    def _delay(self, state: _State, now: float) -> float:
+        token_delay = 0.0
+        if self.limit.rate is not None and state.tokens < 1:
+            token_delay = (1 - state.tokens) / self.limit.rate
+        return max(state.paused_until - now, token_delay)
+
+    @property
+    def wait_time(self) -> float:
+        """Time to wait before the next request can be sent, in seconds."""
+        with self._state() as state:
+            now = self._clock()
+            self._refill(state, now)
+            return self._delay(state, now)
+
+    @property
+    def failures(self) -> int:
+        """Number of consecutive responses asking to slow down."""
+        with self._state() as state:
+            return state.failures
+
+    def reserve(self) -> float:
+        """Reserve the next request slot.
+
+        :return: the time to wait before sending the request, in seconds.
+        :rtype: float
+
+        """
+        with self._state() as state:
+            now = self._clock()
+            self._refill(state, now)
+            delay = self._delay(state, now)
+            # take the token now, it is available after the delay
+            state.tokens -= 1
+            return delay
+
+    def acquire(self) -> None:
+        """Wait for the next request slot and a free connection, blocking the thread."""
+        if self._connections is not None:
+            self._connections.acquire()
+        delay = self.reserve()
+        if delay > 0:
+            logger.debug('Rate limited [%s]: waiting %.2fs', self.name, delay)
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        """Wait for the next request slot, without blocking the event loop.
+
+        The concurrent connections are not limited, the :class:`~subliminal.core.AsyncioProviderPool` limits the
+        concurrent calls to the provider instead.
+
+        """
+        delay = self.reserve()
+        if delay > 0:
+            logger.debug('Rate limited [%s]: waiting %.2fs', self.name, delay)
+            await asyncio.sleep(delay)
+
+    def release(self) -> None:
+        """Release the connection taken by :meth:`acquire`."""
+        if self._connections is not None:
+            self._connections.release()
+
+    def pause(self, delay: float) -> None:
+        """Do not send any request for `delay` seconds.
+
+        :param float delay: the delay, in seconds.
+
+        """
+        with self._state() as state:
+            state.paused_until = max(state.paused_until, self._clock() + delay)
+
+    def backoff(self, retry_after: float | None = None) -> float:
+        """Pause after a failed request, for `retry_after` seconds or with a jittered exponential backoff.
+
+        :param float retry_after: the delay requested by the server, if any.
+        :return: the pause, in seconds.
+        :rtype: float
+
+        """
+        with self._state() as state:
+            state.failures += 1
+            failures = state.failures
+        if retry_after is None:
+            # full jitter, so the clients paused at the same time do not retry at the same time
+            retry_after = random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2 ** (failures - 1)))  # noqa: S311
+        logger.info('Rate limited [%s]: pausing %.2fs after %d failure(s)', self.name, retry_after, failures)
+        self.pause(retry_after)
+        return retry_after
+
+    def update(self, status_code: int, retry_after: str | None = None) -> bool:
+        """Update the limiter with the status of a response.
+
+        :param int status_code: the status code of the response.
+        :param str retry_after: the ``Retry-After`` header of the response, if any.
+        :return: `True` if the request should be retried, after the pause.
+        :rtype: bool
+
+        """
+        if status_code in RETRY_STATUS_CODES:
+            self.backoff(parse_retry_after(retry_after))
+            return True
+        with self._state() as state:
+            state.failures = 0
+        return False
+
+    @property
+    def quota(self) -> int | None:
+        """Remaining quota, typically of downloads, or None if unknown or reset since it was set."""
+        with self._state() as state:
+            if state.quota is None or state.quota_reset is None or time.time() >= state.quota_reset:
+                return None
+            return state.quota
+
+    @property
+    def quota_exhausted(self) -> bool:
+        """Whether the :attr:`quota` is exhausted."""
+        quota = self.quota
+        return quota is not None and quota <= 0
+
+    def set_quota(self, remaining: int, reset_at: float | None = None) -> None:
+        """Set the remaining quota, as reported by the provider.
+
+        :param int remaining: the remaining quota.
+        :param float reset_at: the timestamp when the quota is reset, if known.
+            Otherwise, the quota is reset after :data:`QUOTA_EXPIRATION_TIME`.
+
+        """
+        with self._state() as state:
+            state.quota = remaining
+            state.quota_reset = reset_at if reset_at is not None else time.time() + QUOTA_EXPIRATION_TIME
+
+
+class SharedRateLimiter(RateLimiter):
+    """A :class:`RateLimiter` with the state shared between processes, in a SQLite database.
+
+    The state is read and written in an exclusive transaction, so all the processes using the same database
+    collectively respect the limits and see the same quota. The concurrent connections are limited per process.
+
+    :param limit: the limits, if any.
+    :type limit: :class:`RateLimit`
+    :param str name: name of the limiter in the database.
+    :param str path: path of the SQLite database, created if needed.
+
+    """
+
+    #: Path of the SQLite database
+    path: str
+
+    def __init__(self, limit: RateLimit | None = None, name: str = '', *, path: str | os.PathLike[str]) -> None:
+        self.path = os.fspath(path)
+        super().__init__(limit, name)
+        with self._connect() as connection:
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS rate_limiters (name TEXT PRIMARY KEY, tokens REAL, updated REAL, '
+                'paused_until REAL, failures INTEGER, quota INTEGER, quota_reset REAL)'
+            )
+
+    def _connect(self) -> closing[sqlite3.Connection]:
+        return closing(sqlite3.connect(self.path, timeout=SHARED_LOCK_TIMEOUT, isolation_level=None))
+
+    def _clock(self) -> float:
+        # the monotonic clock is not shared between processes
+        return time.time()
+
+    @contextmanager
+    def _state(self) -> Iterator[_State]:
+        with self._lock, self._connect() as connection:
+            # lock the database until the state is written
+            connection.execute('BEGIN IMMEDIATE')
+            try:
+                row = connection.execute(
+                    'SELECT tokens, updated, paused_until, failures, quota, quota_reset FROM rate_limiters '
+                    'WHERE name = ?',
+                    (self.name,),
+                ).fetchone()
+                state = _State(*row) if row is not None else _State(float(self.limit.burst), self._clock())
+                yield state
+                connection.execute(
+                    'INSERT OR REPLACE INTO rate_limiters VALUES (?, ?, ?, ?, ?, ?, ?)',
+                    (
+                        self.name,
+                        state.tokens,
+                        state.updated,
+                        state.paused_until,
+                        state.failures,
+                        state.quota,
+                        state.quota_reset,
+                    ),
+                )
+            except BaseException:
+                connection.execute('ROLLBACK')
+                raise
+            connection.execute('COMMIT')
+
+
+_rate_limiters: dict[str, RateLimiter] = {}
+_rate_limiters_lock = threading.Lock()
+_shared_path: str | None = None
+
+
+def configure_shared_rate_limiters(path: str | os.PathLike[str] | None) -> None:
+    """Share the state of the rate limiters between processes, in the SQLite database at `path`.
+
+    The limiters returned by :func:`get_rate_limiter` are then :class:`SharedRateLimiter`.
+
+    :param path: path of the SQLite database, or None to keep the state in memory.
+
+    """
+    global _shared_path
+    with _rate_limiters_lock:
+        _shared_path = os.fspath(path) if path is not None else None
+        _rate_limiters.clear()
+
+
+def get_rate_limiter(name: str, limit: RateLimit | None = None) -> RateLimiter:
+    """Get the rate limiter shared by all the clients of `name`, creating it with `limit` if needed.
+
+    :param str name: name of the limiter, typically the provider name.
+    :param limit: the limits, used if the limiter is created.
+    :type limit: :class:`RateLimit`
+    :return: the rate limiter, shared between processes if :func:`configure_shared_rate_limiters` was called.
+    :rtype: :class:`RateLimiter`
+
+    """
+    with _rate_limiters_lock:
+        if name not in _rate_limiters:
+            if _shared_path is not None:
+                _rate_limiters[name] = SharedRateLimiter(limit, name=name, path=_shared_path)
+            else:
+                _rate_limiters[name] = RateLimiter(limit, name=name)
+        return _rate_limiters[name]
+
+
+class RateLimitAdapter(adapters.HTTPAdapter):
+    """:class:`~requests.adapters.HTTPAdapter` sending the requests through a :class:`RateLimiter`.
+
+    The requests with a '429' or '503' response are retried, up to :attr:`RateLimit.max_retries` times, then
+    the last response is returned.
+
+    :param rate_limiter: the rate limiter, if None the requests are not limited.
+    :type rate_limiter: :class:`RateLimiter`
+
+    """
+
+    #: The rate limiter
+    rate_limiter: RateLimiter | None
+
+    def __init__(self, rate_limiter: RateLimiter | None = None, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.rate_limiter = rate_limiter
+
+    def send(self, request: PreparedRequest, *args: Any, **kwargs: Any) -> Response:
+        """Send the request, when the rate limiter allows it."""
+        if self.rate_limiter is None:
+            return super().send(request, *args, **kwargs)
+
+        retries = self.rate_limiter.limit.max_retries
+        while True:
+            self.rate_limiter.acquire()
+            try:
+                response = super().send(request, *args, **kwargs)
+            finally:
+                self.rate_limiter.release()
+            if not self.rate_limiter.update(response.status_code, response.headers.get('Retry-After')) or retries <= 0:
+                return response
+            retries -= 1
+            response.close()
+
+
+def mount_rate_limiter(session: Session, rate_limiter: RateLimiter) -> None:
+    """Rate limit the HTTP and HTTPS requests of a session, with a :class:`RateLimitAdapter`.
+
+    :param session: the session.
+    :type session: :class:`requests.Session`
+    :param rate_limiter: the rate limiter.
+    :type rate_limiter: :class:`RateLimiter`
+
+    """
+    adapter = RateLimitAdapter(rate_limiter)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
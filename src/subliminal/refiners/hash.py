@@ -3,12 +3,10 @@
 from __future__ import annotations
 
 import logging
-import os
-import struct
-from functools import cache
 from typing import TYPE_CHECKING, Any, cast
 
 from subliminal.extensions import get_default_providers, provider_manager
+from subliminal.hashers import compute_cached_hashes
 
 if TYPE_CHECKING:
     from collections.abc import Callable, Sequence, Set
@@ -24,44 +22,21 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
-@cache
 def hash_opensubtitles(video_name: str) -> str | None:
     """Compute a hash using OpenSubtitles' algorithm.
 
-    The result is cached so it can be reused by several providers without cost.
+    The result is cached, keyed by the identity of the file, see :func:`~subliminal.hashers.compute_cached_hashes`.
 
     :param str video_name: filename of the video.
     :return: the hash or None if it failed.
     :rtype: str | None
 
     """
-    video_name = os.fspath(video_name)
-    bytesize = struct.calcsize(b'<q')
-    with open(video_name, 'rb') as f:
-        filesize = os.path.getsize(video_name)
-        filehash = filesize
-        if filesize < 65536 * 2:
-            return None
-        for _ in range(65536 // bytesize):
-            filebuffer = f.read(bytesize)
-            (l_value,) = struct.unpack(b'<q', filebuffer)
-            filehash += l_value
-            filehash &= 0xFFFFFFFFFFFFFFFF  # to remain as 64bit number
-        f.seek(max(0, filesize - 65536), 0)
-        for _ in range(65536 // bytesize):
-            filebuffer = f.read(bytesize)
-            (l_value,) = struct.unpack(b'<q', filebuffer)
-            filehash += l_value
-            filehash &= 0xFFFFFFFFFFFFFFFF
-    return f'{filehash:016x}'
-
-
-hash_functions: dict[str, HashFunc] = {
-    'opensubtitles': hash_opensubtitles,
-    'opensubtitlesvip': hash_opensubtitles,
-    'opensubtitlescom': hash_opensubtitles,
-    'opensubtitlescomvip': hash_opensubtitles,
-}
+    return compute_cached_hashes(video_name, ['opensubtitles']).get('opensubtitles')
+
+
+#: Hash functions for the providers that do not declare a :attr:`~subliminal.providers.Provider.hasher`
+hash_functions: dict[str, HashFunc] = {}
 
 
 def refine(
@@ -73,6 +48,9 @@ def refine(
 ) -> Video:
     """Refine a video computing required hashes for the given providers.
 
+    The hashes declared by the providers with :attr:`~subliminal.providers.Provider.hasher` are computed
+    together with :func:`~subliminal.hashers.compute_cached_hashes`, reading the video file at most once.
+
     The following :class:`~subliminal.video.Video` attribute can be found:
 
       * :attr:`~subliminal.video.Video.hashes`
@@ -89,6 +67,7 @@ def refine(
     providers = providers if providers is not None else get_default_providers()
 
     logger.debug('Computing hashes for %r', video.name)
+    provider_hashers: dict[str, str] = {}
     for name in providers:
         provider = cast('Provider', provider_manager[name].plugin)
         if not provider.check_types(video):
@@ -97,6 +76,11 @@ def refine(
         if languages is not None and not provider.check_languages(languages):
             continue
 
+        # Declared hasher, computed below
+        if provider.hasher is not None:
+            provider_hashers[name] = provider.hasher
+            continue
+
         # Try provider static method
         h = provider.hash_video(video.name)
 
@@ -108,5 +92,15 @@ def refine(
         if h is not None:
             video.hashes[name] = h
 
+    if provider_hashers:
+        try:
+            hashes = compute_cached_hashes(video.name, provider_hashers.values())
+        except OSError:
+            logger.warning('Cannot read %r: hashes not computed', video.name)
+            hashes = {}
+        for name, hasher in provider_hashers.items():
+            if hasher in hashes:
+                video.hashes[name] = hashes[hasher]
+
     logger.debug('Computed hashes %r', video.hashes)
     return video
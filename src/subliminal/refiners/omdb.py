@@ -6,16 +6,17 @@ import logging
 import operator
 from typing import TYPE_CHECKING, Any, ClassVar, cast
 
-import requests
-
 from subliminal import __short_version__
 from subliminal.cache import REFINER_EXPIRATION_TIME, region
+from subliminal.http import create_session
 from subliminal.utils import decorate_imdb_id, sanitize_id
 from subliminal.video import Episode, Movie, Video
 
 if TYPE_CHECKING:
     from collections.abc import Mapping
 
+    import requests
+
 logger = logging.getLogger(__name__)
 
 #: OMDB subliminal API key
@@ -52,7 +53,7 @@ class OMDBClient:
         self.timeout = timeout
 
         #: Session for the requests
-        self.session = session if session is not None else requests.Session()
+        self.session = session if session is not None else create_session()
         self.session.headers['User-Agent'] = self.user_agent
         self.session.headers.update(headers or {})
         self.session.params['r'] = 'json'  # type: ignore[index]
@@ -4,15 +4,18 @@ from __future__ import annotations
 
 import logging
 import re
-from typing import Any, ClassVar, cast
-
-import requests
+from typing import TYPE_CHECKING, Any, ClassVar, cast
 
 from subliminal import __short_version__
 from subliminal.cache import REFINER_EXPIRATION_TIME, region
+from subliminal.http import create_session
+from subliminal.singleflight import single_flight
 from subliminal.utils import decorate_imdb_id, sanitize, sanitize_id
 from subliminal.video import Episode, Movie, Video
 
+if TYPE_CHECKING:
+    import requests
+
 logger = logging.getLogger(__name__)
 
 series_re = re.compile(r'^(?P<series>.*?)(?: \((?:(?P<year>\d{4})|(?P<country>[A-Z]{2}))\))?$')
@@ -67,7 +70,7 @@ class TMDBClient:
         self.timeout = timeout
 
         #: Session for the requests
-        self.session = session if session is not None else requests.Session()
+        self.session = session if session is not None else create_session()
         self.session.headers['User-Agent'] = self.user_agent
         self.session.headers.update(headers or {})
         self.session.headers['Content-Type'] = 'application/json'
@@ -75,6 +78,7 @@ class TMDBClient:
         if apikey is not None:
             self.session.params['api_key'] = self.apikey  # type: ignore[index]
 
+    @single_flight
     @region.cache_on_arguments(expiration_time=REFINER_EXPIRATION_TIME)
     def search(
         self,
@@ -98,6 +102,7 @@ class TMDBClient:
         r.raise_for_status()
         return cast('list', r.json().get('results'))
 
+    @single_flight
     @region.cache_on_arguments(expiration_time=REFINER_EXPIRATION_TIME)
     def get_id(
         self,
@@ -143,6 +148,7 @@ class TMDBClient:
         logger.warning('No match for %r from the %d results', title_year, len(results))
         return None
 
+    @single_flight
     @region.cache_on_arguments(expiration_time=REFINER_EXPIRATION_TIME)
     def query(
         self,
@@ -9,11 +9,12 @@ from functools import wraps
 from typing import TYPE_CHECKING, Any, ClassVar, cast
 
 import guessit  # type: ignore[import-untyped]
-import requests
 from babelfish import Country  # type: ignore[import-untyped]
 
 from subliminal import __short_version__
 from subliminal.cache import REFINER_EXPIRATION_TIME, region
+from subliminal.http import create_session
+from subliminal.singleflight import single_flight
 from subliminal.utils import decorate_imdb_id, sanitize, sanitize_id
 from subliminal.video import Episode, Video
 
@@ -21,6 +22,8 @@ if TYPE_CHECKING:
     from collections.abc import Callable
     from typing import TypeVar
 
+    import requests
+
     C = TypeVar('C', bound=Callable)
 
 
@@ -106,7 +109,7 @@ class TVDBClient:
         self.timeout = timeout
 
         #: Session for the requests
-        self.session = session if session is not None else requests.Session()
+        self.session = session if session is not None else create_session()
         self.session.headers['User-Agent'] = self.user_agent
         self.session.headers.update(headers or {})
         self.session.headers['Content-Type'] = 'application/json'
@@ -146,6 +149,7 @@ class TVDBClient:
         # update token_date
         self.token_date = datetime.now(timezone.utc)
 
+    @single_flight
     @region.cache_on_arguments(expiration_time=REFINER_EXPIRATION_TIME)
     @requires_auth
     def search_series(self, name: str, imdb_id: str | None = None, zap2it_id: str | None = None) -> dict[str, Any]:
@@ -205,6 +209,7 @@ class TVDBClient:
 
         return cast('dict', r.json())
 
+    @single_flight
     @region.cache_on_arguments(expiration_time=REFINER_EXPIRATION_TIME)
     @requires_auth
     def get_series(self, series_id: int) -> dict[str, Any]:
@@ -260,6 +265,7 @@ class TVDBClient:
 
         return cast('dict', r.json())
 
+    @single_flight
     @region.cache_on_arguments(expiration_time=REFINER_EXPIRATION_TIME)
     @requires_auth
     def get_series_episode(self, series_id: int, season: int, episode: int) -> dict[str, Any]:
@@ -0,0 +1,252 @@
+"""Persistent index of scanned videos, to avoid guessing unchanged files again."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+from typing import TYPE_CHECKING, Any
+
+from .utils import FileInfo, safely_guessit, safely_guessit_batch
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from types import TracebackType
+    from typing import Self
+
+logger = logging.getLogger(__name__)
+
+#: Number of writes before committing to the database
+COMMIT_INTERVAL = 100
+
+
+class ScanIndex:
+    """An on-disk index of the guesses made for video files, backed by SQLite.
+
+    An entry is keyed by the path guessed for the video file, as passed to :func:`~subliminal.core.scan_video`,
+    and is only valid as long as the size, modification time and inode of the file did not change, and the same
+    replacement `name` is used. A relative and an absolute path to the same file are guessed and stored separately,
+    as guessit can find different information in them.
+
+    Many videos can be guessed in parallel processes with :meth:`guess_batch`, and then retrieved with :meth:`guess`.
+    It supports the `with` statement to :meth:`close` the index on exit.
+
+    :param str filename: path of the SQLite database, use ``':memory:'`` for an in-memory index.
+
+    """
+
+    #: Path of the SQLite database
+    filename: str
+
+    #: Number of lookups that found a valid entry
+    hits: int
+
+    #: Number of lookups that required a new guess
+    misses: int
+
+    def __init__(self, filename: str | os.PathLike[str]) -> None:
+        self.filename = os.fspath(filename)
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._prefetched: dict[str, dict[str, Any]] = {}
+        self._connection = sqlite3.connect(self.filename, check_same_thread=False)
+        self._connection.execute(
+            'CREATE TABLE IF NOT EXISTS videos ('
+            'path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, inode INTEGER, name TEXT, guess TEXT)'
+        )
+        self._connection.commit()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._connection.execute('SELECT COUNT(*) FROM videos').fetchone()
+        return int(count)
+
+    @staticmethod
+    def _key(file_info: FileInfo, path: str | os.PathLike[str] | None) -> str:
+        return os.fspath(path) if path is not None else file_info.path
+
+    def get(
+        self,
+        file_info: FileInfo,
+        *,
+        name: str | None = None,
+        path: str | os.PathLike[str] | None = None,
+    ) -> dict[str, Any] | None:
+        """Get the indexed guess for a file, if the file did not change.
+
+        :param file_info: information about the video file.
+        :type file_info: :class:`~subliminal.utils.FileInfo`
+        :param str name: replacement name used with guessit instead of the path.
+        :param str path: path guessed for the file, if None the path of the `file_info`.
+        :return: the guess or None if the file is not indexed or has changed.
+        :rtype: dict | None
+
+        """
+        with self._lock:
+            row = self._connection.execute(
+                'SELECT size, mtime_ns, inode, name, guess FROM videos WHERE path = ?',
+                (self._key(file_info, path),),
+            ).fetchone()
+        if row is None:
+            return None
+        size, mtime_ns, inode, indexed_name, guess = row
+        if (size, mtime_ns, inode, indexed_name) != (file_info.size, file_info.mtime_ns, file_info.inode, name or ''):
+            return None
+        return json.loads(guess)  # type: ignore[no-any-return]
+
+    def set(
+        self,
+        file_info: FileInfo,
+        guess: dict[str, Any],
+        *,
+        name: str | None = None,
+        path: str | os.PathLike[str] | None = None,
+    ) -> None:
+        """Store the guess for a file.
+
+        :param file_info: information about the video file.
+        :type file_info: :class:`~subliminal.utils.FileInfo`
+        :param dict guess: the guess, as returned by :func:`~subliminal.utils.safely_guessit`.
+        :param str name: replacement name used with guessit instead of the path.
+        :param str path: path guessed for the file, if None the path of the `file_info`.
+
+        """
+        with self._lock:
+            self._connection.execute(
+                'INSERT OR REPLACE INTO videos (path, size, mtime_ns, inode, name, guess) VALUES (?, ?, ?, ?, ?, ?)',
+                (
+                    self._key(file_info, path),
+                    file_info.size,
+                    file_info.mtime_ns,
+                    file_info.inode,
+                    name or '',
+                    json.dumps(guess, default=str),
+                ),
+            )
+            self._pending += 1
+            if self._pending >= COMMIT_INTERVAL:
+                self._connection.commit()
+                self._pending = 0
+
+    def guess(
+        self,
+        file_info: FileInfo,
+        *,
+        name: str | None = None,
+        path: str | os.PathLike[str] | None = None,
+    ) -> dict[str, Any]:
+        """Get the guess for a file from the index, or guess it and store the result.
+
+        :param file_info: information about the video file.
+        :type file_info: :class:`~subliminal.utils.FileInfo`
+        :param str name: if defined, name to use with guessit instead of the path.
+        :param str path: path to guess, if None the path of the `file_info`.
+        :return: the guess.
+        :rtype: dict
+
+        """
+        key = self._key(file_info, path)
+        guess = self._prefetched.pop(key, None)
+        if guess is None:
+            guess = self.get(file_info, name=name, path=key)
+            if guess is not None:
+                logger.debug('Using indexed guess for %r', key)
+                self.hits += 1
+                return guess
+
+            logger.info('Scanning video %r', key)
+            guess = safely_guessit(name or key)
+
+        self.misses += 1
+        self.set(file_info, guess, name=name, path=key)
+        return guess
+
+    def guess_batch(
+        self,
+        file_infos: Sequence[FileInfo],
+        *,
+        name: str | None = None,
+        paths: Sequence[str] | None = None,
+        workers: int | None = None,
+    ) -> None:
+        """Guess the files that are not indexed yet, in parallel processes.
+
+        The guesses are kept until they are retrieved with :meth:`guess`, with the same `name` and path.
+
+        :param file_infos: information about the video files.
+        :type file_infos: Sequence[:class:`~subliminal.utils.FileInfo`]
+        :param str name: if defined, name to use with guessit instead of the paths.
+        :param paths: paths to guess, one for each file, if None the paths of the `file_infos`.
+        :type paths: Sequence[str]
+        :param int workers: number of worker processes, see :func:`~subliminal.utils.safely_guessit_batch`.
+
+        """
+        keys = list(paths) if paths is not None else [f.path for f in file_infos]
+        missing = [
+            (key, f) for key, f in zip(keys, file_infos, strict=True) if self.get(f, name=name, path=key) is None
+        ]
+        if not missing:
+            return
+
+        logger.info('Scanning %d videos with %r workers', len(missing), workers)
+        # with a replacement name, the guess is the same for all the files
+        names = [name] if name else [key for key, _ in missing]
+        guesses = safely_guessit_batch(names, workers=workers)
+        for i, (key, _) in enumerate(missing):
+            self._prefetched[key] = guesses[0 if name else i]
+
+    def prune(self) -> int:
+        """Remove the entries of files that were deleted or modified.
+
+        The relative paths are resolved from the current directory.
+
+        :return: the number of removed entries.
+        :rtype: int
+
+        """
+        with self._lock:
+            rows = self._connection.execute('SELECT path, size, mtime_ns, inode FROM videos').fetchall()
+
+        stale = []
+        for path, size, mtime_ns, inode in rows:
+            try:
+                file_info = FileInfo.from_path(path)
+            except OSError:
+                stale.append((path,))
+                continue
+            if (file_info.size, file_info.mtime_ns, file_info.inode) != (size, mtime_ns, inode):
+                stale.append((path,))
+
+        with self._lock:
+            self._connection.executemany('DELETE FROM videos WHERE path = ?', stale)
+            self._connection.commit()
+        logger.info('Pruned %d entries from the scan index', len(stale))
+        return len(stale)
+
+    def clear(self) -> None:
+        """Remove all the entries, the index is rebuilt on the next scans."""
+        with self._lock:
+            self._connection.execute('DELETE FROM videos')
+            self._connection.commit()
+            self._pending = 0
+
+    def close(self) -> None:
+        """Commit the pending entries and close the database."""
+        with self._lock:
+            self._connection.commit()
+            self._connection.close()
@@ -0,0 +1,152 @@
+"""Coalescing of the identical concurrent calls, so they share a single network round trip.
+
+With concurrent workers, the episodes of the same show often make the same call to a provider or a refiner at
+the same moment, like searching the show id. The first call runs, and the identical calls made while it is in
+flight wait for it and get a copy of its result, or its error. The calls made after it completes run again, the results
+are not kept: this is what the cache is for, see :mod:`subliminal.cache`.
+
+The calls are identical if they are made to the same function with the same arguments, once normalized with
+the signature of the function: the positional and keyword arguments, and the default values, give the same key.
+The methods are bound to their instance, so only the calls on the same instance are coalesced.
+
+.. code-block:: python
+
+    class MyProvider(Provider):
+        @single_flight
+        @region.cache_on_arguments(expiration_time=SHOW_EXPIRATION_TIME)
+        def search_show_id(self, series, year=None): ...
+
+"""
+
+from __future__ import annotations
+
+import copy
+import functools
+import inspect
+import logging
+import threading
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any, ParamSpec, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable
+
+logger = logging.getLogger(__name__)
+
+P = ParamSpec('P')
+R = TypeVar('R')
+
+
+class _Call:
+    """A call in flight, with its result or error once done."""
+
+    __slots__ = ('done', 'error', 'result')
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """A group of calls in flight, the identical concurrent calls run once and share the result.
+
+    The group is thread-safe. The asyncio API is not coalesced, a coroutine waiting for another thread would
+    block its event loop.
+
+    """
+
+    #: Number of calls that shared the result of an identical call in flight
+    coalesced: int
+
+    def __init__(self) -> None:
+        self.coalesced = 0
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Call] = {}
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} in_flight={len(self._calls)!r} coalesced={self.coalesced!r}>'
+
+    def do(self, key: Hashable, func: Callable[P, R], *args: P.args, **kwargs: P.kwargs) -> R:
+        """Call `func`, or wait for the identical call in flight with the same `key` and share its outcome.
+
+        The callers waiting for the call in flight get a deep copy of its result, so they do not share the
+        mutable objects of the result, like the :class:`~subliminal.subtitle.Subtitle` of a query.
+
+        :param key: key identifying the identical calls.
+        :param func: function to call.
+        :return: the result of the call.
+        :raises: the error of the call.
+
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+            else:
+                self.coalesced += 1
+
+        # wait for the call in flight
+        if not leader:
+            logger.debug('Waiting for the identical call in flight %r', key)
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            # a deep copy, so the callers do not share the objects of the result
+            return copy.deepcopy(call.result)  # type: ignore[no-any-return]
+
+        try:
+            call.result = func(*args, **kwargs)
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+        return call.result  # type: ignore[no-any-return]
+
+
+#: Default group of the calls in flight, used by :func:`single_flight`
+default_group = SingleFlight()
+
+
+def _freeze(value: Any) -> Any:
+    """Make the containers of a value hashable, for the key of a call."""
+    if isinstance(value, Mapping):
+        return frozenset((k, _freeze(v)) for k, v in value.items())
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(v) for v in value)
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def single_flight(func: Callable[P, R]) -> Callable[P, R]:
+    """Decorate a function so its identical concurrent calls share one call, in the :data:`default_group`.
+
+    The key of a call is the function with its arguments, normalized with the signature of the function.
+    The calls with arguments that cannot be hashed are not coalesced.
+
+    :param func: the function to decorate.
+    :return: the decorated function.
+
+    """
+    signature = inspect.signature(func)
+    name = f'{func.__module__}.{func.__qualname__}'
+
+    @functools.wraps(func)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        try:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = (name, _freeze(bound.arguments))
+            hash(key)
+        except TypeError:
+            return func(*args, **kwargs)
+
+        return default_group.do(key, func, *args, **kwargs)
+
+    return wrapper
@@ -8,7 +8,9 @@ import os
 import platform
 import re
 import socket
+import struct
 from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta, timezone
 from types import GeneratorType
 from typing import TYPE_CHECKING, Any, Generic, TypeVar, cast, overload
@@ -76,6 +78,45 @@ def safely_guessit(name: str | None, options: dict[str, Any] | None = None) -> d
     return result
 
 
+def _warm_up_guessit() -> None:
+    """Build the guessit rules once, when a worker process starts."""
+    safely_guessit('Subliminal.S01E01.720p.HDTV.x264-WARMUP.mkv')
+
+
+def _safely_guessit_dict(name: str) -> dict[str, Any]:
+    """Call :func:`safely_guessit` and return a plain dict, that can be sent back from a worker process."""
+    return dict(safely_guessit(name))
+
+
+def safely_guessit_batch(
+    names: Sequence[str],
+    *,
+    workers: int | None = None,
+    chunksize: int | None = None,
+) -> list[dict[str, Any]]:
+    """Call :func:`safely_guessit` on many names, in parallel processes.
+
+    Guessing is CPU-bound, so with more than one `workers` the names are guessed in a process pool,
+    submitted in chunks, with guessit initialized once per worker process.
+
+    :param names: the names to guess.
+    :type names: Sequence[str]
+    :param (int | None) workers: number of worker processes, guess in the current process if None or 1.
+    :param (int | None) chunksize: number of names sent to a worker at once, default to spread the names
+        in 4 chunks per worker.
+    :return: the guesses, in the same order as the names.
+    :rtype: list[dict]
+
+    """
+    if workers is None or workers <= 1 or len(names) <= 1:
+        return [safely_guessit(name) for name in names]
+
+    workers = min(workers, len(names))
+    chunksize = chunksize or max(1, len(names) // (workers * 4))
+    with ProcessPoolExecutor(workers, initializer=_warm_up_guessit) as executor:
+        return list(executor.map(_safely_guessit_dict, names, chunksize=chunksize))
+
+
 class none_passthrough(Generic[T, R]):
     """Decorator to pass-through None input values."""
 
@@ -264,7 +305,16 @@ def creation_date(filepath: os.PathLike | str) -> float:
     # Use creation time (although it may not be correct)
     if platform.system() == 'Windows':  # pragma: no cover
         return os.path.getctime(filepath)
-    stat = os.stat(filepath)
+    return creation_date_from_stat(os.stat(filepath))
+
+
+def creation_date_from_stat(stat: os.stat_result) -> float:
+    """Get the creation date from the result of a :func:`os.stat` call.
+
+    Same as :func:`creation_date`, without an additional system call.
+    """
+    if platform.system() == 'Windows':  # pragma: no cover
+        return stat.st_ctime
     try:
         return stat.st_birthtime  # type: ignore[no-any-return,attr-defined]
     except AttributeError:
@@ -273,6 +323,115 @@ def creation_date(filepath: os.PathLike | str) -> float:
         return stat.st_mtime
 
 
+class FileInfo:
+    """Information about a file, cached from a single :func:`os.stat` call.
+
+    It is created when walking directories with :func:`os.scandir` and carried along with the file path
+    so the size and age of a video do not require additional system calls.
+
+    :param str path: path of the file.
+    :param int size: size of the file in bytes.
+    :param float mtime: modification time of the file, as a timestamp.
+    :param float ctime: creation time of the file (see :func:`creation_date`), as a timestamp.
+    :param int mtime_ns: modification time of the file, in nanoseconds.
+    :param int inode: inode number of the file.
+    :param int device: device identifier of the file.
+    :param bool is_symlink: whether the path is a symbolic link.
+
+    """
+
+    __slots__ = ('ctime', 'device', 'inode', 'is_symlink', 'mtime', 'mtime_ns', 'path', 'size')
+
+    #: Path of the file
+    path: str
+
+    #: Size of the file in bytes
+    size: int
+
+    #: Modification time, as a timestamp
+    mtime: float
+
+    #: Creation time, as a timestamp
+    ctime: float
+
+    #: Modification time, in nanoseconds
+    mtime_ns: int
+
+    #: Inode number
+    inode: int
+
+    #: Device identifier
+    device: int
+
+    #: The path is a symbolic link
+    is_symlink: bool
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        size: int = 0,
+        mtime: float = 0.0,
+        ctime: float = 0.0,
+        mtime_ns: int = 0,
+        inode: int = 0,
+        device: int = 0,
+        is_symlink: bool = False,
+    ) -> None:
+        self.path = path
+        self.size = size
+        self.mtime = mtime
+        self.ctime = ctime
+        self.mtime_ns = mtime_ns
+        self.inode = inode
+        self.device = device
+        self.is_symlink = is_symlink
+
+    @classmethod
+    def from_stat(cls, path: str | os.PathLike, stat: os.stat_result, *, is_symlink: bool = False) -> FileInfo:
+        """Create a :class:`FileInfo` from the result of a :func:`os.stat` call."""
+        return cls(
+            os.fspath(path),
+            size=stat.st_size,
+            mtime=stat.st_mtime,
+            ctime=creation_date_from_stat(stat),
+            mtime_ns=stat.st_mtime_ns,
+            inode=stat.st_ino,
+            device=stat.st_dev,
+            is_symlink=is_symlink,
+        )
+
+    @classmethod
+    def from_entry(cls, entry: os.DirEntry[str]) -> FileInfo:
+        """Create a :class:`FileInfo` from a :func:`os.scandir` entry, using its cached information.
+
+        :raises: :class:`OSError` if the file cannot be accessed.
+        """
+        return cls.from_stat(entry.path, entry.stat(), is_symlink=entry.is_symlink())
+
+    @classmethod
+    def from_path(cls, path: str | os.PathLike) -> FileInfo:
+        """Create a :class:`FileInfo` from a path.
+
+        :raises: :class:`OSError` if the file cannot be accessed.
+        """
+        return cls.from_stat(path, os.stat(path), is_symlink=os.path.islink(path))
+
+    def get_age(self, *, reference_date: datetime | None = None, use_ctime: bool = False) -> timedelta:
+        """Get the age of the file, like :func:`get_age` but from the cached information."""
+        file_date = max(self.mtime, self.ctime) if use_ctime else self.mtime
+        reference_date = reference_date if reference_date is not None else datetime.now(timezone.utc)
+        return reference_date - datetime.fromtimestamp(file_date, timezone.utc)
+
+    @property
+    def identity(self) -> tuple[int, int, int, int]:
+        """Identity of the content of the file: device, inode, size and modification time in nanoseconds."""
+        return (self.device, self.inode, self.size, self.mtime_ns)
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} [{self.path!r}, size={self.size}]>'
+
+
 def get_age(
     filepath: os.PathLike | str,
     *,
@@ -407,6 +566,21 @@ def clip(value: float, minimum: float | None, maximum: float | None) -> float:
     return value
 
 
+def sum_uint64(data: bytes) -> int:
+    """Sum the little-endian 64-bit words of `data`, wrapping around like an unsigned 64-bit integer.
+
+    The words are unpacked with a single :func:`struct.unpack` call, this is the core
+    of the OpenSubtitles and BSPlayer hashes.
+
+    :param bytes data: the data, its length must be a multiple of 8.
+    :return: the sum modulo 2**64.
+    :rtype: int
+
+    """
+    words: tuple[int, ...] = struct.unpack(f'<{len(data) // 8}Q', data)
+    return sum(words) & 0xFFFFFFFFFFFFFFFF
+
+
 def trim_pattern(string: str, patterns: str | Sequence[str], *, sep: str = '') -> tuple[str, str]:
     """Trim a prefix or suffix from a string, with an optional separator.
 
@@ -16,6 +16,7 @@ if TYPE_CHECKING:
     from babelfish import Country, Language  # type: ignore[import-untyped]
 
     from subliminal.subtitle import Subtitle
+    from subliminal.utils import FileInfo
 
 logger = logging.getLogger(__name__)
 
@@ -121,6 +122,8 @@ class Video:
     :param hashes: hashes of the video file by provider names.
     :type hashes: dict[str, str]
     :param int size: size of the video file in bytes.
+    :param file_info: cached information about the video file, if it was collected from the filesystem.
+    :type file_info: :class:`~subliminal.utils.FileInfo`
     :param subtitles: existing subtitles.
     :type subtitles: set[:class:`~subliminal.subtitle.Subtitle`]
     :param int year: year of the video.
@@ -164,6 +167,9 @@ class Video:
     #: Size of the video file in bytes
     size: int | None
 
+    #: Cached information about the video file
+    file_info: FileInfo | None
+
     #: Title of the video
     title: str | None
 
@@ -199,6 +205,7 @@ class Video:
         duration: float | None = None,
         hashes: Mapping[str, str] | None = None,
         size: int | None = None,
+        file_info: FileInfo | None = None,
         use_ctime: bool = True,
         subtitles: Sequence[Subtitle] | None = None,
         title: str | None = None,
@@ -218,6 +225,7 @@ class Video:
         self.duration = duration
         self.hashes = dict(hashes) if hashes is not None else {}
         self.size = size
+        self.file_info = file_info
         self.use_ctime = use_ctime
         self.subtitles = list(subtitles) if subtitles is not None else []
         self.title = title
@@ -240,6 +248,8 @@ class Video:
     @property
     def age(self) -> timedelta:
         """Age of the video."""
+        if self.file_info is not None:
+            return self.file_info.get_age(use_ctime=self.use_ctime)
         return get_age(self.name, use_ctime=self.use_ctime)
 
     @property
@@ -1,12 +1,17 @@
 from __future__ import annotations
 
+import os
 from typing import TYPE_CHECKING
 
 import pytest
 
 from subliminal.cli.cli import subliminal as subliminal_cli
+from subliminal.http_cache import HTTPCache, get_http_cache
+from subliminal.ratelimit import SharedRateLimiter, configure_shared_rate_limiters, get_rate_limiter
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from tests.conftest import CliRunner
 
 
@@ -32,3 +37,56 @@ def test_cli_cache(cli_runner: CliRunner) -> None:
     result = cli_runner.run(subliminal_cli, ['cache', '--clear-subliminal'])
     assert result.exit_code == 0
     assert result.out == "Subliminal's cache cleared.\n"
+
+
+def test_cli_cache_scan_index(cli_runner: CliRunner, tmp_path: Path) -> None:
+    cache_dir = os.fspath(tmp_path / 'cache')
+    os.makedirs(cache_dir)
+
+    result = cli_runner.run(subliminal_cli, ['--cache-dir', cache_dir, 'cache', '--prune-scan-index'])
+    assert result.exit_code == 0
+    assert result.out == '0 videos pruned from the scan index.\n'
+
+    result = cli_runner.run(subliminal_cli, ['--cache-dir', cache_dir, 'cache', '--clear-scan-index'])
+    assert result.exit_code == 0
+    assert result.out == 'Scan index cleared.\n'
+
+
+def test_cli_shared_rate_limits(cli_runner: CliRunner, tmp_path: Path) -> None:
+    cache_dir = tmp_path / 'cache'
+
+    try:
+        result = cli_runner.run(subliminal_cli, ['--cache-dir', os.fspath(cache_dir), '--shared-rate-limits', 'cache'])
+        assert result.exit_code == 0
+        assert isinstance(get_rate_limiter('test'), SharedRateLimiter)
+        assert (cache_dir / 'subliminal-rate-limits.db').is_file()
+    finally:
+        configure_shared_rate_limiters(None)
+
+
+def test_cli_http_cache(cli_runner: CliRunner, tmp_path: Path) -> None:
+    cache_dir = tmp_path / 'cache'
+
+    # disabled by default
+    result = cli_runner.run(subliminal_cli, ['--cache-dir', os.fspath(cache_dir), 'cache', '--clear-http-cache'])
+    assert result.exit_code == 0
+    assert result.out == 'HTTP cache cleared.\n'
+    assert get_http_cache() is None
+    assert (cache_dir / 'subliminal-http-cache.db').is_file()
+
+    result = cli_runner.run(subliminal_cli, ['--cache-dir', os.fspath(cache_dir), '--http-cache-size', '100', 'cache'])
+    assert result.exit_code == 0
+    assert isinstance(get_http_cache(), HTTPCache)
+
+
+def test_cli_cache_negative_cache(cli_runner: CliRunner, tmp_path: Path) -> None:
+    cache_dir = os.fspath(tmp_path / 'cache')
+    os.makedirs(cache_dir)
+
+    result = cli_runner.run(subliminal_cli, ['--cache-dir', cache_dir, 'cache', '--prune-negative-cache'])
+    assert result.exit_code == 0
+    assert result.out == '0 searches pruned from the negative cache.\n'
+
+    result = cli_runner.run(subliminal_cli, ['--cache-dir', cache_dir, 'cache', '--clear-negative-cache'])
+    assert result.exit_code == 0
+    assert result.out == 'Negative cache cleared.\n'
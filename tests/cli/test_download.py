@@ -10,7 +10,10 @@ import pytest
 from tests.conftest import ensure
 
 from subliminal.cli import generate_default_config
+from subliminal.cli.cli import negative_cache_file, scan_index_file
 from subliminal.cli.cli import subliminal as subliminal_cli
+from subliminal.negative_cache import NegativeCache
+from subliminal.scan_index import ScanIndex
 
 if TYPE_CHECKING:
     from tests.conftest import CliRunner
@@ -34,6 +37,20 @@ def test_cli_download_wrong_language(cli_runner: CliRunner) -> None:
         assert result.exit_code > 0
 
 
+@pytest.mark.parametrize('stage_workers', ['unknown=2', 'list', 'list=0'])
+def test_cli_download_wrong_stage_workers(cli_runner: CliRunner, stage_workers: str) -> None:
+    video_name = 'Marvels.Agents.of.S.H.I.E.L.D.S02E06.720p.HDTV.x264-KILLERS.mkv'
+
+    with cli_runner.isolated_filesystem():
+        result = cli_runner.run(
+            subliminal_cli,
+            ['download', '-l', 'en', '-p', 'podnapisi', '--stage-workers', stage_workers, video_name],
+        )
+
+        assert result.exit_code > 0
+        assert 'is not a valid STAGE=N' in result.err
+
+
 def test_cli_download_guessing_error(cli_runner: CliRunner) -> None:
     video_name = '1x1.mkv'
 
@@ -136,11 +153,57 @@ def test_cli_download_no_provider(cli_runner: CliRunner) -> None:
         assert 'No provider was selected to download subtitles.' in result.out
 
 
-def test_cli_download(cli_runner: CliRunner) -> None:
+def test_cli_download_scan_index(cli_runner: CliRunner) -> None:
+    movie_name = os.path.join('Man of Steel (2013)', 'man.of.steel.2013.720p.bluray.x264-felony.mkv')
+    episode_name = 'Marvels.Agents.of.S.H.I.E.L.D.S02E06.720p.HDTV.x264-KILLERS.mkv'
+
+    with cli_runner.isolated_filesystem() as td:
+        ensure(movie_name)
+        ensure(episode_name)
+        cache_dir = os.path.join(td, 'cache')
+        args = ['--cache-dir', cache_dir, 'download', '-l', 'en', '-p', 'podnapisi', '-P', 'podnapisi', '--scan-index']
+
+        for _ in range(2):
+            result = cli_runner.run(subliminal_cli, [*args, '.'])
+            assert result.exit_code == 0
+            assert '2 videos collected' in result.out
+
+        with ScanIndex(os.path.join(cache_dir, scan_index_file)) as index:
+            assert len(index) == 2
+
+
+@pytest.mark.parametrize('option', ['--negative-cache', '--bypass-negative-cache'])
+def test_cli_download_negative_cache(cli_runner: CliRunner, option: str) -> None:
+    episode_name = 'Marvels.Agents.of.S.H.I.E.L.D.S02E06.720p.HDTV.x264-KILLERS.mkv'
+
+    with cli_runner.isolated_filesystem() as td:
+        ensure(episode_name)
+        cache_dir = os.path.join(td, 'cache')
+        args = ['--cache-dir', cache_dir, 'download', '-l', 'en', '-l', 'de', '-p', 'podnapisi', option, episode_name]
+
+        result = cli_runner.run(subliminal_cli, args)
+        assert result.exit_code == 0
+
+        # the search of the missing language is recorded
+        with NegativeCache(os.path.join(cache_dir, negative_cache_file)) as negative_cache:
+            assert len(negative_cache) == 1
+
+
+@pytest.mark.parametrize(
+    'options',
+    [
+        [],
+        ['--early-init'],
+        ['--early-termination'],
+        ['--time-budget', '60', '--adaptive-timeouts'],
+        ['--stage-workers', 'list=2', '--stage-workers', 'save=2', '--queue-size', '1'],
+    ],
+)
+def test_cli_download(cli_runner: CliRunner, options: list[str]) -> None:
     video_name = 'Marvels.Agents.of.S.H.I.E.L.D.S02E06.720p.HDTV.x264-KILLERS.mkv'
 
     with cli_runner.isolated_filesystem() as td:
-        result = cli_runner.run(subliminal_cli, ['download', '-l', 'en', '-p', 'podnapisi', video_name])
+        result = cli_runner.run(subliminal_cli, ['download', '-l', 'en', '-p', 'podnapisi', *options, video_name])
 
         assert result.exit_code == 0
         assert result.out.startswith('Collecting videos')
@@ -168,7 +231,8 @@ def test_cli_download(cli_runner: CliRunner) -> None:
     assert content.startswith(expected)
 
 
-def test_cli_download_directory(cli_runner: CliRunner) -> None:
+@pytest.mark.parametrize('options', [[], ['--walk-workers', '4']])
+def test_cli_download_directory(cli_runner: CliRunner, options: list[str]) -> None:
     movie_name = os.path.join('Man of Steel (2013)', 'man.of.steel.2013.720p.bluray.x264-felony.mkv')
     episode_name = 'Marvels.Agents.of.S.H.I.E.L.D.S02E06.720p.HDTV.x264-KILLERS.mkv'
 
@@ -176,7 +240,7 @@ def test_cli_download_directory(cli_runner: CliRunner) -> None:
         ensure(movie_name)
         ensure(episode_name)
 
-        result = cli_runner.run(subliminal_cli, ['download', '-l', 'en', '-p', 'podnapisi', '.'])
+        result = cli_runner.run(subliminal_cli, ['download', '-l', 'en', '-p', 'podnapisi', *options, '.'])
 
         assert result.exit_code == 0
         assert result.out.startswith('Collecting videos')
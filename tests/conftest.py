@@ -6,6 +6,7 @@ import os
 import shlex
 import subprocess
 import sys
+import threading
 from dataclasses import dataclass
 from io import BytesIO
 from pathlib import Path
@@ -16,10 +17,13 @@ from zipfile import ZipFile
 import pytest
 import requests
 from babelfish import Country, Language  # type: ignore[import-untyped]
+from urllib3 import connectionpool
 
 import subliminal
 from subliminal.cache import region
 from subliminal.extensions import RegistrableExtensionManager
+from subliminal.http import configure_connection_pools
+from subliminal.http_cache import configure_http_cache
 from subliminal.providers.mock import MockSubtitle, mock_subtitle_provider
 from subliminal.video import Episode, Movie
 
@@ -58,6 +62,34 @@ def _configure_region() -> None:
     region.configure = Mock()  # type: ignore[method-assign]
 
 
+@pytest.fixture(autouse=True, scope='session')
+def _serialize_new_connections() -> Generator[None, None, None]:
+    # vcrpy removes its patches of the connection classes while creating a connection, so the connections
+    # created concurrently by the asyncio providers could be real connections
+    lock = threading.Lock()
+
+    def serialized(new_conn: Callable[[Any], Any]) -> Callable[[Any], Any]:
+        @functools.wraps(new_conn)
+        def wrapper(self: Any) -> Any:
+            with lock:
+                return new_conn(self)
+
+        return wrapper
+
+    with pytest.MonkeyPatch.context() as mp:
+        for pool_class in (connectionpool.HTTPConnectionPool, connectionpool.HTTPSConnectionPool):
+            mp.setattr(pool_class, '_new_conn', serialized(pool_class._new_conn))
+        yield
+
+
+@pytest.fixture(autouse=True)
+def _reset_http() -> Generator[None, None, None]:
+    # the CLI configures the connection pools and the HTTP cache
+    yield
+    configure_connection_pools(None)
+    configure_http_cache(None)
+
+
 @pytest.fixture
 def movies() -> dict[str, Movie]:
     return {
@@ -590,6 +590,20 @@ def test_list_subtitles(episodes: dict[str, Episode]) -> None:
     assert {subtitle.language for subtitle in subtitles} == languages
 
 
+@pytest.mark.integration
+@vcr.use_cassette('test_list_subtitles')
+def test_list_subtitles_batch(episodes: dict[str, Episode]) -> None:
+    video = episodes['bbt_s07e05']
+    other = Episode(video.name.replace('S07E05', 'S07E06'), video.series, 7, 6, year=video.year)
+    languages = {Language('deu'), Language('fra')}
+    with Addic7edProvider() as provider:
+        results = provider.list_subtitles_batch([video, other], languages)
+    assert [{subtitle.subtitle_id for subtitle in subtitles} for subtitles in results] == [
+        {'updated/8/80254/1', 'updated/11/80254/5'},
+        {'updated/8/80518/0', 'updated/8/80518/1', 'updated/11/80518/7', 'updated/11/80518/8'},
+    ]
+
+
 @pytest.mark.integration
 @vcr.use_cassette
 def test_download_subtitle(episodes: dict[str, Episode]) -> None:
@@ -1,3 +1,4 @@
+import asyncio
 import os
 
 import pytest
@@ -433,3 +434,67 @@ def test_download_with_bom(episodes: dict[str, Episode]) -> None:
     provider.download_subtitle(subtitle)
     assert subtitle.content is not None
     assert subtitle.is_valid() is True
+
+
+@pytest.mark.integration
+@vcr.use_cassette('test_list_subtitles')
+def test_list_subtitles_async(episodes: dict[str, Episode]) -> None:
+    video = episodes['bbt_s07e05']
+    languages = {Language('deu'), Language('fra')}
+    expected_subtitles = {
+        '90fe1369-fa0c-4154-bd04-d3d332dec587',
+        '712de981-a7cc-4ce0-842c-0da9a06d1472',
+    }
+
+    async def list_subtitles() -> list[GestdownSubtitle]:
+        async with GestdownProvider() as provider:
+            return await provider.list_subtitles_async(video, languages)
+
+    subtitles = asyncio.run(list_subtitles())
+    assert {subtitle.subtitle_id for subtitle in subtitles} == expected_subtitles
+    assert {subtitle.language for subtitle in subtitles} == languages
+
+
+@pytest.mark.integration
+@vcr.use_cassette('test_query_all_series')
+def test_list_subtitles_batch(episodes: dict[str, Episode]) -> None:
+    video = episodes['got_s03e10']
+    other = Episode(video.name.replace('S03E10', 'S03E09'), video.series, 3, 9, series_tvdb_id=video.series_tvdb_id)
+    with GestdownProvider() as provider:
+        results = provider.list_subtitles_batch([video, other], {Language('eng')})
+    assert len(results) == 2
+    assert results[0]
+    assert all(subtitle.episode == 10 for subtitle in results[0])
+    assert results[1]
+    assert all(subtitle.episode == 9 for subtitle in results[1])
+
+
+@pytest.mark.integration
+@vcr.use_cassette('test_query_all_series')
+def test_list_subtitles_batch_async(episodes: dict[str, Episode]) -> None:
+    video = episodes['got_s03e10']
+    other = Episode(video.name.replace('S03E10', 'S03E09'), video.series, 3, 9, series_tvdb_id=video.series_tvdb_id)
+
+    async def list_subtitles_batch() -> list[list[GestdownSubtitle]]:
+        async with GestdownProvider() as provider:
+            return await provider.list_subtitles_batch_async([video, other], {Language('eng')})
+
+    results = asyncio.run(list_subtitles_batch())
+    assert [{subtitle.episode for subtitle in subtitles} for subtitles in results] == [{10}, {9}]
+
+
+@pytest.mark.integration
+@vcr.use_cassette('test_download_subtitle')
+def test_download_subtitle_async(episodes: dict[str, Episode]) -> None:
+    video = episodes['bbt_s07e05']
+    languages = {Language('fra')}
+
+    async def download_subtitle() -> GestdownSubtitle:
+        async with GestdownProvider() as provider:
+            subtitles = await provider.list_subtitles_async(video, languages)
+            await provider.download_subtitle_async(subtitles[0])
+        return subtitles[0]
+
+    subtitle = asyncio.run(download_subtitle())
+    assert subtitle.content is not None
+    assert subtitle.is_valid() is True
@@ -209,6 +209,15 @@ def test_configuration_error_no_password() -> None:
         OpenSubtitlesProvider(username=USERNAME)
 
 
+def test_call_timeout() -> None:
+    provider = OpenSubtitlesProvider(timeout=10)
+    transport = provider.server._ServerProxy__transport  # type: ignore[attr-defined]
+    assert transport.make_connection('api.opensubtitles.org').timeout == 10
+    with provider.call_timeout(2):
+        assert transport.make_connection('api.opensubtitles.org').timeout == 2
+    assert transport.make_connection('api.opensubtitles.org').timeout == 10
+
+
 @pytest.mark.skip('authorization no longer works on the old API')
 @pytest.mark.integration
 @vcr.use_cassette
@@ -1,3 +1,4 @@
+import asyncio
 import os
 
 import pytest
@@ -6,11 +7,14 @@ from vcr import VCR  # type: ignore[import-untyped]
 
 from subliminal.exceptions import ConfigurationError
 from subliminal.providers.opensubtitlescom import (
+    DownloadLimitReached,
     OpenSubtitlesComError,
     OpenSubtitlesComProvider,
     OpenSubtitlesComSubtitle,
     Unauthorized,
+    parse_reset_time,
 )
+from subliminal.ratelimit import RateLimiter
 from subliminal.video import Episode, Movie
 
 USERNAME = 'python-subliminal-test'
@@ -437,6 +441,58 @@ def test_download_subtitle(movies: dict[str, Movie]) -> None:
     assert subtitles[0].encoding == 'utf-8'
 
 
+@pytest.mark.integration
+@vcr.use_cassette('test_download_subtitle')
+def test_download_subtitle_async(movies: dict[str, Movie]) -> None:
+    video = movies['man_of_steel']
+    languages = {Language('deu'), Language('fra')}
+
+    async def download_subtitle() -> list[OpenSubtitlesComSubtitle]:
+        async with OpenSubtitlesComProvider(USERNAME, PASSWORD) as provider:
+            subtitles = await provider.list_subtitles_async(video, languages)
+            await provider.download_subtitle_async(subtitles[0])
+            return subtitles
+
+    subtitles = asyncio.run(download_subtitle())
+    assert subtitles[0].content is not None
+    assert subtitles[0].is_valid() is True
+    assert subtitles[0].encoding == 'utf-8'
+
+
+@pytest.mark.integration
+@vcr.use_cassette('test_download_subtitle')
+def test_download_subtitle_quota(movies: dict[str, Movie], monkeypatch: pytest.MonkeyPatch) -> None:
+    video = movies['man_of_steel']
+    languages = {Language('deu'), Language('fra')}
+    rate_limiter = RateLimiter()
+    monkeypatch.setattr(OpenSubtitlesComProvider, 'get_rate_limiter', staticmethod(lambda: rate_limiter))
+    # the reset time of the cassette is in the past
+    monkeypatch.setattr('subliminal.providers.opensubtitlescom.parse_reset_time', lambda value: None)
+    with OpenSubtitlesComProvider(USERNAME, PASSWORD) as provider:
+        subtitles = provider.list_subtitles(video, languages)
+        provider.download_subtitle(subtitles[0])
+        assert rate_limiter.quota == 19
+
+        # the quota was exhausted by another client
+        rate_limiter.set_quota(0)
+        with pytest.raises(DownloadLimitReached):
+            provider.download_subtitle(subtitles[1])
+
+
+@pytest.mark.parametrize(
+    ('value', 'expected'),
+    [
+        ('2022-04-08T13:03:16.000Z', 1649422996.0),
+        ('2022-04-08T13:03:16', 1649422996.0),
+        ('', None),
+        (None, None),
+        ('tomorrow', None),
+    ],
+)
+def test_parse_reset_time(value: str | None, expected: float | None) -> None:
+    assert parse_reset_time(value) == expected
+
+
 @pytest.mark.integration
 @vcr.use_cassette
 def test_tag_match(episodes: dict[str, Episode]) -> None:
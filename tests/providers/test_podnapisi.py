@@ -1,3 +1,4 @@
+import asyncio
 import os
 
 import pytest
@@ -184,6 +185,37 @@ def test_list_subtitles_movie(movies: dict[str, Movie]) -> None:
     assert {subtitle.language for subtitle in subtitles} == languages
 
 
+@pytest.mark.integration
+@vcr.use_cassette('test_list_subtitles_movie')
+def test_list_subtitles_movie_async(movies: dict[str, Movie]) -> None:
+    video = movies['man_of_steel']
+    languages = {Language('eng'), Language('fra')}
+    expected_subtitles = {
+        'Tsko',
+        'Nv0l',
+        'XnUm',
+        'EMgo',
+        'ZmIm',
+        'whQm',
+        'MOko',
+        'aoYm',
+        'WMgp',
+        'd_Im',
+        'GMso',
+        '8RIm',
+        'NLUo',
+        'uYcm',
+    }
+
+    async def list_subtitles() -> list[PodnapisiSubtitle]:
+        async with PodnapisiProvider() as provider:
+            return await provider.list_subtitles_async(video, languages)
+
+    subtitles = asyncio.run(list_subtitles())
+    assert {subtitle.subtitle_id for subtitle in subtitles} == expected_subtitles
+    assert {subtitle.language for subtitle in subtitles} == languages
+
+
 @pytest.mark.integration
 @vcr.use_cassette
 def test_list_subtitles_episode(episodes: dict[str, Episode]) -> None:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import os
 from typing import TYPE_CHECKING
 from unittest.mock import MagicMock, patch
@@ -352,6 +353,35 @@ def test_download_subtitle() -> None:
             assert subtitle.is_valid() is True
 
 
+@pytest.mark.integration
+@vcr.use_cassette('test_download_subtitle')
+def test_download_subtitle_async() -> None:
+    video = Movie(
+        'Novocaine.2025.1080p.WEBRip.V2.x264.Dual.YG.mkv',
+        'Novocaine',
+        source='Web',
+        release_group='YG',
+        resolution='1080p',
+        video_codec='H.264',
+        year=2025,
+        size=4541737725,
+    )
+    languages = {Language('spa')}
+
+    async def download_subtitle() -> list[SubtisSubtitle]:
+        async with SubtisProvider() as provider:
+            subtitles = await provider.list_subtitles_async(video, languages)
+            for subtitle in subtitles[:1]:
+                await provider.download_subtitle_async(subtitle)
+        return subtitles
+
+    subtitles = asyncio.run(download_subtitle())
+    assert subtitles
+    assert subtitles[0].is_synced is True
+    assert '/file/bytes/' in (subtitles[0].page_link or '')
+    assert subtitles[0].is_valid() is True
+
+
 def test_download_subtitle_missing_download_link() -> None:
     subtitle = SubtisSubtitle(
         language=Language('spa'),
@@ -1,8 +1,11 @@
+import os
+import struct
 from pathlib import Path
 
 from babelfish import Language  # type: ignore[import-untyped]
 
 from subliminal.extensions import get_default_providers
+from subliminal.providers.bsplayer import BSPlayerProvider
 from subliminal.refiners.hash import hash_opensubtitles, refine
 from subliminal.video import Movie
 
@@ -17,6 +20,20 @@ def test_hash_opensubtitles_too_small(tmp_path: Path) -> None:
     assert hash_opensubtitles(str(path)) is None
 
 
+def test_hash_opensubtitles_random(tmp_path: Path) -> None:
+    data = os.urandom(3 * 65536 + 8)
+    path = tmp_path / 'test_random.mkv'
+    path.write_bytes(data)
+
+    # reference: the word-by-word loop over the first and last 64KiB
+    expected = len(data)
+    for chunk in (data[:65536], data[-65536:]):
+        for (value,) in struct.iter_unpack('<q', chunk):
+            expected = (expected + value) & 0xFFFFFFFFFFFFFFFF
+    assert hash_opensubtitles(str(path)) == f'{expected:016x}'
+    assert BSPlayerProvider.hash_video(str(path)) == f'{expected:016x}'
+
+
 def test_refine_too_small(mkv: dict[str, str]) -> None:
     path = mkv['test1']
     video = Movie.fromguess(path, {'type': 'movie', 'title': 'Titanic'})
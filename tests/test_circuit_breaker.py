@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import math
+
+import pytest
+
+from subliminal.circuit_breaker import CircuitBreaker, CircuitState
+
+# Core test
+pytestmark = pytest.mark.core
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr('subliminal.circuit_breaker.time', clock)
+    return clock
+
+
+def test_circuit_breaker_failure_rate(clock: FakeClock) -> None:
+    breaker = CircuitBreaker('provider', window=4, failure_rate=0.5, min_calls=4)
+
+    # not enough calls
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state is CircuitState.CLOSED
+    assert breaker.allow()
+
+    # too many failures in the window
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.failures == 3
+    assert breaker.state is CircuitState.OPEN  # type: ignore[comparison-overlap]
+    assert not breaker.allow()
+    assert breaker.retry_in == 60
+
+
+def test_circuit_breaker_window(clock: FakeClock) -> None:
+    breaker = CircuitBreaker('provider', window=4, failure_rate=0.5, min_calls=4)
+
+    # old failures are forgotten
+    for _ in range(10):
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_success()
+        breaker.record_success()
+    assert breaker.state is CircuitState.CLOSED
+
+
+def test_circuit_breaker_half_open(clock: FakeClock) -> None:
+    breaker = CircuitBreaker('provider', cooldown=30)
+    breaker.record_failure(trip=True)
+    assert breaker.state is CircuitState.OPEN
+
+    # a single probe after the cooldown
+    clock.now += 30
+    assert breaker.state is CircuitState.HALF_OPEN  # type: ignore[comparison-overlap]
+    assert breaker.retry_in == 0
+    assert breaker.allow()
+    assert not breaker.allow()
+
+    # the probe fails, open again
+    breaker.record_failure()
+    assert breaker.state is CircuitState.OPEN
+    assert breaker.retry_in == 30
+
+    # the probe succeeds, closed
+    clock.now += 30
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state is CircuitState.CLOSED
+    assert breaker.failures == 0
+    assert breaker.allow()
+    assert breaker.allow()
+
+
+def test_circuit_breaker_cancellation(clock: FakeClock) -> None:
+    breaker = CircuitBreaker('provider', window=4, failure_rate=0.5, min_calls=1, cooldown=30)
+
+    # a cancelled call is not a failure
+    assert breaker.allow()
+    breaker.record_cancellation()
+    assert breaker.failures == 0
+    assert breaker.state is CircuitState.CLOSED
+
+    # the cancelled probe releases the half-open circuit
+    breaker.record_failure(trip=True)
+    clock.now += 30
+    assert breaker.allow()
+    breaker.record_cancellation()
+    assert breaker.state is CircuitState.HALF_OPEN  # type: ignore[comparison-overlap]
+    assert breaker.allow()
+
+
+def test_circuit_breaker_permanent(clock: FakeClock) -> None:
+    breaker = CircuitBreaker('provider')
+    breaker.record_failure(permanent=True)
+
+    clock.now += 1e9
+    assert breaker.state is CircuitState.OPEN
+    assert breaker.retry_in == math.inf
+    assert not breaker.allow()
+
+    breaker.reset()
+    assert breaker.state is CircuitState.CLOSED  # type: ignore[comparison-overlap]
+    assert breaker.allow()
@@ -5,13 +5,15 @@ import re
 from datetime import datetime, timedelta, timezone
 from textwrap import dedent
 from typing import TYPE_CHECKING, Any
-from unittest.mock import Mock
+from unittest.mock import ANY, Mock
 
 import pytest
 from babelfish import Language  # type: ignore[import-untyped]
 
 from subliminal.core import (
     check_video,
+    collect_video_filepaths,
+    collect_video_files,
     save_subtitles,
     scan_name,
     scan_path,
@@ -19,9 +21,10 @@ from subliminal.core import (
     scan_video_or_archive,
     scan_videos,
     search_external_subtitles,
+    search_external_subtitles_batch,
 )
 from subliminal.subtitle import Subtitle
-from subliminal.utils import timestamp
+from subliminal.utils import FileInfo, timestamp
 from subliminal.video import Episode, Movie
 from tests.conftest import ensure
 
@@ -130,6 +133,48 @@ def test_search_external_subtitles_in_directory(episodes: dict[str, Episode], tm
     assert subtitle_languages == expected_subtitles
 
 
+def test_search_external_subtitles_batch(
+    episodes: dict[str, Episode],
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    season_dir = tmp_path / 'Season 07'
+    video_paths = [
+        ensure(season_dir / 'The.Big.Bang.Theory.S07E05.720p.HDTV.X264-DIMENSION.mkv'),
+        ensure(season_dir / 'The.Big.Bang.Theory.S07E05.720p.HDTV.X264-DIMENSION.Part2.mkv'),
+        ensure(season_dir / 'The.Big.Bang.Theory.S07E06.720p.HDTV.X264-DIMENSION.mkv'),
+    ]
+    subtitle_names = [
+        'The.Big.Bang.Theory.S07E05.720p.HDTV.X264-DIMENSION.en.srt',
+        'The.Big.Bang.Theory.S07E05.720p.HDTV.X264-DIMENSION.Part2.fr.srt',
+        'The.Big.Bang.Theory.S07E06.720p.HDTV.X264-DIMENSION.mkv.pt-BR.srt',
+        'The.Big.Bang.Theory.S07E06.720p.HDTV.X264-DIMENSION.nfo',
+        'The.Big.Bang.Theory.S07E07.720p.HDTV.X264-DIMENSION.en.srt',
+    ]
+    for name in subtitle_names:
+        ensure(season_dir / name)
+    other_video_path = ensure(tmp_path / os.path.basename(episodes['got_s03e10'].name))
+
+    # the batch gives the same results as searching for each video
+    expected = {os.fspath(p): search_external_subtitles(p) for p in [*video_paths, other_video_path]}
+
+    # each directory is listed only once
+    mock_listdir = Mock(wraps=os.listdir)
+    monkeypatch.setattr('subliminal.core.os.listdir', mock_listdir)
+    subtitles = search_external_subtitles_batch([*video_paths, other_video_path])
+    assert mock_listdir.call_count == 2
+
+    assert subtitles.keys() == expected.keys()
+    for path, video_subtitles in subtitles.items():
+        assert {p: s.language for p, s in video_subtitles.items()} == {p: s.language for p, s in expected[path].items()}
+    assert {p: s.language for p, s in subtitles[os.fspath(video_paths[0])].items()} == {
+        # the subtitle of the Part2 video also starts with the same root
+        'The.Big.Bang.Theory.S07E05.720p.HDTV.X264-DIMENSION.en.srt': Language('eng'),
+        'The.Big.Bang.Theory.S07E05.720p.HDTV.X264-DIMENSION.Part2.fr.srt': Language('und'),
+    }
+    assert subtitles[os.fspath(other_video_path)] == {}
+
+
 def test_scan_video_movie(movies: dict[str, Movie], tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
     video = movies['man_of_steel']
     monkeypatch.chdir(tmp_path)
@@ -361,7 +406,7 @@ def test_scan_videos(movies: dict[str, Movie], tmp_path: Path, monkeypatch: pyte
     assert mock_scan_archive.call_count == 1
 
     # scan_video calls
-    kwargs: dict[str, Any] = {'name': None}
+    kwargs: dict[str, Any] = {'name': None, 'file_info': ANY, 'index': None}
     scan_video_calls = [
         ((os.path.join('movies', movies['man_of_steel'].name),), kwargs),
         ((os.path.join('movies', movies['enders_game'].name),), kwargs),
@@ -394,11 +439,59 @@ def test_scan_videos_age(movies: dict[str, Movie], tmp_path: Path, monkeypatch:
     assert mock_scan_archive.call_count == 0
 
     # scan_video calls
-    kwargs: dict[str, Any] = {'name': None}
+    kwargs: dict[str, Any] = {'name': None, 'file_info': ANY, 'index': None}
     scan_video_calls = [((os.path.join('movies', movies['man_of_steel'].name),), kwargs)]
     mock_scan_video.assert_has_calls(scan_video_calls, any_order=True)  # type: ignore[arg-type]
 
 
+def test_collect_video_files(movies: dict[str, Movie], episodes: dict[str, Episode], tmp_path: Path) -> None:
+    man_of_steel = ensure(tmp_path / 'movies' / movies['man_of_steel'].name)
+    man_of_steel.write_bytes(b'x' * 42)
+    ensure(tmp_path / 'movies' / movies['enders_game'].name)
+    ensure(tmp_path / 'movies' / '.hidden_video.mkv')
+    ensure(tmp_path / 'movies' / 'Sample' / 'video.mkv')
+    ensure(tmp_path / 'tv' / episodes['bbt_s07e05'].name)
+    ensure(tmp_path / 'tv' / episodes['got_s03e10'].name)
+    ensure(tmp_path / 'tv' / 'notes.txt')
+    (tmp_path / 'link.mkv').symlink_to(man_of_steel)
+
+    files = collect_video_files(tmp_path)
+    assert all(isinstance(f, FileInfo) for f in files)
+    assert sorted(f.path for f in files) == sorted(
+        [
+            str(man_of_steel),
+            str(tmp_path / 'movies' / movies['enders_game'].name),
+            str(tmp_path / 'tv' / episodes['bbt_s07e05'].name),
+            str(tmp_path / 'tv' / episodes['got_s03e10'].name),
+        ]
+    )
+    file_info = next(f for f in files if f.path == str(man_of_steel))
+    assert file_info.size == 42
+    assert file_info.inode == man_of_steel.stat().st_ino
+    assert file_info.mtime_ns == man_of_steel.stat().st_mtime_ns
+
+    # the top-level directories are walked in parallel, with the same result
+    parallel_files = collect_video_files(tmp_path, max_workers=4)
+    assert [f.path for f in parallel_files] == [f.path for f in files]
+    assert collect_video_filepaths(tmp_path) == [f.path for f in files]
+
+
+def test_scan_video_file_info(movies: dict[str, Movie], tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    video_path = ensure(tmp_path / movies['man_of_steel'].name)
+    ts = timestamp(datetime.now(timezone.utc) - timedelta(days=3))
+    file_info = FileInfo(str(video_path), size=1234, mtime=ts, ctime=ts)
+
+    # no additional system call is made when the file information is known
+    mock_from_path = Mock(side_effect=OSError)
+    monkeypatch.setattr(FileInfo, 'from_path', mock_from_path)
+    scanned_video = scan_video(video_path, file_info=file_info)
+    mock_from_path.assert_not_called()
+
+    assert scanned_video.size == 1234
+    assert scanned_video.file_info is file_info
+    assert timedelta(days=3) <= scanned_video.age < timedelta(days=3, minutes=1)
+
+
 def test_save_subtitles(movies: dict[str, Movie], tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.chdir(tmp_path)
     ensure(tmp_path / movies['man_of_steel'].name)
@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import struct
+from typing import TYPE_CHECKING
+from unittest.mock import Mock
+
+import pytest
+from dogpile.cache import make_region
+
+from subliminal.hashers import Hasher, clear_memory_cache, compute_cached_hashes, compute_hashes, hashers
+from subliminal.providers.bsplayer import BSPlayerProvider
+from subliminal.providers.napiprojekt import NapiProjektProvider
+from subliminal.providers.subtis import SubtisProvider
+from subliminal.refiners.hash import refine
+from subliminal.video import Movie
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+# Core test
+pytestmark = pytest.mark.core
+
+
+def opensubtitles_reference(data: bytes) -> str:
+    value = len(data)
+    for chunk in (data[:65536], data[-65536:]):
+        for (word,) in struct.iter_unpack('<q', chunk):
+            value = (value + word) & 0xFFFFFFFFFFFFFFFF
+    return f'{value:016x}'
+
+
+@pytest.fixture(autouse=True)
+def _clear_memory_cache() -> None:
+    clear_memory_cache()
+
+
+@pytest.fixture
+def video_data() -> bytes:
+    # larger than the 10MiB of NapiProjekt, and not a multiple of the chunk size
+    return os.urandom(11 * 1024 * 1024 + 24)
+
+
+@pytest.mark.parametrize('chunk_size', [1024 * 1024, 1003])
+def test_compute_hashes(video_data: bytes, chunk_size: int, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr('subliminal.hashers.CHUNK_SIZE', chunk_size)
+    path = tmp_path / 'video.mkv'
+    path.write_bytes(video_data)
+
+    assert compute_hashes(path, ['opensubtitles', 'napiprojekt']) == {
+        'opensubtitles': opensubtitles_reference(video_data),
+        'napiprojekt': hashlib.md5(video_data[: 10 * 1024 * 1024]).hexdigest(),
+    }
+
+
+def test_compute_hashes_too_small(tmp_path: Path) -> None:
+    path = tmp_path / 'video.mkv'
+    path.write_bytes(b'\x01' * 1000)
+
+    assert compute_hashes(path, ['opensubtitles', 'napiprojekt']) == {
+        'napiprojekt': hashlib.md5(b'\x01' * 1000).hexdigest(),
+    }
+
+
+def test_compute_hashes_custom_hasher(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    state = Mock(**{'hexdigest.return_value': 'custom'})
+    hasher = Mock(spec=Hasher, **{'ranges.return_value': [(2, 4), (6, 8)], 'start.return_value': state})
+    monkeypatch.setitem(hashers, 'custom', hasher)
+    path = tmp_path / 'video.mkv'
+    path.write_bytes(b'0123456789')
+
+    assert compute_hashes(path, ['custom']) == {'custom': 'custom'}
+    assert [bytes(c.args[0]) for c in state.update.call_args_list] == [b'23', b'67']
+
+
+def test_provider_hash_video(video_data: bytes, tmp_path: Path) -> None:
+    path = tmp_path / 'video.mkv'
+    path.write_bytes(video_data)
+
+    assert BSPlayerProvider.hash_video(str(path)) == opensubtitles_reference(video_data)
+    assert SubtisProvider.hash_video(str(path)) == opensubtitles_reference(video_data)
+    assert NapiProjektProvider.hash_video(str(path)) == hashlib.md5(video_data[: 10 * 1024 * 1024]).hexdigest()
+
+
+def test_refine_opens_once(video_data: bytes, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    path = tmp_path / 'video.mkv'
+    path.write_bytes(video_data)
+    video = Movie(str(path), 'Video', size=len(video_data))
+    mock_open = Mock(wraps=open)
+    monkeypatch.setattr('builtins.open', mock_open)
+
+    refine(video, providers=['bsplayer', 'napiprojekt', 'opensubtitlescom', 'subtis'])
+
+    assert mock_open.call_count == 1
+    assert video.hashes == {
+        'bsplayer': opensubtitles_reference(video_data),
+        'napiprojekt': hashlib.md5(video_data[: 10 * 1024 * 1024]).hexdigest(),
+        'opensubtitlescom': opensubtitles_reference(video_data),
+        'subtis': opensubtitles_reference(video_data),
+    }
+
+
+def test_compute_cached_hashes(video_data: bytes, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    region = make_region().configure('dogpile.cache.memory')
+    monkeypatch.setattr('subliminal.hashers.region', region)
+    mock_compute_hashes = Mock(wraps=compute_hashes)
+    monkeypatch.setattr('subliminal.hashers.compute_hashes', mock_compute_hashes)
+    path = tmp_path / 'video.mkv'
+    path.write_bytes(video_data)
+    expected = {'opensubtitles': opensubtitles_reference(video_data)}
+
+    assert compute_cached_hashes(path, ['opensubtitles']) == expected
+    assert mock_compute_hashes.call_count == 1
+
+    # from memory, then from the persistent region
+    assert compute_cached_hashes(path, ['opensubtitles']) == expected
+    clear_memory_cache()
+    assert compute_cached_hashes(path, ['opensubtitles']) == expected
+    assert mock_compute_hashes.call_count == 1
+
+    # only the missing hash is computed
+    compute_cached_hashes(path, ['opensubtitles', 'napiprojekt'])
+    mock_compute_hashes.assert_called_with(path, ['napiprojekt'])
+
+    # replaced file
+    new_data = video_data[::-1]
+    path.write_bytes(new_data)
+    os.utime(path, ns=(0, 0))
+    assert compute_cached_hashes(path, ['opensubtitles']) == {'opensubtitles': opensubtitles_reference(new_data)}
+    assert mock_compute_hashes.call_count == 3
+
+
+def test_compute_cached_hashes_memory_bounded(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr('subliminal.hashers.MEMORY_CACHE_SIZE', 1)
+    mock_compute_hashes = Mock(wraps=compute_hashes)
+    monkeypatch.setattr('subliminal.hashers.compute_hashes', mock_compute_hashes)
+    paths = [tmp_path / 'video1.mkv', tmp_path / 'video2.mkv']
+    for path in paths:
+        path.write_bytes(b'\x01' * 1000)
+
+    for path in (*paths, paths[1], paths[0]):
+        compute_cached_hashes(path, ['napiprojekt'])
+    assert [c.args[0] for c in mock_compute_hashes.call_args_list] == [paths[0], paths[1], paths[0]]
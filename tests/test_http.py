@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING
+
+import pytest
+
+from subliminal.http import (
+    ACCEPT_ENCODING,
+    POOL_SIZE,
+    ConnectionMetrics,
+    TransportAdapter,
+    configure_connection_pools,
+    connection_metrics,
+    create_session,
+)
+from subliminal.providers import SecLevelOneTLSAdapter
+from subliminal.ratelimit import RateLimit, RateLimiter
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+# Core test
+pytestmark = pytest.mark.core
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self) -> None:
+        body = self.headers.get('Accept-Encoding', '').encode()
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        pass
+
+
+@pytest.fixture
+def server() -> Generator[str, None, None]:
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), KeepAliveHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{httpd.server_address[1]}'
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def _pool_size() -> Generator[None, None, None]:
+    yield
+    configure_connection_pools(None)
+
+
+def test_create_session() -> None:
+    rate_limiter = RateLimiter(RateLimit(max_concurrent=1))
+    session = create_session(rate_limiter, headers={'User-Agent': 'Subliminal'})
+
+    adapter = session.get_adapter('https://example.com')
+    assert isinstance(adapter, TransportAdapter)
+    assert session.get_adapter('http://example.com') is adapter
+    assert adapter.rate_limiter is rate_limiter
+    assert adapter.pool_size == POOL_SIZE
+    assert session.headers['Accept-Encoding'] == ACCEPT_ENCODING
+    assert session.headers['User-Agent'] == 'Subliminal'
+
+
+def test_create_session_adapter_class() -> None:
+    session = create_session(adapter_class=SecLevelOneTLSAdapter, pool_size=3)
+
+    adapter = session.get_adapter('https://example.com')
+    assert isinstance(adapter, SecLevelOneTLSAdapter)
+    assert adapter.pool_size == 3
+    assert adapter.poolmanager.connection_pool_kw['ssl_context'] is not None
+
+
+@pytest.mark.usefixtures('_pool_size')
+def test_configure_connection_pools() -> None:
+    configured = TransportAdapter()
+    fixed = TransportAdapter(pool_size=2)
+
+    configure_connection_pools(12)
+    assert configured.pool_size == 12
+    assert configured.poolmanager.connection_pool_kw['maxsize'] == 12
+    assert fixed.pool_size == 2
+    assert TransportAdapter().pool_size == 12
+
+    configure_connection_pools(None)
+    assert configured.pool_size == POOL_SIZE
+
+
+def test_connection_metrics_reused(server: str) -> None:
+    connection_metrics.reset()
+    session = create_session()
+
+    for _ in range(3):
+        r = session.get(server, timeout=5)
+        r.raise_for_status()
+    # the compressions are negotiated
+    assert r.text == ACCEPT_ENCODING
+
+    metrics = connection_metrics.hosts['127.0.0.1']
+    assert metrics.requests == 3
+    assert metrics.connections == 1
+    assert metrics.reused == 2
+
+
+def test_connection_metrics() -> None:
+    metrics = ConnectionMetrics()
+    metrics.record_request('example.com')
+    metrics.record_request('example.com')
+    metrics.record_connection('example.com')
+
+    assert repr(metrics) == '<ConnectionMetrics hosts=1>'
+    assert repr(metrics.hosts['example.com']) == '<HostMetrics requests=2 connections=1>'
+    assert metrics.hosts['example.com'].reused == 1
+
+    metrics.reset()
+    assert metrics.hosts == {}
@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING, ClassVar
+
+import pytest
+from requests import Response
+
+from subliminal.http import create_session
+from subliminal.http_cache import HTTPCache, configure_http_cache, get_http_cache
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+    from pathlib import Path
+
+# Core test
+pytestmark = pytest.mark.core
+
+
+class ETagHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    etag = '"v1"'
+    cache_control = 'max-age=0'
+    requests: ClassVar[list[str | None]] = []
+
+    def do_GET(self) -> None:
+        self.requests.append(self.headers.get('If-None-Match'))
+        if self.headers.get('If-None-Match') == self.etag:
+            self.send_response(304)
+            self.send_header('ETag', self.etag)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        body = f'page {self.etag}'.encode()
+        self.send_response(200)
+        self.send_header('ETag', self.etag)
+        self.send_header('Cache-Control', self.cache_control)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        pass
+
+
+@pytest.fixture
+def server() -> Generator[str, None, None]:
+    ETagHandler.requests = []
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), ETagHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{httpd.server_address[1]}'
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def make_response(url: str, content: bytes, headers: dict[str, str]) -> Response:
+    response = Response()
+    response.status_code = 200
+    response.url = url
+    response.headers.update(headers)
+    response._content = content
+    return response
+
+
+def test_http_cache_revalidate(server: str, tmp_path: Path) -> None:
+    configure_http_cache(tmp_path / 'http.db')
+    http_cache = get_http_cache()
+    assert http_cache is not None
+    session = create_session(cached=True)
+
+    r = session.get(server, timeout=5)
+    assert r.status_code == 200
+    assert r.text == 'page "v1"'
+    assert len(http_cache) == 1
+
+    # revalidated with a 304
+    r = session.get(server, timeout=5)
+    assert r.status_code == 200
+    assert r.text == 'page "v1"'
+    assert r.encoding == 'utf-8'
+    assert ETagHandler.requests == [None, '"v1"']
+    assert (http_cache.hits, http_cache.revalidations, http_cache.misses) == (0, 1, 1)
+
+
+def test_http_cache_modified(server: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    configure_http_cache(':memory:')
+    session = create_session(cached=True)
+    session.get(server, timeout=5)
+
+    monkeypatch.setattr(ETagHandler, 'etag', '"v2"')
+    r = session.get(server, timeout=5)
+    assert r.text == 'page "v2"'
+    http_cache = get_http_cache()
+    assert http_cache is not None
+    assert (http_cache.hits, http_cache.revalidations, http_cache.misses) == (0, 0, 2)
+    cached = http_cache.get(server + '/')
+    assert cached is not None
+    assert cached.content == b'page "v2"'
+
+
+def test_http_cache_fresh(server: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(ETagHandler, 'cache_control', 'max-age=3600')
+    configure_http_cache(':memory:')
+    session = create_session(cached=True)
+
+    for _ in range(3):
+        r = session.get(server, timeout=5)
+        assert r.text == 'page "v1"'
+    # no request for the fresh response
+    assert ETagHandler.requests == [None]
+    http_cache = get_http_cache()
+    assert http_cache is not None
+    assert http_cache.hits == 2
+
+
+def test_http_cache_not_cached_session(server: str) -> None:
+    configure_http_cache(':memory:')
+    session = create_session()
+
+    session.get(server, timeout=5)
+    session.get(server, timeout=5)
+    assert ETagHandler.requests == [None, None]
+    http_cache = get_http_cache()
+    assert http_cache is not None
+    assert len(http_cache) == 0
+
+
+def test_http_cache_set() -> None:
+    with HTTPCache(':memory:') as http_cache:
+        # without validator
+        assert not http_cache.set(make_response('https://example.com/a', b'a', {}))
+        # no-store
+        assert not http_cache.set(
+            make_response('https://example.com/a', b'a', {'ETag': 'a', 'Cache-Control': 'no-store'})
+        )
+        assert http_cache.set(
+            make_response('https://example.com/a', b'a', {'Last-Modified': 'now', 'Content-Encoding': 'gzip'})
+        )
+
+        cached = http_cache.get('https://example.com/a')
+        assert cached is not None
+        assert cached.validators == {'If-Modified-Since': 'now'}
+        # the transfer headers are not stored
+        assert 'Content-Encoding' not in cached.headers
+        assert not cached.fresh
+
+
+def test_http_cache_eviction() -> None:
+    with HTTPCache(':memory:', max_size=20) as http_cache:
+        for name in 'abc':
+            assert http_cache.set(make_response(f'https://example.com/{name}', b'x' * 8, {'ETag': name}))
+            # the first page is used, so it is kept
+            http_cache.get('https://example.com/a')
+
+        assert len(http_cache) == 2
+        assert http_cache.size == 16
+        assert http_cache.get('https://example.com/a') is not None
+        assert http_cache.get('https://example.com/b') is None
+
+        # too large
+        assert not http_cache.set(make_response('https://example.com/d', b'x' * 21, {'ETag': 'd'}))
+
+        http_cache.clear()
+        assert len(http_cache) == 0
+
+
+def test_http_cache_counters() -> None:
+    with HTTPCache(':memory:') as http_cache:
+
+        def record() -> None:
+            for _ in range(1000):
+                http_cache.record_hit()
+                http_cache.record_revalidation()
+                http_cache.record_miss()
+
+        threads = [threading.Thread(target=record) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert (http_cache.hits, http_cache.revalidations, http_cache.misses) == (8000, 8000, 8000)
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import pickle
+
+import pytest
+from babelfish import Language  # type: ignore[import-untyped]
+from dogpile.cache import make_region
+
+from subliminal.listing_cache import ListingCache
+from subliminal.subtitle import Subtitle
+from subliminal.video import Episode
+
+# Core test
+pytestmark = pytest.mark.core
+
+
+def test_listing_cache(episodes: dict[str, Episode]) -> None:
+    video = episodes['bbt_s07e05']
+    listing_cache = ListingCache(cache_region=make_region().configure('dogpile.cache.memory'))
+    languages = {Language('eng'), Language('fra')}
+    subtitle = Subtitle(Language('eng'), 'eng-1')
+    subtitle.content = b'content'
+
+    assert listing_cache.get('podnapisi', video, languages) == ([], languages)
+    listing_cache.set('podnapisi', video, languages, [subtitle])
+
+    subtitles, missing = listing_cache.get('podnapisi', video, languages)
+    assert missing == set()
+    assert [s.id for s in subtitles] == ['eng-1']
+    # stored without content
+    assert subtitles[0].content is None
+    assert subtitle.content == b'content'
+    assert listing_cache.get('gestdown', video, languages) == ([], languages)
+    assert (listing_cache.hits, listing_cache.misses) == (2, 4)
+
+
+def test_listing_cache_other_release(episodes: dict[str, Episode]) -> None:
+    video = episodes['bbt_s07e05']
+    listing_cache = ListingCache(cache_region=make_region().configure('dogpile.cache.memory'))
+    listing_cache.set('podnapisi', video, {Language('eng')}, [])
+
+    # another release of the same episode
+    other = Episode(video.name.replace('DIMENSION', 'LOL'), video.series, video.season, video.episode)
+    assert listing_cache.get('podnapisi', other, {Language('eng')}) == ([], {Language('eng')})
+
+
+def test_listing_cache_expiration(episodes: dict[str, Episode]) -> None:
+    video = episodes['bbt_s07e05']
+    listing_cache = ListingCache(-1, cache_region=make_region().configure('dogpile.cache.memory'))
+    listing_cache.set('podnapisi', video, {Language('eng')}, [])
+    assert listing_cache.get('podnapisi', video, {Language('eng')}) == ([], {Language('eng')})
+
+
+def test_listing_cache_not_configured(episodes: dict[str, Episode]) -> None:
+    video = episodes['bbt_s07e05']
+    listing_cache = ListingCache(cache_region=make_region())
+    listing_cache.set('podnapisi', video, {Language('eng')}, [])
+    assert listing_cache.get('podnapisi', video, {Language('eng')}) == ([], {Language('eng')})
+
+
+def test_listing_cache_pickle() -> None:
+    subtitle = Subtitle(Language('eng'), 'eng-1', page_link='https://example.com')
+    assert pickle.loads(pickle.dumps(subtitle)).page_link == 'https://example.com'
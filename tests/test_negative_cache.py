@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+from babelfish import Language  # type: ignore[import-untyped]
+
+from subliminal.negative_cache import BloomFilter, NegativeCache, video_identity
+from subliminal.subtitle import Subtitle
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from subliminal.video import Episode, Movie
+
+# Core test
+pytestmark = pytest.mark.core
+
+
+def test_video_identity(episodes: dict[str, Episode], movies: dict[str, Movie]) -> None:
+    bbt = episodes['bbt_s07e05']
+    assert video_identity(bbt) == 'episode:the big bang theory:2007::7:5'
+    assert video_identity(movies['man_of_steel']) == 'movie:man of steel:2013'
+
+    # the same for all the releases
+    other = episodes['bbt_s07e05']
+    other.release_group = 'other'
+    assert video_identity(other) == video_identity(bbt)
+
+
+def test_bloom_filter() -> None:
+    bloom_filter = BloomFilter(capacity=100)
+    for i in range(100):
+        bloom_filter.add(f'key{i}')
+
+    assert all(f'key{i}' in bloom_filter for i in range(100))
+    assert sum(f'other{i}' in bloom_filter for i in range(1000)) < 50
+    assert repr(bloom_filter) == '<BloomFilter [100/100]>'
+    assert not bloom_filter.full
+    bloom_filter.add('key')
+    assert bloom_filter.full
+
+
+def test_negative_cache_decay(episodes: dict[str, Episode], monkeypatch: pytest.MonkeyPatch) -> None:
+    video = episodes['bbt_s07e05']
+    languages = {Language('eng'), Language('fra')}
+    now = time.time()
+    monkeypatch.setattr('subliminal.negative_cache.time.time', lambda: now)
+
+    with NegativeCache(':memory:', decay=(10, 30)) as negative_cache:
+        assert negative_cache.filter_languages('podnapisi', video, languages) == languages
+
+        negative_cache.record('podnapisi', video, languages, [Subtitle(Language('eng'))])
+        assert negative_cache.filter_languages('podnapisi', video, languages) == {Language('eng')}
+        # the other providers are not skipped
+        assert negative_cache.filter_languages('gestdown', video, languages) == languages
+
+        # retried after the first decay
+        monkeypatch.setattr('subliminal.negative_cache.time.time', lambda: now + 11)
+        assert negative_cache.filter_languages('podnapisi', video, languages) == languages
+        negative_cache.record('podnapisi', video, {Language('fra')}, [])
+        monkeypatch.setattr('subliminal.negative_cache.time.time', lambda: now + 11 + 29)
+        assert negative_cache.filter_languages('podnapisi', video, languages) == {Language('eng')}
+
+        # a subtitle is found
+        negative_cache.record('podnapisi', video, {Language('fra')}, [Subtitle(Language('fra'))])
+        assert negative_cache.filter_languages('podnapisi', video, languages) == languages
+        assert len(negative_cache) == 0
+        assert negative_cache.hits == 2
+
+
+def test_negative_cache_language_decays(episodes: dict[str, Episode]) -> None:
+    video = episodes['bbt_s07e05']
+    languages = {Language('eng'), Language('fra')}
+
+    with NegativeCache(':memory:', decay=(3600,), language_decays={Language('fra'): (0,)}) as negative_cache:
+        negative_cache.record('podnapisi', video, languages, [])
+        assert negative_cache.filter_languages('podnapisi', video, languages) == {Language('fra')}
+
+
+def test_negative_cache_persistent(episodes: dict[str, Episode], tmp_path: Path) -> None:
+    video = episodes['bbt_s07e05']
+    languages = {Language('fra')}
+
+    with NegativeCache(tmp_path / 'negative.db') as negative_cache:
+        negative_cache.record('podnapisi', video, languages, [])
+
+    with NegativeCache(tmp_path / 'negative.db') as negative_cache:
+        assert len(negative_cache) == 1
+        assert negative_cache.filter_languages('podnapisi', video, languages) == set()
+        assert negative_cache.prune() == 0
+
+        negative_cache.clear()
+        assert negative_cache.filter_languages('podnapisi', video, languages) == languages
+
+
+def test_negative_cache_prune(episodes: dict[str, Episode]) -> None:
+    video = episodes['bbt_s07e05']
+
+    with NegativeCache(':memory:', decay=(0,)) as negative_cache:
+        negative_cache.record('podnapisi', video, {Language('fra')}, [])
+        assert negative_cache.prune() == 1
+        assert len(negative_cache) == 0
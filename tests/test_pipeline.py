@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING
+
+import pytest
+
+from subliminal.pipeline import Pipeline, Stage
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+# Core test
+pytestmark = pytest.mark.core
+
+
+def test_pipeline() -> None:
+    results: list[int] = []
+    lock = threading.Lock()
+
+    def expand(n: int) -> Iterator[int]:
+        # drop the odd numbers, repeat the others
+        if n % 2 == 0:
+            yield n
+            yield n
+
+    def save(n: int) -> list[None]:
+        with lock:
+            results.append(n * 10)
+        return []
+
+    stages = [Stage('expand', expand, workers=2), Stage('double', lambda n: [n * 2], workers=3), Stage('save', save)]
+    with Pipeline(stages, queue_size=2) as pipeline:
+        for n in range(6):
+            pipeline.put(n)
+
+    assert sorted(results) == [0, 0, 40, 40, 80, 80]
+    assert pipeline.processed == {'expand': 6, 'double': 6, 'save': 6}
+
+
+def test_pipeline_bounded_queues() -> None:
+    release = threading.Event()
+    put: list[int] = []
+
+    def wait(n: int) -> list[int]:
+        release.wait(5)
+        return []
+
+    pipeline = Pipeline([Stage('first', lambda n: [n]), Stage('slow', wait)], queue_size=1)
+    pipeline.start()
+
+    def feed() -> None:
+        for n in range(20):
+            pipeline.put(n)
+            put.append(n)
+        pipeline.close()
+
+    feeder = threading.Thread(target=feed)
+    feeder.start()
+    feeder.join(0.2)
+
+    # the items wait in the queues and the stages, then the feeder is blocked
+    assert feeder.is_alive()
+    assert len(put) <= 4
+
+    release.set()
+    feeder.join()
+    pipeline.join()
+    assert pipeline.processed == {'first': 20, 'slow': 20}
+
+
+def test_pipeline_error() -> None:
+    def fail(n: int) -> list[int]:
+        if n == 2:
+            msg = 'Failed'
+            raise ValueError(msg)
+        return [n]
+
+    saved: list[int] = []
+
+    def save(n: int) -> list[int]:
+        saved.append(n)
+        return []
+
+    def run(pipeline: Pipeline) -> None:
+        with pipeline:
+            for n in range(10):
+                pipeline.put(n)
+
+    pipeline = Pipeline([Stage('fail', fail), Stage('save', save)], queue_size=1)
+    with pytest.raises(ValueError, match='Failed'):
+        run(pipeline)
+
+    # the items after the error are dropped
+    assert 2 not in saved
+    assert pipeline.processed['fail'] < 10
+
+
+def test_pipeline_without_stage() -> None:
+    with pytest.raises(ValueError, match='at least one stage'):
+        Pipeline([])
@@ -1,6 +1,8 @@
 # ruff: noqa: PT011
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
 from subliminal.providers import FeatureNotFound, ParserBeautifulSoup, Provider
@@ -53,3 +55,15 @@ def test_check_required_hash(episodes: dict[str, Episode], movies: dict[str, Mov
     Provider.required_hash = 'opensubtitles'
     assert Provider.check(movies['man_of_steel']) is True
     assert Provider.check(episodes['dallas_s01e03']) is False
+
+
+def test_call_timeout() -> None:
+    provider, other = Provider(), Provider()
+    provider.timeout = 10
+    with provider.call_timeout(2):
+        assert provider.timeout == 2
+        # the other instances and threads keep their timeout
+        assert other.timeout is None
+        with ThreadPoolExecutor(1) as executor:
+            assert executor.submit(lambda: provider.timeout).result() == 10
+    assert provider.timeout == 10
@@ -1,29 +1,47 @@
 from __future__ import annotations
 
+import asyncio
+import math
+import threading
+import time
 from typing import TYPE_CHECKING, Any, cast
 from unittest.mock import Mock, call
 
 import pytest
 from babelfish import Language  # type: ignore[import-untyped]
+from dogpile.cache import make_region
 
+from subliminal.circuit_breaker import CircuitState
 from subliminal.core import (
+    AsyncioProviderPool,
     AsyncProviderPool,
+    BatchProviderPool,
+    Hedging,
     ProviderPool,
+    Timeouts,
     download_best_subtitles,
+    download_best_subtitles_async,
     download_subtitles,
+    group_videos,
     list_subtitles,
     refine,
     refiner_manager,
 )
+from subliminal.exceptions import AuthenticationError
+from subliminal.listing_cache import ListingCache
+from subliminal.negative_cache import NegativeCache
+from subliminal.providers import Provider
+from subliminal.ratelimit import RateLimiter
 from subliminal.score import episode_scores
 from subliminal.subtitle import Subtitle
+from subliminal.video import Episode, Movie
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterator, Set
 
     from subliminal.extensions import RegistrableExtensionManager
     from subliminal.providers.mock import MockProvider
-    from subliminal.video import Episode, Movie, Video
+    from subliminal.video import Video
 
 # Core test
 pytestmark = [
@@ -129,6 +147,53 @@ def test_provider_pool_list_subtitles(
         assert provider_manager[provider_s].plugin.list_subtitles.called  # type: ignore[attr-defined]
 
 
+def test_provider_pool_initialize_early(
+    provider_manager: RegistrableExtensionManager,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    released = threading.Event()
+    calls: list[str] = []
+
+    def slow_initialize(self: Any) -> None:
+        calls.append(self.__class__.__name__)
+        released.wait(timeout=10)
+
+    monkeypatch.setattr(provider_manager['gestdown'].plugin, 'initialize', slow_initialize)
+
+    pool = ProviderPool(providers=['gestdown', 'podnapisi'], initialize_early=True)
+    # concurrent callers wait for the initialization in background
+    threads = [threading.Thread(target=lambda: pool['gestdown']) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    released.set()
+    for thread in threads:
+        thread.join(timeout=10)
+    pool.terminate()
+
+    assert len(calls) == 1
+    assert pool.initialized_providers == {}
+
+
+def test_provider_pool_initialize_early_error(
+    provider_manager: RegistrableExtensionManager,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    mock_initialize = Mock(side_effect=ValueError)
+    monkeypatch.setattr(provider_manager['gestdown'].plugin, 'initialize', mock_initialize)
+
+    with ProviderPool(providers=['gestdown', 'podnapisi'], initialize_early=True) as pool:
+        assert pool._initializer is not None
+        pool._initializer.shutdown(wait=True)
+        assert set(pool.initialized_providers) == {'podnapisi'}
+
+        # the error is raised on first use, then the initialization is tried again
+        with pytest.raises(ValueError):  # noqa: PT011
+            pool['gestdown']
+        with pytest.raises(ValueError):  # noqa: PT011
+            pool['gestdown']
+    assert mock_initialize.call_count == 2
+
+
 @pytest.mark.usefixtures('_mock_providers')
 def test_async_provider_pool_list_subtitles_provider(
     episodes: dict[str, Episode],
@@ -160,6 +225,21 @@ def test_async_provider_pool_list_subtitles(
         assert provider_manager[provider_s].plugin.list_subtitles.called  # type: ignore[attr-defined]
 
 
+@pytest.mark.usefixtures('_mock_providers')
+def test_async_provider_pool_executor(episodes: dict[str, Episode]) -> None:
+    with AsyncProviderPool() as pool:
+        executor = pool.executor
+        pool.list_subtitles(episodes['bbt_s07e05'], {Language('eng')})
+        pool.list_subtitles(episodes['got_s03e10'], {Language('eng')})
+        # the same executor is used for all the videos
+        assert pool.executor is executor
+        assert executor._max_workers == len(pool.providers)
+
+    # shut down on terminate
+    with pytest.raises(RuntimeError):
+        executor.submit(print)
+
+
 @pytest.mark.usefixtures('_mock_providers')
 def test_list_subtitles_movie(
     movies: dict[str, Movie],
@@ -292,6 +372,207 @@ def test_download_subtitles(provider_manager: RegistrableExtensionManager) -> No
         assert provider_manager[name].plugin.download_subtitle.called  # type: ignore[attr-defined]
 
 
+def next_episode(video: Episode) -> Episode:
+    return Episode(f'{video.name}.next', video.series, video.season, cast('int', video.episode) + 1, year=video.year)
+
+
+def test_group_videos(episodes: dict[str, Episode], movies: dict[str, Movie]) -> None:
+    bbt = episodes['bbt_s07e05']
+    got = episodes['got_s03e10']
+    movie = movies['man_of_steel']
+    bbt_next = next_episode(bbt)
+    other_season = Episode('bbt.s08e01.mkv', bbt.series, 8, 1, year=bbt.year)
+
+    assert group_videos([bbt, movie, got, other_season, bbt_next]) == [
+        [bbt, bbt_next],
+        [movie],
+        [got],
+        [other_season],
+    ]
+
+
+@pytest.fixture
+def _provider_checks(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Restore the default checks of the providers, modified by the tests of :class:`Provider`."""
+    monkeypatch.setattr(Provider, 'video_types', (Episode, Movie))
+    monkeypatch.setattr(Provider, 'required_hash', None)
+
+
+@pytest.fixture
+def batch_calls(
+    monkeypatch: pytest.MonkeyPatch,
+    provider_manager: RegistrableExtensionManager,
+    _provider_checks: None,
+) -> list[list[str]]:
+    """Record the videos of each batch listed by gestdown, that lists the subtitles of each video by name."""
+    calls: list[list[str]] = []
+
+    def list_subtitles_batch(self: Provider, videos: list[Video], languages: Set[Language]) -> list[list[str]]:
+        calls.append([video.name for video in videos])
+        return [[video.name] for video in videos]
+
+    monkeypatch.setattr(provider_manager['gestdown'].plugin, 'list_subtitles_batch', list_subtitles_batch)
+    return calls
+
+
+@pytest.mark.usefixtures('_mock_providers')
+@pytest.mark.parametrize('pool_class', [ProviderPool, AsyncProviderPool, BatchProviderPool])
+def test_provider_pool_list_subtitles_batch(
+    pool_class: type[ProviderPool],
+    episodes: dict[str, Episode],
+    movies: dict[str, Movie],
+    provider_manager: RegistrableExtensionManager,
+    batch_calls: list[list[str]],
+) -> None:
+    bbt = episodes['bbt_s07e05']
+    bbt_next = next_episode(bbt)
+    movie = movies['man_of_steel']
+    videos = [bbt, movie, bbt_next]
+
+    with pool_class(providers=['gestdown', 'podnapisi']) as pool:
+        results = pool.list_subtitles_batch(videos, {Language('eng')})
+
+    # a single call for the episodes of the season, gestdown does not list movies
+    assert batch_calls == [[bbt.name, bbt_next.name]]
+    assert provider_manager['podnapisi'].plugin.list_subtitles.call_count == 3  # type: ignore[attr-defined]
+    assert [sorted(subtitles) for subtitles in results] == [  # type: ignore[type-var,comparison-overlap]
+        [bbt.name, 'podnapisi'],
+        ['podnapisi'],
+        [bbt_next.name, 'podnapisi'],
+    ]
+
+
+def test_provider_pool_negative_cache(episodes: dict[str, Episode]) -> None:
+    video = episodes['bbt_s07e05']
+    languages = {Language('eng'), Language('deu')}
+
+    with (
+        NegativeCache(':memory:') as negative_cache,
+        ProviderPool(['podnapisi'], negative_cache=negative_cache) as pool,
+    ):
+        subtitles = pool.list_subtitles_provider('podnapisi', video, languages)
+        assert subtitles
+        assert {subtitle.language for subtitle in subtitles} == {Language('eng')}
+        assert len(negative_cache) == 1
+
+        # the language without subtitle is not searched again
+        assert pool.list_subtitles_provider('podnapisi', video, {Language('deu')}) == []
+        assert negative_cache.hits == 1
+        assert pool.list_subtitles_provider('podnapisi', video, languages) == subtitles
+        assert negative_cache.hits == 2
+
+        # unless bypassed
+        negative_cache.bypass = True
+        assert pool.list_subtitles_provider('podnapisi', video, {Language('deu')}) == []
+        assert negative_cache.hits == 2
+
+
+@pytest.mark.usefixtures('_provider_checks')
+def test_provider_pool_list_subtitles_batch_negative_cache(episodes: dict[str, Episode]) -> None:
+    bbt = episodes['bbt_s07e05']
+    bbt_next = next_episode(bbt)
+    videos = [bbt, bbt_next]
+
+    with (
+        NegativeCache(':memory:') as negative_cache,
+        ProviderPool(['podnapisi'], negative_cache=negative_cache) as pool,
+    ):
+        pool.list_subtitles_batch(videos, {Language('deu')})
+        assert len(negative_cache) == 2
+
+        # all the videos are skipped
+        assert pool.list_subtitles_provider_batch('podnapisi', videos, {Language('deu')}) == [[], []]
+        assert negative_cache.hits == 2
+
+
+def test_provider_pool_listing_cache(episodes: dict[str, Episode], monkeypatch: pytest.MonkeyPatch) -> None:
+    video = episodes['bbt_s07e05']
+    listing_cache = ListingCache(cache_region=make_region().configure('dogpile.cache.memory'))
+
+    with ProviderPool(['podnapisi'], listing_cache=listing_cache) as pool:
+        instance = pool['podnapisi']
+        mock_list_subtitles = Mock(wraps=instance.list_subtitles)
+        monkeypatch.setattr(instance, 'list_subtitles', mock_list_subtitles)
+
+        subtitles = pool.list_subtitles_provider('podnapisi', video, {Language('eng')})
+        assert subtitles
+        # listed again from the cache, without content
+        subtitles[0].content = b'content'
+        cached = pool.list_subtitles_provider('podnapisi', video, {Language('eng')})
+        assert [s.id for s in cached] == [s.id for s in subtitles]  # type: ignore[union-attr]
+        assert cached[0].content is None  # type: ignore[index]
+        assert mock_list_subtitles.call_count == 1
+
+        # only the missing languages are listed
+        subtitles = pool.list_subtitles_provider('podnapisi', video, {Language('eng'), Language('fra')})
+        assert {s.language for s in subtitles} == {Language('eng'), Language('fra')}  # type: ignore[union-attr]
+        assert mock_list_subtitles.call_args == call(video, {Language('fra')})
+        assert (listing_cache.hits, listing_cache.misses) == (2, 2)
+
+
+def test_provider_pool_list_subtitles_batch_listing_cache(episodes: dict[str, Episode]) -> None:
+    bbt = episodes['bbt_s07e05']
+    listing_cache = ListingCache(cache_region=make_region().configure('dogpile.cache.memory'))
+
+    with ProviderPool(['podnapisi'], listing_cache=listing_cache) as pool:
+        pool.list_subtitles_provider('podnapisi', bbt, {Language('eng')})
+        results = pool.list_subtitles_provider_batch('podnapisi', [bbt], {Language('eng'), Language('fra')})
+
+    assert results is not None
+    assert sorted(str(s.language) for s in results[0]) == ['en', 'fr']
+    assert (listing_cache.hits, listing_cache.misses) == (1, 2)
+
+
+@pytest.mark.usefixtures('batch_calls')
+def test_provider_pool_list_subtitles_batch_discarded_provider(episodes: dict[str, Episode]) -> None:
+    bbt = episodes['bbt_s07e05']
+    videos = [bbt, next_episode(bbt), episodes['got_s03e10']]
+
+    with ProviderPool(['gestdown', 'podnapisi']) as pool:
+        cast('MockProvider', pool['podnapisi']).is_broken = True
+        results = pool.list_subtitles_batch(videos, {Language('eng')})
+        assert pool.discarded_providers == {'podnapisi'}
+
+    assert results == [[video.name] for video in videos]  # type: ignore[comparison-overlap]
+
+
+@pytest.mark.usefixtures('_mock_providers')
+def test_list_subtitles_batch(episodes: dict[str, Episode], batch_calls: list[list[str]]) -> None:
+    bbt = episodes['bbt_s07e05']
+    bbt_next = next_episode(bbt)
+    # a video missing fewer languages is listed in its own batch
+    bbt_next.subtitles = [Subtitle(Language('fra'))]
+    languages = {Language('eng'), Language('fra')}
+
+    subtitles = list_subtitles({bbt, bbt_next}, languages, providers=['gestdown'])
+
+    assert sorted(batch_calls) == [[bbt.name], [bbt_next.name]]
+    assert subtitles == {bbt: [bbt.name], bbt_next: [bbt_next.name]}  # type: ignore[comparison-overlap]
+
+
+@pytest.mark.usefixtures('_mock_providers')
+def test_asyncio_provider_pool_list_subtitles_batch(
+    episodes: dict[str, Episode],
+    movies: dict[str, Movie],
+    batch_calls: list[list[str]],
+) -> None:
+    bbt = episodes['bbt_s07e05']
+    bbt_next = next_episode(bbt)
+    movie = movies['man_of_steel']
+
+    async def list_subtitles_batch() -> list[list[Subtitle]]:
+        async with AsyncioProviderPool(['gestdown', 'podnapisi']) as pool:
+            return await pool.list_subtitles_batch([bbt, movie, bbt_next], {Language('eng')})
+
+    results = asyncio.run(list_subtitles_batch())
+    assert batch_calls == [[bbt.name, bbt_next.name]]
+    assert [sorted(subtitles) for subtitles in results] == [  # type: ignore[type-var,comparison-overlap]
+        [bbt.name, 'podnapisi'],
+        ['podnapisi'],
+        [bbt_next.name, 'podnapisi'],
+    ]
+
+
 def test_list_subtitles_discarded_provider(
     movies: dict[str, Movie],
     provider_manager: RegistrableExtensionManager,
@@ -369,6 +650,696 @@ def test_download_subtitles_discarded_provider(
     assert 'opensubtitlescom' in pool.discarded_providers
 
 
+def test_provider_pool_circuit_breaker_recovery(
+    monkeypatch: pytest.MonkeyPatch,
+    movies: dict[str, Movie],
+) -> None:
+    now = [1000.0]
+    monkeypatch.setattr('subliminal.circuit_breaker.time.monotonic', lambda: now[0])
+    video = movies['man_of_steel']
+    languages = {Language('eng')}
+
+    pool = ProviderPool(['opensubtitlescom'])
+    provider = cast('MockProvider', pool['opensubtitlescom'])
+
+    # Mock a broken provider
+    provider.is_broken = True
+    assert pool.list_subtitles(video, languages) == []
+    assert pool.circuit_breakers['opensubtitlescom'].state is CircuitState.OPEN
+
+    # The provider works again, it is probed after the cooldown
+    provider.is_broken = False
+    assert pool.list_subtitles(video, languages) == []
+    now[0] += pool.circuit_breakers['opensubtitlescom'].cooldown
+    assert 'opensubtitlescom' not in pool.discarded_providers
+    assert len(pool.list_subtitles(video, languages)) == 1
+    assert pool.circuit_breakers['opensubtitlescom'].state is CircuitState.CLOSED  # type: ignore[comparison-overlap]
+
+
+@pytest.mark.usefixtures('_mock_providers')
+def test_provider_pool_circuit_breaker_errors(
+    monkeypatch: pytest.MonkeyPatch,
+    provider_manager: RegistrableExtensionManager,
+    episodes: dict[str, Episode],
+) -> None:
+    video = episodes['bbt_s07e05']
+    languages = {Language('eng')}
+    plugins = {provider.name: provider.plugin for provider in provider_manager}
+    monkeypatch.setattr(plugins['gestdown'], 'list_subtitles', Mock(side_effect=ValueError))
+    monkeypatch.setattr(plugins['podnapisi'], 'list_subtitles', Mock(side_effect=AuthenticationError))
+
+    pool = ProviderPool(['gestdown', 'podnapisi'])
+
+    # Unexpected errors open the circuit on the failure rate
+    breaker = pool.circuit_breakers['gestdown']
+    for _ in range(breaker.min_calls - 1):
+        pool.list_subtitles(video, languages)
+        assert breaker.state is CircuitState.CLOSED
+    pool.list_subtitles(video, languages)
+    assert breaker.state is CircuitState.OPEN
+
+    # Authentication errors open the circuit for good
+    assert pool.circuit_breakers['podnapisi'].retry_in == math.inf
+    assert plugins['podnapisi'].list_subtitles.call_count == 1
+
+
+class SlowProvider:
+    def __init__(self) -> None:
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def set(self) -> None:
+        self.started.set()
+        self.release.set()
+
+
+@pytest.fixture
+def best_subtitle_providers(
+    monkeypatch: pytest.MonkeyPatch,
+    provider_manager: RegistrableExtensionManager,
+) -> SlowProvider:
+    """Gestdown lists a subtitle with the maximum score for each language once podnapisi is started.
+
+    Podnapisi waits to be released.
+    """
+    slow = SlowProvider()
+    plugins = {provider.name: provider.plugin for provider in provider_manager}
+
+    def list_best(video: Video, languages: Set[Language]) -> list[Subtitle]:
+        slow.started.wait(5)
+        subtitle_class = plugins['gestdown'].subtitle_class
+        return [subtitle_class(language, subtitle_id=f'best-{language}') for language in languages]
+
+    def list_slow(video: Video, languages: Set[Language]) -> list[Subtitle]:
+        slow.started.set()
+        slow.release.wait(5)
+        subtitle_class = plugins['podnapisi'].subtitle_class
+        return [subtitle_class(language, subtitle_id=f'slow-{language}') for language in languages]
+
+    monkeypatch.setattr(plugins['gestdown'], 'list_subtitles', Mock(side_effect=list_best))
+    monkeypatch.setattr(plugins['podnapisi'], 'list_subtitles', Mock(side_effect=list_slow))
+    return slow
+
+
+def best_score(subtitle: Subtitle, video: Video) -> int:
+    return episode_scores['hash'] if subtitle.id.startswith('best') else 0
+
+
+@pytest.mark.parametrize(
+    ('languages', 'only_one', 'stopped'),
+    [
+        ({Language('eng')}, False, True),
+        ({Language('eng'), Language('deu')}, False, False),
+        ({Language('eng'), Language('deu')}, True, True),
+    ],
+)
+def test_provider_pool_list_best_subtitles(
+    best_subtitle_providers: SlowProvider,
+    episodes: dict[str, Episode],
+    provider_manager: RegistrableExtensionManager,
+    languages: set[Language],
+    only_one: bool,
+    stopped: bool,
+) -> None:
+    video = episodes['bbt_s07e05']
+    # gestdown does not support deu
+    best_subtitle_providers.set()
+
+    with ProviderPool(['gestdown', 'podnapisi']) as pool:
+        subtitles = pool.list_best_subtitles(video, languages, only_one=only_one, compute_score=best_score)
+
+    podnapisi = provider_manager['podnapisi'].plugin
+    assert podnapisi.list_subtitles.called is not stopped
+    assert {s.id for s in subtitles if s.id.startswith('best')} == {'best-en'}
+    assert pool.time_saved == 0
+
+
+@pytest.mark.parametrize('pool_class', [AsyncProviderPool, BatchProviderPool])
+def test_provider_pool_list_best_subtitles_ignored_calls(
+    best_subtitle_providers: SlowProvider,
+    episodes: dict[str, Episode],
+    pool_class: type[ProviderPool],
+) -> None:
+    video = episodes['bbt_s07e05']
+
+    with pool_class(providers=['gestdown', 'podnapisi']) as pool:
+        subtitles = pool.list_best_subtitles(video, {Language('eng')}, compute_score=best_score)
+        assert [s.id for s in subtitles] == ['best-en']
+        best_subtitle_providers.release.set()
+
+    # the time until the ignored call completed
+    assert pool.time_saved > 0
+
+
+def test_asyncio_provider_pool_list_best_subtitles(
+    best_subtitle_providers: SlowProvider,
+    episodes: dict[str, Episode],
+) -> None:
+    video = episodes['bbt_s07e05']
+
+    async def list_best_subtitles() -> tuple[list[Subtitle], AsyncioProviderPool]:
+        async with AsyncioProviderPool(['gestdown', 'podnapisi']) as pool:
+            subtitles = await pool.list_best_subtitles(video, {Language('eng')}, compute_score=best_score)
+            best_subtitle_providers.release.set()
+            return subtitles, pool
+
+    subtitles, pool = asyncio.run(list_best_subtitles())
+    assert [s.id for s in subtitles] == ['best-en']
+    assert pool.time_saved > 0
+    assert pool.initialized_providers == {}
+
+
+def test_download_best_subtitles_early_termination(
+    monkeypatch: pytest.MonkeyPatch,
+    best_subtitle_providers: SlowProvider,
+    episodes: dict[str, Episode],
+    provider_manager: RegistrableExtensionManager,
+) -> None:
+    video = episodes['bbt_s07e05']
+    best_subtitle_providers.set()
+    download = Mock(side_effect=lambda subtitle: subtitle.set_content(b'1\n00:00:01,000 --> 00:00:02,000\nHi\n'))
+    monkeypatch.setattr(provider_manager['gestdown'].plugin, 'download_subtitle', download)
+
+    downloaded = download_best_subtitles(
+        {video},
+        {Language('eng')},
+        compute_score=best_score,
+        early_termination=True,
+        providers=['gestdown', 'podnapisi'],
+    )
+
+    assert not provider_manager['podnapisi'].plugin.list_subtitles.called
+    assert download.call_count == 1
+    assert [s.id for s in downloaded[video]] == ['best-en']
+
+
+@pytest.mark.usefixtures('_mock_providers')
+def test_batch_provider_pool_list_subtitles(episodes: dict[str, Episode]) -> None:
+    with BatchProviderPool() as pool:
+        subtitles = pool.list_subtitles(episodes['bbt_s07e05'], {Language('eng')})
+        assert sorted(subtitles) == [  # type: ignore[type-var,comparison-overlap]
+            'gestdown',
+            'opensubtitlescom',
+            'podnapisi',
+            'tvsubtitles',
+        ]
+        assert pool.max_workers == len(pool.providers)
+        assert pool.max_videos == pool.max_workers
+
+
+def test_batch_provider_pool_discarded_providers(episodes: dict[str, Episode]) -> None:
+    videos = [episodes['bbt_s07e05'], episodes['got_s03e10'], episodes['dallas_s01e03']]
+    languages = {Language('eng')}
+
+    with BatchProviderPool(max_workers=2) as pool:
+        # One provider is broken
+        cast('MockProvider', pool['opensubtitlescom']).is_broken = True
+
+        results = dict(pool.process_videos(lambda v: pool.list_subtitles(v, languages), videos))
+        assert set(results) == set(videos)
+        assert not any(s.provider_name == 'opensubtitlescom' for subtitles in results.values() for s in subtitles)
+        assert 'opensubtitlescom' in pool.discarded_providers
+
+
+@pytest.mark.usefixtures('_mock_providers', '_provider_checks')
+def test_batch_provider_pool_slow_provider(
+    episodes: dict[str, Episode],
+    provider_manager: RegistrableExtensionManager,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    videos = [episodes['bbt_s07e05'], episodes['got_s03e10'], episodes['dallas_s01e03']]
+    released = threading.Event()
+    calls: list[str] = []
+
+    def slow_list_subtitles(self: Any, video: Video, languages: set[Language]) -> list[str]:
+        released.wait(timeout=10)
+        return ['gestdown']
+
+    def list_subtitles(self: Any, video: Video, languages: set[Language]) -> list[str]:
+        calls.append(self.__class__.__name__)
+        return [self.__class__.__name__]
+
+    for provider in provider_manager:
+        monkeypatch.setattr(provider.plugin, 'list_subtitles', list_subtitles)
+    monkeypatch.setattr(provider_manager['gestdown'].plugin, 'list_subtitles', slow_list_subtitles)
+
+    with BatchProviderPool(providers=['gestdown', 'podnapisi', 'tvsubtitles'], max_videos=3) as pool:
+        results = pool.process_videos(lambda v: pool.list_subtitles(v, {Language('eng')}), videos)
+        # the slow provider only holds its own worker, the other providers list all the videos
+        thread = threading.Thread(target=lambda: dict(results))
+        thread.start()
+        for _ in range(200):
+            if len(calls) == 6:
+                break
+            threading.Event().wait(0.05)
+        assert len(calls) == 6
+        released.set()
+        thread.join(timeout=10)
+        assert not thread.is_alive()
+
+
+@pytest.mark.usefixtures('_mock_providers')
+def test_batch_provider_pool_max_workers(
+    episodes: dict[str, Episode],
+    provider_manager: RegistrableExtensionManager,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    videos = [episodes['bbt_s07e05'], episodes['got_s03e10'], episodes['dallas_s01e03']]
+    lock = threading.Lock()
+    running = [0]
+    max_running = [0]
+
+    def list_subtitles(self: Any, video: Video, languages: set[Language]) -> list[str]:
+        with lock:
+            running[0] += 1
+            max_running[0] = max(max_running[0], running[0])
+        threading.Event().wait(0.02)
+        with lock:
+            running[0] -= 1
+        return []
+
+    for provider in provider_manager:
+        monkeypatch.setattr(provider.plugin, 'list_subtitles', list_subtitles)
+
+    with BatchProviderPool(max_workers=2, max_workers_per_provider=2, max_videos=3) as pool:
+        list(pool.process_videos(lambda v: pool.list_subtitles(v, {Language('eng')}), videos))
+    assert max_running[0] == 2
+
+
+def test_batch_provider_pool_process_videos_window(episodes: dict[str, Episode]) -> None:
+    videos = [episodes['bbt_s07e05'], episodes['got_s03e10'], episodes['dallas_s01e03'], episodes['bbt_s11e16']]
+    consumed: list[Video] = []
+    processed: list[Video] = []
+
+    def iter_videos() -> Iterator[Video]:
+        for video in videos:
+            consumed.append(video)
+            yield video
+
+    def func(video: Video) -> str:
+        processed.append(video)
+        return video.name
+
+    with BatchProviderPool(providers=[], max_videos=2) as pool:
+        results = pool.process_videos(func, iter_videos())
+        video, name = next(results)
+        assert name == video.name
+        # the window is refilled when a video is done
+        assert len(consumed) == 3
+        results.close()
+
+    assert len(consumed) == 3
+    assert set(processed) <= set(consumed)
+
+
+def test_download_best_subtitles_batch_provider_pool(episodes: dict[str, Episode]) -> None:
+    videos = {episodes['bbt_s07e05'], episodes['got_s03e10'], episodes['dallas_s01e03']}
+    languages = {Language('eng'), Language('fra')}
+
+    expected = download_best_subtitles(videos, languages)
+    subtitles = download_best_subtitles(videos, languages, pool_class=BatchProviderPool, max_videos=3)
+
+    assert {v: [(s.provider_name, s.id) for s in subs] for v, subs in subtitles.items()} == {
+        v: [(s.provider_name, s.id) for s in subs] for v, subs in expected.items()
+    }
+
+
+@pytest.fixture
+def concurrent_downloads(
+    monkeypatch: pytest.MonkeyPatch,
+    provider_manager: RegistrableExtensionManager,
+) -> list[Subtitle]:
+    """Subtitles of two providers, the first downloads of the providers wait for each other."""
+    plugins = {provider.name: provider.plugin for provider in provider_manager}
+    barrier = threading.Barrier(2, timeout=5)
+
+    def download_subtitle(subtitle: Subtitle) -> None:
+        if subtitle.id.endswith('-1'):
+            barrier.wait()
+        # the first english subtitle is invalid
+        if subtitle.id != 'en-1':
+            subtitle.set_content(b'1\n00:00:01,000 --> 00:00:02,000\nHi\n')
+
+    for name in ('gestdown', 'podnapisi'):
+        monkeypatch.setattr(plugins[name], 'download_subtitle', Mock(side_effect=download_subtitle))
+
+    return [
+        plugins['gestdown'].subtitle_class(Language('eng'), subtitle_id='en-1'),
+        plugins['gestdown'].subtitle_class(Language('eng'), subtitle_id='en-2'),
+        plugins['podnapisi'].subtitle_class(Language('fra'), subtitle_id='fr-1'),
+    ]
+
+
+def download_score(subtitle: Subtitle, video: Video) -> int:
+    return 100 if subtitle.id.endswith('-1') else 50
+
+
+@pytest.mark.parametrize('pool_class', [AsyncProviderPool, BatchProviderPool])
+def test_provider_pool_download_best_subtitles_concurrently(
+    concurrent_downloads: list[Subtitle],
+    episodes: dict[str, Episode],
+    pool_class: type[ProviderPool],
+) -> None:
+    video = episodes['bbt_s07e05']
+    languages = {Language('eng'), Language('fra')}
+
+    with pool_class(providers=['gestdown', 'podnapisi']) as pool:
+        subtitles = pool.download_best_subtitles(concurrent_downloads, video, languages, compute_score=download_score)
+
+    # fallback on the next english subtitle
+    assert [s.id for s in subtitles] == ['fr-1', 'en-2']
+
+
+def test_asyncio_provider_pool_download_best_subtitles_concurrently(
+    concurrent_downloads: list[Subtitle],
+    episodes: dict[str, Episode],
+) -> None:
+    video = episodes['bbt_s07e05']
+    languages = {Language('eng'), Language('fra')}
+
+    async def download_best_subtitles() -> list[Subtitle]:
+        async with AsyncioProviderPool(['gestdown', 'podnapisi']) as pool:
+            return await pool.download_best_subtitles(
+                concurrent_downloads,
+                video,
+                languages,
+                compute_score=download_score,
+            )
+
+    subtitles = asyncio.run(download_best_subtitles())
+    assert [s.id for s in subtitles] == ['fr-1', 'en-2']
+
+
+class HedgedDownloads:
+    """The best subtitle of gestdown is downloaded once the runner-up of podnapisi is, or after 5 seconds."""
+
+    def __init__(self, monkeypatch: pytest.MonkeyPatch, provider_manager: RegistrableExtensionManager) -> None:
+        self.plugins = {provider.name: provider.plugin for provider in provider_manager}
+        self.runner_up_downloaded = threading.Event()
+        self.hedged: list[bool] = []
+        self.best_valid = True
+        monkeypatch.setattr(self.plugins['gestdown'], 'download_subtitle', Mock(side_effect=self.download_best))
+        monkeypatch.setattr(self.plugins['podnapisi'], 'download_subtitle', Mock(side_effect=self.download_runner_up))
+
+    def download_best(self, subtitle: Subtitle) -> None:
+        self.hedged.append(self.runner_up_downloaded.wait(5))
+        if self.best_valid:
+            subtitle.set_content(b'1\n00:00:01,000 --> 00:00:02,000\nBest\n')
+
+    def download_runner_up(self, subtitle: Subtitle) -> None:
+        subtitle.set_content(b'1\n00:00:01,000 --> 00:00:02,000\nRunner-up\n')
+        self.runner_up_downloaded.set()
+
+    def subtitles(self, runner_up_score: int) -> list[tuple[Subtitle, int]]:
+        return [
+            (self.plugins['gestdown'].subtitle_class(Language('eng'), subtitle_id='best'), 100),
+            (self.plugins['podnapisi'].subtitle_class(Language('eng'), subtitle_id='runner-up'), runner_up_score),
+        ]
+
+
+@pytest.fixture
+def hedged_downloads(monkeypatch: pytest.MonkeyPatch, provider_manager: RegistrableExtensionManager) -> HedgedDownloads:
+    return HedgedDownloads(monkeypatch, provider_manager)
+
+
+def hedged_download_best_subtitles(
+    pool_class: type[ProviderPool],
+    subtitles: list[tuple[Subtitle, int]],
+    video: Video,
+    hedging: Hedging | None,
+) -> list[Subtitle]:
+    scores = {s.id: score for s, score in subtitles}
+    with pool_class(providers=['gestdown', 'podnapisi']) as pool:
+        return pool.download_best_subtitles(
+            [s for s, _ in subtitles],
+            video,
+            {Language('eng')},
+            compute_score=lambda s, v: scores[s.id],
+            hedging=hedging,
+        )
+
+
+@pytest.mark.parametrize('pool_class', [AsyncProviderPool, BatchProviderPool])
+def test_provider_pool_download_best_subtitles_hedged_close_score(
+    hedged_downloads: HedgedDownloads,
+    episodes: dict[str, Episode],
+    pool_class: type[ProviderPool],
+) -> None:
+    subtitles = hedged_downloads.subtitles(runner_up_score=98)
+
+    downloaded = hedged_download_best_subtitles(pool_class, subtitles, episodes['bbt_s07e05'], Hedging(score_margin=5))
+
+    # the runner-up is downloaded at once, but the best subtitle is kept
+    assert [s.id for s in downloaded] == ['best']
+    assert hedged_downloads.hedged == [True]
+
+
+@pytest.mark.parametrize('pool_class', [AsyncProviderPool, BatchProviderPool])
+def test_provider_pool_download_best_subtitles_hedged_latency(
+    hedged_downloads: HedgedDownloads,
+    episodes: dict[str, Episode],
+    pool_class: type[ProviderPool],
+) -> None:
+    subtitles = hedged_downloads.subtitles(runner_up_score=50)
+    hedged_downloads.best_valid = False
+
+    downloaded = hedged_download_best_subtitles(pool_class, subtitles, episodes['bbt_s07e05'], Hedging(delay=0.01))
+
+    # the runner-up is downloaded when the best subtitle is slow, and kept as the best subtitle is invalid
+    assert [s.id for s in downloaded] == ['runner-up']
+    assert hedged_downloads.hedged == [True]
+
+
+def test_provider_pool_download_best_subtitles_hedged_quota(
+    monkeypatch: pytest.MonkeyPatch,
+    hedged_downloads: HedgedDownloads,
+    episodes: dict[str, Episode],
+) -> None:
+    subtitles = hedged_downloads.subtitles(runner_up_score=98)
+    limiter = RateLimiter()
+    limiter.set_quota(5)
+    monkeypatch.setattr(hedged_downloads.plugins['podnapisi'], 'get_rate_limiter', lambda: limiter)
+    hedging = Hedging(score_margin=5, delay=0.01, min_quota=10)
+
+    downloaded = hedged_download_best_subtitles(BatchProviderPool, subtitles, episodes['bbt_s07e05'], hedging)
+
+    # the quota of the runner-up is too low
+    assert [s.id for s in downloaded] == ['best']
+    assert hedged_downloads.hedged == [False]
+    assert not hedged_downloads.plugins['podnapisi'].download_subtitle.called
+
+
+def test_asyncio_provider_pool_download_best_subtitles_hedged(
+    hedged_downloads: HedgedDownloads,
+    episodes: dict[str, Episode],
+) -> None:
+    subtitles = hedged_downloads.subtitles(runner_up_score=98)
+    scores = {s.id: score for s, score in subtitles}
+
+    async def download_best_subtitles() -> list[Subtitle]:
+        async with AsyncioProviderPool(['gestdown', 'podnapisi']) as pool:
+            return await pool.download_best_subtitles(
+                [s for s, _ in subtitles],
+                episodes['bbt_s07e05'],
+                {Language('eng')},
+                compute_score=lambda s, v: scores[s.id],
+                hedging=Hedging(score_margin=5),
+            )
+
+    assert [s.id for s in asyncio.run(download_best_subtitles())] == ['best']
+    assert hedged_downloads.hedged == [True]
+
+
+def test_hedging_get_delay() -> None:
+    hedging = Hedging(percentile=90, delay=2, min_samples=3)
+    assert hedging.get_delay([0.1, 0.2]) == 2
+    assert hedging.get_delay([float(i) for i in range(1, 11)]) == 9
+    assert Hedging(percentile=100).get_delay([3.0, 1.0, 2.0, 5.0, 4.0]) == 5
+
+
+def test_timeouts_get_timeout() -> None:
+    timeouts = Timeouts(percentile=50, factor=2, min_timeout=1, min_samples=3)
+    # not enough latencies
+    assert timeouts.get_timeout([0.1, 0.2], default=10) == 10
+    assert timeouts.get_timeout([0.1, 0.2]) is None
+    # a multiple of the percentile, within the minimum timeout and the default timeout
+    assert timeouts.get_timeout([2.0, 1.0, 3.0], default=10) == 4
+    assert timeouts.get_timeout([0.1, 0.2, 0.3], default=10) == 1
+    assert timeouts.get_timeout([20.0, 30.0, 40.0], default=10) == 10
+    assert Timeouts(adaptive=False).get_timeout([0.1] * 10, default=10) == 10
+    # within the remaining time budget
+    assert timeouts.get_timeout([2.0, 1.0, 3.0], deadline=time.monotonic() + 0.5) == pytest.approx(0.5, abs=0.1)
+
+
+def test_provider_pool_adaptive_timeouts(episodes: dict[str, Episode], monkeypatch: pytest.MonkeyPatch) -> None:
+    video = episodes['bbt_s07e05']
+    with ProviderPool(['podnapisi'], timeouts=Timeouts(factor=2, min_timeout=0, min_samples=2)) as pool:
+        provider = pool['podnapisi']
+        list_subtitles = provider.list_subtitles
+        call_timeouts = []
+
+        def record_timeout(video: Video, languages: Set[Language]) -> list[Subtitle]:
+            call_timeouts.append(provider.timeout)
+            return list_subtitles(video, languages)
+
+        monkeypatch.setattr(provider, 'list_subtitles', record_timeout)
+        for _ in range(2):
+            pool.list_subtitles(video, {Language('eng')})
+        latencies = list(pool.list_latencies['podnapisi'])
+
+        pool.list_subtitles(video, {Language('eng')})
+
+        # not enough latencies for the first calls
+        assert call_timeouts == [None, None, pytest.approx(2 * max(latencies))]
+        # the timeout of the shared provider is not changed
+        assert provider.timeout is None
+
+
+@pytest.mark.parametrize('pool_class', [AsyncProviderPool, BatchProviderPool])
+@pytest.mark.parametrize('as_completed', [False, True])
+def test_provider_pool_list_subtitles_time_budget(
+    best_subtitle_providers: SlowProvider,
+    episodes: dict[str, Episode],
+    pool_class: type[ProviderPool],
+    as_completed: bool,
+) -> None:
+    video = episodes['bbt_s07e05']
+    with pool_class(providers=['gestdown', 'podnapisi'], timeouts=Timeouts(0.5)) as pool:
+        try:
+            with pool.video_budget(video):
+                if as_completed:
+                    subtitles = [
+                        s for _, subs in pool.list_subtitles_as_completed(video, {Language('eng')}) for s in subs or []
+                    ]
+                else:
+                    subtitles = pool.list_subtitles(video, {Language('eng')})
+
+                # the slow provider is ignored
+                assert [s.id for s in subtitles] == ['best-en']
+                # the time budget of the video is spent
+                assert pool.list_subtitles(video, {Language('eng')}) == []
+                assert best_subtitle_providers.release.is_set() is False
+        finally:
+            best_subtitle_providers.set()
+
+
+def test_provider_pool_list_subtitles_time_budget_per_listing(
+    episodes: dict[str, Episode],
+) -> None:
+    video = episodes['bbt_s07e05']
+    with ProviderPool(providers=['gestdown'], timeouts=Timeouts(0.5)) as pool:
+        subtitles = pool.list_subtitles(video, {Language('eng')})
+        time.sleep(0.6)
+
+        # each listing has its own time budget
+        assert subtitles
+        assert [s.id for s in pool.list_subtitles(video, {Language('eng')})] == [s.id for s in subtitles]
+        # the time budget of the video is forgotten
+        assert pool._deadlines == {}
+
+
+def test_asyncio_provider_pool_list_subtitles_time_budget(
+    best_subtitle_providers: SlowProvider,
+    episodes: dict[str, Episode],
+) -> None:
+    video = episodes['bbt_s07e05']
+
+    async def list_subtitles() -> tuple[list[Subtitle], list[Subtitle], int]:
+        async with AsyncioProviderPool(['gestdown', 'podnapisi'], timeouts=Timeouts(0.5)) as pool:
+            try:
+                with pool.video_budget(video):
+                    return (
+                        await pool.list_subtitles(video, {Language('eng')}),
+                        await pool.list_subtitles(video, {Language('eng')}),
+                        sum(breaker.failures for breaker in pool.circuit_breakers.values()),
+                    )
+            finally:
+                best_subtitle_providers.set()
+
+    subtitles, spent, failures = asyncio.run(list_subtitles())
+
+    # the slow provider is cancelled, then the time budget of the video is spent
+    assert [s.id for s in subtitles] == ['best-en']
+    assert spent == []
+    # the cancellation is not a failure of the provider
+    assert failures == 0
+
+
+@pytest.mark.parametrize('pool_class', [AsyncProviderPool, BatchProviderPool])
+def test_provider_pool_download_best_subtitles_time_budget(
+    hedged_downloads: HedgedDownloads,
+    episodes: dict[str, Episode],
+    pool_class: type[ProviderPool],
+) -> None:
+    subtitles = hedged_downloads.subtitles(runner_up_score=50)
+    scores = {s.id: score for s, score in subtitles}
+    with pool_class(providers=['gestdown', 'podnapisi'], timeouts=Timeouts(0.3)) as pool:
+        try:
+            downloaded = pool.download_best_subtitles(
+                [s for s, _ in subtitles],
+                episodes['bbt_s07e05'],
+                {Language('eng')},
+                compute_score=lambda s, v: scores[s.id],
+            )
+        finally:
+            hedged_downloads.runner_up_downloaded.set()
+
+    # the slow download is ignored, and the runner-up is not downloaded
+    assert downloaded == []
+    assert not hedged_downloads.plugins['podnapisi'].download_subtitle.called
+    # the time budget of the video is forgotten
+    assert pool._deadlines == {}
+
+
+def test_asyncio_provider_pool_list_subtitles(episodes: dict[str, Episode]) -> None:
+    video = episodes['bbt_s07e05']
+    languages = {Language('eng')}
+
+    async def list_subtitles() -> tuple[list[Subtitle], AsyncioProviderPool]:
+        async with AsyncioProviderPool() as pool:
+            # One provider is broken
+            cast('MockProvider', await pool.get_provider('opensubtitlescom')).is_broken = True
+            return await pool.list_subtitles(video, languages), pool
+
+    subtitles, pool = asyncio.run(list_subtitles())
+    assert {s.provider_name for s in subtitles} == {'gestdown', 'podnapisi', 'tvsubtitles'}
+    assert pool.discarded_providers == {'opensubtitlescom'}
+    assert pool.initialized_providers == {}
+
+
+def test_asyncio_provider_pool_get_provider(
+    provider_manager: RegistrableExtensionManager,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    mock_initialize = Mock()
+    monkeypatch.setattr(provider_manager['gestdown'].plugin, 'initialize', mock_initialize)
+
+    async def get_providers() -> None:
+        pool = AsyncioProviderPool()
+        with pytest.raises(KeyError):
+            await pool.get_provider('nwodtseg')
+        # concurrent calls initialize the provider once
+        providers = await asyncio.gather(*(pool.get_provider('gestdown') for _ in range(5)))
+        assert len({id(p) for p in providers}) == 1
+        await pool.terminate()
+
+    asyncio.run(get_providers())
+    assert mock_initialize.call_count == 1
+
+
+def test_download_best_subtitles_async(episodes: dict[str, Episode]) -> None:
+    videos = {episodes['bbt_s07e05'], episodes['got_s03e10'], episodes['dallas_s01e03']}
+    languages = {Language('eng'), Language('fra')}
+
+    expected = download_best_subtitles(videos, languages)
+    subtitles = asyncio.run(download_best_subtitles_async(videos, languages, max_concurrency=2))
+
+    assert {v: [(s.provider_name, s.id) for s in subs] for v, subs in subtitles.items()} == {
+        v: [(s.provider_name, s.id) for s in subs] for v, subs in expected.items()
+    }
+    assert asyncio.run(download_best_subtitles_async(set(), languages)) == {}
+
+
 def test_download_best_subtitles(episodes: dict[str, Episode]) -> None:
     video = episodes['bbt_s07e05']
     languages = {Language('eng'), Language('fra')}
@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+import asyncio
+import io
+import time
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from typing import TYPE_CHECKING
+from unittest.mock import Mock
+
+import pytest
+from requests import Response, Session
+
+from subliminal.http import AsyncSession
+from subliminal.providers.gestdown import GestdownProvider
+from subliminal.providers.opensubtitlescom import OpenSubtitlesComProvider
+from subliminal.ratelimit import (
+    BACKOFF_MAX,
+    RateLimit,
+    RateLimitAdapter,
+    RateLimiter,
+    SharedRateLimiter,
+    configure_shared_rate_limiters,
+    get_rate_limiter,
+    mount_rate_limiter,
+    parse_retry_after,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+# Core test
+pytestmark = pytest.mark.core
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def time(self) -> float:
+        return self.now
+
+    def sleep(self, delay: float) -> None:
+        self.sleeps.append(delay)
+        self.now += delay
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr('subliminal.ratelimit.time', clock)
+    return clock
+
+
+def response(status_code: int, headers: dict[str, str] | None = None) -> Response:
+    r = Response()
+    r.status_code = status_code
+    r.headers.update(headers or {})
+    r.raw = io.BytesIO(b'')
+    return r
+
+
+@pytest.mark.parametrize(
+    ('value', 'expected'),
+    [
+        (None, None),
+        ('', None),
+        ('2', 2.0),
+        (' 1.5 ', 1.5),
+        ('-3', 0.0),
+        ('3600', BACKOFF_MAX),
+        ('not a date', None),
+        (format_datetime(datetime.fromtimestamp(1010, timezone.utc), usegmt=True), 10.0),
+    ],
+)
+def test_parse_retry_after(value: str | None, expected: float | None) -> None:
+    assert parse_retry_after(value, now=1000) == expected
+
+
+def test_rate_limiter_token_bucket(clock: FakeClock) -> None:
+    limiter = RateLimiter(RateLimit(2, burst=3))
+
+    # the burst is sent at once, then 2 requests per second
+    for _ in range(5):
+        limiter.acquire()
+    assert clock.sleeps == [0.5, 0.5]
+    assert limiter.wait_time == 0.5
+
+    clock.now += 10
+    assert limiter.wait_time == 0
+
+
+def test_rate_limiter_unlimited(clock: FakeClock) -> None:
+    limiter = RateLimiter()
+    for _ in range(100):
+        limiter.acquire()
+    assert clock.sleeps == []
+
+
+def test_rate_limiter_backoff(clock: FakeClock, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr('subliminal.ratelimit.random.uniform', lambda a, b: b)
+    limiter = RateLimiter(RateLimit(10))
+
+    # jittered exponential backoff
+    assert limiter.update(429) is True
+    assert limiter.wait_time == 1
+    assert limiter.update(503) is True
+    assert limiter.wait_time == 2
+    assert limiter.failures == 2
+
+    # Retry-After
+    assert limiter.update(429, '5') is True
+    assert limiter.wait_time == 5
+
+    # success resets the backoff
+    assert limiter.update(200) is False
+    assert limiter.failures == 0
+    limiter.acquire()
+    assert clock.sleeps == [5]
+
+
+def test_rate_limit_adapter(clock: FakeClock, monkeypatch: pytest.MonkeyPatch) -> None:
+    responses = [response(429, {'Retry-After': '3'}), response(503, {'Retry-After': '1'}), response(200)]
+    mock_send = Mock(side_effect=responses)
+    monkeypatch.setattr('requests.adapters.HTTPAdapter.send', mock_send)
+    session = Session()
+    mount_rate_limiter(session, RateLimiter(RateLimit(max_concurrent=1)))
+
+    r = session.get('https://example.com')
+
+    assert r.status_code == 200
+    assert mock_send.call_count == 3
+    assert clock.sleeps == [3, 1]
+
+
+def test_rate_limit_adapter_max_retries(clock: FakeClock, monkeypatch: pytest.MonkeyPatch) -> None:
+    mock_send = Mock(side_effect=lambda *args, **kwargs: response(429, {'Retry-After': '1'}))
+    monkeypatch.setattr('requests.adapters.HTTPAdapter.send', mock_send)
+    session = Session()
+    session.mount('https://', RateLimitAdapter(RateLimiter(RateLimit(max_retries=2))))
+
+    assert session.get('https://example.com').status_code == 429
+    assert mock_send.call_count == 3
+
+
+def test_async_session_rate_limiter(clock: FakeClock, monkeypatch: pytest.MonkeyPatch) -> None:
+    mock_sleep = Mock(side_effect=lambda delay: clock.sleep(delay))
+
+    async def fake_sleep(delay: float) -> None:
+        mock_sleep(delay)
+
+    monkeypatch.setattr('subliminal.ratelimit.asyncio.sleep', fake_sleep)
+    responses = [response(429, {'Retry-After': '2'}), response(200)]
+    session = AsyncSession(rate_limiter=RateLimiter(RateLimit(1)))
+    mock_request = Mock(side_effect=responses)
+    monkeypatch.setattr(session._get_session(), 'request', mock_request)
+
+    r = asyncio.run(session.get('https://example.com'))
+
+    assert r.status_code == 200
+    assert mock_request.call_count == 2
+    mock_sleep.assert_called_once_with(2)
+
+
+def test_provider_get_rate_limiter() -> None:
+    limiter = OpenSubtitlesComProvider.get_rate_limiter()
+    assert limiter is OpenSubtitlesComProvider.get_rate_limiter()
+    assert limiter.limit is OpenSubtitlesComProvider.rate_limit
+    assert GestdownProvider.get_rate_limiter() is not limiter
+    assert GestdownProvider.get_rate_limiter().limit.rate is None
+
+
+def test_rate_limiter_quota(monkeypatch: pytest.MonkeyPatch) -> None:
+    limiter = RateLimiter()
+    assert limiter.quota is None
+    assert not limiter.quota_exhausted
+
+    limiter.set_quota(1)
+    assert limiter.quota == 1
+    assert not limiter.quota_exhausted
+    limiter.set_quota(0)
+    assert limiter.quota_exhausted
+
+    # the quota is reset
+    limiter.set_quota(0, reset_at=time.time() - 1)
+    assert limiter.quota is None
+    assert not limiter.quota_exhausted
+
+
+def test_shared_rate_limiter(clock: FakeClock, tmp_path: Path) -> None:
+    path = tmp_path / 'rate-limits.db'
+    # limiters of two processes
+    limiters = [SharedRateLimiter(RateLimit(1, burst=2), name='provider', path=path) for _ in range(2)]
+
+    # the burst is shared
+    assert limiters[0].reserve() == 0
+    assert limiters[1].reserve() == 0
+    assert limiters[0].reserve() == 1
+    assert limiters[1].wait_time == 2
+
+    # the pauses and quota are shared
+    limiters[0].update(429, '10')
+    assert limiters[1].wait_time == 10
+    assert limiters[1].failures == 1
+    limiters[1].set_quota(0)
+    assert limiters[0].quota_exhausted
+
+    # other names are independent
+    assert SharedRateLimiter(RateLimit(1), name='other', path=path).wait_time == 0
+
+
+def test_configure_shared_rate_limiters(tmp_path: Path) -> None:
+    try:
+        configure_shared_rate_limiters(tmp_path / 'rate-limits.db')
+        limiter = get_rate_limiter('provider')
+        assert isinstance(limiter, SharedRateLimiter)
+        assert get_rate_limiter('provider') is limiter
+    finally:
+        configure_shared_rate_limiters(None)
+    assert not isinstance(get_rate_limiter('provider'), SharedRateLimiter)
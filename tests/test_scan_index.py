@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+from unittest.mock import Mock
+
+import pytest
+
+from subliminal.core import scan_video, scan_videos
+from subliminal.scan_index import ScanIndex
+from subliminal.utils import FileInfo
+from tests.conftest import ensure
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from subliminal.video import Episode, Movie
+
+# Core test
+pytestmark = pytest.mark.core
+
+
+def test_scan_index_get_set(movies: dict[str, Movie], tmp_path: Path) -> None:
+    video_path = ensure(tmp_path / movies['man_of_steel'].name)
+    file_info = FileInfo.from_path(video_path)
+    guess = {'type': 'movie', 'title': 'Man of Steel', 'year': 2013}
+
+    with ScanIndex(tmp_path / 'index.db') as index:
+        assert index.get(file_info) is None
+        index.set(file_info, guess)
+        assert index.get(file_info) == guess
+        # a different replacement name invalidates the entry
+        assert index.get(file_info, name='other.name.mkv') is None
+
+    # the index is persistent
+    with ScanIndex(tmp_path / 'index.db') as index:
+        assert len(index) == 1
+        assert index.get(file_info) == guess
+
+        # modified file
+        video_path.write_bytes(b'modified')
+        assert index.get(FileInfo.from_path(video_path)) is None
+
+
+def test_scan_index_guess(movies: dict[str, Movie], tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    video_path = ensure(tmp_path / movies['man_of_steel'].name)
+    file_info = FileInfo.from_path(video_path)
+    mock_guessit = Mock(return_value={'type': 'movie', 'title': 'Man of Steel'})
+    monkeypatch.setattr('subliminal.scan_index.safely_guessit', mock_guessit)
+
+    with ScanIndex(':memory:') as index:
+        assert index.guess(file_info) == {'type': 'movie', 'title': 'Man of Steel'}
+        assert index.guess(file_info) == {'type': 'movie', 'title': 'Man of Steel'}
+        assert mock_guessit.call_count == 1
+        assert (index.hits, index.misses) == (1, 1)
+
+
+def test_scan_index_guess_path(movies: dict[str, Movie], tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    video_path = ensure(tmp_path / movies['man_of_steel'].name)
+    monkeypatch.chdir(tmp_path)
+    relative_path = os.path.relpath(video_path, tmp_path)
+    file_info = FileInfo.from_path(relative_path)
+    mock_guessit = Mock(return_value={'type': 'movie', 'title': 'Man of Steel'})
+    monkeypatch.setattr('subliminal.scan_index.safely_guessit', mock_guessit)
+
+    with ScanIndex(':memory:') as index:
+        scan_video(relative_path, file_info=file_info, index=index)
+        scan_video(os.path.abspath(relative_path), file_info=file_info, index=index)
+        # the path passed to scan_video is guessed, and indexed separately
+        assert [c.args[0] for c in mock_guessit.call_args_list] == [relative_path, os.path.abspath(relative_path)]
+        assert len(index) == 2
+        assert index.get(file_info, path=os.path.abspath(relative_path)) is not None
+
+
+def test_scan_index_guess_batch(movies: dict[str, Movie], tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    file_infos = [FileInfo.from_path(ensure(tmp_path / movies[key].name)) for key in ('man_of_steel', 'enders_game')]
+    mock_guessit = Mock(side_effect=AssertionError)
+    monkeypatch.setattr('subliminal.scan_index.safely_guessit', mock_guessit)
+
+    with ScanIndex(':memory:') as index:
+        index.guess_batch(file_infos)
+        guesses = [index.guess(f) for f in file_infos]
+        assert [g['type'] for g in guesses] == ['movie', 'movie']
+        assert (index.hits, index.misses) == (0, 2)
+
+        # already indexed, nothing to guess
+        index.guess_batch(file_infos)
+        assert [index.guess(f) for f in file_infos] == guesses
+        assert (index.hits, index.misses) == (2, 2)
+
+        # the guesses are retrieved with the same paths
+        paths = [os.path.relpath(f.path) for f in file_infos]
+        index.guess_batch(file_infos, paths=paths)
+        assert [index.guess(f, path=p) for f, p in zip(file_infos, paths, strict=True)] == guesses
+        assert (index.hits, index.misses) == (2, 4)
+
+
+def test_scan_index_prune(movies: dict[str, Movie], tmp_path: Path) -> None:
+    kept_path = ensure(tmp_path / movies['man_of_steel'].name)
+    deleted_path = ensure(tmp_path / movies['enders_game'].name)
+    modified_path = ensure(tmp_path / movies['café_society'].name)
+
+    with ScanIndex(':memory:') as index:
+        for path in (kept_path, deleted_path, modified_path):
+            index.set(FileInfo.from_path(path), {'type': 'movie', 'title': os.path.basename(path)})
+        deleted_path.unlink()
+        modified_path.write_bytes(b'modified')
+
+        assert index.prune() == 2
+        assert len(index) == 1
+        assert index.get(FileInfo.from_path(kept_path)) is not None
+
+        index.clear()
+        assert len(index) == 0
+
+
+def test_scan_videos_index(
+    movies: dict[str, Movie],
+    episodes: dict[str, Episode],
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    ensure(tmp_path / 'movies' / movies['man_of_steel'].name)
+    ensure(tmp_path / 'tv' / episodes['bbt_s07e05'].name)
+
+    with ScanIndex(tmp_path / 'index.db') as index:
+        videos = scan_videos(tmp_path, index=index)
+        assert (index.hits, index.misses) == (0, 2)
+
+    # unchanged videos are not guessed again
+    mock_guessit = Mock(side_effect=AssertionError)
+    monkeypatch.setattr('subliminal.scan_index.safely_guessit', mock_guessit)
+    monkeypatch.setattr('subliminal.core.safely_guessit', mock_guessit)
+    with ScanIndex(tmp_path / 'index.db') as index:
+        indexed_videos = scan_videos(tmp_path, index=index)
+        assert (index.hits, index.misses) == (2, 0)
+
+    assert [type(v) for v in indexed_videos] == [type(v) for v in videos]
+    assert [v.name for v in indexed_videos] == [v.name for v in videos]
+    assert [v.title for v in indexed_videos] == [v.title for v in videos]
+    assert [v.size for v in indexed_videos] == [v.size for v in videos]
+
+
+def test_scan_videos_workers(movies: dict[str, Movie], episodes: dict[str, Episode], tmp_path: Path) -> None:
+    for video in [*movies.values(), *episodes.values()]:
+        if video.name.endswith('.mkv'):
+            ensure(tmp_path / video.name)
+
+    videos = scan_videos(tmp_path)
+    parallel_videos = scan_videos(tmp_path, workers=2)
+
+    assert len(parallel_videos) == len(videos) > 2
+    for video, parallel_video in zip(videos, parallel_videos, strict=True):
+        assert type(parallel_video) is type(video)
+        assert parallel_video.name == video.name
+        assert parallel_video.title == video.title
+        assert parallel_video.release_group == video.release_group
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from babelfish import Language  # type: ignore[import-untyped]
+
+from subliminal.singleflight import SingleFlight, default_group, single_flight
+from subliminal.subtitle import Subtitle
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# Core test
+pytestmark = pytest.mark.core
+
+
+def run_concurrently(
+    func: Callable[[], Any],
+    count: int,
+    group: SingleFlight,
+    release: threading.Event,
+) -> list[Any]:
+    """Call `func` in `count` threads, and `release` the call once the others wait for it."""
+    results: list[Any] = []
+    lock = threading.Lock()
+
+    def target() -> None:
+        try:
+            result = func()
+        except Exception as e:  # noqa: BLE001
+            result = e
+        with lock:
+            results.append(result)
+
+    coalesced = group.coalesced
+    threads = [threading.Thread(target=target) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+
+    # wait for the calls to be coalesced
+    deadline = time.monotonic() + 5
+    while group.coalesced - coalesced < count - 1 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    release.set()
+
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def test_single_flight_do() -> None:
+    group = SingleFlight()
+    release = threading.Event()
+    calls: list[int] = []
+
+    def fetch(n: int) -> list[int]:
+        calls.append(n)
+        release.wait(5)
+        return [n]
+
+    def call() -> list[int]:
+        return group.do('key', fetch, 1)
+
+    results = run_concurrently(call, 4, group, release)
+
+    assert calls == [1]
+    assert results == [[1], [1], [1], [1]]
+    # the callers do not share the same list
+    assert len({id(result) for result in results}) == 4
+    assert group.coalesced == 3
+    assert repr(group) == '<SingleFlight in_flight=0 coalesced=3>'
+
+
+def test_single_flight_do_subtitles() -> None:
+    group = SingleFlight()
+    release = threading.Event()
+
+    def query() -> list[Subtitle]:
+        release.wait(5)
+        return [Subtitle(Language('eng'), 'id')]
+
+    results = run_concurrently(lambda: group.do('key', query), 3, group, release)
+
+    assert [[s.id for s in result] for result in results] == [['id'], ['id'], ['id']]
+    # the callers do not share the same subtitles
+    assert len({id(result[0]) for result in results}) == 3
+
+
+def test_single_flight_do_error() -> None:
+    group = SingleFlight()
+    release = threading.Event()
+    calls: list[int] = []
+
+    def fetch() -> None:
+        calls.append(1)
+        release.wait(5)
+        msg = 'Failed'
+        raise ValueError(msg)
+
+    results = run_concurrently(lambda: group.do('key', fetch), 3, group, release)
+
+    assert calls == [1]
+    assert len(results) == 3
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+def test_single_flight_do_sequential() -> None:
+    group = SingleFlight()
+    calls: list[int] = []
+
+    def fetch(n: int) -> int:
+        calls.append(n)
+        return n
+
+    # the results are not kept once the call is done
+    assert group.do('key', fetch, 1) == 1
+    assert group.do('key', fetch, 2) == 2
+    assert calls == [1, 2]
+    assert group.coalesced == 0
+
+
+def test_single_flight_decorator() -> None:
+    release = threading.Event()
+    calls: list[tuple[str, int | None]] = []
+
+    @single_flight
+    def search(series: str, year: int | None = None) -> int:
+        calls.append((series, year))
+        release.wait(5)
+        return len(series)
+
+    variants = [
+        lambda: search('Dallas'),
+        lambda: search('Dallas', None),
+        lambda: search(series='Dallas', year=None),
+    ]
+    remaining = iter(variants)
+    lock = threading.Lock()
+
+    def call() -> int:
+        with lock:
+            func = next(remaining)
+        return func()
+
+    results = run_concurrently(call, 3, default_group, release)
+
+    # the normalized arguments are identical
+    assert calls == [('Dallas', None)]
+    assert results == [6, 6, 6]
+    assert search.__name__ == 'search'
+
+
+def test_single_flight_decorator_different_arguments() -> None:
+    @single_flight
+    def search(series: str, year: int | None = None) -> tuple[str, int | None]:
+        return series, year
+
+    assert search('Dallas') == ('Dallas', None)
+    assert search('Dallas', 2012) == ('Dallas', 2012)
+    # unhashable arguments are frozen
+    assert search('Dallas', year={'year': 2012}) == ('Dallas', {'year': 2012})  # type: ignore[arg-type,comparison-overlap]
+
+
+def test_single_flight_decorator_unhashable() -> None:
+    calls = []
+
+    @single_flight
+    def fetch(value: Any) -> Any:
+        calls.append(value)
+        return value
+
+    # the call is not coalesced, but still made
+    unhashable = bytearray(b'data')
+    assert fetch(unhashable) is unhashable
+    assert calls == [unhashable]
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import datetime
+import struct
 import sys
 from typing import TYPE_CHECKING, Any
 from xmlrpc.client import ProtocolError
@@ -22,9 +23,11 @@ from subliminal.utils import (
     merge_extend_and_ignore_unions,
     modification_date,
     safely_guessit,
+    safely_guessit_batch,
     sanitize,
     sanitize_id,
     sanitize_release_group,
+    sum_uint64,
     trim_pattern,
 )
 
@@ -81,6 +84,18 @@ def test_safely_guessit_with_empty_string() -> None:
     assert result == {}
 
 
+@pytest.mark.parametrize('workers', [None, 2])
+def test_safely_guessit_batch(workers: int | None) -> None:
+    names = [
+        'The.Big.Bang.Theory.S01E01.720p.BluRay.x264',
+        'The.Matrix.1999.1080p',
+        '',
+        'Game.of.Thrones.S03E10.Mhysa.720p.WEB-DL.DD5.1.H.264-NTb.mkv',
+    ]
+    result = safely_guessit_batch(names, workers=workers, chunksize=1)
+    assert result == [safely_guessit(name) for name in names]
+
+
 @pytest.mark.skipif(sys.version_info < (3, 11), reason='not a bug in python3.10...')
 def test_safely_guessit_with_error() -> None:
     """Regression test for https://github.com/Diaoul/subliminal/issues/1351"""
@@ -349,6 +364,20 @@ def test_clip(value: float, minimum: float | None, maximum: float | None, expect
     assert out == expected
 
 
+@pytest.mark.parametrize(
+    'data',
+    [b'', b'\x01' * 8, b'\xff' * 65536, bytes(range(256)) * 256],
+    ids=['empty', 'one-word', 'overflow', 'mixed'],
+)
+def test_sum_uint64(data: bytes) -> None:
+    # reference: the word-by-word signed sum used by the hash algorithms
+    expected = 0
+    for i in range(0, len(data), 8):
+        (value,) = struct.unpack('<q', data[i : i + 8])
+        expected = (expected + value) & 0xFFFFFFFFFFFFFFFF
+    assert sum_uint64(data) == expected
+
+
 @pytest.mark.parametrize(
     ('string', 'patterns', 'sep', 'expected'),
     [